@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from src.database.database import get_db
 from src.services.api_key_service import APIKeyService
+from src.services.revocation_events import publish_revocation
 from src.middleware.auth_middleware import get_auth_context, AuthContext, require_permission
 
 router = APIRouter()
@@ -91,6 +92,7 @@ async def revoke_api_key(
             detail="Access denied"
         )
     
+    key_hash = key.key_hash
     success = APIKeyService.revoke_api_key(db, key_id)
     if not success:
         raise HTTPException(
@@ -98,6 +100,7 @@ async def revoke_api_key(
             detail="API key not found"
         )
     
+    publish_revocation(key_hash)
     return {"message": "API key revoked successfully"}
 
 
@@ -11,6 +11,7 @@ from src.services.auth_service import AuthService
 from src.services.otp_service import OTPService
 from src.services.two_fa_service import TwoFAService
 from src.services.notification_service import notification_service
+from src.services.revocation_events import publish_token_revocation
 from src.middleware.auth_middleware import security, get_auth_context, AuthContext
 from src.middleware.rate_limiting import rate_limit, enforce_rate_limit
 from src.database.models import User, Organization
@@ -242,6 +243,7 @@ async def logout(
             detail="Invalid or expired token"
         )
 
+    publish_token_revocation(credentials.credentials)
     return {"message": "Logged out successfully"}
 
 
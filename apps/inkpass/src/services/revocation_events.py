@@ -0,0 +1,30 @@
+"""Publish credential revocations so downstream auth caches drop them"""
+
+import hashlib
+import json
+import structlog
+from src.middleware import rate_limiting
+
+logger = structlog.get_logger()
+
+# Consumers (e.g. Mimic's auth cache) subscribe to this channel
+REVOCATION_CHANNEL = "inkpass:auth:revocations"
+
+
+def publish_revocation(token_hash: str) -> None:
+    """Announce that the credential with this SHA-256 hash is no longer valid.
+
+    Best effort: caches also expire on their own TTL, so a Redis outage only
+    delays invalidation.
+    """
+    if not rate_limiting.redis_client:
+        return
+    try:
+        rate_limiting.redis_client.publish(REVOCATION_CHANNEL, json.dumps({"token_hash": token_hash}))
+    except Exception as e:
+        logger.warning("Failed to publish revocation", error=str(e))
+
+
+def publish_token_revocation(token: str) -> None:
+    """Announce revocation of a raw token (JWT or API key)."""
+    publish_revocation(hashlib.sha256(token.encode()).hexdigest())
@@ -0,0 +1,29 @@
+"""Webhook event dispatch state: ordering key and retry schedule.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('webhook_events', sa.Column('ordering_key', sa.String(255), nullable=True))
+    op.add_column('webhook_events', sa.Column('next_attempt_at', sa.DateTime(), nullable=True))
+    # The dispatcher reads pending events oldest first
+    op.create_index('idx_webhook_events_status_created', 'webhook_events', ['status', 'created_at'])
+    op.create_index('idx_webhook_events_ordering_key', 'webhook_events', ['ordering_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_webhook_events_ordering_key', 'webhook_events')
+    op.drop_index('idx_webhook_events_status_created', 'webhook_events')
+    op.drop_column('webhook_events', 'next_attempt_at')
+    op.drop_column('webhook_events', 'ordering_key')
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""
+Benchmark outbound delivery with per-call clients against shared provider pools.
+
+Starts a local HTTPS mock provider (self-signed certificate, keep-alive,
+``--latency-ms`` of simulated processing per request) and sends
+``--requests`` POSTs with ``--concurrency`` in flight, first opening a new
+``httpx.AsyncClient`` per call as the delivery paths used to, then through
+a ``ProviderPool`` (what ``provider_client`` uses) of ``--pool-size``
+connections, which reuses them and queues the rest of the in-flight
+requests on its semaphore. Reports throughput, the number of TCP
+connections the server accepted and latency percentiles.
+
+Usage:
+    python scripts/bench_provider_clients.py [--requests 2000] [--concurrency 50] [--latency-ms 5] [--pool-size 10]
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import ssl
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from cryptography import x509  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from cryptography.x509.oid import NameOID  # noqa: E402
+
+from src.clients.provider_transport import DEFAULT_POLICY, ProviderPolicy, ProviderPool  # noqa: E402
+
+HOST = "127.0.0.1"
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 11\r\n\r\n{\"ok\":true}"
+
+
+def self_signed_cert(directory: str):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address(HOST))]), False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+    return cert_path, key_path
+
+
+class MockProvider:
+    """Minimal keep-alive HTTP/1.1 server answering every request with 200."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(self.latency)
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(make_client, url: str, requests: int, concurrency: int):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            async with make_client() as client:
+                response = await client.post(url, json={"content": f"message {i}"})
+                response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(requests)))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def report(name: str, elapsed: float, latencies: list, connections: int) -> None:
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(
+        f"{name:<16} {len(latencies) / elapsed:8.0f} req/s  {connections:5d} connections  "
+        f"p50 {pct(0.50):6.1f} ms  p99 {pct(0.99):6.1f} ms"
+    )
+
+
+async def main_async(args) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = self_signed_cert(directory)
+        server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_ctx.load_cert_chain(cert_path, key_path)
+        client_ctx = ssl.create_default_context(cafile=cert_path)
+
+        provider = MockProvider(args.latency_ms / 1000)
+        server = await asyncio.start_server(provider.handle, HOST, 0, ssl=server_ctx)
+        url = f"https://{HOST}:{server.sockets[0].getsockname()[1]}/api/webhooks/1/token"
+
+        print(
+            f"{args.requests} POSTs, {args.concurrency} in flight, "
+            f"{args.latency_ms} ms provider latency, TLS, pool of {args.pool_size}\n"
+        )
+
+        provider.connections = 0
+        elapsed, latencies = await run(
+            lambda: httpx.AsyncClient(verify=client_ctx, timeout=10.0), url, args.requests, args.concurrency
+        )
+        report("client per call", elapsed, latencies, provider.connections)
+
+        pool = ProviderPool(
+            "bench",
+            ProviderPolicy(max_concurrency=args.pool_size, max_keepalive=args.pool_size),
+            verify=client_ctx,
+        )
+        provider.connections = 0
+        elapsed, latencies = await run(
+            lambda: httpx.AsyncClient(transport=pool.for_action("send_message"), timeout=10.0),
+            url, args.requests, args.concurrency,
+        )
+        report("shared pool", elapsed, latencies, provider.connections)
+
+        await pool.aclose()
+        server.close()
+        await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POLICY.max_concurrency)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Benchmark the GCRA rate limiter against the old list-based limiter.
+
+The list-based limiter kept a timestamp per request and rebuilt the list on
+every check, so a check cost O(limit) and a key held up to ``limit``
+floats. GCRA keeps one integer per key. Each limiter performs ``--checks``
+checks for a single hot key with a ``--limit`` request window. Pass
+``--redis-url`` to also time the shared Redis limiter (one round trip per
+check).
+
+Usage:
+    python scripts/bench_rate_limiter.py [--checks 50000] [--limit 1000] [--redis-url redis://localhost:6379/0]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.middleware.rate_limiting import LocalRateLimiter, RateLimiter  # noqa: E402
+
+WINDOW_SECONDS = 60
+
+
+def list_based_limiter():
+    """The previous per-process implementation, kept here for comparison."""
+    rate_limits = defaultdict(lambda: defaultdict(list))
+
+    def check(user_id, limit_type, max_requests, window_seconds):
+        now = time.time()
+        rate_limits[user_id][limit_type] = [
+            timestamp for timestamp in rate_limits[user_id][limit_type]
+            if now - timestamp < window_seconds
+        ]
+        if len(rate_limits[user_id][limit_type]) >= max_requests:
+            return False
+        rate_limits[user_id][limit_type].append(now)
+        return True
+
+    return check
+
+
+def report(name, elapsed, checks):
+    print(f"{name:<12} {elapsed * 1000:9.1f} ms total  {elapsed / checks * 1e6:8.2f} us/check")
+
+
+async def bench_redis(url, checks, limit):
+    import redis.asyncio as aioredis
+
+    client = aioredis.from_url(url)
+    limiter = RateLimiter(client)
+    await client.delete("mimic:ratelimit:bench:user")
+    start = time.perf_counter()
+    for _ in range(checks):
+        await limiter.check("bench:user", limit, WINDOW_SECONDS)
+    elapsed = time.perf_counter() - start
+    await client.delete("mimic:ratelimit:bench:user")
+    await client.aclose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--checks", type=int, default=50000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    print(f"{args.checks} checks, limit {args.limit}/{WINDOW_SECONDS}s, one key\n")
+
+    check = list_based_limiter()
+    start = time.perf_counter()
+    for _ in range(args.checks):
+        check("user", "user", args.limit, WINDOW_SECONDS)
+    report("list-based", time.perf_counter() - start, args.checks)
+
+    local = LocalRateLimiter()
+    start = time.perf_counter()
+    for _ in range(args.checks):
+        local.check("user:user", args.limit, WINDOW_SECONDS)
+    report("gcra-local", time.perf_counter() - start, args.checks)
+
+    if args.redis_url:
+        report("gcra-redis", asyncio.run(bench_redis(args.redis_url, args.checks, args.limit)), args.checks)
+
+
+if __name__ == "__main__":
+    main()
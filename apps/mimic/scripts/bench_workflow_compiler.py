@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark the workflow compiler against the old recursive traversal.
+
+The old traversal rescanned every edge for each visited node (O(nodes x
+edges)) and recursed once per node along a path, so long chains hit the
+recursion limit. The compiler now builds adjacency maps once and orders
+steps with Kahn's algorithm. Synthetic ``--nodes`` graphs are compiled
+``--repeat`` times each:
+
+- chain: one long path;
+- layered: fan-out/fan-in layers ``--width`` nodes wide, every node wired
+  to two nodes of the next layer;
+- fan-out: the trigger wired straight to every other node.
+
+"hashed" is ``WorkflowCompiler.compile`` on an unchanged definition (hash
+plus cache lookup), "by version" the same with a ``version_key`` as the
+trigger route passes.
+
+Usage:
+    python scripts/bench_workflow_compiler.py [--nodes 1000] [--width 20] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.workflow_compiler import WorkflowCompiler  # noqa: E402
+
+
+def legacy_build_steps(compiler, nodes, edges):
+    """The previous recursive traversal, kept here for comparison."""
+    steps = []
+    node_map = {node["id"]: node for node in nodes}
+    start_node = next((n for n in nodes if n.get("type") == "trigger"), None)
+    visited = set()
+
+    def traverse(node):
+        if node["id"] in visited:
+            return
+        visited.add(node["id"])
+        step = compiler._node_to_step(node)
+        if step:
+            steps.append(step)
+        for edge in [e for e in edges if e.get("source") == node["id"]]:
+            target_id = edge.get("target")
+            if target_id and target_id in node_map:
+                traverse(node_map[target_id])
+
+    traverse(start_node)
+    return steps
+
+
+def action(i):
+    return {"id": f"n{i}", "type": "action", "provider": "email", "recipient": f"user{i}@example.com"}
+
+
+def chain(count, width):
+    nodes = [{"id": "n0", "type": "trigger"}] + [action(i) for i in range(1, count)]
+    edges = [{"source": f"n{i}", "target": f"n{i + 1}"} for i in range(count - 1)]
+    return {"nodes": nodes, "edges": edges}
+
+
+def layered(count, width):
+    nodes = [{"id": "n0", "type": "trigger"}] + [action(i) for i in range(1, count)]
+    layers = [["n0"]] + [
+        [f"n{i}" for i in range(start, min(start + width, count))]
+        for start in range(1, count, width)
+    ]
+    edges = []
+    for upper, lower in zip(layers, layers[1:]):
+        for i, source in enumerate(upper):
+            targets = {lower[i % len(lower)], lower[(i + 1) % len(lower)]}
+            if len(upper) < len(lower):
+                targets.update(lower[i::len(upper)])
+            edges.extend({"source": source, "target": target} for target in sorted(targets))
+    return {"nodes": nodes, "edges": edges}
+
+
+def fan_out(count, width):
+    nodes = [{"id": "n0", "type": "trigger"}] + [action(i) for i in range(1, count)]
+    edges = [{"source": "n0", "target": f"n{i}"} for i in range(1, count)]
+    return {"nodes": nodes, "edges": edges}
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    compiler = WorkflowCompiler()
+    print(f"{args.nodes} nodes, mean of {args.repeat} compiles (ms)\n")
+    print(f"{'graph':<10} {'edges':>6} {'legacy':>10} {'compiler':>10} {'hashed':>10} {'by version':>10}")
+    for name, build in (("chain", chain), ("layered", layered), ("fan-out", fan_out)):
+        definition = build(args.nodes, args.width)
+        nodes, edges = definition["nodes"], definition["edges"]
+        try:
+            legacy = f"{timed(lambda: legacy_build_steps(compiler, nodes, edges), args.repeat):10.2f}"
+        except RecursionError:
+            legacy = f"{'recursion':>10}"
+        uncached = timed(lambda: compiler._compile(definition), args.repeat)
+        compiler.compile(definition)
+        hashed = timed(lambda: compiler.compile(definition), args.repeat)
+        compiler.compile(definition, version_key=f"{name}:1")
+        by_version = timed(lambda: compiler.compile(definition, version_key=f"{name}:1"), args.repeat)
+        print(f"{name:<10} {len(edges):6d} {legacy} {uncached:10.2f} {hashed:10.2f} {by_version:10.4f}")
+
+
+if __name__ == "__main__":
+    main()
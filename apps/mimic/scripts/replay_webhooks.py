@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""
+Replay signed webhooks against the integration gateway and report throughput.
+
+Runs the real FastAPI app in-process against a throwaway SQLite database
+with one GitHub-style integration (HMAC signature auth and a transform
+template), then posts ``--requests`` signed events to its webhook path.
+Routing to Celery is replaced by a no-op so only ingest is measured.
+
+``--mode cached`` uses the compiled per-path pipeline; ``--mode uncached``
+forces the DB lookup, secret decryption and template compile on every
+request, as the gateway did before pipelines were cached.
+
+Usage:
+    python scripts/replay_webhooks.py [--requests 2000] [--mode cached|uncached|both]
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("APP_ENV", "test")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structlog  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from src.api.routes import integrations  # noqa: E402
+from src.database.database import Base, get_db  # noqa: E402
+from src.database.models import (  # noqa: E402
+    DestinationService,
+    InboundAuthMethod,
+    Integration,
+    IntegrationDirection,
+    IntegrationInboundConfig,
+    IntegrationProvider,
+    IntegrationStatus,
+)
+from src.main import app  # noqa: E402
+from src.services import key_encryption, webhook_pipeline  # noqa: E402
+from src.services.key_encryption import KeyEncryptionService  # noqa: E402
+
+WEBHOOK_PATH = "wh-replay"
+SECRET = "replay-secret"
+TEMPLATE = """{
+    "event_type": "{{ action }}",
+    "data": {
+        "repository": "{{ repository.full_name }}",
+        "sender": "{{ sender.login }}",
+        "commits": {{ commits | length }}
+    }
+}"""
+PAYLOAD = {
+    "action": "push",
+    "repository": {"full_name": "acme/widgets"},
+    "sender": {"login": "octocat"},
+    "commits": [{"id": str(i), "message": "change"} for i in range(20)],
+}
+
+
+class _NoopRoutingTask:
+    def delay(self, **kwargs):
+        return SimpleNamespace(id="replay")
+
+
+def build_client() -> TestClient:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = Session()
+    db.add(Integration(
+        id="replay-integration",
+        organization_id="replay-org",
+        user_id="replay-user",
+        name="Replay",
+        provider=IntegrationProvider.github,
+        direction=IntegrationDirection.inbound,
+        status=IntegrationStatus.active,
+    ))
+    db.add(IntegrationInboundConfig(
+        integration_id="replay-integration",
+        webhook_path=WEBHOOK_PATH,
+        auth_method=InboundAuthMethod.signature,
+        signature_secret=KeyEncryptionService().encrypt(SECRET),
+        transform_template=TEMPLATE,
+        destination_service=DestinationService.tentacle,
+        is_active=True,
+    ))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    integrations.get_route_integration_event_task = lambda: _NoopRoutingTask()
+    return TestClient(app)
+
+
+_compile_cached = webhook_pipeline.compile_template
+
+
+def set_mode(mode: str) -> None:
+    webhook_pipeline.webhook_pipelines.clear()
+    key_encryption._decrypted_cache.clear()
+    if mode == "cached":
+        webhook_pipeline.webhook_pipelines.ttl = 30
+        key_encryption._decrypted_cache.ttl = 60
+        webhook_pipeline.compile_template = _compile_cached
+    else:
+        webhook_pipeline.webhook_pipelines.ttl = 0
+        key_encryption._decrypted_cache.ttl = 0
+        webhook_pipeline.compile_template = _compile_cached.__wrapped__
+
+
+def replay(client: TestClient, requests: int) -> float:
+    body = json.dumps(PAYLOAD).encode()
+    signature = "sha256=" + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+    headers = {"Content-Type": "application/json", "X-Hub-Signature-256": signature}
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.post(f"/api/v1/gateway/integrations/{WEBHOOK_PATH}", content=body, headers=headers)
+        if response.status_code != 200:
+            raise SystemExit(f"Unexpected {response.status_code}: {response.text}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--mode", choices=["cached", "uncached", "both"], default="both")
+    args = parser.parse_args()
+
+    # Per-request info logs would dominate the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    client = build_client()
+    modes = ["uncached", "cached"] if args.mode == "both" else [args.mode]
+    print(f"{args.requests} signed webhooks, template transform, SQLite\n")
+    for mode in modes:
+        set_mode(mode)
+        replay(client, 50)  # warm up
+        elapsed = replay(client, args.requests)
+        print(
+            f"{mode:<9} {args.requests / elapsed:8.0f} req/s  "
+            f"{elapsed / args.requests * 1000:6.2f} ms/request"
+        )
+
+
+if __name__ == "__main__":
+    main()
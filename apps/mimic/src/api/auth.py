@@ -5,15 +5,20 @@ Provides FastAPI dependencies for JWT and API key authentication
 via InkPass Mothership service.
 """
 
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Annotated, Callable, Optional
+from typing import Annotated, Any, Awaitable, Callable, Optional, Tuple
 
 import httpx
+import redis.asyncio as aioredis
 import structlog
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+from jose import jwt
 
 from src.config import settings
+from src.services.auth_cache import AuthCache, RevocationListener
 
 logger = structlog.get_logger(__name__)
 
@@ -34,40 +39,82 @@ class AuthContext:
 
 
 class InkPassClient:
-    """Client for InkPass Mothership authentication service."""
+    """Client for InkPass Mothership authentication service.
 
-    def __init__(self, base_url: str):
+    Shares one keep-alive connection pool across requests and, when given an
+    ``AuthCache``, serves repeated validations and permission checks from it.
+    """
+
+    def __init__(self, base_url: str, cache: Optional[AuthCache] = None, timeout: float = 10.0):
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Pooled client, recreated if the event loop changed (e.g. in tests)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _cached(
+        self,
+        token: str,
+        field: str,
+        loader: Callable[[], Awaitable[Tuple[Any, bool]]],
+        max_ttl: Optional[float] = None,
+    ) -> Any:
+        if self.cache is None:
+            value, _ = await loader()
+            return value
+        return await self.cache.get_or_load(token, field, loader, max_ttl=max_ttl)
 
     async def validate_token(self, token: str) -> Optional[dict]:
         """Validate a JWT token via InkPass."""
+        return await self._cached(
+            token, "token", lambda: self._fetch_token(token), max_ttl=_jwt_remaining_seconds(token)
+        )
+
+    async def _fetch_token(self, token: str) -> Tuple[Optional[dict], bool]:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/auth/me",
-                    headers={"Authorization": f"Bearer {token}"},
-                )
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            response = await self._http().get(
+                f"{self.base_url}/api/v1/auth/me",
+                headers={"Authorization": f"Bearer {token}"},
+            )
         except Exception as e:
             logger.error("inkpass_token_validation_failed", error=str(e))
-            return None
+            return None, False
+        if response.status_code == 200:
+            return response.json(), True
+        return None, response.status_code in _REJECTED
 
     async def validate_api_key(self, api_key: str) -> Optional[dict]:
         """Validate an API key via InkPass."""
+        return await self._cached(api_key, "api_key", lambda: self._fetch_api_key(api_key))
+
+    async def _fetch_api_key(self, api_key: str) -> Tuple[Optional[dict], bool]:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/auth/api-key/validate",
-                    headers={"X-API-Key": api_key},
-                )
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            response = await self._http().get(
+                f"{self.base_url}/api/v1/auth/api-key/validate",
+                headers={"X-API-Key": api_key},
+            )
         except Exception as e:
             logger.error("inkpass_api_key_validation_failed", error=str(e))
-            return None
+            return None, False
+        if response.status_code == 200:
+            return response.json(), True
+        return None, response.status_code in _REJECTED
 
     async def check_permission(
         self, token: str, resource: str, action: str
@@ -77,18 +124,24 @@ class InkPassClient:
         Uses the /api/v1/auth/check endpoint which checks permissions
         via the role template system.
         """
+        return await self._cached(
+            token,
+            f"perm:{resource}:{action}",
+            lambda: self._fetch_permission(token, resource, action),
+            max_ttl=_jwt_remaining_seconds(token),
+        )
+
+    async def _fetch_permission(self, token: str, resource: str, action: str) -> Tuple[bool, bool]:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/auth/check",
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={"resource": resource, "action": action},
-                    json={},  # ABAC context (optional)
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("has_permission", False)
-                return False
+            response = await self._http().post(
+                f"{self.base_url}/api/v1/auth/check",
+                headers={"Authorization": f"Bearer {token}"},
+                params={"resource": resource, "action": action},
+                json={},  # ABAC context (optional)
+            )
+            if response.status_code == 200:
+                data = response.json()
+                return bool(data.get("has_permission", False)), True
         except Exception as e:
             logger.error(
                 "inkpass_permission_check_failed",
@@ -96,11 +149,48 @@ class InkPassClient:
                 resource=resource,
                 action=action,
             )
-            return False
+            return False, False
+        return False, response.status_code in _REJECTED
+
+
+# InkPass answers that are decisions (cacheable), as opposed to outages
+_REJECTED = frozenset({401, 403, 404})
+
+
+def _jwt_remaining_seconds(token: str) -> Optional[float]:
+    """Seconds until a JWT's ``exp`` (unverified; only bounds cache lifetime)."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except Exception:
+        return None
+    if exp is None:
+        return None
+    return float(exp) - time.time()
 
 
 # Singleton for InkPass client
 _inkpass_client: Optional[InkPassClient] = None
+_auth_cache: Optional[AuthCache] = None
+_revocation_listener: Optional[RevocationListener] = None
+
+
+def get_auth_cache() -> AuthCache:
+    """Get the shared auth result cache (singleton)."""
+    global _auth_cache
+
+    if _auth_cache is None:
+        redis_client = None
+        if settings.INKPASS_AUTH_CACHE_REDIS:
+            redis_client = aioredis.from_url(settings.REDIS_URL)
+        _auth_cache = AuthCache(
+            ttl=settings.INKPASS_AUTH_CACHE_TTL_SECONDS,
+            permission_ttl=settings.INKPASS_PERMISSION_CACHE_TTL_SECONDS,
+            negative_ttl=settings.INKPASS_NEGATIVE_CACHE_TTL_SECONDS,
+            max_entries=settings.INKPASS_AUTH_CACHE_MAX_ENTRIES,
+            redis_client=redis_client,
+        )
+
+    return _auth_cache
 
 
 def get_inkpass_client() -> InkPassClient:
@@ -108,11 +198,36 @@ def get_inkpass_client() -> InkPassClient:
     global _inkpass_client
 
     if _inkpass_client is None:
-        _inkpass_client = InkPassClient(base_url=settings.INKPASS_URL)
+        _inkpass_client = InkPassClient(base_url=settings.INKPASS_URL, cache=get_auth_cache())
 
     return _inkpass_client
 
 
+async def start_auth_cache() -> None:
+    """Start listening for InkPass revocations (app startup)."""
+    global _revocation_listener
+
+    cache = get_auth_cache()
+    if cache.redis is None or _revocation_listener is not None:
+        return
+    _revocation_listener = RevocationListener(cache, cache.redis, settings.INKPASS_REVOCATION_CHANNEL)
+    _revocation_listener.start()
+
+
+async def stop_auth_cache() -> None:
+    """Stop the revocation listener and close pooled connections (app shutdown)."""
+    global _revocation_listener
+
+    if _revocation_listener is not None:
+        await _revocation_listener.stop()
+        _revocation_listener = None
+    if _inkpass_client is not None:
+        try:
+            await _inkpass_client.aclose()
+        except Exception as e:
+            logger.warning("inkpass_client_close_failed", error=str(e))
+
+
 async def get_current_user(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
     api_key: Annotated[Optional[str], Depends(api_key_header)],
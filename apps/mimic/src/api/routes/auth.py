@@ -63,20 +63,18 @@ def get_current_user(
     # Hash the provided key
     key_hash = hash_api_key(api_key)
     
-    # Find the API key in database
-    db_key = db.query(APIKey).filter(APIKey.key_hash == key_hash).first()
-    if not db_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API key"
-        )
-    
-    # Get the user
-    user = db.query(User).filter(User.id == db_key.user_id).first()
+    # Always checked against the key table: AuthMiddleware's cached
+    # resolution can outlive a deleted key
+    user = (
+        db.query(User)
+        .join(APIKey, APIKey.user_id == User.id)
+        .filter(APIKey.key_hash == key_hash)
+        .first()
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Invalid API key"
         )
     
     return user
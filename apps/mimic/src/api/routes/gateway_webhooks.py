@@ -5,21 +5,24 @@ Handles inbound webhooks from external services:
 - Stripe: Payment and subscription events
 - Resend: Email delivery events
 
-All webhooks are logged for audit, then routed to appropriate services via Celery.
+All webhooks are stored for audit and idempotency and acknowledged right
+away; the dispatcher task routes them to downstream services via Celery
+(see src.services.webhook_dispatcher).
 """
 
 from datetime import datetime
 from typing import Annotated, Optional
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Request, status
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from src.config import settings
 from src.database.database import get_db
 from src.database.models import WebhookEvent, WebhookDelivery
 from src.api.auth import require_permission, AuthContext
+from src.services.stripe_service import get_stripe_webhook_client
+from src.services.webhook_dispatcher import persist_webhook_event, request_dispatch
 
 logger = structlog.get_logger(__name__)
 
@@ -39,15 +42,16 @@ router = APIRouter(prefix="/gateway/webhooks", tags=["webhook-gateway"])
 )
 async def stripe_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     stripe_signature: Optional[str] = Header(None, alias="Stripe-Signature"),
 ):
     """
     Handle Stripe webhook events.
 
-    Verifies signature, logs event, and routes to downstream services.
+    Verifies the signature, stores the event and acknowledges; the
+    dispatcher routes it to downstream services.
     """
     payload = await request.body()
-    db: Session = next(get_db())
 
     # Verify signature
     if not stripe_signature:
@@ -64,16 +68,10 @@ async def stripe_webhook(
             detail={"error": "ConfigurationError", "message": "Stripe webhook secret not configured"},
         )
 
-    try:
-        from fluxos_stripe import StripeClient, StripeConfig, StripeWebhookError
-
-        config = StripeConfig(
-            api_key=settings.STRIPE_SECRET_KEY or "",
-            webhook_secret=settings.STRIPE_WEBHOOK_SECRET,
-        )
-        client = StripeClient(config)
-        event = client.verify_webhook_signature(payload, stripe_signature)
+    from fluxos_stripe import StripeWebhookError
 
+    try:
+        event = get_stripe_webhook_client().verify_webhook_signature(payload, stripe_signature)
     except StripeWebhookError as e:
         logger.error("stripe_webhook_signature_invalid", error=str(e))
         raise HTTPException(
@@ -81,113 +79,35 @@ async def stripe_webhook(
             detail={"error": "InvalidSignature", "message": "Invalid webhook signature"},
         )
 
-    # Log the event for audit and idempotency
-    try:
-        webhook_event = WebhookEvent(
-            provider="stripe",
-            event_type=event.type,
-            event_id=event.id,
-            payload=event.data,
-            signature=stripe_signature[:100] if stripe_signature else None,  # Truncate for storage
-            status="received",
-        )
-        db.add(webhook_event)
-        db.commit()
-        db.refresh(webhook_event)
-    except IntegrityError:
-        db.rollback()
-        # Duplicate event - already processed
-        logger.info("stripe_webhook_duplicate", event_id=event.id, event_type=event.type)
-        return {"received": True, "event_type": event.type, "status": "duplicate"}
-
-    logger.info(
-        "stripe_webhook_received",
-        event_id=event.id,
-        event_type=event.type,
-        webhook_event_id=webhook_event.id,
+    return await _accept_event(
+        background_tasks, "stripe", event.type, event.id, event.data, stripe_signature
     )
 
-    # Route to appropriate Celery tasks
-    try:
-        await _route_stripe_event(db, webhook_event, event)
-        webhook_event.status = "delivered"
-        webhook_event.processed_at = datetime.utcnow()
-    except Exception as e:
-        logger.error(
-            "stripe_webhook_routing_failed",
-            event_id=event.id,
-            error=str(e),
-        )
-        webhook_event.status = "failed"
-        webhook_event.error_message = str(e)
-
-    db.commit()
-    return {"received": True, "event_type": event.type, "event_id": webhook_event.id}
-
-
-async def _route_stripe_event(db: Session, webhook_event: WebhookEvent, event):
-    """Route Stripe event to appropriate services via Celery."""
-    from src.core.celery_app import app as celery_app
-
-    event_type = event.type
-    event_data = event.data
-
-    # Determine which services need this event
-    routes = []
-
-    if event_type == "checkout.session.completed":
-        # InkPass: Update subscription state
-        routes.append(("inkpass", "mimic.tasks.route_to_inkpass_subscription_created"))
 
-    elif event_type == "customer.subscription.deleted":
-        # InkPass: Update subscription state
-        routes.append(("inkpass", "mimic.tasks.route_to_inkpass_subscription_deleted"))
-
-    elif event_type == "customer.subscription.updated":
-        # InkPass: Update subscription state
-        routes.append(("inkpass", "mimic.tasks.route_to_inkpass_subscription_updated"))
-
-    elif event_type in ["invoice.payment_failed", "invoice.payment_succeeded"]:
-        # InkPass: Update billing state
-        routes.append(("inkpass", "mimic.tasks.route_to_inkpass_invoice_event"))
-
-    else:
-        logger.info("stripe_event_ignored", event_type=event_type)
-        return
-
-    # Create delivery records and dispatch Celery tasks
-    for target_service, task_name in routes:
-        delivery = WebhookDelivery(
-            event_id=webhook_event.id,
-            target_service=target_service,
-            task_name=task_name,
-            status="pending",
-        )
-        db.add(delivery)
-        db.flush()
-
-        # Dispatch Celery task
-        task = celery_app.send_task(
-            task_name,
-            kwargs={
-                "event_type": event_type,
-                "event_data": event_data,
-                "webhook_event_id": webhook_event.id,
-                "delivery_id": delivery.id,
-            },
-        )
-
-        delivery.celery_task_id = task.id
-        delivery.status = "dispatched"
-        delivery.attempt_count = 1
-        delivery.last_attempt_at = datetime.utcnow()
+async def _accept_event(
+    background_tasks: BackgroundTasks,
+    provider: str,
+    event_type: str,
+    event_id: str,
+    payload: dict,
+    signature: Optional[str],
+) -> dict:
+    """Store the event (idempotently) and acknowledge; dispatch happens after the response."""
+    webhook_event_id, created = await persist_webhook_event(
+        provider, event_type, event_id, payload, signature
+    )
+    if not created:
+        logger.info(f"{provider}_webhook_duplicate", event_id=event_id, event_type=event_type)
+        return {"received": True, "event_type": event_type, "status": "duplicate"}
 
-        logger.info(
-            "stripe_event_routed",
-            target_service=target_service,
-            task_name=task_name,
-            celery_task_id=task.id,
-        )
+    logger.info(
+        f"{provider}_webhook_received",
+        event_id=event_id,
+        event_type=event_type,
+        webhook_event_id=webhook_event_id,
+    )
+    background_tasks.add_task(request_dispatch)
+    return {"received": True, "event_type": event_type, "event_id": webhook_event_id}
 
 
 # ============================================================================
@@ -203,6 +123,7 @@ async def _route_stripe_event(db: Session, webhook_event: WebhookEvent, event):
 )
 async def resend_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     svix_id: Optional[str] = Header(None, alias="svix-id"),
     svix_timestamp: Optional[str] = Header(None, alias="svix-timestamp"),
     svix_signature: Optional[str] = Header(None, alias="svix-signature"),
@@ -211,9 +132,9 @@ async def resend_webhook(
     Handle Resend webhook events.
 
     Resend uses Svix for webhook delivery with signature verification.
+    Events are stored and acknowledged like Stripe's.
     """
     payload = await request.json()
-    db: Session = next(get_db())
 
     # TODO: Implement Svix signature verification when RESEND_WEBHOOK_SECRET is set
     # For now, we'll accept the webhook without verification in dev mode
@@ -225,93 +146,12 @@ async def resend_webhook(
         pass
 
     event_type = payload.get("type", "unknown")
-    event_id = payload.get("data", {}).get("email_id", str(datetime.utcnow().timestamp()))
+    # svix-id identifies the message across redeliveries; the email_id is
+    # shared by all of an email's events and only orders them
+    event_id = svix_id or str(datetime.utcnow().timestamp())
 
-    # Log the event
-    try:
-        webhook_event = WebhookEvent(
-            provider="resend",
-            event_type=event_type,
-            event_id=event_id,
-            payload=payload,
-            signature=svix_signature[:100] if svix_signature else None,
-            status="received",
-        )
-        db.add(webhook_event)
-        db.commit()
-        db.refresh(webhook_event)
-    except IntegrityError:
-        db.rollback()
-        logger.info("resend_webhook_duplicate", event_id=event_id, event_type=event_type)
-        return {"received": True, "event_type": event_type, "status": "duplicate"}
-
-    logger.info(
-        "resend_webhook_received",
-        event_type=event_type,
-        event_id=event_id,
-        webhook_event_id=webhook_event.id,
-    )
-
-    # Route internally to Mimic for delivery tracking
-    try:
-        await _route_resend_event(db, webhook_event, payload)
-        webhook_event.status = "delivered"
-        webhook_event.processed_at = datetime.utcnow()
-    except Exception as e:
-        logger.error(
-            "resend_webhook_routing_failed",
-            event_id=event_id,
-            error=str(e),
-        )
-        webhook_event.status = "failed"
-        webhook_event.error_message = str(e)
-
-    db.commit()
-    return {"received": True, "event_type": event_type, "event_id": webhook_event.id}
-
-
-async def _route_resend_event(db: Session, webhook_event: WebhookEvent, payload: dict):
-    """Route Resend event to internal Mimic handler via Celery."""
-    from src.core.celery_app import app as celery_app
-
-    event_type = payload.get("type", "unknown")
-
-    # Resend events handled internally by Mimic
-    if event_type in ["email.delivered", "email.bounced", "email.complained", "email.opened"]:
-        task_name = "mimic.tasks.handle_email_delivery_event"
-    else:
-        logger.info("resend_event_ignored", event_type=event_type)
-        return
-
-    delivery = WebhookDelivery(
-        event_id=webhook_event.id,
-        target_service="mimic",
-        task_name=task_name,
-        status="pending",
-    )
-    db.add(delivery)
-    db.flush()
-
-    task = celery_app.send_task(
-        task_name,
-        kwargs={
-            "event_type": event_type,
-            "payload": payload,
-            "webhook_event_id": webhook_event.id,
-            "delivery_id": delivery.id,
-        },
-    )
-
-    delivery.celery_task_id = task.id
-    delivery.status = "dispatched"
-    delivery.attempt_count = 1
-    delivery.last_attempt_at = datetime.utcnow()
-
-    logger.info(
-        "resend_event_routed",
-        target_service="mimic",
-        task_name=task_name,
-        celery_task_id=task.id,
+    return await _accept_event(
+        background_tasks, "resend", event_type, event_id, payload, svix_signature
     )
 
 
@@ -334,6 +174,7 @@ async def _route_resend_event(db: Session, webhook_event: WebhookEvent, payload:
 )
 async def stripe_webhook_test(
     request: Request,
+    background_tasks: BackgroundTasks,
 ):
     """
     Test endpoint for simulating Stripe webhooks without signature verification.
@@ -350,62 +191,18 @@ async def stripe_webhook_test(
         )
 
     payload = await request.json()
-    db: Session = next(get_db())
 
-    event_type = payload.get("type")
     event_id = payload.get("data", {}).get("object", {}).get("id", str(datetime.utcnow().timestamp()))
 
-    # Create a mock event object
-    class MockEvent:
-        def __init__(self, payload):
-            self.id = f"evt_test_{event_id}"
-            self.type = payload.get("type")
-            self.data = payload.get("data", {})
-
-    event = MockEvent(payload)
-
-    # Log the event
-    try:
-        webhook_event = WebhookEvent(
-            provider="stripe",
-            event_type=event.type,
-            event_id=event.id,
-            payload=event.data,
-            signature="test_signature",
-            status="received",
-        )
-        db.add(webhook_event)
-        db.commit()
-        db.refresh(webhook_event)
-    except IntegrityError:
-        db.rollback()
-        logger.info("stripe_test_webhook_duplicate", event_id=event.id)
-        return {"received": True, "event_type": event.type, "status": "duplicate"}
-
-    logger.info(
-        "stripe_test_webhook_received",
-        event_id=event.id,
-        event_type=event.type,
-        webhook_event_id=webhook_event.id,
+    return await _accept_event(
+        background_tasks,
+        "stripe",
+        payload.get("type"),
+        f"evt_test_{event_id}",
+        payload.get("data", {}),
+        "test_signature",
     )
 
-    # Route to Celery tasks
-    try:
-        await _route_stripe_event(db, webhook_event, event)
-        webhook_event.status = "delivered"
-        webhook_event.processed_at = datetime.utcnow()
-    except Exception as e:
-        logger.error(
-            "stripe_test_webhook_routing_failed",
-            event_id=event.id,
-            error=str(e),
-        )
-        webhook_event.status = "failed"
-        webhook_event.error_message = str(e)
-
-    db.commit()
-    return {"received": True, "event_type": event.type, "event_id": webhook_event.id}
-
 
 # ============================================================================
 # Admin Endpoints
@@ -33,23 +33,22 @@ Credentials are never returned in plaintext after creation.
 """
 
 from datetime import datetime, timezone
-import hashlib
-import hmac
 import json
 import os
 import secrets
-from typing import Annotated, Any, Optional, List
+from typing import Annotated, Any, Awaitable, Callable, Optional, List
 import uuid
 
-import redis
 import structlog
-from jinja2 import Environment, BaseLoader, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session, joinedload
 
 from src.api.auth import AuthContext, require_permission
+from src.clients.provider_transport import provider_client
+from src.config import settings
 from src.database.database import get_db
 from src.database.models import (
     CredentialType,
@@ -67,9 +66,22 @@ from src.database.models import (
     IntegrationWebhookEventStatus,
     OutboundActionType,
 )
+from src.services.action_rate_limiter import (
+    ActionLimitResult,
+    Bucket,
+    action_buckets,
+    get_action_rate_limiter,
+    provider_backoff,
+)
 from src.services.key_encryption import KeyEncryptionService
 from src.services.provider_validator import ProviderValidatorService
 from src.services.discord_interaction_service import DiscordInteractionService
+from src.services.webhook_pipeline import (
+    CompiledWebhook,
+    TemplateBudgetExceeded,
+    render_template,
+    webhook_pipelines,
+)
 
 
 def get_route_integration_event_task():
@@ -743,6 +755,7 @@ async def update_integration(
         integration.status = data.status
 
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
     db.refresh(integration)
 
     logger.info(
@@ -771,6 +784,7 @@ async def delete_integration(
     # Soft delete
     integration.deleted_at = datetime.utcnow()
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
 
     logger.info(
         "integration_deleted",
@@ -820,6 +834,7 @@ async def create_credential(
 
     db.add(credential)
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
     db.refresh(credential)
 
     logger.info(
@@ -885,6 +900,7 @@ async def update_credential(
         credential.expires_at = data.expires_at
 
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
     db.refresh(credential)
 
     logger.info(
@@ -917,6 +933,7 @@ async def delete_credential(
 
     db.delete(credential)
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
 
     logger.info(
         "credential_deleted",
@@ -1182,6 +1199,7 @@ async def set_inbound_config(
         )
 
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
     db.refresh(config)
 
     return _inbound_config_to_response(config)
@@ -1235,6 +1253,7 @@ async def delete_inbound_config(
     webhook_path = config.webhook_path
     db.delete(config)
     db.commit()
+    webhook_pipelines.invalidate_integration(integration.id)
 
     logger.info(
         "inbound_config_deleted",
@@ -1494,107 +1513,10 @@ class WebhookErrorResponse(BaseModel):
     message: str
 
 
-def _verify_api_key_auth(
-    inbound_config: IntegrationInboundConfig,
-    api_key_header: Optional[str],
-) -> bool:
-    """Verify X-API-Key authentication."""
-    if not api_key_header:
-        return False
-
-    # Get the expected API key from credentials
-    integration = inbound_config.integration
-    for cred in integration.credentials:
-        if cred.credential_type == CredentialType.api_key:
-            try:
-                decrypted_key = encryption_service.decrypt(cred.encrypted_value)
-                if decrypted_key == api_key_header:
-                    return True
-            except Exception:
-                continue
-    return False
-
-
-def _verify_signature_auth(
-    inbound_config: IntegrationInboundConfig,
-    body: bytes,
-    signature_header: Optional[str],
-    hub_signature_header: Optional[str],
-) -> bool:
-    """
-    Verify HMAC signature authentication.
-
-    Supports both X-Signature and X-Hub-Signature-256 headers.
-    """
-    if not inbound_config.signature_secret:
-        return False
-
-    # Get the signature to verify
-    signature = signature_header or hub_signature_header
-    if not signature:
-        return False
-
-    try:
-        decrypted_secret = encryption_service.decrypt(inbound_config.signature_secret)
-    except Exception:
-        return False
-
-    # Handle GitHub-style signature with "sha256=" prefix
-    expected_prefix = "sha256="
-    if signature.startswith(expected_prefix):
-        signature = signature[len(expected_prefix):]
-
-    # Compute HMAC-SHA256
-    computed = hmac.new(
-        decrypted_secret.encode("utf-8"),
-        body,
-        hashlib.sha256,
-    ).hexdigest()
-
-    # Constant-time comparison
-    return hmac.compare_digest(computed.lower(), signature.lower())
-
-
-def _verify_bearer_auth(
-    inbound_config: IntegrationInboundConfig,
-    authorization_header: Optional[str],
-) -> bool:
-    """Verify Authorization: Bearer token authentication."""
-    if not authorization_header:
-        return False
-
-    # Extract token from "Bearer <token>"
-    if not authorization_header.startswith("Bearer "):
-        return False
-
-    token = authorization_header[7:]  # len("Bearer ") = 7
-
-    # Check against credentials
-    integration = inbound_config.integration
-    for cred in integration.credentials:
-        # Check against oauth_token, bot_token, or api_key
-        if cred.credential_type in [
-            CredentialType.oauth_token,
-            CredentialType.bot_token,
-            CredentialType.api_key,
-        ]:
-            try:
-                decrypted_value = encryption_service.decrypt(cred.encrypted_value)
-                if decrypted_value == token:
-                    return True
-            except Exception:
-                continue
-    return False
-
-
 # =============================================================================
 # Payload Transformation (INT-011)
 # =============================================================================
 
-# Create a sandboxed Jinja2 environment for template rendering
-_jinja_env = Environment(loader=BaseLoader(), autoescape=True)
-
-
 class TransformedPayload(BaseModel):
     """Standard output format for transformed webhook payloads (INT-011)."""
 
@@ -1606,14 +1528,15 @@ class TransformedPayload(BaseModel):
 
 
 def _transform_payload(
-    inbound_config: IntegrationInboundConfig,
+    pipeline: CompiledWebhook,
     raw_payload: dict,
     provider: str,
 ) -> TransformedPayload:
     """
     Transform an incoming webhook payload using Jinja2 template if configured.
 
-    If transform_template is set, applies the Jinja2 transformation.
+    If transform_template is set, applies the precompiled Jinja2 transformation
+    in the sandbox, within the render budget.
     If no template, passes raw payload in data field.
     Transformation errors are logged but don't fail the request.
 
@@ -1625,14 +1548,14 @@ def _transform_payload(
     - data: Transformed or raw payload data
     """
     timestamp = datetime.now(timezone.utc).isoformat()
-    source = inbound_config.webhook_path
+    source = pipeline.webhook_path
 
     # Default values for when no template or template fails
     default_event_type = "webhook"
     default_data = raw_payload
 
     # If no transform_template, return raw payload in standard format
-    if not inbound_config.transform_template:
+    if pipeline.template is None and pipeline.template_error is None:
         logger.debug(
             "webhook_no_transform_template",
             webhook_path=source,
@@ -1648,11 +1571,13 @@ def _transform_payload(
 
     # Apply Jinja2 transformation
     try:
-        template = _jinja_env.from_string(inbound_config.transform_template)
+        if pipeline.template_error is not None:
+            raise TemplateSyntaxError(pipeline.template_error, pipeline.template_error_line)
 
         # Render the template with the raw payload as context
         # The template can access payload fields directly, e.g., {{ action }} or {{ payload.action }}
-        rendered = template.render(
+        rendered = render_template(
+            pipeline.template,
             payload=raw_payload,
             **raw_payload,  # Also expose top-level fields directly
             provider=provider,
@@ -1717,6 +1642,22 @@ def _transform_payload(
             data=default_data,
         )
 
+    except TemplateBudgetExceeded as e:
+        # Runaway templates are cut off; the event still goes through raw
+        logger.error(
+            "webhook_transform_budget_exceeded",
+            webhook_path=source,
+            provider=provider,
+            error=str(e),
+        )
+        return TransformedPayload(
+            event_type=default_event_type,
+            timestamp=timestamp,
+            source=source,
+            provider=provider,
+            data=default_data,
+        )
+
     except json.JSONDecodeError as e:
         # Log JSON parse errors but don't fail the request
         logger.error(
@@ -1751,22 +1692,6 @@ def _transform_payload(
         )
 
 
-def _get_inbound_config_by_webhook_path(
-    db: Session, webhook_path: str
-) -> Optional[IntegrationInboundConfig]:
-    """Look up inbound config by webhook path, including integration for auth."""
-    return (
-        db.query(IntegrationInboundConfig)
-        .options(
-            joinedload(IntegrationInboundConfig.integration).joinedload(
-                Integration.credentials
-            )
-        )
-        .filter(IntegrationInboundConfig.webhook_path == webhook_path)
-        .first()
-    )
-
-
 @gateway_router.post(
     "/{webhook_path}",
     responses={
@@ -1834,11 +1759,11 @@ async def receive_integration_webhook(
     # Get raw body for signature verification
     body = await request.body()
 
-    # Look up inbound config by webhook_path
-    inbound_config = _get_inbound_config_by_webhook_path(db, webhook_path)
+    # Look up the compiled pipeline (config, verification material, template) by webhook_path
+    pipeline = webhook_pipelines.get_or_compile(db, webhook_path)
 
     # 404: Not found
-    if not inbound_config:
+    if not pipeline:
         logger.warning(
             "webhook_not_found",
             webhook_path=webhook_path,
@@ -1848,14 +1773,12 @@ async def receive_integration_webhook(
             detail={"error": "NotFound", "message": "Webhook not found"},
         )
 
-    integration = inbound_config.integration
-
     # 404: Integration deleted (soft delete)
-    if integration.deleted_at is not None:
+    if pipeline.integration_deleted:
         logger.warning(
             "webhook_integration_deleted",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1863,12 +1786,12 @@ async def receive_integration_webhook(
         )
 
     # 404: Integration not active
-    if integration.status != IntegrationStatus.active:
+    if pipeline.integration_status != IntegrationStatus.active:
         logger.warning(
             "webhook_integration_inactive",
             webhook_path=webhook_path,
-            integration_id=integration.id,
-            status=integration.status.value,
+            integration_id=pipeline.integration_id,
+            status=pipeline.integration_status.value,
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1876,11 +1799,11 @@ async def receive_integration_webhook(
         )
 
     # 404: Inbound config not active
-    if not inbound_config.is_active:
+    if not pipeline.is_active:
         logger.warning(
             "webhook_config_inactive",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1888,7 +1811,7 @@ async def receive_integration_webhook(
         )
 
     # Validate authentication based on auth_method
-    auth_method = inbound_config.auth_method
+    auth_method = pipeline.auth_method
     auth_success = False
 
     if auth_method == InboundAuthMethod.none:
@@ -1897,35 +1820,33 @@ async def receive_integration_webhook(
         logger.debug(
             "webhook_auth_none",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
         )
 
     elif auth_method == InboundAuthMethod.api_key:
-        auth_success = _verify_api_key_auth(inbound_config, x_api_key)
+        auth_success = pipeline.verify_api_key(x_api_key)
         logger.debug(
             "webhook_auth_api_key",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
             success=auth_success,
         )
 
     elif auth_method == InboundAuthMethod.signature:
-        auth_success = _verify_signature_auth(
-            inbound_config, body, x_signature, x_hub_signature_256
-        )
+        auth_success = pipeline.verify_signature(body, x_signature, x_hub_signature_256)
         logger.debug(
             "webhook_auth_signature",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
             success=auth_success,
         )
 
     elif auth_method == InboundAuthMethod.bearer:
-        auth_success = _verify_bearer_auth(inbound_config, authorization)
+        auth_success = pipeline.verify_bearer(authorization)
         logger.debug(
             "webhook_auth_bearer",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
             success=auth_success,
         )
 
@@ -1933,13 +1854,12 @@ async def receive_integration_webhook(
         # Ed25519 verification (Discord interactions)
         if not x_signature_ed25519 or not x_signature_timestamp:
             auth_success = False
-        elif not inbound_config.signature_secret:
+        elif not pipeline.ed25519_public_key:
             auth_success = False
         else:
             try:
-                public_key_hex = encryption_service.decrypt(inbound_config.signature_secret)
                 auth_success = discord_interaction_service.verify_signature(
-                    public_key_hex=public_key_hex,
+                    public_key_hex=pipeline.ed25519_public_key,
                     signature_hex=x_signature_ed25519,
                     timestamp=x_signature_timestamp,
                     body=body,
@@ -1949,7 +1869,7 @@ async def receive_integration_webhook(
         logger.debug(
             "webhook_auth_ed25519",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
             success=auth_success,
         )
 
@@ -1958,7 +1878,7 @@ async def receive_integration_webhook(
         logger.warning(
             "webhook_auth_failed",
             webhook_path=webhook_path,
-            integration_id=integration.id,
+            integration_id=pipeline.integration_id,
             auth_method=auth_method.value,
         )
         raise HTTPException(
@@ -1977,7 +1897,7 @@ async def receive_integration_webhook(
             logger.info(
                 "discord_ping_pong",
                 webhook_path=webhook_path,
-                integration_id=integration.id,
+                integration_id=pipeline.integration_id,
             )
             return JSONResponse(content=discord_interaction_service.pong_response())
         if discord_interaction_service.is_interaction(ping_payload):
@@ -1985,7 +1905,7 @@ async def receive_integration_webhook(
             logger.info(
                 "discord_interaction_deferred",
                 webhook_path=webhook_path,
-                integration_id=integration.id,
+                integration_id=pipeline.integration_id,
                 interaction_type=ping_payload.get("type"),
             )
 
@@ -1998,9 +1918,9 @@ async def receive_integration_webhook(
 
     # Apply payload transformation (INT-011)
     transformed = _transform_payload(
-        inbound_config=inbound_config,
+        pipeline=pipeline,
         raw_payload=raw_payload,
-        provider=integration.provider.value,
+        provider=pipeline.provider,
     )
 
     # =========================================================================
@@ -2010,10 +1930,10 @@ async def receive_integration_webhook(
     # Create webhook event record
     webhook_event = IntegrationWebhookEvent(
         id=str(uuid.uuid4()),
-        integration_id=integration.id,
-        organization_id=integration.organization_id,
+        integration_id=pipeline.integration_id,
+        organization_id=pipeline.organization_id,
         webhook_path=webhook_path,
-        provider=integration.provider.value,
+        provider=pipeline.provider,
         event_type=transformed.event_type,
         raw_payload=raw_payload,
         transformed_payload={
@@ -2023,8 +1943,8 @@ async def receive_integration_webhook(
             "provider": transformed.provider,
             "data": transformed.data,
         },
-        destination_service=inbound_config.destination_service.value,
-        destination_config=inbound_config.destination_config,
+        destination_service=pipeline.destination_service,
+        destination_config=pipeline.destination_config,
         status=IntegrationWebhookEventStatus.received,
     )
     db.add(webhook_event)
@@ -2035,7 +1955,7 @@ async def receive_integration_webhook(
     webhook_delivery = IntegrationWebhookDelivery(
         id=str(uuid.uuid4()),
         event_id=webhook_event.id,
-        destination_service=inbound_config.destination_service.value,
+        destination_service=pipeline.destination_service,
         status="pending",
     )
     db.add(webhook_delivery)
@@ -2047,11 +1967,11 @@ async def receive_integration_webhook(
     celery_task = route_integration_event.delay(
         event_id=webhook_event.id,
         delivery_id=webhook_delivery.id,
-        destination_service=inbound_config.destination_service.value,
-        destination_config=inbound_config.destination_config or {},
+        destination_service=pipeline.destination_service,
+        destination_config=pipeline.destination_config or {},
         transformed_payload=webhook_event.transformed_payload,
-        integration_id=integration.id,
-        organization_id=integration.organization_id,
+        integration_id=pipeline.integration_id,
+        organization_id=pipeline.organization_id,
     )
 
     # Update delivery with Celery task ID
@@ -2061,15 +1981,15 @@ async def receive_integration_webhook(
     logger.info(
         "webhook_received_routing_triggered",
         webhook_path=webhook_path,
-        integration_id=integration.id,
-        provider=integration.provider.value,
+        integration_id=pipeline.integration_id,
+        provider=pipeline.provider,
         auth_method=auth_method.value,
         body_size=len(body),
         event_type=transformed.event_type,
         webhook_event_id=webhook_event.id,
         delivery_id=webhook_delivery.id,
         celery_task_id=celery_task.id,
-        destination_service=inbound_config.destination_service.value,
+        destination_service=pipeline.destination_service,
     )
 
     # Discord interactions: return deferred response (type 5) so Discord shows "thinking..."
@@ -2080,8 +2000,8 @@ async def receive_integration_webhook(
     return WebhookResponse(
         received=True,
         webhook_path=webhook_path,
-        integration_id=integration.id,
-        provider=integration.provider.value,
+        integration_id=pipeline.integration_id,
+        provider=pipeline.provider,
         message="Webhook received and routing triggered",
         # Transformed payload fields (INT-011)
         event_type=transformed.event_type,
@@ -2218,6 +2138,11 @@ class ActionExecuteRequest(BaseModel):
         default=False,
         description="Execute asynchronously via Celery and return job ID"
     )
+    defer_if_rate_limited: bool = Field(
+        default=False,
+        description="When rate limited, queue the action for the next free slot "
+                    "instead of returning 429"
+    )
 
 
 class ActionExecuteResponse(BaseModel):
@@ -2247,55 +2172,39 @@ def get_execute_integration_action_task():
     return execute_integration_action
 
 
-def _check_rate_limit(
+async def _check_rate_limit(
     integration_id: str,
-    outbound_config: IntegrationOutboundConfig,
-) -> tuple[bool, int]:
+    buckets: List[Bucket],
+    max_delay: float = 0,
+) -> ActionLimitResult:
     """
-    Check if rate limit is exceeded for an integration's outbound actions.
+    Take a slot for an outbound action in all of its rate limit buckets.
 
-    Returns:
-        tuple: (is_allowed: bool, retry_after_seconds: int)
+    With ``max_delay`` the earliest slot within that many seconds is reserved
+    rather than rejecting; ``result.delay`` then says how long to wait.
     """
-    if not outbound_config.rate_limit_requests or not outbound_config.rate_limit_window_seconds:
-        # No rate limit configured
-        return True, 0
-
-    from src.config import settings
-
-    try:
-        r = redis.from_url(settings.REDIS_URL)
-        rate_limit_key = f"rate_limit:integration:{integration_id}:actions"
-
-        # Get current count
-        current_count = r.get(rate_limit_key)
-        if current_count is None:
-            # First request in this window
-            r.setex(
-                rate_limit_key,
-                outbound_config.rate_limit_window_seconds,
-                1
-            )
-            return True, 0
-
-        current_count = int(current_count)
-        if current_count >= outbound_config.rate_limit_requests:
-            # Rate limit exceeded
-            ttl = r.ttl(rate_limit_key)
-            return False, ttl if ttl > 0 else outbound_config.rate_limit_window_seconds
-
-        # Increment counter
-        r.incr(rate_limit_key)
-        return True, 0
-
-    except Exception as e:
-        # If Redis fails, log but allow the request (fail open for availability)
-        logger.warning(
-            "rate_limit_check_failed",
+    result = await get_action_rate_limiter().acquire(buckets, max_delay=max_delay)
+    if result.delay > 0:
+        logger.info(
+            "action_rate_limited",
             integration_id=integration_id,
-            error=str(e),
+            bucket=result.bucket.key if result.bucket else None,
+            delay=result.delay,
+            deferred=result.allowed,
         )
-        return True, 0
+    return result
+
+
+def _rate_limit_exceeded(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail={
+            "error": "RateLimitExceeded",
+            "message": f"Rate limit exceeded. Retry after {retry_after} seconds.",
+            "retry_after_seconds": retry_after,
+        },
+        headers={"Retry-After": str(retry_after)},
+    )
 
 
 def _merge_action_params(
@@ -2358,7 +2267,10 @@ def _merge_action_params(
     **Rate Limiting:**
     If rate_limit_requests and rate_limit_window_seconds are configured on the
     outbound config, requests exceeding the limit will receive a 429 response
-    with retry_after_seconds.
+    with retry_after_seconds. Discord and Slack actions are also held to the
+    provider's per-webhook, per-channel and global limits, and back off as long
+    as the provider asks. With defer_if_rate_limited=true a rate limited action
+    is queued for the next free slot instead of being rejected.
     """,
 )
 async def execute_action(
@@ -2412,35 +2324,11 @@ async def execute_action(
                    f"'{outbound_config.action_type.value}' for this integration",
         )
 
-    # Check rate limit
-    is_allowed, retry_after = _check_rate_limit(integration_id, outbound_config)
-    if not is_allowed:
-        logger.warning(
-            "action_rate_limit_exceeded",
-            integration_id=integration_id,
-            action_type=action_type,
-            retry_after=retry_after,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "error": "RateLimitExceeded",
-                "message": f"Rate limit exceeded. Retry after {retry_after} seconds.",
-                "retry_after_seconds": retry_after,
-            },
-        )
-
     # Merge request params with default template
-    request_params = data.model_dump(exclude_none=True, exclude={"async_execution"})
-    merged_params = _merge_action_params(request_params, outbound_config.default_template)
-
-    logger.info(
-        "executing_action",
-        integration_id=integration_id,
-        action_type=action_type,
-        provider=integration.provider.value,
-        async_execution=data.async_execution,
+    request_params = data.model_dump(
+        exclude_none=True, exclude={"async_execution", "defer_if_rate_limited"}
     )
+    merged_params = _merge_action_params(request_params, outbound_config.default_template)
 
     # Get the appropriate credential for this action
     # For webhook-based providers (Discord, Slack), we need the webhook_url
@@ -2461,11 +2349,43 @@ async def execute_action(
                 continue
             api_token = encryption_service.decrypt(cred.encrypted_value)
 
+    # Check rate limits: the configured one plus the provider's own buckets
+    buckets = action_buckets(
+        integration_id,
+        integration.provider.value,
+        merged_params,
+        webhook_url=webhook_url,
+        rate_limit_requests=outbound_config.rate_limit_requests,
+        rate_limit_window_seconds=outbound_config.rate_limit_window_seconds,
+    )
+    max_delay = settings.ACTION_RATE_LIMIT_MAX_DEFER_SECONDS if data.defer_if_rate_limited else 0
+    limit = await _check_rate_limit(integration_id, buckets, max_delay=max_delay)
+    if not limit.allowed:
+        logger.warning(
+            "action_rate_limit_exceeded",
+            integration_id=integration_id,
+            action_type=action_type,
+            retry_after=limit.retry_after_seconds,
+        )
+        raise _rate_limit_exceeded(limit.retry_after_seconds)
+
+    # A slot reserved in the future can only be used through the queue
+    deferred = limit.delay > 0
+
+    logger.info(
+        "executing_action",
+        integration_id=integration_id,
+        action_type=action_type,
+        provider=integration.provider.value,
+        async_execution=data.async_execution,
+        deferred=deferred,
+    )
+
     # Execute synchronously or asynchronously
-    if data.async_execution:
+    if data.async_execution or deferred:
         # Queue for async execution
         execute_task = get_execute_integration_action_task()
-        celery_task = execute_task.delay(
+        task_kwargs = dict(
             integration_id=integration_id,
             organization_id=auth.organization_id,
             action_type=action_type,
@@ -2474,13 +2394,22 @@ async def execute_action(
             webhook_url=webhook_url,
             api_token=api_token,
             credential_metadata=credential_metadata,  # INT-016: Pass metadata for custom headers
+            rate_limit_requests=outbound_config.rate_limit_requests,
+            rate_limit_window_seconds=outbound_config.rate_limit_window_seconds,
         )
+        if deferred:
+            celery_task = execute_task.apply_async(kwargs=task_kwargs, countdown=limit.delay)
+            message = f"Rate limited; action queued to run in {limit.retry_after_seconds} seconds"
+        else:
+            celery_task = execute_task.delay(**task_kwargs)
+            message = "Action queued for async execution"
 
         logger.info(
             "action_queued",
             integration_id=integration_id,
             action_type=action_type,
             job_id=celery_task.id,
+            countdown=limit.delay,
         )
 
         return ActionExecuteResponse(
@@ -2488,10 +2417,13 @@ async def execute_action(
             integration_id=integration_id,
             action_type=action_type,
             job_id=celery_task.id,
-            message="Action queued for async execution",
+            message=message,
         )
     else:
         # Execute synchronously
+        async def observe_provider_limits(response) -> None:
+            await get_action_rate_limiter().observe(buckets, response.status_code, response.headers)
+
         try:
             result = await _execute_action_sync(
                 provider=integration.provider.value,
@@ -2500,6 +2432,7 @@ async def execute_action(
                 webhook_url=webhook_url,
                 api_token=api_token,
                 credential_metadata=credential_metadata,  # INT-016: Pass metadata for custom headers
+                on_response=observe_provider_limits,
             )
 
             logger.info(
@@ -2524,6 +2457,11 @@ async def execute_action(
                 action_type=action_type,
                 error=str(e),
             )
+            provider_response = getattr(e, "response", None)
+            if getattr(provider_response, "status_code", None) == 429:
+                # The provider's Retry-After has already been applied to our buckets
+                retry_after, _ = provider_backoff(429, provider_response.headers)
+                raise _rate_limit_exceeded(max(1, int(retry_after + 0.999)))
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Action execution failed: {str(e)}",
@@ -2644,6 +2582,7 @@ async def _execute_discord_action(
     webhook_url: Optional[str],
     action_type: str,
     params: dict,
+    on_response: Optional[Callable[[Any], Awaitable[None]]] = None,
 ) -> dict:
     """
     Execute Discord-specific outbound actions (INT-014).
@@ -2655,8 +2594,6 @@ async def _execute_discord_action(
     Uses webhook_url credential, validates Discord character limits,
     returns Discord message ID on success.
     """
-    import httpx
-
     if not webhook_url:
         raise ValueError("Discord actions require a webhook_url credential")
 
@@ -2692,12 +2629,14 @@ async def _execute_discord_action(
             else:
                 request_url = f"{request_url}?thread_id={params['thread_id']}"
 
-        async with httpx.AsyncClient() as client:
+        async with provider_client("discord", action_type) as client:
             response = await client.post(
                 request_url,
                 json=payload,
                 timeout=10.0,
             )
+            if on_response:
+                await on_response(response)
             response.raise_for_status()
 
             # Parse response to get message ID
@@ -2819,12 +2758,14 @@ async def _execute_discord_action(
             else:
                 request_url = f"{request_url}?thread_id={params['thread_id']}"
 
-        async with httpx.AsyncClient() as client:
+        async with provider_client("discord", action_type) as client:
             response = await client.post(
                 request_url,
                 json=payload,
                 timeout=10.0,
             )
+            if on_response:
+                await on_response(response)
             response.raise_for_status()
 
             # Parse response to get message ID
@@ -3061,6 +3002,7 @@ async def _execute_slack_action(
     webhook_url: Optional[str],
     action_type: str,
     params: dict,
+    on_response: Optional[Callable[[Any], Awaitable[None]]] = None,
 ) -> dict:
     """
     Execute Slack-specific outbound actions (INT-015).
@@ -3072,8 +3014,6 @@ async def _execute_slack_action(
     Uses webhook_url credential, validates Slack character limits,
     returns Slack timestamp (ts) on success.
     """
-    import httpx
-
     if not webhook_url:
         raise ValueError("Slack actions require a webhook_url credential")
 
@@ -3116,12 +3056,14 @@ async def _execute_slack_action(
         if params.get("mrkdwn") is not None:
             payload["mrkdwn"] = params["mrkdwn"]
 
-        async with httpx.AsyncClient() as client:
+        async with provider_client("slack", action_type) as client:
             response = await client.post(
                 webhook_url,
                 json=payload,
                 timeout=10.0,
             )
+            if on_response:
+                await on_response(response)
             response.raise_for_status()
 
             # Parse response to get timestamp
@@ -3186,12 +3128,14 @@ async def _execute_slack_action(
         if params.get("unfurl_media") is not None:
             payload["unfurl_media"] = params["unfurl_media"]
 
-        async with httpx.AsyncClient() as client:
+        async with provider_client("slack", action_type) as client:
             response = await client.post(
                 webhook_url,
                 json=payload,
                 timeout=10.0,
             )
+            if on_response:
+                await on_response(response)
             response.raise_for_status()
 
             # Parse response
@@ -3226,24 +3170,25 @@ async def _execute_action_sync(
     webhook_url: Optional[str] = None,
     api_token: Optional[str] = None,
     credential_metadata: Optional[dict] = None,
+    on_response: Optional[Callable[[Any], Awaitable[None]]] = None,
 ) -> dict:
     """
     Execute an action synchronously.
 
     Routes to provider-specific implementation based on provider and action_type.
+    Discord and Slack responses are passed to ``on_response`` (before status
+    checks) so their rate limit headers can be observed.
 
     INT-016: For custom_webhook provider, credential_metadata can contain custom headers
     that are merged with headers from params (params headers take precedence).
     """
-    import httpx
-
     # Discord actions (INT-014)
     if provider == "discord":
-        return await _execute_discord_action(webhook_url, action_type, params)
+        return await _execute_discord_action(webhook_url, action_type, params, on_response)
 
     # Slack actions (INT-015)
     elif provider == "slack":
-        return await _execute_slack_action(webhook_url, action_type, params)
+        return await _execute_slack_action(webhook_url, action_type, params, on_response)
 
     # GitHub actions (INT-014 will fully implement)
     elif provider == "github":
@@ -3267,7 +3212,7 @@ async def _execute_action_sync(
             if params.get("labels"):
                 issue_payload["labels"] = params["labels"]
 
-            async with httpx.AsyncClient() as client:
+            async with provider_client(provider, action_type) as client:
                 response = await client.post(
                     f"https://api.github.com/repos/{repo}/issues",
                     json=issue_payload,
@@ -3284,7 +3229,7 @@ async def _execute_action_sync(
             if not repo or not issue_number or not body:
                 raise ValueError("post_comment requires 'repo', 'issue_number', and 'body' parameters")
 
-            async with httpx.AsyncClient() as client:
+            async with provider_client(provider, action_type) as client:
                 response = await client.post(
                     f"https://api.github.com/repos/{repo}/issues/{issue_number}/comments",
                     json={"body": body},
@@ -3311,7 +3256,7 @@ async def _execute_action_sync(
             if len(content) > 280:
                 raise ValueError(f"Tweet exceeds 280 character limit ({len(content)} chars)")
 
-            async with httpx.AsyncClient() as client:
+            async with provider_client(provider, action_type) as client:
                 response = await client.post(
                     "https://api.x.com/2/tweets",
                     json={"text": content},
@@ -3343,7 +3288,7 @@ async def _execute_action_sync(
 
         payload = params.get("payload", {})
 
-        async with httpx.AsyncClient() as client:
+        async with provider_client(provider, action_type) as client:
             if action_type == "post":
                 response = await client.post(
                     target_url,
@@ -327,7 +327,7 @@ async def send_with_template(
 
     # Look up template
     try:
-        template = template_service.get_template(
+        template = template_service.get_compiled(
             name=request.template_name,
             organization_id=auth.organization_id,
         )
@@ -7,7 +7,7 @@ from typing import Annotated, Optional
 from src.database.database import get_db
 from src.database.models import DeliveryLog
 from src.api.auth import require_permission, AuthContext
-import httpx
+from src.clients.provider_transport import provider_client
 import structlog
 
 router = APIRouter()
@@ -30,7 +30,7 @@ async def send_webhook_callback(webhook_url: str, payload: dict, max_retries: in
     """Send webhook callback with retry logic"""
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with provider_client("webhook_callback", "delivery_status", timeout=10.0) as client:
                 response = await client.post(webhook_url, json=payload)
                 if response.status_code < 400:
                     logger.info("Webhook callback sent successfully", webhook_url=webhook_url, attempt=attempt+1)
@@ -7,7 +7,7 @@ from typing import Annotated, Optional, Dict, Any
 from src.database.database import get_db
 from src.database.models import Workflow, User
 from src.api.auth import require_permission, AuthContext
-from src.services.workflow_compiler import WorkflowCompiler
+from src.services.workflow_compiler import WorkflowCompiler, WorkflowCompileError
 from src.clients.tentacle_client import TentacleClient
 from src.middleware.subscription_check import check_subscription
 from fastapi import HTTPException, status
@@ -240,7 +240,16 @@ async def trigger_workflow(
         )
     
     # Compile workflow to Tentacle spec
-    tentacle_spec = workflow_compiler.compile(workflow.definition_json)
+    try:
+        tentacle_spec = workflow_compiler.compile(
+            workflow.definition_json,
+            version_key=f"{workflow.id}:{workflow.version}",
+        )
+    except WorkflowCompileError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     # Trigger workflow in Tentacle
     try:
@@ -0,0 +1,295 @@
+"""
+Shared, instrumented HTTP transports for outbound provider calls.
+
+Every provider (Discord, Slack, Postmark, Resend, Tentacle, ...) gets one
+keep-alive connection pool for the process, so a burst of deliveries reuses
+connections instead of paying DNS, TCP and TLS setup per message. HTTP/2 is
+used for providers that support it when the ``h2`` package is installed.
+
+Callers keep the ``async with httpx.AsyncClient(...)`` shape they already
+have, via ``provider_client(provider, action)``: the client is a cheap
+wrapper whose transport routes into the shared pool and is not closed with
+it. Around each request the transport also
+
+- bounds in-flight requests per provider (per host for customer endpoints)
+  with a semaphore;
+- trips a per-host circuit breaker after consecutive connection errors or
+  5xx responses, failing fast with ``CircuitOpenError`` until a trial
+  request succeeds;
+- records latency by provider, action and status class.
+"""
+
+import asyncio
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import structlog
+from prometheus_client import Counter, Histogram
+
+logger = structlog.get_logger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+PROVIDER_REQUEST_SECONDS = Histogram(
+    "mimic_provider_request_duration_seconds",
+    "Time to response headers for outbound provider requests",
+    ["provider", "action", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+PROVIDER_CIRCUIT_REJECTIONS = Counter(
+    "mimic_provider_circuit_rejections_total",
+    "Outbound provider requests failed fast by an open circuit breaker",
+    ["provider"],
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """A provider host is failing; the request was not sent."""
+
+
+@dataclass(frozen=True)
+class ProviderPolicy:
+    # In-flight requests beyond this wait on the semaphore rather than in
+    # httpcore's pool, whose per-request bookkeeping scans every connection
+    max_concurrency: int = 10
+    max_keepalive: int = 10
+    http2: bool = False
+    failure_threshold: int = 5  # consecutive failures that open the circuit
+    reset_timeout: float = 30.0  # seconds before a trial request is let through
+    # Separate pool and concurrency limit per URL host, for providers whose
+    # hosts are unrelated (customer endpoints)
+    per_host: bool = False
+
+
+DEFAULT_POLICY = ProviderPolicy()
+
+PROVIDER_POLICIES: Dict[str, ProviderPolicy] = {
+    "discord": ProviderPolicy(max_concurrency=20, max_keepalive=20, http2=True),
+    "slack": ProviderPolicy(max_concurrency=20, max_keepalive=20, http2=True),
+    "github": ProviderPolicy(max_concurrency=10, http2=True),
+    "twitter": ProviderPolicy(max_concurrency=10, http2=True),
+    "postmark": ProviderPolicy(),
+    "resend": ProviderPolicy(http2=True),
+    "tentacle": ProviderPolicy(max_concurrency=20, max_keepalive=20),
+    # Arbitrary customer endpoints: pools, limits and breakers are per host,
+    # so one slow or failing endpoint does not stall the others
+    "custom_webhook": ProviderPolicy(max_concurrency=20, max_keepalive=20, per_host=True),
+    "webhook_callback": ProviderPolicy(max_concurrency=20, max_keepalive=20, per_host=True),
+}
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: closed -> open -> half-open -> closed."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if this opened the circuit."""
+        self.failures += 1
+        was_closed = self.opened_at is None
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+            return was_closed
+        return False
+
+
+class ProviderPool:
+    """One provider's connection pool, concurrency limit and breakers.
+
+    With ``policy.per_host`` the pool and limit are kept per URL host.
+    """
+
+    def __init__(self, provider: str, policy: ProviderPolicy = DEFAULT_POLICY, **transport_options: Any):
+        self.provider = provider
+        self.policy = policy
+        self.transport_options = transport_options
+        self.http2 = policy.http2 and HTTP2_AVAILABLE
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._connections: Dict[Optional[str], Tuple[httpx.AsyncHTTPTransport, asyncio.Semaphore]] = {}
+        self._closers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def connection(self, host: Optional[str] = None):
+        """Pool and semaphore for *host* on the running loop, recreated if it changed.
+
+        Celery tasks run each action under its own ``asyncio.run``, so a pool
+        is closed when its loop finishes rather than left to the GC.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._connections = {}
+            self._closers = []
+            self._loop = loop
+        key = host if self.policy.per_host else None
+        connection = self._connections.get(key)
+        if connection is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.policy.max_concurrency,
+                    max_keepalive_connections=self.policy.max_keepalive,
+                ),
+                **self.transport_options,
+            )
+            connection = (transport, asyncio.Semaphore(self.policy.max_concurrency))
+            self._connections[key] = connection
+            self._closers.append(loop.create_task(self._close_with_loop(transport)))
+        return connection
+
+    @staticmethod
+    async def _close_with_loop(transport: httpx.AsyncHTTPTransport) -> None:
+        # asyncio.run (and pytest-asyncio) cancel leftover tasks before
+        # closing the loop, while it can still run the close
+        try:
+            await asyncio.Future()
+        except asyncio.CancelledError:
+            await transport.aclose()
+            raise
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.policy.failure_threshold, self.policy.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    def for_action(self, action: str) -> "ProviderTransport":
+        return ProviderTransport(self, action)
+
+    async def aclose(self) -> None:
+        for closer in self._closers:
+            closer.cancel()
+        connections = list(self._connections.values())
+        self._connections = {}
+        self._closers = []
+        for transport, _ in connections:
+            await transport.aclose()
+
+
+class ProviderTransport(httpx.AsyncBaseTransport):
+    """Per-call view of a ``ProviderPool``; closing it leaves the pool open."""
+
+    def __init__(self, pool: ProviderPool, action: str):
+        self.pool = pool
+        self.action = action
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        provider = self.pool.provider
+        host = request.url.host
+        breaker = self.pool.breaker(host)
+        if not breaker.allow():
+            PROVIDER_CIRCUIT_REJECTIONS.labels(provider).inc()
+            raise CircuitOpenError(f"Circuit open for {provider} host {host}", request=request)
+
+        transport, semaphore = self.pool.connection(host)
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await transport.handle_async_request(request)
+            except httpx.TransportError:
+                self._observe(start, "error")
+                self._record_failure(breaker, host)
+                raise
+            except BaseException:
+                # Cancelled or unexpected: let a half-open breaker try again
+                breaker.release_trial()
+                raise
+
+        self._observe(start, f"{response.status_code // 100}xx")
+        if response.status_code >= 500:
+            self._record_failure(breaker, host)
+        else:
+            breaker.record_success()
+        return response
+
+    def _observe(self, start: float, status: str) -> None:
+        PROVIDER_REQUEST_SECONDS.labels(self.pool.provider, self.action, status).observe(
+            time.perf_counter() - start
+        )
+
+    def _record_failure(self, breaker: CircuitBreaker, host: str) -> None:
+        if breaker.record_failure():
+            logger.warning(
+                "provider_circuit_opened",
+                provider=self.pool.provider,
+                host=host,
+                failures=breaker.failures,
+                reset_timeout=breaker.reset_timeout,
+            )
+
+    async def aclose(self) -> None:
+        # The pool outlives the per-call client
+        pass
+
+
+class ProviderTransportRegistry:
+    """Process-wide ``ProviderPool`` per provider."""
+
+    def __init__(self, policies: Optional[Dict[str, ProviderPolicy]] = None):
+        self.policies = PROVIDER_POLICIES if policies is None else policies
+        self._pools: Dict[str, ProviderPool] = {}
+
+    def pool(self, provider: str) -> ProviderPool:
+        pool = self._pools.get(provider)
+        if pool is None:
+            pool = ProviderPool(provider, self.policies.get(provider, DEFAULT_POLICY))
+            self._pools[provider] = pool
+        return pool
+
+    async def aclose(self) -> None:
+        for pool in self._pools.values():
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning("provider_pool_close_failed", provider=pool.provider, error=str(e))
+        self._pools.clear()
+
+    def clear(self) -> None:
+        """Forget all pools and breakers without closing (tests)."""
+        self._pools.clear()
+
+
+provider_transports = ProviderTransportRegistry()
+
+
+def provider_client(provider: str, action: str, **kwargs: Any) -> httpx.AsyncClient:
+    """An ``httpx.AsyncClient`` over the provider's shared pool.
+
+    Use it like a normal client (``async with provider_client(...) as
+    client``); timeouts and other options are per client as before.
+    """
+    return httpx.AsyncClient(transport=provider_transports.pool(provider).for_action(action), **kwargs)
@@ -1,8 +1,8 @@
 """Tentacle integration client"""
 
-import httpx
 from typing import Dict, Any, Optional
 from src.config import settings
+from src.clients.provider_transport import provider_client
 from src.database.models import ProviderKey
 from src.services.key_encryption import KeyEncryptionService
 from src.database.database import SessionLocal
@@ -56,7 +56,7 @@ class TentacleClient:
             }
             
             # Get spec ID first, then use published workflow endpoint for auto-execution
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            async with provider_client("tentacle", "send_notification", timeout=self.timeout, follow_redirects=True) as client:
                 # Get spec by name to get the spec_id
                 spec_response = await client.get(
                     f"{self.base_url}/api/workflow-specs/name/notification_delivery_v1",
@@ -134,7 +134,7 @@ class TentacleClient:
             # Call Tentacle to create workflow run from spec
             # Note: This assumes the workflow spec is already registered in Tentacle
             # For dynamic workflows, you'd need to register the spec first via /api/workflow-specs
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with provider_client("tentacle", "trigger_workflow", timeout=self.timeout) as client:
                 # Use the notification_delivery_v1 spec name (assumes it's registered)
                 response = await client.post(
                     f"{self.base_url}/api/workflow-runs/spec/name/notification_delivery_v1",
@@ -157,7 +157,7 @@ class TentacleClient:
     async def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get workflow execution status from Tentacle"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with provider_client("tentacle", "get_workflow_status", timeout=self.timeout) as client:
                 response = await client.get(
                     f"{self.base_url}/api/workflow-runs/{workflow_id}",
                     headers={
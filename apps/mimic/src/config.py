@@ -31,12 +31,46 @@ class Settings(BaseSettings):
 
     # InkPass Integration (for auth)
     INKPASS_URL: str = os.getenv("INKPASS_URL", "http://localhost:8004")
+    INKPASS_AUTH_CACHE_TTL_SECONDS: int = 300
+    INKPASS_PERMISSION_CACHE_TTL_SECONDS: int = 60
+    INKPASS_NEGATIVE_CACHE_TTL_SECONDS: int = 15
+    INKPASS_AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # Share cached auth results across workers/pods through REDIS_URL
+    INKPASS_AUTH_CACHE_REDIS: bool = os.getenv("INKPASS_AUTH_CACHE_REDIS", "true").lower() == "true"
+    INKPASS_REVOCATION_CHANNEL: str = "inkpass:auth:revocations"
+    # Local API key -> user id lookups done by AuthMiddleware
+    API_KEY_CACHE_TTL_SECONDS: int = 60
+    AUTH_LOOKUP_MAX_WORKERS: int = 4
+
+    # Per-user API rate limits by subscription tier, shared through REDIS_URL
+    RATE_LIMIT_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_FREE_REQUESTS: int = 100
+    RATE_LIMIT_ANNUAL_REQUESTS: int = 1000
+    RATE_LIMIT_REDIS: bool = os.getenv("RATE_LIMIT_REDIS", "true").lower() == "true"
+    # Longest an outbound action may be deferred when it asks to be queued
+    ACTION_RATE_LIMIT_MAX_DEFER_SECONDS: int = 300
 
     # Encryption
     ENCRYPTION_KEY: str = os.getenv(
         "ENCRYPTION_KEY",
         "dev-encryption-key-32-chars-long"
     )
+    # Rotation: extra key versions as "2:secret,3:secret"; ENCRYPTION_KEY is version 1
+    ENCRYPTION_KEYS: str = os.getenv("ENCRYPTION_KEYS", "")
+    # Version used for new ciphertexts (default: newest configured)
+    ENCRYPTION_KEY_VERSION: Optional[int] = None
+    DECRYPTED_SECRET_CACHE_TTL_SECONDS: int = 60
+    DECRYPTED_SECRET_CACHE_MAX_ENTRIES: int = 1024
+
+    # Integration webhook gateway: compiled per-path pipelines and template limits
+    WEBHOOK_PIPELINE_CACHE_TTL_SECONDS: int = 30
+    WEBHOOK_PIPELINE_CACHE_MAX_ENTRIES: int = 1000
+    WEBHOOK_TEMPLATE_BUDGET_MS: int = 50
+    WEBHOOK_TEMPLATE_MAX_OUTPUT_CHARS: int = 1_000_000
+
+    # System (email) templates: compiled templates and name resolution cache
+    SYSTEM_TEMPLATE_CACHE_TTL_SECONDS: int = 30
+    SYSTEM_TEMPLATE_CACHE_MAX_ENTRIES: int = 1000
 
     # Security
     SECRET_KEY: str = os.getenv(
@@ -55,6 +89,17 @@ class Settings(BaseSettings):
 
     # Webhook Gateway
     RESEND_WEBHOOK_SECRET: Optional[str] = os.getenv("RESEND_WEBHOOK_SECRET", None)
+    # Inbound events are stored and acknowledged, then fanned out by the
+    # dispatcher task (Celery beat, plus a nudge after each new event)
+    WEBHOOK_INGEST_MAX_WORKERS: int = 4
+    WEBHOOK_DISPATCH_INTERVAL_SECONDS: int = 10
+    WEBHOOK_DISPATCH_BATCH_SIZE: int = 100
+    WEBHOOK_DISPATCH_MAX_ATTEMPTS: int = 8
+    WEBHOOK_DISPATCH_RETRY_BASE_SECONDS: int = 10
+    WEBHOOK_DISPATCH_RETRY_MAX_SECONDS: int = 3600
+    # A routing task still unfinished after this long (lost worker) stops
+    # holding back later events with its ordering key
+    WEBHOOK_DISPATCH_ORDER_HOLD_SECONDS: int = 300
 
     # Internal Service URLs (for Celery tasks to call)
     INKPASS_INTERNAL_URL: str = os.getenv("INKPASS_INTERNAL_URL", "http://inkpass:8000")
@@ -27,4 +27,12 @@ app.conf.update(
     task_time_limit=300,  # 5 minutes max per task
     task_soft_time_limit=290,
     task_default_queue='mimic',
+    beat_schedule={
+        # Drains stored gateway webhooks, including retries that became due
+        'dispatch-webhook-events': {
+            'task': 'mimic.tasks.dispatch_webhook_events',
+            'schedule': float(settings.WEBHOOK_DISPATCH_INTERVAL_SECONDS),
+            'options': {'expires': settings.WEBHOOK_DISPATCH_INTERVAL_SECONDS},
+        },
+    },
 )
@@ -5,6 +5,8 @@ Routes webhook events from Mimic gateway to downstream services:
 - InkPass: Billing and subscription state
 - Mimic: Email delivery tracking
 - Tentacle/Custom: Integration event routing (INT-012)
+
+It also runs queued outbound integration actions.
 """
 
 import httpx
@@ -33,6 +35,10 @@ def update_delivery_status(db: Session, delivery_id: str, status: str, result: d
         delivery.result = result
         delivery.last_attempt_at = datetime.utcnow()
         db.commit()
+        if delivery.event is not None and delivery.event.ordering_key:
+            # Later events with this key were held back until now
+            from src.services.webhook_dispatcher import request_dispatch
+            request_dispatch()
 
 
 # ============================================================================
@@ -483,3 +489,206 @@ def route_integration_event(
             )
     finally:
         db.close()
+
+
+# ============================================================================
+# Integration Actions
+# ============================================================================
+
+
+@app.task(
+    bind=True,
+    name='mimic.tasks.execute_integration_action',
+    max_retries=3,
+)
+def execute_integration_action(
+    self,
+    integration_id: str,
+    organization_id: str,
+    action_type: str,
+    provider: str,
+    merged_params: dict,
+    webhook_url: str = None,
+    api_token: str = None,
+    credential_metadata: dict = None,
+    rate_limit_requests: int = None,
+    rate_limit_window_seconds: int = None,
+):
+    """Run an outbound integration action queued by the execute route.
+
+    Queued for ``async_execution`` requests, and with a countdown when the
+    route reserved a rate limit slot in the future. Provider responses
+    adapt the action's rate limit buckets, as for synchronous actions. A
+    provider 429 means nothing was done, so the retry reserves the earliest
+    slot the buckets allow (no sooner than the provider's Retry-After) and
+    runs then; other failures are not retried, as the action may have
+    taken effect.
+    """
+    import asyncio
+    import redis.asyncio as aioredis
+    from src.api.routes.integrations import _execute_action_sync
+    from src.services.action_rate_limiter import (
+        ActionRateLimiter,
+        action_buckets,
+        get_action_rate_limiter,
+        provider_backoff,
+    )
+
+    buckets = action_buckets(
+        integration_id,
+        provider,
+        merged_params,
+        webhook_url=webhook_url,
+        rate_limit_requests=rate_limit_requests,
+        rate_limit_window_seconds=rate_limit_window_seconds,
+    )
+
+    async def run_action():
+        # Redis connections belong to this run's event loop; the in-process
+        # fallback state is shared by the worker's runs
+        redis_client = aioredis.from_url(settings.REDIS_URL) if settings.RATE_LIMIT_REDIS else None
+        limiter = ActionRateLimiter(redis_client, local=get_action_rate_limiter().local)
+
+        async def observe_provider_limits(response) -> None:
+            await limiter.observe(buckets, response.status_code, response.headers)
+
+        try:
+            try:
+                result = await _execute_action_sync(
+                    provider=provider,
+                    action_type=action_type,
+                    params=merged_params,
+                    webhook_url=webhook_url,
+                    api_token=api_token,
+                    credential_metadata=credential_metadata,
+                    on_response=observe_provider_limits,
+                )
+                return result, None, None
+            except Exception as e:
+                provider_response = getattr(e, "response", None)
+                if getattr(provider_response, "status_code", None) != 429:
+                    raise
+                # The 429 has pushed the buckets out; take the retry's slot
+                # now so actions queued meanwhile cannot run ahead of it
+                slot = await limiter.acquire(buckets, max_delay=settings.ACTION_RATE_LIMIT_MAX_DEFER_SECONDS)
+                return None, e, slot
+        finally:
+            if redis_client is not None:
+                await redis_client.aclose()
+
+    try:
+        result, rate_limited, slot = asyncio.run(run_action())
+    except Exception as e:
+        logger.error(
+            "integration_action_failed",
+            integration_id=integration_id,
+            organization_id=organization_id,
+            action_type=action_type,
+            error=str(e),
+        )
+        raise
+
+    if rate_limited is not None:
+        retry_after, _ = provider_backoff(429, rate_limited.response.headers)
+        logger.warning(
+            "integration_action_rate_limited",
+            integration_id=integration_id,
+            action_type=action_type,
+            retry_after=retry_after,
+            slot_delay=slot.delay,
+            retry_count=self.request.retries,
+        )
+        if not slot.allowed:
+            # No slot within the longest deferral; fail as the route would
+            raise rate_limited
+        raise self.retry(exc=rate_limited, countdown=max(retry_after, slot.delay))
+
+    logger.info(
+        "integration_action_executed",
+        integration_id=integration_id,
+        organization_id=organization_id,
+        action_type=action_type,
+    )
+    return result
+
+
+# ============================================================================
+# Gateway Webhook Dispatch
+# ============================================================================
+
+DISPATCH_LOCK_KEY = "mimic:webhook-dispatch"
+DISPATCH_MAX_BATCHES = 20
+
+_dispatch_redis = None
+
+
+def _get_dispatch_redis():
+    """Redis client for the dispatch lock, shared by the tasks of a worker."""
+    global _dispatch_redis
+    if _dispatch_redis is None:
+        import redis
+
+        _dispatch_redis = redis.Redis.from_url(settings.CELERY_BROKER_URL)
+    return _dispatch_redis
+
+
+@app.task(bind=True, name='mimic.tasks.dispatch_webhook_events', ignore_result=True)
+def dispatch_webhook_events(self):
+    """Fan stored gateway webhook events out to their routing tasks.
+
+    Scheduled by beat and requested after each new event. A Redis lock lets
+    only one dispatcher drain at a time, which keeps per-customer order;
+    overlapping runs return straight away.
+    """
+    import redis
+    from src.services.webhook_dispatcher import dispatch_pending_events
+
+    lock = _get_dispatch_redis().lock(
+        DISPATCH_LOCK_KEY, timeout=app.conf.task_time_limit, blocking=False
+    )
+    if not lock.acquire():
+        return None
+
+    db = get_db_session()
+    totals = {}
+    try:
+        for _ in range(DISPATCH_MAX_BATCHES):
+            counts = dispatch_pending_events(db, app.send_task)
+            for outcome, count in counts.items():
+                totals[outcome] = totals.get(outcome, 0) + count
+            fetched = sum(counts.values())
+            # A short batch drained the queue; held-back keys are not fetched again
+            if fetched < settings.WEBHOOK_DISPATCH_BATCH_SIZE:
+                break
+        if any(totals.values()):
+            logger.info("webhook_events_dispatched", **totals)
+        return totals
+    finally:
+        db.close()
+        try:
+            lock.release()
+        except redis.exceptions.LockError:
+            pass  # Expired after task_time_limit; nothing left to release
+
+
+# ============================================================================
+# Maintenance Tasks
+# ============================================================================
+
+
+@app.task(bind=True, name='mimic.tasks.reencrypt_stored_secrets')
+def reencrypt_stored_secrets_task(self, batch_size: int = 500):
+    """Re-encrypt stored secrets under the primary encryption key version.
+
+    Run after adding a key to ENCRYPTION_KEYS; old versions must stay
+    configured until this reports nothing left to rotate.
+    """
+    from src.services.key_encryption import reencrypt_stored_secrets
+
+    db = get_db_session()
+    try:
+        counts = reencrypt_stored_secrets(db, batch_size=batch_size)
+        logger.info("reencrypt_stored_secrets_complete", rotated=counts)
+        return counts
+    finally:
+        db.close()
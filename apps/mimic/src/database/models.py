@@ -1,7 +1,7 @@
 """Database models for Mimic Notification Service"""
 
 import enum
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, Numeric, Enum
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, Numeric, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.database.database import Base
@@ -246,7 +246,9 @@ class WebhookEvent(Base):
     event_id = Column(String(255), nullable=False)  # Provider's event ID
     payload = Column(JSON, nullable=False)  # Raw payload
     signature = Column(String(500), nullable=True)  # For verification audit
-    status = Column(String(20), default="received", index=True)  # received, processing, delivered, failed
+    status = Column(String(20), default="received", index=True)  # received, retrying, delivered, dead_letter
+    ordering_key = Column(String(255), nullable=True)  # Events with the same key are dispatched in order (e.g. Stripe customer)
+    next_attempt_at = Column(DateTime, nullable=True)  # When a retrying event is due
     processed_at = Column(DateTime, nullable=True)
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
@@ -257,6 +259,9 @@ class WebhookEvent(Base):
 
     __table_args__ = (
         # Idempotency: prevent duplicate events from same provider
+        Index("idx_webhook_events_provider_event_id", "provider", "event_id", unique=True),
+        Index("idx_webhook_events_status_created", "status", "created_at"),
+        Index("idx_webhook_events_ordering_key", "ordering_key"),
         {"extend_existing": True},
     )
 
@@ -11,7 +11,10 @@ from src.database.database import engine, Base
 from src.monitoring.sentry_config import init_sentry
 from src.monitoring.metrics import router as metrics_router
 from src.middleware.rate_limiting_middleware import RateLimitingMiddleware
-from src.middleware.auth_middleware import AuthMiddleware
+from src.middleware.auth_middleware import AuthMiddleware, shutdown_auth_executor
+from src.api.auth import start_auth_cache, stop_auth_cache
+from src.clients.provider_transport import provider_transports
+from src.services.webhook_dispatcher import shutdown_ingest_executor
 from src.config import settings
 
 logger = structlog.get_logger()
@@ -27,7 +30,12 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
-# Auth middleware (extracts user_id for rate limiting)
+# Middleware added last runs first: CORS, then auth, then rate limiting.
+
+# Rate limiting middleware (needs the user_id set by AuthMiddleware)
+app.add_middleware(RateLimitingMiddleware)
+
+# Auth middleware (extracts user_id and plan for rate limiting)
 app.add_middleware(AuthMiddleware)
 
 # CORS middleware
@@ -39,9 +47,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Rate limiting middleware
-app.add_middleware(RateLimitingMiddleware)
-
 # Include routers
 app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
 app.include_router(notifications.router, prefix="/api/v1", tags=["notifications"])
@@ -79,9 +84,14 @@ async def startup_event():
     # migrations; in development we can auto-create tables for convenience.
     if settings.APP_ENV != "test":
         Base.metadata.create_all(bind=engine)
+        await start_auth_cache()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown event handler"""
     logger.info("Mimic Notification Service shutting down")
+    await stop_auth_cache()
+    shutdown_auth_executor()
+    shutdown_ingest_executor()
+    await provider_transports.aclose()
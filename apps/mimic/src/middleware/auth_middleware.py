@@ -1,13 +1,22 @@
 """Auth middleware to set user_id in request state"""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from src.api.auth import get_auth_cache
+from src.config import settings
 from src.database.database import SessionLocal
 from src.database.models import User, APIKey
 import structlog
 
 logger = structlog.get_logger()
 
+# Shared, bounded pool for the blocking key lookup; keeps DB latency off the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+
 
 def hash_api_key(key: str) -> str:
     """Hash an API key for storage"""
@@ -15,31 +24,81 @@ def hash_api_key(key: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.AUTH_LOOKUP_MAX_WORKERS,
+            thread_name_prefix="mimic-auth",
+        )
+    return _executor
+
+
+def shutdown_auth_executor() -> None:
+    """Stop the lookup pool (app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def lookup_api_key_user(key_hash: str) -> Optional[dict]:
+    """Resolve a key hash to its user's id and tier with one joined query (blocking)."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(User.id, User.subscription_tier)
+            .join(APIKey, APIKey.user_id == User.id)
+            .filter(APIKey.key_hash == key_hash)
+            .first()
+        )
+        return {"user_id": row[0], "subscription_tier": row[1]} if row else None
+    finally:
+        db.close()
+
+
+async def resolve_api_key_user(api_key: str) -> Optional[dict]:
+    """Resolve an API key to ``{"user_id", "subscription_tier"}``, cached per key hash.
+
+    Unknown keys are cached for the negative TTL; entries are dropped when
+    InkPass publishes a revocation for the key hash.
+    """
+    key_hash = hash_api_key(api_key)
+
+    async def load():
+        loop = asyncio.get_running_loop()
+        user = await loop.run_in_executor(_get_executor(), lookup_api_key_user, key_hash)
+        return user, True
+
+    return await get_auth_cache().get_or_load(
+        api_key, "local_user", load, max_ttl=settings.API_KEY_CACHE_TTL_SECONDS
+    )
+
+
+def _is_local_api_key(token: str) -> bool:
+    """Local API keys are url-safe tokens; JWTs and the service key are handled elsewhere."""
+    if settings.MIMIC_SERVICE_API_KEY and token == settings.MIMIC_SERVICE_API_KEY:
+        return False
+    return token.count(".") != 2
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to extract and set user_id in request state for rate limiting"""
+    """Middleware to set user_id and subscription_tier in request state for rate limiting"""
     
     async def dispatch(self, request: Request, call_next):
         # Try to extract user from Authorization header
         auth_header = request.headers.get("Authorization")
         if auth_header and auth_header.startswith("Bearer "):
-            try:
-                # Extract API key and get user
-                api_key = auth_header.replace("Bearer ", "")
-                key_hash = hash_api_key(api_key)
-                
-                db = SessionLocal()
+            api_key = auth_header.replace("Bearer ", "")
+            if _is_local_api_key(api_key):
                 try:
-                    db_key = db.query(APIKey).filter(APIKey.key_hash == key_hash).first()
-                    if db_key:
-                        user = db.query(User).filter(User.id == db_key.user_id).first()
-                        if user:
-                            request.state.user_id = user.id
-                finally:
-                    db.close()
-            except Exception:
-                # If auth fails, user_id won't be set (rate limiting will be per-IP)
-                pass
+                    user = await resolve_api_key_user(api_key)
+                    if user:
+                        request.state.user_id = user["user_id"]
+                        request.state.subscription_tier = user["subscription_tier"]
+                except Exception as e:
+                    # If auth fails, user_id won't be set (rate limiting will be per-IP)
+                    logger.warning("api_key_resolution_failed", error=str(e))
         
         response = await call_next(request)
         return response
-
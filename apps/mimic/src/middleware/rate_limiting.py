@@ -1,53 +1,192 @@
-"""Rate limiting middleware"""
+"""
+Rate limiting shared across workers and pods.
+
+Uses the generic cell rate algorithm (GCRA): each key stores a single
+"theoretical arrival time" (TAT), so state is O(1) per key whatever the
+limit. A limit of N requests per window admits a burst of N, then one
+request every window/N. The Redis implementation is one Lua script that
+runs atomically and gives the key a TTL equal to its remaining TAT, so
+idle keys expire on their own. When Redis is unavailable the same
+arithmetic runs in-process (per worker) until Redis is retried.
+"""
 
-from fastapi import Request, HTTPException, status
-from typing import Dict
-from datetime import datetime, timedelta
-from collections import defaultdict
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+import structlog
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+REDIS_KEY_PREFIX = "mimic:ratelimit:"
+# After a Redis error the shared limiter is skipped for this long
+REDIS_RETRY_SECONDS = 30
+
+# KEYS[1] = limiter key; ARGV = emission interval (ms), burst tolerance (ms).
+# Uses the Redis clock so every pod agrees on "now". Returns
+# {allowed, remaining, retry_after_ms, reset_after_ms}.
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+
+if tat - now > tolerance then
+    return {0, 0, tat - now - tolerance, tat - now}
+end
+
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', new_tat - now)
+return {1, math.floor((now + tolerance + interval - new_tat) / interval), 0, new_tat - now}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until the next request would be allowed
+    reset_after: float  # seconds until the key is back to a full burst
+
+
+def gcra_params(limit: int, window_seconds: float) -> Tuple[int, int]:
+    """Emission interval and burst tolerance in whole milliseconds."""
+    interval = max(1, round(window_seconds * 1000 / limit))
+    return interval, interval * (limit - 1)
+
+
+class LocalRateLimiter:
+    """In-process GCRA with the same semantics as the Redis script."""
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self._tats: "OrderedDict[str, int]" = OrderedDict()
+
+    def check(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        interval, tolerance = gcra_params(limit, window_seconds)
+        now = int(time.time() * 1000)
+        tat = max(self._tats.get(key, now), now)
+
+        if tat - now > tolerance:
+            return RateLimitResult(False, limit, 0, (tat - now - tolerance) / 1000, (tat - now) / 1000)
+
+        new_tat = tat + interval
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        self._evict(now)
+        remaining = (now + tolerance + interval - new_tat) // interval
+        return RateLimitResult(True, limit, remaining, 0.0, (new_tat - now) / 1000)
+
+    def _evict(self, now: int) -> None:
+        # Least recently updated first: drop keys that are back to a full
+        # burst (their state is equivalent to no state), plus any overflow.
+        while self._tats:
+            key, tat = next(iter(self._tats.items()))
+            if tat > now and len(self._tats) <= self.max_entries:
+                break
+            del self._tats[key]
 
-# Simple in-memory rate limiter (use Redis in production)
-_rate_limits: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    def __len__(self) -> int:
+        return len(self._tats)
 
 
-def check_rate_limit(
+class RateLimiter:
+    """GCRA limiter in Redis, falling back to ``LocalRateLimiter``."""
+
+    def __init__(self, redis_client: Any = None, local: Optional[LocalRateLimiter] = None):
+        self.redis = redis_client
+        self.local = local if local is not None else LocalRateLimiter()
+        self._script = redis_client.register_script(GCRA_SCRIPT) if redis_client is not None else None
+        self._redis_down_until = 0.0
+
+    async def check(self, key: str, limit: int, window_seconds: float) -> RateLimitResult:
+        if self._script is not None and time.monotonic() >= self._redis_down_until:
+            interval, tolerance = gcra_params(limit, window_seconds)
+            try:
+                allowed, remaining, retry_ms, reset_ms = await self._script(
+                    keys=[REDIS_KEY_PREFIX + key], args=[interval, tolerance]
+                )
+                return RateLimitResult(bool(allowed), limit, int(remaining), retry_ms / 1000, reset_ms / 1000)
+            except Exception as e:
+                self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+                logger.warning("rate_limit_redis_failed", error=str(e))
+        return self.local.check(key, limit, window_seconds)
+
+
+def plan_limit(subscription_tier: Optional[str]) -> int:
+    """Requests per RATE_LIMIT_WINDOW_SECONDS for a subscription tier."""
+    limits: Dict[str, int] = {
+        "free": settings.RATE_LIMIT_FREE_REQUESTS,
+        "annual": settings.RATE_LIMIT_ANNUAL_REQUESTS,
+    }
+    return limits.get(subscription_tier or "free", settings.RATE_LIMIT_FREE_REQUESTS)
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the rate limiter (singleton)."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        redis_client = aioredis.from_url(settings.REDIS_URL) if settings.RATE_LIMIT_REDIS else None
+        _rate_limiter = RateLimiter(redis_client)
+
+    return _rate_limiter
+
+
+async def check_rate_limit(
     user_id: str,
     limit_type: str = "user",
     max_requests: int = 100,
     window_seconds: int = 60
-) -> bool:
-    """Check if user has exceeded rate limit"""
-    now = time.time()
-    key = f"{user_id}:{limit_type}"
-    
-    # Clean old entries
-    _rate_limits[user_id][limit_type] = [
-        timestamp for timestamp in _rate_limits[user_id][limit_type]
-        if now - timestamp < window_seconds
-    ]
-    
-    # Check limit
-    if len(_rate_limits[user_id][limit_type]) >= max_requests:
-        return False
-    
-    # Add current request
-    _rate_limits[user_id][limit_type].append(now)
-    return True
+) -> RateLimitResult:
+    """Count one request for ``user_id`` against its limit"""
+    return await get_rate_limiter().check(f"{limit_type}:{user_id}", max_requests, window_seconds)
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(int(result.reset_after + 0.999)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, int(result.retry_after + 0.999)))
+    return headers
+
+
+def rate_limited_response(result: RateLimitResult) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Rate limit exceeded. Please try again later."},
+        headers=rate_limit_headers(result),
+    )
 
 
 async def rate_limit_middleware(request: Request, call_next):
     """Rate limiting middleware"""
     # Extract user ID from request (from API key or auth token)
     user_id = request.headers.get("X-User-ID")
-    
+
     if user_id:
         # Per-user rate limit
-        if not check_rate_limit(user_id, "user", max_requests=100, window_seconds=60):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded"
-            )
-    
+        result = await check_rate_limit(user_id, "user", max_requests=100, window_seconds=60)
+        if not result.allowed:
+            return rate_limited_response(result)
+
     response = await call_next(request)
     return response
-
@@ -1,8 +1,14 @@
 """Rate limiting middleware for FastAPI"""
 
-from fastapi import Request, HTTPException, status
+from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
-from src.middleware.rate_limiting import check_rate_limit
+from src.config import settings
+from src.middleware.rate_limiting import (
+    check_rate_limit,
+    plan_limit,
+    rate_limit_headers,
+    rate_limited_response,
+)
 import structlog
 
 logger = structlog.get_logger()
@@ -13,16 +19,21 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next):
         # Extract user ID from request (set by auth middleware)
-        user_id = request.state.user_id if hasattr(request.state, 'user_id') else None
-        
-        if user_id:
-            # Check rate limit
-            if not check_rate_limit(user_id, "user", max_requests=100, window_seconds=60):
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail="Rate limit exceeded. Please try again later."
-                )
-        
+        user_id = getattr(request.state, "user_id", None)
+        if not user_id:
+            return await call_next(request)
+
+        tier = getattr(request.state, "subscription_tier", None)
+        result = await check_rate_limit(
+            user_id,
+            "user",
+            max_requests=plan_limit(tier),
+            window_seconds=settings.RATE_LIMIT_WINDOW_SECONDS,
+        )
+        if not result.allowed:
+            logger.info("rate_limit_exceeded", user_id=user_id, tier=tier)
+            return rate_limited_response(result)
+
         response = await call_next(request)
+        response.headers.update(rate_limit_headers(result))
         return response
-
@@ -0,0 +1,309 @@
+"""
+Rate limiting for outbound integration actions.
+
+An action is checked against several GCRA buckets at once (see
+``src.middleware.rate_limiting``): the integration's configured limit plus
+buckets that mirror the provider's own limits, so Mimic slows down before
+Discord or Slack start answering 429:
+
+- Discord: per webhook route (5 per 2s), per channel or thread (30 per
+  minute) and the global limit (50 per second, shared by every integration
+  because Discord applies it per source);
+- Slack: per webhook (1 per second), per channel (1 per second) and a
+  workspace-wide ceiling per integration.
+
+All buckets are checked and updated by one Lua script, so concurrent
+requests cannot overshoot. A caller that asks for deferred delivery gets
+the earliest slot reserved instead of a rejection, and provider responses
+(``Retry-After``, ``X-RateLimit-Remaining``/``Reset-After``) push the
+matching bucket out so later requests wait as long as the provider asked.
+"""
+
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+import structlog
+
+from src.middleware.rate_limiting import LocalRateLimiter, gcra_params, get_rate_limiter
+
+logger = structlog.get_logger(__name__)
+
+REDIS_KEY_PREFIX = "mimic:actionlimit:"
+# After a Redis error the shared limiter is skipped for this long
+REDIS_RETRY_SECONDS = 30
+
+# (requests, window seconds) per scope
+PROVIDER_BUCKET_LIMITS = {
+    "discord": {"route": (5, 2), "channel": (30, 60), "global": (50, 1)},
+    "slack": {"route": (1, 1), "channel": (1, 1), "global": (100, 60)},
+}
+
+_DISCORD_WEBHOOK_ID = re.compile(r"/webhooks/(\d+)/")
+
+# KEYS = bucket keys; ARGV[1] = longest delay the caller accepts (ms, 0 to
+# never queue), then an (emission interval, burst tolerance) pair per key.
+# The action is admitted at the earliest time every bucket allows; if that
+# is within the accepted delay all buckets are updated for that time,
+# otherwise nothing is written. Returns {admitted, delay_ms, bucket index}.
+ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local max_delay = tonumber(ARGV[1])
+
+local tats = {}
+local delay = 0
+local blocking = 0
+for i = 1, #KEYS do
+    local tat = tonumber(redis.call('GET', KEYS[i]))
+    if tat == nil or tat < now then
+        tat = now
+    end
+    tats[i] = tat
+    local wait = tat - now - tonumber(ARGV[i * 2 + 1])
+    if wait > delay then
+        delay = wait
+        blocking = i
+    end
+end
+
+if delay > max_delay then
+    return {0, delay, blocking}
+end
+
+local at = now + delay
+for i = 1, #KEYS do
+    local new_tat = math.max(tats[i], at) + tonumber(ARGV[i * 2])
+    redis.call('SET', KEYS[i], string.format('%d', new_tat), 'PX', new_tat - now)
+end
+return {1, delay, blocking}
+"""
+
+# KEYS[1] = bucket key; ARGV = blocked for (ms), burst tolerance (ms).
+# Moves the TAT out so the bucket admits nothing for the blocked time.
+PENALIZE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local blocked_tat = now + tonumber(ARGV[1]) + tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < blocked_tat then
+    redis.call('SET', KEYS[1], string.format('%d', blocked_tat), 'PX', blocked_tat - now)
+end
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class Bucket:
+    key: str
+    scope: str  # "integration", "route", "channel" or "global"
+    limit: int
+    window_seconds: float
+
+
+@dataclass
+class ActionLimitResult:
+    allowed: bool
+    delay: float  # seconds until the action may run (retry time when not allowed)
+    bucket: Optional[Bucket] = None  # the bucket that set the delay
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, int(self.delay + 0.999))
+
+
+def _url_scope(url: str) -> str:
+    # Webhook URLs embed their secret, so only a digest goes into keys
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def _discord_webhook_scope(webhook_url: str) -> str:
+    match = _DISCORD_WEBHOOK_ID.search(webhook_url)
+    return match.group(1) if match else _url_scope(webhook_url)
+
+
+def action_buckets(
+    integration_id: str,
+    provider: str,
+    params: dict,
+    webhook_url: Optional[str] = None,
+    rate_limit_requests: Optional[int] = None,
+    rate_limit_window_seconds: Optional[int] = None,
+) -> List[Bucket]:
+    """Buckets an outbound action counts against, narrowest scope first."""
+    buckets: List[Bucket] = []
+    limits = PROVIDER_BUCKET_LIMITS.get(provider)
+
+    if limits and webhook_url:
+        if provider == "discord":
+            webhook = _discord_webhook_scope(webhook_url)
+            channel = params.get("thread_id") or webhook
+            scopes = {"route": webhook, "channel": channel, "global": "all"}
+        else:
+            webhook = _url_scope(webhook_url)
+            channel = params.get("channel") or params.get("channel_id") or webhook
+            scopes = {"route": webhook, "channel": f"{integration_id}:{channel}", "global": integration_id}
+        for scope, scope_id in scopes.items():
+            limit, window = limits[scope]
+            buckets.append(Bucket(f"{provider}:{scope}:{scope_id}", scope, limit, window))
+
+    if rate_limit_requests and rate_limit_window_seconds:
+        buckets.append(Bucket(
+            f"integration:{integration_id}",
+            "integration",
+            rate_limit_requests,
+            rate_limit_window_seconds,
+        ))
+    return buckets
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After style value: delta seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def provider_backoff(status_code: int, headers: Any) -> Tuple[float, str]:
+    """How long, and for which bucket scope, a provider response asks us to wait.
+
+    Understands Discord's ``X-RateLimit-*`` headers and the ``Retry-After``
+    both providers send with 429s. Returns ``(0, "")`` when there is nothing
+    to adapt to.
+    """
+    if not isinstance(headers, Mapping):
+        return 0.0, ""
+
+    is_global = (
+        str(headers.get("X-RateLimit-Global", "")).lower() == "true"
+        or headers.get("X-RateLimit-Scope") == "global"
+    )
+    scope = "global" if is_global else "route"
+    reset_after = _header_seconds(headers.get("X-RateLimit-Reset-After"))
+
+    if status_code == 429:
+        seconds = _header_seconds(headers.get("Retry-After"))
+        if seconds is None:
+            seconds = reset_after
+        return (seconds or 1.0), scope
+    if headers.get("X-RateLimit-Remaining") == "0" and reset_after:
+        return reset_after, scope
+    return 0.0, ""
+
+
+class LocalActionRateLimiter(LocalRateLimiter):
+    """In-process version of the acquire and penalize scripts."""
+
+    def acquire(self, buckets: Sequence[Bucket], max_delay: float = 0) -> ActionLimitResult:
+        now = int(time.time() * 1000)
+        tats = []
+        delay, blocking = 0, None
+        for bucket in buckets:
+            _, tolerance = gcra_params(bucket.limit, bucket.window_seconds)
+            tat = max(self._tats.get(bucket.key, now), now)
+            tats.append(tat)
+            if tat - now - tolerance > delay:
+                delay, blocking = tat - now - tolerance, bucket
+
+        if delay > max_delay * 1000:
+            return ActionLimitResult(False, delay / 1000, blocking)
+
+        at = now + delay
+        for bucket, tat in zip(buckets, tats):
+            interval, _ = gcra_params(bucket.limit, bucket.window_seconds)
+            self._tats[bucket.key] = max(tat, at) + interval
+            self._tats.move_to_end(bucket.key)
+        self._evict(now)
+        return ActionLimitResult(True, delay / 1000, blocking)
+
+    def penalize(self, bucket: Bucket, seconds: float) -> None:
+        now = int(time.time() * 1000)
+        _, tolerance = gcra_params(bucket.limit, bucket.window_seconds)
+        blocked_tat = now + int(seconds * 1000) + tolerance
+        if self._tats.get(bucket.key, 0) < blocked_tat:
+            self._tats[bucket.key] = blocked_tat
+            self._tats.move_to_end(bucket.key)
+
+
+class ActionRateLimiter:
+    """Multi-bucket GCRA in Redis, falling back to ``LocalActionRateLimiter``."""
+
+    def __init__(self, redis_client: Any = None, local: Optional[LocalActionRateLimiter] = None):
+        self.redis = redis_client
+        self.local = local if local is not None else LocalActionRateLimiter()
+        self._acquire = redis_client.register_script(ACQUIRE_SCRIPT) if redis_client is not None else None
+        self._penalize = redis_client.register_script(PENALIZE_SCRIPT) if redis_client is not None else None
+        self._redis_down_until = 0.0
+
+    def _redis_available(self) -> bool:
+        return self._acquire is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, e: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning("action_rate_limit_redis_failed", error=str(e))
+
+    async def acquire(self, buckets: Sequence[Bucket], max_delay: float = 0) -> ActionLimitResult:
+        """Take a slot in every bucket, now or within ``max_delay`` seconds.
+
+        ``allowed`` with a positive ``delay`` means a slot was reserved that
+        far in the future; the caller must not run the action before then.
+        """
+        if not buckets:
+            return ActionLimitResult(True, 0.0)
+        if self._redis_available():
+            args: List[int] = [int(max_delay * 1000)]
+            for bucket in buckets:
+                args.extend(gcra_params(bucket.limit, bucket.window_seconds))
+            try:
+                admitted, delay_ms, index = await self._acquire(
+                    keys=[REDIS_KEY_PREFIX + b.key for b in buckets], args=args
+                )
+                blocking = buckets[index - 1] if index else None
+                return ActionLimitResult(bool(admitted), delay_ms / 1000, blocking)
+            except Exception as e:
+                self._redis_failed(e)
+        return self.local.acquire(buckets, max_delay)
+
+    async def penalize(self, bucket: Bucket, seconds: float) -> None:
+        """Admit nothing through ``bucket`` for the next ``seconds``."""
+        if self._redis_available():
+            _, tolerance = gcra_params(bucket.limit, bucket.window_seconds)
+            try:
+                await self._penalize(keys=[REDIS_KEY_PREFIX + bucket.key], args=[int(seconds * 1000), tolerance])
+                return
+            except Exception as e:
+                self._redis_failed(e)
+        self.local.penalize(bucket, seconds)
+
+    async def observe(self, buckets: Sequence[Bucket], status_code: int, headers: Any) -> None:
+        """Adapt bucket state to the rate-limit headers of a provider response."""
+        seconds, scope = provider_backoff(status_code, headers)
+        if seconds <= 0 or not buckets:
+            return
+        # Providers without their own buckets only have the integration's
+        bucket = next((b for b in buckets if b.scope == scope), buckets[0])
+        logger.info("action_rate_limit_backoff", bucket=bucket.key, seconds=seconds, status_code=status_code)
+        await self.penalize(bucket, seconds)
+
+
+_action_rate_limiter: Optional[ActionRateLimiter] = None
+
+
+def get_action_rate_limiter() -> ActionRateLimiter:
+    """Get the action rate limiter (singleton), sharing the API limiter's Redis pool."""
+    global _action_rate_limiter
+
+    if _action_rate_limiter is None:
+        _action_rate_limiter = ActionRateLimiter(get_rate_limiter().redis)
+
+    return _action_rate_limiter
@@ -0,0 +1,298 @@
+"""
+Two-tier cache for InkPass authentication results.
+
+Every authenticated Mimic request validates its token with InkPass, and
+``require_permission`` routes make a second call for the permission check.
+``AuthCache`` keeps validated principals and permission decisions, keyed on
+the SHA-256 of the token:
+
+- in-process TTL-LRU, checked first;
+- Redis, shared by every worker and pod (optional; failures fall back to
+  the local tier).
+
+Rejections are cached too (``negative_ttl``) so a bad token cannot hammer
+InkPass, while transport errors are never cached. Concurrent lookups for
+the same entry share one InkPass call; if the request making it is
+cancelled, the others retry. ``RevocationListener`` drops entries
+when InkPass publishes a revocation (logout, API key deletion).
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+REDIS_KEY_PREFIX = "mimic:auth:"
+# Bumped to drop the whole shared tier; entries from older generations are ignored
+REDIS_GENERATION_KEY = REDIS_KEY_PREFIX + "generation"
+# After a Redis error the shared tier is skipped for this long
+REDIS_RETRY_SECONDS = 30
+
+# Loader result: (value, cacheable). Falsy values are rejections.
+Loader = Callable[[], Awaitable[Tuple[Any, bool]]]
+
+
+def hash_token(token: str) -> str:
+    """SHA-256 hex digest of a token (matches InkPass API key hashes)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class AuthCache:
+    """TTL-LRU + Redis cache of InkPass auth results with single-flight loads."""
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        permission_ttl: float = 60,
+        negative_ttl: float = 15,
+        max_entries: int = 10000,
+        redis_client: Any = None,
+    ):
+        self.ttl = ttl
+        self.permission_ttl = permission_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.redis = redis_client
+        self._redis_down_until = 0.0
+        self._local: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Bumped by clear(); a load that started before a clear is not stored
+        self._generation = 0
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get_or_load(
+        self,
+        token: str,
+        field: str,
+        loader: Loader,
+        max_ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached result for (token, field), loading it on a miss.
+
+        ``field`` names the entry: "token", "api_key" or "perm:<resource>:<action>".
+        ``max_ttl`` caps the lifetime, e.g. at a JWT's remaining validity.
+        """
+        key = (hash_token(token), field)
+
+        while True:
+            found, value = self._get_local(key)
+            if found:
+                self.hits += 1
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The leading request was cancelled (client disconnect), not
+                # this one: look again, taking over the load if needed
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            found, value, redis_generation = await self._get_redis(key)
+            if found:
+                self.redis_hits += 1
+            else:
+                self.misses += 1
+                value, cacheable = await loader()
+                if cacheable and generation == self._generation:
+                    await self._store(key, value, max_ttl, redis_generation)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _entry_ttl(self, field: str, value: Any, max_ttl: Optional[float]) -> float:
+        if not value:
+            ttl = self.negative_ttl
+        elif field.startswith("perm:"):
+            ttl = self.permission_ttl
+        else:
+            ttl = self.ttl
+        return min(ttl, max_ttl) if max_ttl is not None else ttl
+
+    def _get_local(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        entry = self._local.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if time.time() >= expires_at:
+            del self._local[key]
+            return False, None
+        self._local.move_to_end(key)
+        return True, value
+
+    def _put_local(self, key: Tuple[str, str], expires_at: float, value: Any) -> None:
+        self._local[key] = (expires_at, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def _redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, event: str, error: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(event, error=str(error))
+
+    async def _get_redis(self, key: Tuple[str, str]) -> Tuple[bool, Any, Optional[int]]:
+        """Look up the shared tier; also returns its current generation (None if unavailable)."""
+        if not self._redis_available():
+            return False, None, None
+        token_hash, field = key
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(REDIS_GENERATION_KEY)
+                pipe.hget(REDIS_KEY_PREFIX + token_hash, field)
+                generation, raw = await pipe.execute()
+        except Exception as e:
+            self._redis_failed("auth_cache_redis_get_failed", e)
+            return False, None, None
+        generation = int(generation or 0)
+        if raw is None:
+            return False, None, generation
+        try:
+            entry = json.loads(raw)
+        except (TypeError, ValueError):
+            return False, None, generation
+        if time.time() >= entry["exp"] or entry.get("g", 0) != generation:
+            return False, None, generation
+        self._put_local(key, entry["exp"], entry["v"])
+        return True, entry["v"], generation
+
+    async def _store(
+        self,
+        key: Tuple[str, str],
+        value: Any,
+        max_ttl: Optional[float],
+        redis_generation: Optional[int],
+    ) -> None:
+        ttl = self._entry_ttl(key[1], value, max_ttl)
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._put_local(key, expires_at, value)
+        # Written with the generation seen before the load, so a load that
+        # raced a clear() is ignored by readers
+        if redis_generation is None or not self._redis_available():
+            return
+        token_hash, field = key
+        redis_key = REDIS_KEY_PREFIX + token_hash
+        try:
+            # One hash per token so a revocation is a single DEL; each field
+            # carries its own expiry, the key lives as long as the longest.
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(redis_key, field, json.dumps({"v": value, "exp": expires_at, "g": redis_generation}))
+                pipe.expire(redis_key, int(max(self.ttl, self.permission_ttl, self.negative_ttl)) + 1)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed("auth_cache_redis_set_failed", e)
+
+    async def invalidate(self, token_hash: str) -> None:
+        """Drop every cached result for one token hash, in both tiers."""
+        for key in [key for key in self._local if key[0] == token_hash]:
+            del self._local[key]
+        if self.redis is not None:
+            try:
+                await self.redis.delete(REDIS_KEY_PREFIX + token_hash)
+            except Exception as e:
+                logger.warning("auth_cache_redis_delete_failed", error=str(e))
+
+    def clear_local(self) -> None:
+        self._generation += 1
+        self._local.clear()
+
+    async def clear(self) -> None:
+        """Drop every cached result, in both tiers."""
+        self.clear_local()
+        if self.redis is not None:
+            try:
+                await self.redis.incr(REDIS_GENERATION_KEY)
+            except Exception as e:
+                logger.warning("auth_cache_redis_clear_failed", error=str(e))
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+
+class RevocationListener:
+    """
+    Subscribes to the InkPass revocation channel and invalidates ``AuthCache``.
+
+    Messages are JSON: ``{"token_hash": "<sha256>"}`` for one token, or
+    ``{"all": true}`` to drop every entry (e.g. after a role change).
+    """
+
+    def __init__(self, cache: AuthCache, redis_client: Any, channel: str):
+        self.cache = cache
+        self.redis = redis_client
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def handle(self, data: Any) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("auth_revocation_invalid_message")
+            return
+        if message.get("all"):
+            await self.cache.clear()
+            logger.info("auth_cache_cleared_by_revocation")
+        elif message.get("token_hash"):
+            await self.cache.invalidate(str(message["token_hash"]))
+            logger.info("auth_cache_token_revoked")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(self.channel)
+                logger.info("auth_revocation_listener_started", channel=self.channel)
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            await self.handle(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Entries may be stale while disconnected; keep them short-lived
+                self.cache.clear_local()
+                logger.warning("auth_revocation_listener_error", error=str(e))
+                await asyncio.sleep(5)
@@ -7,9 +7,10 @@ for 15 minutes and work like temporary webhooks — no bot token needed.
 See: https://discord.com/developers/docs/interactions/receiving-and-responding#followup-messages
 """
 
-import httpx
 import structlog
 
+from src.clients.provider_transport import provider_client
+
 logger = structlog.get_logger()
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
@@ -44,7 +45,7 @@ class DiscordRestService:
         if embeds:
             payload["embeds"] = embeds
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with provider_client("discord", "send_followup", timeout=15.0) as client:
             response = await client.post(url, json=payload)
             response.raise_for_status()
             result = response.json()
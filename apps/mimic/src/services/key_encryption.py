@@ -1,37 +1,260 @@
-"""Key encryption service for BYOK"""
+"""Key encryption service for BYOK
 
+Secrets are encrypted with Fernet under a versioned keyring:
+
+- version 1 is ``ENCRYPTION_KEY`` with the original derivation; its
+  ciphertexts are bare Fernet tokens, so existing rows stay readable;
+- further versions come from ``ENCRYPTION_KEYS`` ("2:secret,3:secret") and
+  are written as ``v<version>:<token>``.
+
+New ciphertexts use ``ENCRYPTION_KEY_VERSION`` (default: the newest version)
+while every configured version can still decrypt, so keys rotate without
+downtime: deploy the new key, then run ``reencrypt_stored_secrets`` to move
+old rows over. Keys are derived once per process, not per service instance.
+"""
+
+import base64
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import structlog
 from cryptography.fernet import Fernet
+from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
-import base64
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
 from src.config import settings
 
+logger = structlog.get_logger(__name__)
+
+LEGACY_KEY_VERSION = 1
+KDF_ITERATIONS = 100000
+
+
+def _derive_fernet_key(secret: str, version: int) -> bytes:
+    # Version 1 keeps its original static salt so existing data decrypts
+    salt = b"mimic_salt" if version == LEGACY_KEY_VERSION else f"mimic:encryption:v{version}".encode()
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=KDF_ITERATIONS,
+        backend=default_backend()
+    )
+    return base64.urlsafe_b64encode(kdf.derive(secret.encode()))
+
+
+def parse_encryption_keys(value: str) -> Dict[int, str]:
+    """Parse ``ENCRYPTION_KEYS``: comma-separated ``<version>:<secret>`` pairs."""
+    keys: Dict[int, str] = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        version, sep, secret = entry.partition(":")
+        if not sep or not version.isdigit() or not secret:
+            raise ValueError("ENCRYPTION_KEYS entries must look like '<version>:<secret>'")
+        if int(version) == LEGACY_KEY_VERSION:
+            raise ValueError("Key version 1 is ENCRYPTION_KEY; use versions >= 2")
+        keys[int(version)] = secret
+    return keys
+
+
+class Keyring:
+    """Versioned Fernet keys; encrypts with ``primary``, decrypts with any."""
+
+    def __init__(self, secrets: Dict[int, str], primary: Optional[int] = None):
+        if not secrets:
+            raise ValueError("Keyring needs at least one key")
+        self.primary = primary if primary is not None else max(secrets)
+        if self.primary not in secrets:
+            raise ValueError(f"Primary key version {self.primary} is not configured")
+        self._ciphers = {
+            version: Fernet(_derive_fernet_key(secret, version))
+            for version, secret in secrets.items()
+        }
+
+    @property
+    def versions(self) -> Tuple[int, ...]:
+        return tuple(sorted(self._ciphers))
+
+    def encrypt(self, plaintext: str) -> str:
+        token = self._ciphers[self.primary].encrypt(plaintext.encode()).decode()
+        if self.primary == LEGACY_KEY_VERSION:
+            return token
+        return f"v{self.primary}:{token}"
+
+    def decrypt(self, ciphertext: str) -> str:
+        version, token = self.split(ciphertext)
+        cipher = self._ciphers.get(version)
+        if cipher is None:
+            raise ValueError(f"Unknown encryption key version {version}")
+        return cipher.decrypt(token.encode()).decode()
+
+    @staticmethod
+    def split(ciphertext: str) -> Tuple[int, str]:
+        """Return (key version, Fernet token). Fernet tokens never contain ':'."""
+        prefix, sep, token = ciphertext.partition(":")
+        if sep and prefix.startswith("v") and prefix[1:].isdigit():
+            return int(prefix[1:]), token
+        return LEGACY_KEY_VERSION, ciphertext
+
+    def needs_rotation(self, ciphertext: str) -> bool:
+        return bool(ciphertext) and self.split(ciphertext)[0] != self.primary
+
+    def rotate(self, ciphertext: str) -> str:
+        """Re-encrypt under the primary key (unchanged if already there)."""
+        if not self.needs_rotation(ciphertext):
+            return ciphertext
+        return self.encrypt(self.decrypt(ciphertext))
+
+
+@lru_cache(maxsize=4)
+def _build_keyring(legacy_secret: str, extra_keys: str, primary: Optional[int]) -> Keyring:
+    secrets = {LEGACY_KEY_VERSION: legacy_secret, **parse_encryption_keys(extra_keys)}
+    return Keyring(secrets, primary)
+
+
+def get_keyring() -> Keyring:
+    """Process-wide keyring for the current settings (keys derived once)."""
+    return _build_keyring(
+        settings.ENCRYPTION_KEY,
+        settings.ENCRYPTION_KEYS,
+        settings.ENCRYPTION_KEY_VERSION,
+    )
+
+
+class DecryptedSecretCache:
+    """Short-lived LRU of plaintexts keyed by ciphertext.
+
+    Keyed on the ciphertext itself, so an updated secret is a new entry and
+    never served stale; the TTL bounds how long plaintext stays in memory.
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # Sync routes run in a threadpool
+        self._lock = threading.Lock()
+
+    def get(self, ciphertext: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(ciphertext)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[ciphertext]
+                return None
+            self._entries.move_to_end(ciphertext)
+            return entry[1]
+
+    def put(self, ciphertext: str, plaintext: str) -> None:
+        with self._lock:
+            self._entries[ciphertext] = (time.monotonic() + self.ttl, plaintext)
+            self._entries.move_to_end(ciphertext)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_decrypted_cache = DecryptedSecretCache(
+    ttl=settings.DECRYPTED_SECRET_CACHE_TTL_SECONDS,
+    max_entries=settings.DECRYPTED_SECRET_CACHE_MAX_ENTRIES,
+)
+
+
 class KeyEncryptionService:
     """Service for encrypting and decrypting provider API keys"""
-    
-    def __init__(self):
-        """Initialize encryption service with key from settings"""
-        # Derive key from encryption key setting
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'mimic_salt',  # In production, use a unique salt per user
-            iterations=100000,
-            backend=default_backend()
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(settings.ENCRYPTION_KEY.encode()))
-        self.cipher = Fernet(key)
-    
+
+    def __init__(self, keyring: Optional[Keyring] = None):
+        """Use the given keyring, or the shared one built from settings"""
+        self.keyring = keyring or get_keyring()
+
     def encrypt(self, plaintext: str) -> str:
         """Encrypt a string"""
         if not plaintext:
             return ""
-        return self.cipher.encrypt(plaintext.encode()).decode()
-    
+        return self.keyring.encrypt(plaintext)
+
     def decrypt(self, ciphertext: str) -> str:
         """Decrypt a string"""
         if not ciphertext:
             return ""
-        return self.cipher.decrypt(ciphertext.encode()).decode()
+        return self.keyring.decrypt(ciphertext)
+
+    def decrypt_cached(self, ciphertext: str) -> str:
+        """Decrypt a hot secret (e.g. a webhook signing key) through the short-TTL cache"""
+        if not ciphertext:
+            return ""
+        plaintext = _decrypted_cache.get(ciphertext)
+        if plaintext is None:
+            plaintext = self.keyring.decrypt(ciphertext)
+            _decrypted_cache.put(ciphertext, plaintext)
+        return plaintext
+
+
+def _encrypted_columns():
+    from src.database.models import IntegrationCredential, IntegrationInboundConfig, ProviderKey
+
+    return [
+        ProviderKey.encrypted_api_key,
+        ProviderKey.encrypted_secret,
+        ProviderKey.bot_token,
+        IntegrationCredential.encrypted_value,
+        IntegrationInboundConfig.signature_secret,
+    ]
+
+
+def reencrypt_stored_secrets(db: Session, batch_size: int = 500, keyring: Optional[Keyring] = None) -> Dict[str, int]:
+    """Move every stored ciphertext to the primary key version.
 
+    Runs online: rows are read in primary-key order and committed per batch,
+    and each UPDATE only applies if the column still holds the ciphertext
+    that was read, so concurrent writes are never overwritten. Safe to rerun.
+    Returns rotated row counts per column.
+    """
+    keyring = keyring or get_keyring()
+    counts: Dict[str, int] = {}
+    for column in _encrypted_columns():
+        model = column.class_
+        name = f"{model.__tablename__}.{column.key}"
+        counts[name] = 0
+        last_id = ""
+        while True:
+            rows = (
+                db.query(model.id, column)
+                .filter(model.id > last_id, column.isnot(None), column != "")
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row_id, ciphertext in rows:
+                if not keyring.needs_rotation(ciphertext):
+                    continue
+                try:
+                    rotated = keyring.rotate(ciphertext)
+                except Exception as e:
+                    logger.error("reencrypt_failed", column=name, row_id=row_id, error=str(e))
+                    continue
+                result = db.execute(
+                    update(model)
+                    .where(model.id == row_id, column == ciphertext)
+                    .values({column.key: rotated})
+                    .execution_options(synchronize_session=False)
+                )
+                counts[name] += result.rowcount
+            db.commit()
+            last_id = rows[-1][0]
+        logger.info("reencrypt_column_done", column=name, rotated=counts[name], key_version=keyring.primary)
+    return counts
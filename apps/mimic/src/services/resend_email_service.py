@@ -3,6 +3,7 @@
 import httpx
 import structlog
 from src.config import settings
+from src.clients.provider_transport import provider_client
 
 logger = structlog.get_logger()
 
@@ -71,7 +72,7 @@ class ResendEmailService:
             payload["html"] = html_body
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with provider_client("resend", "send_email") as client:
                 response = await client.post(
                     f"{self.base_url}/emails",
                     headers={
@@ -109,3 +109,22 @@ class StripeService:
             logger.error("Invalid Stripe webhook signature", error=str(e))
             return None
 
+
+_webhook_client = None
+_webhook_client_config: Optional[tuple] = None
+
+
+def get_stripe_webhook_client():
+    """Shared ``fluxos_stripe.StripeClient`` for webhook signature checks.
+
+    Built once and rebuilt only if the Stripe settings change, instead of
+    per webhook request.
+    """
+    global _webhook_client, _webhook_client_config
+    from fluxos_stripe import StripeClient, StripeConfig
+
+    config = (settings.STRIPE_SECRET_KEY or "", settings.STRIPE_WEBHOOK_SECRET)
+    if _webhook_client is None or _webhook_client_config != config:
+        _webhook_client = StripeClient(StripeConfig(api_key=config[0], webhook_secret=config[1]))
+        _webhook_client_config = config
+    return _webhook_client
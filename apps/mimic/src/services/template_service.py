@@ -1,21 +1,183 @@
-"""Template service for rendering system templates."""
+"""
+Template service for rendering system templates.
+
+Templates are parsed once into literal and variable segments
+(``CompiledTemplate``) and cached by template id and version, so a render
+is a single join instead of a regex pass. Name resolution (org
+template, else platform template) is cached for a short TTL, which also
+bounds how long another worker can serve a template changed elsewhere;
+``create_template`` and ``update_template`` invalidate in-process.
+"""
 
 import re
-from typing import Dict, Any, Optional, Tuple
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 import structlog
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
+from src.config import settings
 from src.database.models import SystemTemplate
 
 logger = structlog.get_logger()
 
+PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
+RenderedTemplate = Tuple[str, str, Optional[str]]
+
 
 class TemplateNotFoundError(Exception):
     """Raised when a template cannot be found."""
     pass
 
 
+@dataclass(frozen=True)
+class CompiledContent:
+    """
+    Content split at its {{variable}} placeholders.
+
+    ``parts`` alternates literal text and variable names, starting and
+    ending with (possibly empty) literals, as ``re.split`` returns them.
+    """
+
+    parts: Tuple[str, ...]
+
+    @classmethod
+    def parse(cls, source: str) -> "CompiledContent":
+        return cls(tuple(PLACEHOLDER.split(source)))
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            # Unknown variables are left as written
+            parts[i] = str(variables[name]) if name in variables else f"{{{{{name}}}}}"
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A resolved system template with its content parsed (no ORM state)."""
+
+    id: str
+    name: str
+    organization_id: Optional[str]
+    version: int
+    subject: CompiledContent
+    content_text: CompiledContent
+    content_html: Optional[CompiledContent]
+
+    @classmethod
+    def from_model(cls, template: SystemTemplate) -> "CompiledTemplate":
+        return cls(
+            id=template.id,
+            name=template.name,
+            organization_id=template.organization_id,
+            version=template.version or 1,
+            subject=CompiledContent.parse(template.subject),
+            content_text=CompiledContent.parse(template.content_text),
+            content_html=CompiledContent.parse(template.content_html) if template.content_html else None,
+        )
+
+    @property
+    def cache_key(self) -> Tuple[str, int]:
+        return (self.id, self.version)
+
+    def render(self, variables: Dict[str, Any]) -> RenderedTemplate:
+        return (
+            self.subject.render(variables),
+            self.content_text.render(variables),
+            self.content_html.render(variables) if self.content_html else None,
+        )
+
+
+class TemplateCache:
+    """
+    Compiled templates keyed by (template id, version).
+
+    Lookups by the requesting organization and name resolve through a TTL'd
+    index to one of those keys, so a cached send makes no DB query. The id
+    is part of the key because a template that is deactivated and created
+    again starts over at version 1.
+    """
+
+    def __init__(self, ttl: float = 30, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._compiled: "dict[Tuple[str, int], CompiledTemplate]" = {}
+        self._resolved: "dict[Tuple[Optional[str], str], Tuple[float, Tuple[str, int]]]" = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, template: SystemTemplate) -> CompiledTemplate:
+        """Compiled form of a template row, parsed once per version."""
+        key = (template.id, template.version or 1)
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled[key] = self._compiled.pop(key)
+                return compiled
+
+        compiled = CompiledTemplate.from_model(template)
+        with self._lock:
+            self._compiled[key] = compiled
+            while len(self._compiled) > self.max_entries:
+                self._compiled.pop(next(iter(self._compiled)))
+        return compiled
+
+    def lookup(self, organization_id: Optional[str], name: str) -> Optional[CompiledTemplate]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._resolved.get((organization_id, name))
+            if entry is not None and entry[0] > now:
+                compiled = self._compiled.get(entry[1])
+                if compiled is not None:
+                    self.hits += 1
+                    return compiled
+        self.misses += 1
+        return None
+
+    def remember(self, organization_id: Optional[str], name: str, compiled: CompiledTemplate) -> None:
+        """Record which template a (requesting org, name) lookup resolved to."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._resolved.pop((organization_id, name), None)
+            self._resolved[(organization_id, name)] = (time.monotonic() + self.ttl, compiled.cache_key)
+            while len(self._resolved) > self.max_entries:
+                self._resolved.pop(next(iter(self._resolved)))
+
+    def invalidate(self, name: str) -> None:
+        """Forget every entry for a template name.
+
+        A new or changed platform template affects every organization's
+        lookup, and a new org template shadows the platform one, so
+        invalidation is by name across organizations.
+        """
+        with self._lock:
+            for key in [k for k in self._resolved if k[1] == name]:
+                del self._resolved[key]
+            for key in [k for k, c in self._compiled.items() if c.name == name]:
+                del self._compiled[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+            self._resolved.clear()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+system_templates = TemplateCache(
+    ttl=settings.SYSTEM_TEMPLATE_CACHE_TTL_SECONDS,
+    max_entries=settings.SYSTEM_TEMPLATE_CACHE_MAX_ENTRIES,
+)
+
+
 class TemplateService:
     """
     Service for managing and rendering system templates.
@@ -25,8 +187,9 @@ class TemplateService:
     2. Platform-wide template (organization_id is null)
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache: Optional[TemplateCache] = None):
         self.db = db
+        self.cache = cache if cache is not None else system_templates
 
     def get_template(
         self,
@@ -50,33 +213,28 @@ class TemplateService:
         Raises:
             TemplateNotFoundError: If no matching template found
         """
-        # Try org-specific template first
+        query = self.db.query(SystemTemplate).filter(
+            SystemTemplate.name == name,
+            SystemTemplate.is_active == True,
+        )
         if organization_id:
-            template = self.db.query(SystemTemplate).filter(
-                SystemTemplate.name == name,
-                SystemTemplate.organization_id == organization_id,
-                SystemTemplate.is_active == True,
-            ).first()
-
-            if template:
-                logger.debug(
-                    "Found org-specific template",
-                    template_name=name,
-                    organization_id=organization_id,
+            # One query for both; the org template sorts before the platform one
+            query = query.filter(
+                or_(
+                    SystemTemplate.organization_id == organization_id,
+                    SystemTemplate.organization_id == None,
                 )
-                return template
+            ).order_by(SystemTemplate.organization_id.is_(None))
+        else:
+            query = query.filter(SystemTemplate.organization_id == None)
 
-        # Fall back to platform template
-        template = self.db.query(SystemTemplate).filter(
-            SystemTemplate.name == name,
-            SystemTemplate.organization_id == None,
-            SystemTemplate.is_active == True,
-        ).first()
+        template = query.first()
 
         if template:
             logger.debug(
-                "Found platform template",
+                "Found org-specific template" if template.organization_id else "Found platform template",
                 template_name=name,
+                organization_id=template.organization_id,
             )
             return template
 
@@ -84,42 +242,80 @@ class TemplateService:
             f"Template '{name}' not found for organization '{organization_id}'"
         )
 
+    def get_compiled(
+        self,
+        name: str,
+        organization_id: Optional[str] = None,
+    ) -> CompiledTemplate:
+        """
+        Get a compiled template by name, from the cache when possible.
+
+        Same resolution as ``get_template``.
+
+        Raises:
+            TemplateNotFoundError: If no matching template found
+        """
+        compiled = self.cache.lookup(organization_id, name)
+        if compiled is None:
+            compiled = self.cache.compile(self.get_template(name, organization_id))
+            self.cache.remember(organization_id, name, compiled)
+        return compiled
+
     def render_template(
         self,
-        template: SystemTemplate,
+        template: Union[SystemTemplate, CompiledTemplate],
         variables: Dict[str, Any],
-    ) -> Tuple[str, str, Optional[str]]:
+    ) -> RenderedTemplate:
         """
         Render template with variable substitution.
 
-        Variables use {{variable_name}} syntax.
+        Variables use {{variable_name}} syntax; placeholders without a value
+        are left as written.
 
         Args:
-            template: SystemTemplate to render
+            template: SystemTemplate or CompiledTemplate to render
             variables: Dict of variable name -> value
 
         Returns:
             Tuple of (rendered_subject, rendered_text, rendered_html or None)
         """
-        def substitute(content: str) -> str:
-            """Substitute {{variable}} placeholders."""
-            def replacer(match):
-                var_name = match.group(1)
-                return str(variables.get(var_name, f"{{{{{{var_name}}}}}}"))
-
-            return re.sub(r'\{\{(\w+)\}\}', replacer, content)
-
-        rendered_subject = substitute(template.subject)
-        rendered_text = substitute(template.content_text)
-        rendered_html = substitute(template.content_html) if template.content_html else None
+        compiled = template if isinstance(template, CompiledTemplate) else self.cache.compile(template)
+        rendered = compiled.render(variables)
 
         logger.debug(
             "Rendered template",
-            template_name=template.name,
+            template_name=compiled.name,
             variables_used=list(variables.keys()),
         )
 
-        return rendered_subject, rendered_text, rendered_html
+        return rendered
+
+    def render_many(
+        self,
+        template: Union[SystemTemplate, CompiledTemplate],
+        contexts: Iterable[Dict[str, Any]],
+    ) -> List[RenderedTemplate]:
+        """
+        Render one template against a batch of variable sets (bulk sends).
+
+        Args:
+            template: SystemTemplate or CompiledTemplate to render
+            contexts: Variables for each recipient
+
+        Returns:
+            List of (rendered_subject, rendered_text, rendered_html or None),
+            in the order of ``contexts``
+        """
+        compiled = template if isinstance(template, CompiledTemplate) else self.cache.compile(template)
+        rendered = [compiled.render(variables) for variables in contexts]
+
+        logger.debug(
+            "Rendered template batch",
+            template_name=compiled.name,
+            count=len(rendered),
+        )
+
+        return rendered
 
     def list_templates(
         self,
@@ -179,8 +375,7 @@ class TemplateService:
         """
         # Auto-extract variables if not provided
         if variables is None:
-            all_content = f"{subject} {content_text} {content_html or ''}"
-            variables = list(set(re.findall(r'\{\{(\w+)\}\}', all_content)))
+            variables = _extract_variables(subject, content_text, content_html)
 
         template = SystemTemplate(
             name=name,
@@ -194,6 +389,7 @@ class TemplateService:
         self.db.add(template)
         self.db.commit()
         self.db.refresh(template)
+        self.cache.invalidate(name)
 
         logger.info(
             "Created system template",
@@ -203,3 +399,55 @@ class TemplateService:
         )
 
         return template
+
+    def update_template(
+        self,
+        template_id: str,
+        **changes: Any,
+    ) -> SystemTemplate:
+        """
+        Update a system template and bump its version.
+
+        Args:
+            template_id: ID of the template to update
+            **changes: Columns to change (subject, content_text, content_html,
+                variables, is_active, ...)
+
+        Returns:
+            Updated SystemTemplate
+
+        Raises:
+            TemplateNotFoundError: If the template does not exist
+        """
+        template = self.db.query(SystemTemplate).filter(SystemTemplate.id == template_id).first()
+        if not template:
+            raise TemplateNotFoundError(f"Template '{template_id}' not found")
+
+        old_name = template.name
+        for field, value in changes.items():
+            setattr(template, field, value)
+        content_changed = {"subject", "content_text", "content_html"} & changes.keys()
+        if content_changed and "variables" not in changes:
+            template.variables = _extract_variables(
+                template.subject, template.content_text, template.content_html
+            )
+        template.version = (template.version or 1) + 1
+
+        self.db.commit()
+        self.db.refresh(template)
+        self.cache.invalidate(old_name)
+        self.cache.invalidate(template.name)
+
+        logger.info(
+            "Updated system template",
+            template_id=template.id,
+            template_name=template.name,
+            version=template.version,
+        )
+
+        return template
+
+
+def _extract_variables(subject: str, content_text: str, content_html: Optional[str]) -> list[str]:
+    all_content = f"{subject} {content_text} {content_html or ''}"
+    return list(set(PLACEHOLDER.findall(all_content)))
@@ -0,0 +1,321 @@
+"""
+Store-then-dispatch processing for gateway webhooks (Stripe, Resend).
+
+The webhook routes only verify, store the event idempotently and answer
+200, so a slow broker or a busy database never makes the provider retry.
+The insert is blocking SQLAlchemy work, so it runs on a small dedicated
+thread pool instead of the event loop (``persist_webhook_event``).
+
+``dispatch_pending_events`` (run by the ``dispatch_webhook_events`` Celery
+task) fans stored events out to their Celery tasks:
+
+- events are read oldest first in batches;
+- events with the same ordering key (Stripe customer, Resend email) are
+  processed in order: a later event is only sent once the earlier event's
+  routing tasks have finished (their ``WebhookDelivery`` rows left
+  ``dispatched``), and while one waits for a retry the later ones wait too;
+- a failed dispatch is retried with exponential backoff and ends up
+  ``dead_letter`` after ``WEBHOOK_DISPATCH_MAX_ATTEMPTS``;
+- a retry only sends the tasks that were not sent before, so downstream
+  services get each (event, task) once.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+from sqlalchemy import exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from src.config import settings
+from src.database.database import SessionLocal
+from src.database.models import WebhookDelivery, WebhookEvent
+
+logger = structlog.get_logger(__name__)
+
+PENDING_STATUSES = ("received", "retrying")
+
+# provider -> event type -> [(target service, Celery task)]
+EVENT_ROUTES: Dict[str, Dict[str, List[Tuple[str, str]]]] = {
+    "stripe": {
+        "checkout.session.completed": [("inkpass", "mimic.tasks.route_to_inkpass_subscription_created")],
+        "customer.subscription.deleted": [("inkpass", "mimic.tasks.route_to_inkpass_subscription_deleted")],
+        "customer.subscription.updated": [("inkpass", "mimic.tasks.route_to_inkpass_subscription_updated")],
+        "invoice.payment_failed": [("inkpass", "mimic.tasks.route_to_inkpass_invoice_event")],
+        "invoice.payment_succeeded": [("inkpass", "mimic.tasks.route_to_inkpass_invoice_event")],
+    },
+    "resend": {
+        event_type: [("mimic", "mimic.tasks.handle_email_delivery_event")]
+        for event_type in ("email.delivered", "email.bounced", "email.complained", "email.opened")
+    },
+}
+
+# Shared, bounded pool for the blocking insert; keeps DB latency off the event loop
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.WEBHOOK_INGEST_MAX_WORKERS,
+            thread_name_prefix="mimic-webhook-ingest",
+        )
+    return _executor
+
+
+def shutdown_ingest_executor() -> None:
+    """Stop the ingest pool (app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def ordering_key(provider: str, payload: dict) -> Optional[str]:
+    """Key whose events must be dispatched in the order received, if any."""
+    if provider == "stripe":
+        obj = payload.get("object") or {}
+        customer = obj.get("customer")
+        if isinstance(customer, dict):
+            customer = customer.get("id")
+        if not customer and obj.get("object") == "customer":
+            customer = obj.get("id")
+        return f"stripe:{customer}" if customer else None
+    if provider == "resend":
+        email_id = (payload.get("data") or {}).get("email_id")
+        return f"resend:{email_id}" if email_id else None
+    return None
+
+
+def store_webhook_event(
+    provider: str,
+    event_type: str,
+    event_id: str,
+    payload: dict,
+    signature: Optional[str] = None,
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> Tuple[str, bool]:
+    """Insert an event unless (provider, event_id) exists (blocking).
+
+    Returns ``(webhook_event_id, created)``.
+    """
+    db = (session_factory or SessionLocal)()
+    try:
+        existing = db.query(WebhookEvent.id).filter(
+            WebhookEvent.provider == provider,
+            WebhookEvent.event_id == event_id,
+        ).first()
+        if existing:
+            return existing[0], False
+
+        webhook_event = WebhookEvent(
+            provider=provider,
+            event_type=event_type,
+            event_id=event_id,
+            payload=payload,
+            signature=signature[:100] if signature else None,  # Truncate for storage
+            status="received",
+            ordering_key=ordering_key(provider, payload),
+        )
+        db.add(webhook_event)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent delivery of the same event
+            db.rollback()
+            existing = db.query(WebhookEvent.id).filter(
+                WebhookEvent.provider == provider,
+                WebhookEvent.event_id == event_id,
+            ).first()
+            return existing[0], False
+        return webhook_event.id, True
+    finally:
+        db.close()
+
+
+async def persist_webhook_event(
+    provider: str,
+    event_type: str,
+    event_id: str,
+    payload: dict,
+    signature: Optional[str] = None,
+) -> Tuple[str, bool]:
+    """``store_webhook_event`` on the ingest pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(),
+        lambda: store_webhook_event(provider, event_type, event_id, payload, signature),
+    )
+
+
+def request_dispatch() -> None:
+    """Ask a worker to drain pending events now (best effort; beat also runs it)."""
+    from src.core.celery_app import app as celery_app
+
+    try:
+        celery_app.send_task("mimic.tasks.dispatch_webhook_events")
+    except Exception as e:
+        logger.warning("webhook_dispatch_request_failed", error=str(e))
+
+
+def _task_kwargs(event: WebhookEvent, delivery: WebhookDelivery) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {
+        "event_type": event.event_type,
+        "webhook_event_id": event.id,
+        "delivery_id": delivery.id,
+    }
+    # Stripe tasks take the event's data, Resend tasks the whole payload
+    kwargs["payload" if event.provider == "resend" else "event_data"] = event.payload
+    return kwargs
+
+
+def dispatch_event(db: Session, event: WebhookEvent, send_task: Callable[..., Any]) -> int:
+    """Send the event's Celery tasks that have not been sent yet; returns how many were sent."""
+    routes = EVENT_ROUTES.get(event.provider, {}).get(event.event_type)
+    if not routes:
+        logger.info("webhook_event_ignored", provider=event.provider, event_type=event.event_type)
+        return 0
+
+    deliveries = {d.task_name: d for d in event.deliveries}
+    sent = 0
+    for target_service, task_name in routes:
+        delivery = deliveries.get(task_name)
+        if delivery is not None and delivery.status != "pending":
+            continue  # Sent by an earlier attempt
+        if delivery is None:
+            delivery = WebhookDelivery(
+                event_id=event.id,
+                target_service=target_service,
+                task_name=task_name,
+                status="pending",
+            )
+            db.add(delivery)
+            db.flush()
+
+        delivery.attempt_count = (delivery.attempt_count or 0) + 1
+        delivery.last_attempt_at = datetime.utcnow()
+        task = send_task(task_name, kwargs=_task_kwargs(event, delivery))
+        delivery.celery_task_id = task.id
+        delivery.status = "dispatched"
+        # Persist each send so a later failure cannot cause a resend
+        db.commit()
+        sent += 1
+
+        logger.info(
+            "webhook_event_routed",
+            provider=event.provider,
+            target_service=target_service,
+            task_name=task_name,
+            celery_task_id=task.id,
+        )
+    return sent
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds before retry ``attempt`` (1-based)."""
+    return min(
+        settings.WEBHOOK_DISPATCH_RETRY_BASE_SECONDS * 2 ** (attempt - 1),
+        settings.WEBHOOK_DISPATCH_RETRY_MAX_SECONDS,
+    )
+
+
+def dispatch_pending_events(
+    db: Session,
+    send_task: Callable[..., Any],
+    batch_size: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+) -> Dict[str, int]:
+    """Dispatch one batch of pending events, oldest first; returns counts by outcome.
+
+    Run by a single dispatcher at a time. Per key, at most one event's
+    routing tasks run at once, so their order survives concurrent workers.
+    """
+    batch_size = batch_size or settings.WEBHOOK_DISPATCH_BATCH_SIZE
+    max_attempts = max_attempts or settings.WEBHOOK_DISPATCH_MAX_ATTEMPTS
+    now = datetime.utcnow()
+    counts = {"delivered": 0, "retrying": 0, "dead_letter": 0, "deferred": 0}
+
+    # A key with an event waiting for its retry, or whose routing tasks are
+    # still running, holds back its later events. They are left out in SQL
+    # so they never fill a batch other keys need.
+    waiting = aliased(WebhookEvent)
+    running = aliased(WebhookEvent)
+    hold_cutoff = now - timedelta(seconds=settings.WEBHOOK_DISPATCH_ORDER_HOLD_SECONDS)
+    events = (
+        db.query(WebhookEvent)
+        .filter(
+            WebhookEvent.status.in_(PENDING_STATUSES),
+            (WebhookEvent.next_attempt_at == None) | (WebhookEvent.next_attempt_at <= now),
+            ~exists().where(
+                waiting.ordering_key == WebhookEvent.ordering_key,
+                waiting.status == "retrying",
+                waiting.next_attempt_at > now,
+                waiting.id != WebhookEvent.id,
+            ),
+            ~exists().where(
+                running.ordering_key == WebhookEvent.ordering_key,
+                running.id != WebhookEvent.id,
+                WebhookDelivery.event_id == running.id,
+                WebhookDelivery.status == "dispatched",
+                WebhookDelivery.last_attempt_at > hold_cutoff,
+            ),
+        )
+        .order_by(WebhookEvent.created_at, WebhookEvent.id)
+        .limit(batch_size)
+        .all()
+    )
+
+    # Keys whose event fails or is sent in this batch
+    blocked = set()
+    for event in events:
+        if event.ordering_key in blocked:
+            counts["deferred"] += 1
+            continue
+        try:
+            sent = dispatch_event(db, event, send_task)
+        except Exception as e:
+            db.rollback()
+            event.retry_count = (event.retry_count or 0) + 1
+            event.error_message = str(e)
+            if event.retry_count >= max_attempts:
+                event.status = "dead_letter"
+                event.processed_at = now
+                event.next_attempt_at = None
+                counts["dead_letter"] += 1
+                logger.error(
+                    "webhook_event_dead_lettered",
+                    webhook_event_id=event.id,
+                    provider=event.provider,
+                    event_type=event.event_type,
+                    attempts=event.retry_count,
+                    error=str(e),
+                )
+            else:
+                event.status = "retrying"
+                event.next_attempt_at = now + timedelta(seconds=retry_delay(event.retry_count))
+                counts["retrying"] += 1
+                if event.ordering_key:
+                    blocked.add(event.ordering_key)
+                logger.warning(
+                    "webhook_event_dispatch_failed",
+                    webhook_event_id=event.id,
+                    provider=event.provider,
+                    attempt=event.retry_count,
+                    next_attempt_at=event.next_attempt_at.isoformat(),
+                    error=str(e),
+                )
+        else:
+            if sent and event.ordering_key:
+                blocked.add(event.ordering_key)
+            event.status = "delivered"
+            event.processed_at = now
+            event.next_attempt_at = None
+            event.error_message = None
+            counts["delivered"] += 1
+        db.commit()
+
+    return counts
@@ -0,0 +1,332 @@
+"""
+Compiled ingest pipelines for integration webhooks.
+
+``receive_integration_webhook`` needs, for every event, the inbound config,
+the integration's decrypted verification material and the compiled
+transform template. ``WebhookPipelineCache`` keeps all three per webhook
+path as a ``CompiledWebhook`` holding only plain values (no ORM objects),
+so a hot path skips the DB lookup, the decryption and the Jinja compile.
+
+Entries expire after a short TTL, which also bounds how long another worker
+can serve a config changed elsewhere; the integration routes invalidate
+entries in-process when inbound config, credentials or status change.
+
+Transform templates render in an immutable Jinja sandbox under a time and
+output budget (``render_template``).
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+import structlog
+from jinja2 import Template, TemplateSyntaxError
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+from sqlalchemy.orm import Session, joinedload
+
+from src.config import settings
+from src.database.models import (
+    CredentialType,
+    InboundAuthMethod,
+    Integration,
+    IntegrationInboundConfig,
+    IntegrationStatus,
+)
+from src.services.key_encryption import KeyEncryptionService
+
+logger = structlog.get_logger(__name__)
+
+_BEARER_CREDENTIAL_TYPES = (
+    CredentialType.oauth_token,
+    CredentialType.bot_token,
+    CredentialType.api_key,
+)
+
+
+class TemplateBudgetExceeded(Exception):
+    """A transform template ran past its time or output budget."""
+
+
+_render_deadline: ContextVar[Optional[float]] = ContextVar("_render_deadline", default=None)
+
+
+def _check_deadline() -> None:
+    deadline = _render_deadline.get()
+    if deadline is not None and time.monotonic() > deadline:
+        raise TemplateBudgetExceeded("Template render exceeded its time budget")
+
+
+class _BudgetedSandbox(ImmutableSandboxedEnvironment):
+    """Sandbox that also checks the render deadline on every call and lookup."""
+
+    def call(__self, __context, __obj, *args, **kwargs):
+        _check_deadline()
+        return super().call(__context, __obj, *args, **kwargs)
+
+    def getattr(self, obj, attribute):
+        _check_deadline()
+        return super().getattr(obj, attribute)
+
+    def getitem(self, obj, argument):
+        _check_deadline()
+        return super().getitem(obj, argument)
+
+
+_jinja_env = _BudgetedSandbox(autoescape=True)
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> Template:
+    """Compile a transform template once per distinct source."""
+    return _jinja_env.from_string(source)
+
+
+def render_template(
+    template: Template,
+    budget_seconds: Optional[float] = None,
+    max_output_chars: Optional[int] = None,
+    **context: Any,
+) -> str:
+    """Render in the sandbox, raising ``TemplateBudgetExceeded`` past either budget."""
+    if budget_seconds is None:
+        budget_seconds = settings.WEBHOOK_TEMPLATE_BUDGET_MS / 1000
+    if max_output_chars is None:
+        max_output_chars = settings.WEBHOOK_TEMPLATE_MAX_OUTPUT_CHARS
+    token = _render_deadline.set(time.monotonic() + budget_seconds)
+    try:
+        parts = []
+        size = 0
+        # generate() yields as it goes, so loops that only emit output are
+        # bounded too, not just ones that call or look things up
+        for chunk in template.generate(**context):
+            size += len(chunk)
+            if size > max_output_chars:
+                raise TemplateBudgetExceeded("Template output exceeded its size budget")
+            parts.append(chunk)
+            _check_deadline()
+        return "".join(parts)
+    finally:
+        _render_deadline.reset(token)
+
+
+def _secret_matches(candidates: Tuple[bytes, ...], presented: str) -> bool:
+    presented_bytes = presented.encode()
+    # Check every candidate so timing does not reveal which one matched
+    matched = False
+    for candidate in candidates:
+        matched |= hmac.compare_digest(candidate, presented_bytes)
+    return matched
+
+
+@dataclass(frozen=True)
+class CompiledWebhook:
+    """Everything the webhook gateway needs for one path, resolved once."""
+
+    webhook_path: str
+    inbound_config_id: str
+    integration_id: str
+    organization_id: str
+    provider: str
+    integration_deleted: bool
+    integration_status: IntegrationStatus
+    is_active: bool
+    auth_method: InboundAuthMethod
+    destination_service: str
+    destination_config: Optional[dict]
+    api_keys: Tuple[bytes, ...] = ()
+    bearer_tokens: Tuple[bytes, ...] = ()
+    signature_secret: Optional[bytes] = None
+    ed25519_public_key: Optional[str] = None
+    template: Optional[Template] = None
+    # A broken template is kept as its message and line, not the exception:
+    # re-raising one cached instance would grow its traceback on every event
+    template_error: Optional[str] = None
+    template_error_line: Optional[int] = None
+
+    def verify_api_key(self, api_key_header: Optional[str]) -> bool:
+        """Verify X-API-Key authentication."""
+        if not api_key_header:
+            return False
+        return _secret_matches(self.api_keys, api_key_header)
+
+    def verify_signature(
+        self,
+        body: bytes,
+        signature_header: Optional[str],
+        hub_signature_header: Optional[str],
+    ) -> bool:
+        """
+        Verify HMAC signature authentication.
+
+        Supports both X-Signature and X-Hub-Signature-256 headers.
+        """
+        if not self.signature_secret:
+            return False
+
+        signature = signature_header or hub_signature_header
+        if not signature:
+            return False
+
+        # Handle GitHub-style signature with "sha256=" prefix
+        expected_prefix = "sha256="
+        if signature.startswith(expected_prefix):
+            signature = signature[len(expected_prefix):]
+
+        computed = hmac.new(self.signature_secret, body, hashlib.sha256).hexdigest()
+
+        # Constant-time comparison
+        return hmac.compare_digest(computed.lower(), signature.lower())
+
+    def verify_bearer(self, authorization_header: Optional[str]) -> bool:
+        """Verify Authorization: Bearer token authentication."""
+        if not authorization_header or not authorization_header.startswith("Bearer "):
+            return False
+        return _secret_matches(self.bearer_tokens, authorization_header[7:])
+
+
+def _decrypt(encryption_service: KeyEncryptionService, ciphertext: str, **log_context: Any) -> Optional[str]:
+    try:
+        return encryption_service.decrypt_cached(ciphertext)
+    except Exception as e:
+        # Same outcome as before: an undecryptable secret never authenticates
+        logger.error("webhook_secret_decrypt_failed", error=str(e), **log_context)
+        return None
+
+
+def compile_webhook(
+    inbound_config: IntegrationInboundConfig,
+    encryption_service: Optional[KeyEncryptionService] = None,
+) -> CompiledWebhook:
+    """Resolve an inbound config (with integration and credentials loaded)."""
+    encryption_service = encryption_service or KeyEncryptionService()
+    integration = inbound_config.integration
+    log_context = {"webhook_path": inbound_config.webhook_path, "integration_id": integration.id}
+
+    api_keys = []
+    bearer_tokens = []
+    for cred in integration.credentials:
+        if cred.credential_type not in _BEARER_CREDENTIAL_TYPES:
+            continue
+        value = _decrypt(encryption_service, cred.encrypted_value, credential_id=cred.id, **log_context)
+        if value is None:
+            continue
+        bearer_tokens.append(value.encode())
+        if cred.credential_type == CredentialType.api_key:
+            api_keys.append(value.encode())
+
+    signature_secret = None
+    ed25519_public_key = None
+    if inbound_config.signature_secret:
+        secret = _decrypt(encryption_service, inbound_config.signature_secret, **log_context)
+        if secret is not None:
+            if inbound_config.auth_method == InboundAuthMethod.ed25519:
+                ed25519_public_key = secret
+            else:
+                signature_secret = secret.encode("utf-8")
+
+    template = None
+    template_error = None
+    template_error_line = None
+    if inbound_config.transform_template:
+        try:
+            template = compile_template(inbound_config.transform_template)
+        except TemplateSyntaxError as e:
+            template_error = e.message
+            template_error_line = e.lineno
+
+    return CompiledWebhook(
+        webhook_path=inbound_config.webhook_path,
+        inbound_config_id=inbound_config.id,
+        integration_id=integration.id,
+        organization_id=integration.organization_id,
+        provider=integration.provider.value,
+        integration_deleted=integration.deleted_at is not None,
+        integration_status=integration.status,
+        is_active=bool(inbound_config.is_active),
+        auth_method=inbound_config.auth_method,
+        destination_service=inbound_config.destination_service.value,
+        destination_config=inbound_config.destination_config,
+        api_keys=tuple(api_keys),
+        bearer_tokens=tuple(bearer_tokens),
+        signature_secret=signature_secret,
+        ed25519_public_key=ed25519_public_key,
+        template=template,
+        template_error=template_error,
+        template_error_line=template_error_line,
+    )
+
+
+class WebhookPipelineCache:
+    """TTL-LRU of ``CompiledWebhook`` keyed by webhook path."""
+
+    def __init__(self, ttl: float = 30, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "dict[str, Tuple[float, CompiledWebhook]]" = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a compile that raced one is not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, db: Session, webhook_path: str) -> Optional[CompiledWebhook]:
+        """Return the compiled pipeline for a path, or None if no config exists."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(webhook_path)
+            if entry is not None and entry[0] > now:
+                # Re-insert to keep dict order as recency order
+                self._entries[webhook_path] = self._entries.pop(webhook_path)
+                self.hits += 1
+                return entry[1]
+            generation = self._generation
+
+        self.misses += 1
+        inbound_config = (
+            db.query(IntegrationInboundConfig)
+            .options(
+                joinedload(IntegrationInboundConfig.integration).joinedload(
+                    Integration.credentials
+                )
+            )
+            .filter(IntegrationInboundConfig.webhook_path == webhook_path)
+            .first()
+        )
+        if inbound_config is None:
+            return None
+        compiled = compile_webhook(inbound_config)
+        if self.ttl > 0:
+            with self._lock:
+                if generation != self._generation:
+                    return compiled
+                self._entries.pop(webhook_path, None)
+                self._entries[webhook_path] = (now + self.ttl, compiled)
+                while len(self._entries) > self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+        return compiled
+
+    def invalidate_integration(self, integration_id: str) -> None:
+        """Drop every path served by an integration (its path may have changed)."""
+        with self._lock:
+            self._generation += 1
+            for path in [p for p, (_, c) in self._entries.items() if c.integration_id == integration_id]:
+                del self._entries[path]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+webhook_pipelines = WebhookPipelineCache(
+    ttl=settings.WEBHOOK_PIPELINE_CACHE_TTL_SECONDS,
+    max_entries=settings.WEBHOOK_PIPELINE_CACHE_MAX_ENTRIES,
+)
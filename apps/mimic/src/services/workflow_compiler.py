@@ -1,12 +1,62 @@
 """Workflow compiler service - converts visual workflow JSON to Tentacle spec"""
 
-from typing import Dict, Any, List
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional
+
+
+class WorkflowCompileError(ValueError):
+    """The workflow definition cannot be compiled (e.g. it has a cycle)"""
+
+
+def definition_hash(workflow_definition: Dict[str, Any]) -> str:
+    """Stable hash of a workflow definition, used as its compile cache key"""
+    canonical = json.dumps(workflow_definition, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
 
 class WorkflowCompiler:
-    """Service for compiling visual workflow definitions to Tentacle workflow specs"""
+    """Service for compiling visual workflow definitions to Tentacle workflow specs
+    
+    Steps are emitted in topological order with explicit ``depends_on`` step
+    IDs (and ``branch`` conditions taken from condition edges), so Tentacle
+    can run independent branches in parallel. Compiled specs are cached by
+    definition hash or version key; callers must treat them as read-only.
+    """
     
-    def compile(self, workflow_definition: Dict[str, Any]) -> Dict[str, Any]:
-        """Compile a visual workflow definition to Tentacle workflow spec format"""
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def compile(self, workflow_definition: Dict[str, Any], version_key: Optional[str] = None) -> Dict[str, Any]:
+        """Compile a visual workflow definition to Tentacle workflow spec format
+        
+        ``version_key`` identifies this exact definition (e.g. workflow ID and
+        version) and saves hashing it; by default the definition is hashed.
+        
+        Raises:
+            WorkflowCompileError: If the reachable graph has a cycle
+        """
+        key = version_key or definition_hash(workflow_definition)
+        with self._lock:
+            spec = self._cache.get(key)
+            if spec is not None:
+                self._cache.move_to_end(key)
+                return spec
+        
+        spec = self._compile(workflow_definition)
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = spec
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return spec
+    
+    def _compile(self, workflow_definition: Dict[str, Any]) -> Dict[str, Any]:
+        """Compile without the cache"""
         # Extract workflow metadata
         name = workflow_definition.get("name", "notification_workflow")
         description = workflow_definition.get("description", "")
@@ -46,53 +96,74 @@ class WorkflowCompiler:
         return inputs
     
     def _build_steps(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Build workflow steps from nodes and edges"""
+        """Build workflow steps in dependency order, each with its ``depends_on``"""
         steps = []
         
-        # Create a map of node IDs to nodes
+        # Create a map of node IDs to nodes and of node IDs to outgoing edges
         node_map = {node["id"]: node for node in nodes}
+        outgoing: Dict[str, List[Dict[str, Any]]] = {}
+        for edge in edges:
+            if edge.get("target") in node_map:
+                outgoing.setdefault(edge.get("source"), []).append(edge)
         
         # Find start node (trigger)
         start_node = next((n for n in nodes if n.get("type") == "trigger"), None)
         if not start_node:
             return steps
         
-        # Build steps by traversing the graph
-        visited = set()
-        self._traverse_node(start_node, node_map, edges, steps, visited)
+        # Only nodes reachable from the trigger become steps
+        reachable = {start_node["id"]}
+        queue = deque([start_node["id"]])
+        while queue:
+            for edge in outgoing.get(queue.popleft(), []):
+                if edge["target"] not in reachable:
+                    reachable.add(edge["target"])
+                    queue.append(edge["target"])
+        
+        in_degree = dict.fromkeys(reachable, 0)
+        for node_id in reachable:
+            for edge in outgoing.get(node_id, []):
+                in_degree[edge["target"]] += 1
+        
+        # Kahn's algorithm; a node is emitted once everything before it has been
+        step_deps: Dict[str, Dict[str, Optional[str]]] = {node_id: {} for node_id in reachable}
+        # Every other reachable node has an incoming edge; an edge back into
+        # the trigger leaves nothing to start from and is reported as a cycle
+        queue = deque([start_node["id"]] if in_degree[start_node["id"]] == 0 else [])
+        emitted = 0
+        while queue:
+            node_id = queue.popleft()
+            emitted += 1
+            
+            step = self._node_to_step(node_map[node_id])
+            deps = step_deps.pop(node_id)
+            if step:
+                step["depends_on"] = list(deps)
+                branches = {dep: condition for dep, condition in deps.items() if condition is not None}
+                if branches:
+                    step["branch"] = branches
+                steps.append(step)
+            
+            for edge in outgoing.get(node_id, []):
+                target_id = edge["target"]
+                target_deps = step_deps[target_id]
+                if step:
+                    target_deps.setdefault(node_id, edge.get("condition"))
+                else:
+                    # Nodes that are not steps (triggers) pass their dependencies on
+                    for dep, condition in deps.items():
+                        target_deps.setdefault(dep, condition)
+                in_degree[target_id] -= 1
+                if in_degree[target_id] == 0:
+                    queue.append(target_id)
+        
+        if emitted < len(reachable):
+            cycle = sorted(node_id for node_id, degree in in_degree.items() if degree > 0)
+            raise WorkflowCompileError(f"Workflow has a cycle through nodes: {', '.join(cycle[:10])}")
         
         return steps
     
-    def _traverse_node(
-        self,
-        node: Dict[str, Any],
-        node_map: Dict[str, Any],
-        edges: List[Dict[str, Any]],
-        steps: List[Dict[str, Any]],
-        visited: set
-    ):
-        """Traverse workflow graph and build steps"""
-        if node["id"] in visited:
-            return
-        
-        visited.add(node["id"])
-        
-        # Convert node to step
-        step = self._node_to_step(node)
-        if step:
-            steps.append(step)
-        
-        # Find outgoing edges
-        outgoing_edges = [e for e in edges if e.get("source") == node["id"]]
-        
-        # Traverse connected nodes
-        for edge in outgoing_edges:
-            target_id = edge.get("target")
-            if target_id and target_id in node_map:
-                target_node = node_map[target_id]
-                self._traverse_node(target_node, node_map, edges, steps, visited)
-    
-    def _node_to_step(self, node: Dict[str, Any]) -> Dict[str, Any]:
+    def _node_to_step(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Convert a workflow node to a Tentacle workflow step"""
         node_type = node.get("type")
         
@@ -6,6 +6,12 @@ set -e
 
 # Configurable concurrency (default: 2 for lower idle CPU)
 CELERY_CONCURRENCY=${CELERY_CONCURRENCY:-2}
+# Embedded beat schedules the webhook dispatcher; disable on extra worker replicas
+CELERY_BEAT=${CELERY_BEAT:-true}
+BEAT_ARGS=""
+if [ "$CELERY_BEAT" = "true" ]; then
+  BEAT_ARGS="--beat"
+fi
 
 echo "Starting Mimic Celery Worker..."
 
@@ -23,4 +29,5 @@ exec celery -A src.core.celery_app worker \
     --loglevel=info \
     --concurrency=${CELERY_CONCURRENCY} \
     --max-tasks-per-child=1000 \
+    ${BEAT_ARGS} \
     -Q mimic
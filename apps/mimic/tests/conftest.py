@@ -23,6 +23,8 @@ def get_password_hash(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
 from src.services.key_encryption import KeyEncryptionService
+from src.clients.provider_transport import provider_transports
+from src.services.template_service import system_templates
 
 
 # Test database URL (in-memory SQLite for unit tests)
@@ -243,11 +245,38 @@ def reset_encryption_key():
 
 @pytest.fixture(autouse=True)
 def reset_inkpass_singleton():
-    """Reset InkPass client singleton between tests to prevent state pollution."""
+    """Reset InkPass client and auth cache singletons between tests to prevent state pollution."""
     import src.api.auth as auth_module
     auth_module._inkpass_client = None
+    auth_module._auth_cache = None
     yield
     auth_module._inkpass_client = None
+    auth_module._auth_cache = None
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Reset the request rate limiter singleton between tests."""
+    import src.middleware.rate_limiting as rate_limiting_module
+    rate_limiting_module._rate_limiter = None
+    yield
+    rate_limiting_module._rate_limiter = None
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_transports():
+    """Forget provider pools and circuit breakers between tests."""
+    provider_transports.clear()
+    yield
+    provider_transports.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_system_templates():
+    """Clear the compiled system template cache between tests."""
+    system_templates.clear()
+    yield
+    system_templates.clear()
 
 
 @pytest.fixture(autouse=True)
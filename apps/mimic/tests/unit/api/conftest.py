@@ -0,0 +1,22 @@
+"""Fixtures for API route tests"""
+
+import pytest
+
+from src.services.webhook_pipeline import webhook_pipelines
+
+
+@pytest.fixture(autouse=True)
+def reset_action_rate_limiter():
+    """Reset the integration action rate limiter singleton between tests."""
+    import src.services.action_rate_limiter as action_rate_limiter_module
+    action_rate_limiter_module._action_rate_limiter = None
+    yield
+    action_rate_limiter_module._action_rate_limiter = None
+
+
+@pytest.fixture(autouse=True)
+def reset_webhook_pipelines():
+    """Clear the compiled webhook ingest pipelines between tests."""
+    webhook_pipelines.clear()
+    yield
+    webhook_pipelines.clear()
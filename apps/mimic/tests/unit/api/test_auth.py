@@ -146,3 +146,22 @@ def test_get_current_user_invalid_key(client):
     
     assert response.status_code == 401
 
+
+
+@pytest.mark.unit
+def test_deleted_api_key_stops_authenticating(db_session, test_api_key):
+    """Test that a deleted key is rejected even if AuthMiddleware cached it"""
+    from fastapi import HTTPException
+    from fastapi.security import HTTPAuthorizationCredentials
+    from src.api.routes.auth import get_current_user
+
+    db_key, api_key_value = test_api_key
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=api_key_value)
+    assert get_current_user(credentials, db_session).id == db_key.user_id
+
+    db_session.delete(db_key)
+    db_session.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(credentials, db_session)
+    assert exc_info.value.status_code == 401
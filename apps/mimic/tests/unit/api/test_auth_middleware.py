@@ -0,0 +1,84 @@
+"""Unit tests for AuthMiddleware API key resolution."""
+
+import threading
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import src.middleware.auth_middleware as auth_middleware
+from src.middleware.auth_middleware import AuthMiddleware, hash_api_key
+from src.services.auth_cache import AuthCache
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """Record blocking lookups and serve them from an in-memory key table."""
+    calls = []
+    keys = {hash_api_key("local-key"): {"user_id": "user-1", "subscription_tier": "annual"}}
+
+    def fake_lookup(key_hash):
+        calls.append(threading.current_thread().name)
+        return keys.get(key_hash)
+
+    cache = AuthCache()
+    monkeypatch.setattr(auth_middleware, "lookup_api_key_user", fake_lookup)
+    monkeypatch.setattr(auth_middleware, "get_auth_cache", lambda: cache)
+    return calls
+
+
+@pytest.fixture
+def middleware_client():
+    app = FastAPI()
+    app.add_middleware(AuthMiddleware)
+
+    @app.get("/whoami")
+    async def whoami(request: Request):
+        return {
+            "user_id": getattr(request.state, "user_id", None),
+            "tier": getattr(request.state, "subscription_tier", None),
+        }
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+def test_resolves_key_off_the_event_loop_and_caches(lookups, middleware_client):
+    headers = {"Authorization": "Bearer local-key"}
+
+    first = middleware_client.get("/whoami", headers=headers).json()
+    second = middleware_client.get("/whoami", headers=headers).json()
+
+    assert first == second == {"user_id": "user-1", "tier": "annual"}
+    assert len(lookups) == 1
+    assert lookups[0].startswith("mimic-auth")
+
+
+@pytest.mark.unit
+def test_unknown_key_is_negatively_cached(lookups, middleware_client):
+    headers = {"Authorization": "Bearer unknown-key"}
+
+    middleware_client.get("/whoami", headers=headers)
+    response = middleware_client.get("/whoami", headers=headers)
+
+    assert response.json() == {"user_id": None, "tier": None}
+    assert len(lookups) == 1
+
+
+@pytest.mark.unit
+def test_jwt_bearer_tokens_are_not_looked_up(lookups, middleware_client):
+    response = middleware_client.get("/whoami", headers={"Authorization": "Bearer a.b.c"})
+
+    assert response.json()["user_id"] is None
+    assert lookups == []
+
+
+@pytest.mark.unit
+async def test_revocation_drops_cached_key(lookups):
+    cache = auth_middleware.get_auth_cache()
+
+    assert (await auth_middleware.resolve_api_key_user("local-key"))["user_id"] == "user-1"
+    await cache.invalidate(hash_api_key("local-key"))
+    assert (await auth_middleware.resolve_api_key_user("local-key"))["user_id"] == "user-1"
+
+    assert len(lookups) == 2
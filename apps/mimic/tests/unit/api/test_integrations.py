@@ -2925,6 +2925,43 @@ def test_gateway_webhook_signature_github_format_success(
     assert data["received"] is True
 
 
+@pytest.mark.unit
+def test_gateway_webhook_uses_rotated_secret_after_inbound_config_update(
+    client, mock_inkpass_permission_check, test_integration_with_inbound_signature_auth
+):
+    """Test that updating the inbound config invalidates the cached webhook pipeline."""
+    import hashlib
+    import hmac
+    import json
+
+    body = json.dumps({"event": "push"}).encode("utf-8")
+
+    def post(secret):
+        signature = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        return client.post(
+            "/api/v1/gateway/integrations/webhook-test-signature",
+            content=body,
+            headers={"Content-Type": "application/json", "X-Signature": signature},
+        )
+
+    assert post("my-webhook-secret").status_code == 200
+
+    response = client.put(
+        f"/api/v1/integrations/{test_integration_with_inbound_signature_auth.id}/inbound",
+        json={
+            "webhook_path": "webhook-test-signature",
+            "auth_method": "signature",
+            "signature_secret": "rotated-secret",
+            "destination_service": "tentacle",
+        },
+        headers={"Authorization": "Bearer mock-token"},
+    )
+    assert response.status_code == 200
+
+    assert post("my-webhook-secret").status_code == 401
+    assert post("rotated-secret").status_code == 200
+
+
 @pytest.mark.unit
 def test_gateway_webhook_bearer_success(client, test_integration_with_inbound_bearer_auth):
     """Test successful webhook receipt with Bearer token authentication."""
@@ -4129,9 +4166,12 @@ def test_execute_action_merges_with_default_template(client, mock_inkpass_permis
 @pytest.mark.unit
 def test_execute_action_rate_limit_exceeded_429(client, mock_inkpass_permission_check, test_integration_with_discord_outbound):
     """Test that rate limiting returns 429 when exceeded."""
-    with patch("src.api.routes.integrations._check_rate_limit") as mock_rate_limit:
+    from unittest.mock import AsyncMock
+    from src.services.action_rate_limiter import ActionLimitResult
+
+    with patch("src.api.routes.integrations._check_rate_limit", new_callable=AsyncMock) as mock_rate_limit:
         # Simulate rate limit exceeded
-        mock_rate_limit.return_value = (False, 30)  # Not allowed, 30 seconds retry
+        mock_rate_limit.return_value = ActionLimitResult(False, 30)  # Not allowed, 30 seconds retry
 
         response = client.post(
             "/api/v1/integrations/test-integration-discord-outbound/actions/send_message",
@@ -4145,6 +4185,72 @@ def test_execute_action_rate_limit_exceeded_429(client, mock_inkpass_permission_
     assert data["detail"]["retry_after_seconds"] == 30
 
 
+@pytest.mark.unit
+def test_execute_action_deferred_when_rate_limited(client, mock_inkpass_permission_check, test_integration_with_discord_outbound):
+    """Test that defer_if_rate_limited queues the action for its reserved slot."""
+    from unittest.mock import AsyncMock, MagicMock
+    from src.services.action_rate_limiter import ActionLimitResult
+
+    with patch("src.api.routes.integrations._check_rate_limit", new_callable=AsyncMock) as mock_rate_limit, \
+            patch("src.api.routes.integrations.get_execute_integration_action_task") as mock_get_task:
+        mock_rate_limit.return_value = ActionLimitResult(True, 3.2)  # Slot reserved 3.2s out
+        mock_task = MagicMock()
+        mock_get_task.return_value = mock_task
+        mock_task.apply_async.return_value = MagicMock(id="celery-deferred-1")
+
+        response = client.post(
+            "/api/v1/integrations/test-integration-discord-outbound/actions/send_message",
+            json={"content": "Hello", "defer_if_rate_limited": True},
+            headers={"Authorization": "Bearer mock-token"},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["job_id"] == "celery-deferred-1"
+    assert "4 seconds" in data["message"]
+    call_kwargs = mock_task.apply_async.call_args.kwargs
+    assert call_kwargs["countdown"] == 3.2
+    assert call_kwargs["kwargs"]["merged_params"] == {"content": "Hello"}
+    assert mock_rate_limit.call_args.kwargs["max_delay"] > 0
+
+
+@pytest.mark.unit
+def test_execute_action_provider_429_backs_off_route(client, mock_inkpass_permission_check, test_integration_with_discord_outbound):
+    """Test that a provider 429 is returned as 429 and blocks later sends until Retry-After."""
+    import httpx
+    from unittest.mock import AsyncMock, MagicMock
+
+    provider_response = httpx.Response(
+        429,
+        headers={"Retry-After": "7"},
+        request=httpx.Request("POST", "https://discord.com/api/webhooks/test"),
+    )
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client.post = AsyncMock(return_value=provider_response)
+        mock_client_class.return_value = mock_client
+
+        first = client.post(
+            "/api/v1/integrations/test-integration-discord-outbound/actions/send_message",
+            json={"content": "Hello"},
+            headers={"Authorization": "Bearer mock-token"},
+        )
+        second = client.post(
+            "/api/v1/integrations/test-integration-discord-outbound/actions/send_message",
+            json={"content": "Hello again"},
+            headers={"Authorization": "Bearer mock-token"},
+        )
+
+    assert first.status_code == 429
+    assert first.headers["Retry-After"] == "7"
+    assert second.status_code == 429
+    assert second.json()["detail"]["retry_after_seconds"] >= 6
+    assert mock_client.post.await_count == 1  # The second send never reached Discord
+
+
 @pytest.mark.unit
 def test_execute_action_rate_limit_not_configured_passes(client, mock_inkpass_permission_check, db_session):
     """Test that actions without rate limit configured always pass."""
@@ -4339,6 +4445,82 @@ def test_execute_action_celery_task_receives_correct_params(client, mock_inkpass
     assert call_kwargs["webhook_url"] is not None
 
 
+@pytest.mark.unit
+def test_execute_action_task_is_registered():
+    """Test that the queued-action task the route sends to exists in the worker."""
+    from src.api.routes.integrations import get_execute_integration_action_task
+    from src.core.celery_app import app as celery_app
+
+    task = get_execute_integration_action_task()
+
+    assert task.name == "mimic.tasks.execute_integration_action"
+    assert task.name in celery_app.tasks
+
+
+@pytest.mark.unit
+def test_execute_action_task_runs_the_action():
+    """Test that the Celery task runs the action with the queued params."""
+    from src.core.tasks import execute_integration_action
+
+    with patch("src.api.routes.integrations._execute_action_sync", new_callable=AsyncMock) as mock_execute:
+        mock_execute.return_value = {"message_id": "m-1"}
+
+        result = execute_integration_action.apply(kwargs=dict(
+            integration_id="int-1",
+            organization_id="org-1",
+            action_type="send_message",
+            provider="discord",
+            merged_params={"content": "Hello"},
+            webhook_url="https://discord.com/api/webhooks/test",
+        ))
+
+    assert result.get() == {"message_id": "m-1"}
+    assert mock_execute.call_args.kwargs["params"] == {"content": "Hello"}
+
+
+@pytest.mark.unit
+def test_execute_action_task_reserves_a_slot_for_its_retry(monkeypatch):
+    """Test that a provider 429 in the task backs off the buckets and reserves the retry's slot."""
+    import httpx
+    from celery.exceptions import Retry
+    from src.config import settings
+    from src.core.tasks import execute_integration_action
+    from src.services import action_rate_limiter
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_REDIS", False)
+    limiter = action_rate_limiter.ActionRateLimiter()
+    monkeypatch.setattr(action_rate_limiter, "_action_rate_limiter", limiter)
+    webhook_url = "https://discord.com/api/webhooks/123/token"
+    provider_response = httpx.Response(
+        429,
+        headers={"Retry-After": "7"},
+        request=httpx.Request("POST", webhook_url),
+    )
+
+    async def rate_limited_send(**kwargs):
+        await kwargs["on_response"](provider_response)
+        raise httpx.HTTPStatusError("429", request=provider_response.request, response=provider_response)
+
+    with patch("src.api.routes.integrations._execute_action_sync", side_effect=rate_limited_send), \
+            patch.object(execute_integration_action, "retry", side_effect=Retry()) as mock_retry:
+        execute_integration_action.apply(kwargs=dict(
+            integration_id="int-1",
+            organization_id="org-1",
+            action_type="send_message",
+            provider="discord",
+            merged_params={"content": "Hello"},
+            webhook_url=webhook_url,
+        ))
+
+    countdown = mock_retry.call_args.kwargs["countdown"]
+    assert countdown >= 7
+    # The retry's slot is taken: the next action on this webhook comes after it
+    buckets = action_rate_limiter.action_buckets("int-1", "discord", {"content": "Hello"}, webhook_url=webhook_url)
+    later = limiter.local.acquire(buckets)
+    assert not later.allowed
+    assert later.delay > countdown
+
+
 @pytest.mark.unit
 def test_execute_action_slack_send_message(client, mock_inkpass_permission_check, db_session):
     """Test Slack send_message action execution."""
@@ -0,0 +1,122 @@
+"""Unit tests for GCRA rate limiting and the rate limiting middleware."""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+import src.middleware.rate_limiting as rate_limiting
+from src.config import settings
+from src.middleware.rate_limiting import LocalRateLimiter, RateLimiter, plan_limit
+from src.middleware.rate_limiting_middleware import RateLimitingMiddleware
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the limiter."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(rate_limiting.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_allows_a_full_burst_then_one_per_interval(clock):
+    limiter = LocalRateLimiter()
+
+    results = [limiter.check("user:a", limit=5, window_seconds=10) for _ in range(6)]
+
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+    assert results[5].retry_after == pytest.approx(2.0)
+
+    clock[0] += 2.0
+    assert limiter.check("user:a", limit=5, window_seconds=10).allowed is True
+    assert limiter.check("user:a", limit=5, window_seconds=10).allowed is False
+
+
+@pytest.mark.unit
+def test_keys_are_independent(clock):
+    limiter = LocalRateLimiter()
+
+    assert limiter.check("user:a", limit=1, window_seconds=60).allowed is True
+    assert limiter.check("user:a", limit=1, window_seconds=60).allowed is False
+    assert limiter.check("user:b", limit=1, window_seconds=60).allowed is True
+
+
+@pytest.mark.unit
+def test_idle_keys_are_evicted(clock):
+    limiter = LocalRateLimiter()
+    for user in range(100):
+        limiter.check(f"user:{user}", limit=10, window_seconds=1)
+
+    clock[0] += 5
+    limiter.check("user:new", limit=10, window_seconds=1)
+
+    assert len(limiter) == 1
+
+
+@pytest.mark.unit
+def test_state_is_bounded(clock):
+    limiter = LocalRateLimiter(max_entries=10)
+    for user in range(50):
+        limiter.check(f"user:{user}", limit=10, window_seconds=60)
+
+    assert len(limiter) == 10
+
+
+@pytest.mark.unit
+async def test_redis_failure_falls_back_to_local_limiter(clock):
+    class BrokenRedis:
+        calls = 0
+
+        def register_script(self, script):
+            async def run(keys, args):
+                BrokenRedis.calls += 1
+                raise ConnectionError("redis down")
+
+            return run
+
+    limiter = RateLimiter(BrokenRedis())
+
+    first = await limiter.check("user:a", limit=1, window_seconds=60)
+    second = await limiter.check("user:a", limit=1, window_seconds=60)
+
+    assert (first.allowed, second.allowed) == (True, False)
+    assert BrokenRedis.calls == 1  # Redis is not retried until the backoff expires
+
+
+@pytest.mark.unit
+def test_plan_limits_follow_subscription_tier():
+    assert plan_limit("annual") == settings.RATE_LIMIT_ANNUAL_REQUESTS
+    assert plan_limit("free") == settings.RATE_LIMIT_FREE_REQUESTS
+    assert plan_limit(None) == settings.RATE_LIMIT_FREE_REQUESTS
+    assert plan_limit("unknown") == settings.RATE_LIMIT_FREE_REQUESTS
+
+
+@pytest.mark.unit
+def test_middleware_returns_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_FREE_REQUESTS", 2)
+    monkeypatch.setattr(rate_limiting, "_rate_limiter", RateLimiter())
+
+    class FakeAuth(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            request.state.user_id = request.headers.get("X-Test-User")
+            request.state.subscription_tier = "free"
+            return await call_next(request)
+
+    app = FastAPI()
+    app.add_middleware(RateLimitingMiddleware)
+    app.add_middleware(FakeAuth)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    client = TestClient(app)
+    headers = {"X-Test-User": "user-1"}
+    responses = [client.get("/ping", headers=headers) for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[0].headers["X-RateLimit-Remaining"] == "1"
+    assert int(responses[2].headers["Retry-After"]) >= 1
+    assert client.get("/ping").status_code == 200  # anonymous requests are not limited
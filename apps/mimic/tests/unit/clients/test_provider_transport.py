@@ -0,0 +1,176 @@
+"""Unit tests for the shared provider transports."""
+
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from src.clients.provider_transport import (
+    CircuitOpenError,
+    ProviderPolicy,
+    ProviderPool,
+    ProviderTransportRegistry,
+)
+
+
+def mock_pool(handler, policy=ProviderPolicy(), provider="test"):
+    """ProviderPool whose shared connection is an httpx.MockTransport."""
+    pool = ProviderPool(provider, policy)
+    transport = httpx.MockTransport(handler)
+    semaphore = asyncio.Semaphore(policy.max_concurrency)
+    pool.connection = lambda host=None: (transport, semaphore)
+    return pool
+
+
+def client_for(pool, action="send"):
+    return httpx.AsyncClient(transport=pool.for_action(action))
+
+
+@pytest.mark.unit
+async def test_closing_a_client_keeps_the_shared_pool():
+    registry = ProviderTransportRegistry()
+    pool = registry.pool("discord")
+
+    async with httpx.AsyncClient(transport=pool.for_action("send_message")):
+        pass
+    transport, _ = pool.connection()
+
+    assert registry.pool("discord") is pool
+    assert pool.connection()[0] is transport
+    await registry.aclose()
+
+
+@pytest.mark.unit
+async def test_customer_endpoints_get_a_pool_and_limit_per_host():
+    registry = ProviderTransportRegistry()
+    webhooks = registry.pool("custom_webhook")
+    discord = registry.pool("discord")
+
+    assert webhooks.connection("slow.example.com") is not webhooks.connection("fast.example.com")
+    assert webhooks.connection("slow.example.com") is webhooks.connection("slow.example.com")
+    assert discord.connection("discord.com") is discord.connection("cdn.discordapp.com")
+    await registry.aclose()
+
+
+@pytest.mark.unit
+async def test_slow_customer_host_does_not_stall_other_hosts(monkeypatch):
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.host == "slow.example.com":
+            await release.wait()
+        return httpx.Response(204)
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", lambda **options: httpx.MockTransport(handler))
+    pool = ProviderPool("custom_webhook", ProviderPolicy(max_concurrency=2, per_host=True))
+
+    async with client_for(pool) as client:
+        stuck = [asyncio.create_task(client.post("https://slow.example.com/hook")) for _ in range(4)]
+        await asyncio.sleep(0.01)
+
+        response = await asyncio.wait_for(client.post("https://fast.example.com/hook"), timeout=1)
+
+        assert response.status_code == 204
+        release.set()
+        await asyncio.gather(*stuck)
+    await pool.aclose()
+
+
+@pytest.mark.unit
+async def test_circuit_opens_after_consecutive_failures_and_recovers(monkeypatch):
+    statuses = iter([503, 503, 200])
+    pool = mock_pool(
+        lambda request: httpx.Response(next(statuses)),
+        ProviderPolicy(failure_threshold=2, reset_timeout=30),
+    )
+    clock = [1000.0]
+    monkeypatch.setattr("src.clients.provider_transport.time.monotonic", lambda: clock[0])
+
+    async with client_for(pool) as client:
+        assert (await client.get("https://api.example.com/a")).status_code == 503
+        assert (await client.get("https://api.example.com/a")).status_code == 503
+        with pytest.raises(CircuitOpenError):
+            await client.get("https://api.example.com/a")
+        # Other hosts have their own breaker
+        assert pool.breaker("other.example.com").state == "closed"
+
+        clock[0] += 30
+        assert (await client.get("https://api.example.com/a")).status_code == 200
+    assert pool.breaker("api.example.com").state == "closed"
+
+
+@pytest.mark.unit
+async def test_failed_trial_reopens_the_circuit(monkeypatch):
+    def fail(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    pool = mock_pool(fail, ProviderPolicy(failure_threshold=1, reset_timeout=5))
+    clock = [1000.0]
+    monkeypatch.setattr("src.clients.provider_transport.time.monotonic", lambda: clock[0])
+
+    async with client_for(pool) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://api.example.com/")
+        clock[0] += 5
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://api.example.com/")  # the half-open trial
+        with pytest.raises(CircuitOpenError):
+            await client.get("https://api.example.com/")
+
+
+@pytest.mark.unit
+async def test_concurrency_is_bounded_per_provider():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(204)
+
+    pool = mock_pool(handler, ProviderPolicy(max_concurrency=3))
+    async with client_for(pool) as client:
+        await asyncio.gather(*(client.post("https://api.example.com/") for _ in range(10)))
+
+    assert peak == 3
+
+
+@pytest.mark.unit
+async def test_latency_is_recorded_by_provider_action_and_status():
+    pool = mock_pool(lambda request: httpx.Response(404), provider="latency-test")
+    labels = {"provider": "latency-test", "action": "lookup", "status": "4xx"}
+
+    async with client_for(pool, "lookup") as client:
+        await client.get("https://api.example.com/")
+        await client.get("https://api.example.com/")
+
+    count = REGISTRY.get_sample_value("mimic_provider_request_duration_seconds_count", labels)
+    assert count == 2
+    assert pool.breaker("api.example.com").state == "closed"  # 4xx is not a provider failure
+
+
+@pytest.mark.unit
+def test_pool_is_closed_when_its_loop_finishes(monkeypatch):
+    closed = []
+    original_aclose = httpx.AsyncHTTPTransport.aclose
+
+    async def record_aclose(self):
+        closed.append(self)
+        await original_aclose(self)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "aclose", record_aclose)
+    pool = ProviderPool("test")
+
+    async def deliver():
+        return pool.connection()[0]
+
+    first = asyncio.run(deliver())
+    assert closed == [first]
+
+    second = asyncio.run(deliver())
+    assert second is not first
+    assert closed == [first, second]
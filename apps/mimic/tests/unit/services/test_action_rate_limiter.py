@@ -0,0 +1,125 @@
+"""Unit tests for the multi-bucket outbound action rate limiter."""
+
+import httpx
+import pytest
+
+import src.middleware.rate_limiting as rate_limiting
+from src.services.action_rate_limiter import (
+    ActionRateLimiter,
+    Bucket,
+    LocalActionRateLimiter,
+    action_buckets,
+    provider_backoff,
+)
+
+DISCORD_WEBHOOK = "https://discord.com/api/webhooks/123456/secret-token"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the limiter."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(rate_limiting.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_discord_buckets_mirror_route_channel_and_global_limits():
+    buckets = action_buckets(
+        "int-1", "discord", {"thread_id": "999"}, webhook_url=DISCORD_WEBHOOK,
+        rate_limit_requests=10, rate_limit_window_seconds=60,
+    )
+
+    assert [(b.scope, b.key) for b in buckets] == [
+        ("route", "discord:route:123456"),
+        ("channel", "discord:channel:999"),
+        ("global", "discord:global:all"),
+        ("integration", "integration:int-1"),
+    ]
+    assert all("secret-token" not in b.key for b in buckets)
+
+
+@pytest.mark.unit
+def test_slack_buckets_are_scoped_to_the_integration():
+    buckets = action_buckets("int-1", "slack", {"channel": "#ops"}, webhook_url="https://hooks.slack.com/services/T/B/X")
+
+    keys = {b.scope: b.key for b in buckets}
+    assert keys["channel"] == "slack:channel:int-1:#ops"
+    assert keys["global"] == "slack:global:int-1"
+    assert "integration" not in keys  # no configured limit
+
+
+@pytest.mark.unit
+def test_all_buckets_must_admit_and_rejections_consume_nothing(clock):
+    limiter = LocalActionRateLimiter()
+    narrow = Bucket("route", "route", 1, 10)
+    wide = Bucket("global", "global", 5, 10)
+
+    assert limiter.acquire([narrow, wide]).allowed is True
+    rejected = limiter.acquire([narrow, wide])
+
+    assert rejected.allowed is False
+    assert rejected.bucket == narrow
+    assert rejected.delay == pytest.approx(10.0)
+    # Only the admitted request counted against the wide bucket
+    assert [limiter.acquire([wide]).allowed for _ in range(5)] == [True] * 4 + [False]
+
+
+@pytest.mark.unit
+def test_deferred_requests_reserve_consecutive_slots(clock):
+    limiter = LocalActionRateLimiter()
+    bucket = Bucket("route", "route", 1, 2)
+
+    delays = [limiter.acquire([bucket], max_delay=5).delay for _ in range(3)]
+    over = limiter.acquire([bucket], max_delay=5)
+
+    assert delays == [0.0, 2.0, 4.0]
+    assert (over.allowed, over.delay) == (False, 6.0)
+
+
+@pytest.mark.unit
+def test_provider_backoff_reads_discord_and_retry_after_headers():
+    assert provider_backoff(429, httpx.Headers({"Retry-After": "2.5", "X-RateLimit-Global": "true"})) == (2.5, "global")
+    assert provider_backoff(429, httpx.Headers({"Retry-After": "3"})) == (3.0, "route")
+    assert provider_backoff(
+        200, httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"})
+    ) == (1.5, "route")
+    assert provider_backoff(200, httpx.Headers({"X-RateLimit-Remaining": "4"})) == (0.0, "")
+
+
+@pytest.mark.unit
+async def test_provider_429_blocks_the_bucket_for_its_retry_after(clock):
+    limiter = ActionRateLimiter()
+    buckets = action_buckets("int-1", "discord", {}, webhook_url=DISCORD_WEBHOOK)
+
+    await limiter.observe(buckets, 429, httpx.Headers({"Retry-After": "7"}))
+
+    blocked = await limiter.acquire(buckets)
+    assert blocked.allowed is False
+    assert blocked.bucket.scope == "route"
+    assert blocked.delay == pytest.approx(7.0)
+
+    clock[0] += 7
+    assert (await limiter.acquire(buckets)).allowed is True
+
+
+@pytest.mark.unit
+async def test_redis_failure_falls_back_to_local_limiter(clock):
+    class BrokenRedis:
+        calls = 0
+
+        def register_script(self, script):
+            async def run(keys, args):
+                BrokenRedis.calls += 1
+                raise ConnectionError("redis down")
+
+            return run
+
+    limiter = ActionRateLimiter(BrokenRedis())
+    bucket = [Bucket("integration:a", "integration", 1, 60)]
+
+    first = await limiter.acquire(bucket)
+    second = await limiter.acquire(bucket)
+
+    assert (first.allowed, second.allowed) == (True, False)
+    assert BrokenRedis.calls == 1  # Redis is not retried until the backoff expires
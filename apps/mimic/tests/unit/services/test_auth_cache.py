@@ -0,0 +1,245 @@
+"""Unit tests for InkPass auth caching and the pooled InkPass client."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from jose import jwt
+
+from src.api.auth import InkPassClient
+from src.services.auth_cache import AuthCache, RevocationListener, hash_token
+
+
+def make_client(handler, cache=None):
+    """InkPassClient whose pooled connection is served by ``handler``."""
+    client = InkPassClient("http://inkpass", cache=cache or AuthCache())
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._client_loop = asyncio.get_running_loop()
+    return client
+
+
+@pytest.mark.unit
+async def test_validate_token_is_cached():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "user-1"})
+
+    client = make_client(handler)
+    first = await client.validate_token("tok")
+    second = await client.validate_token("tok")
+
+    assert first == second == {"id": "user-1"}
+    assert calls == ["/api/v1/auth/me"]
+    await client.aclose()
+
+
+@pytest.mark.unit
+async def test_rejections_are_cached_but_outages_are_not():
+    responses = [httpx.Response(503), httpx.Response(401), httpx.Response(200, json={"id": "u"})]
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return responses[len(calls) - 1]
+
+    client = make_client(handler)
+
+    assert await client.validate_api_key("key") is None  # 503: retried next time
+    assert await client.validate_api_key("key") is None  # 401: cached
+    assert await client.validate_api_key("key") is None
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.unit
+async def test_permission_checks_are_cached_per_action():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["action"])
+        return httpx.Response(200, json={"has_permission": request.url.params["action"] == "read"})
+
+    client = make_client(handler)
+
+    assert await client.check_permission("tok", "integrations", "read") is True
+    assert await client.check_permission("tok", "integrations", "delete") is False
+    assert await client.check_permission("tok", "integrations", "read") is True
+    assert calls == ["read", "delete"]
+    await client.aclose()
+
+
+@pytest.mark.unit
+async def test_expired_jwt_is_not_cached():
+    token = jwt.encode({"sub": "u", "exp": int(time.time()) - 10}, "secret", algorithm="HS256")
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"id": "u"})
+
+    client = make_client(handler)
+    await client.validate_token(token)
+    await client.validate_token(token)
+
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.unit
+async def test_concurrent_misses_share_one_load():
+    cache = AuthCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": "u"}, True
+
+    results = await asyncio.gather(*(cache.get_or_load("tok", "token", loader) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result == {"id": "u"} for result in results)
+
+
+@pytest.mark.unit
+async def test_loader_error_propagates_to_waiters_and_is_not_cached():
+    cache = AuthCache()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        cache.get_or_load("tok", "token", failing),
+        cache.get_or_load("tok", "token", failing),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+async def test_waiters_retry_when_the_leading_load_is_cancelled():
+    cache = AuthCache()
+    calls = 0
+    started = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.01)
+        return {"id": "u"}, True
+
+    leader = asyncio.create_task(cache.get_or_load("tok", "token", loader))
+    await started.wait()
+    waiters = [asyncio.create_task(cache.get_or_load("tok", "token", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    results = await asyncio.gather(*waiters)
+
+    assert leader.cancelled()
+    assert results == [{"id": "u"}] * 3
+    assert calls == 2
+
+
+@pytest.mark.unit
+async def test_lru_evicts_oldest_entry():
+    cache = AuthCache(max_entries=2)
+
+    async def loader():
+        return {"id": "u"}, True
+
+    for token in ("a", "b", "c"):
+        await cache.get_or_load(token, "token", loader)
+
+    assert len(cache) == 2
+    assert cache._get_local((hash_token("a"), "token")) == (False, None)
+
+
+@pytest.mark.unit
+async def test_revocation_message_invalidates_token():
+    cache = AuthCache()
+    values = iter([{"id": "u"}, None])
+
+    async def loader():
+        return next(values), True
+
+    await cache.get_or_load("tok", "token", loader)
+    listener = RevocationListener(cache, redis_client=None, channel="revocations")
+    await listener.handle(json.dumps({"token_hash": hash_token("tok")}))
+
+    assert await cache.get_or_load("tok", "token", loader) is None
+
+
+class FakeRedis:
+    """The few Redis commands AuthCache uses, on dicts."""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key) or 0) + 1
+        return self.values[key]
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+@pytest.mark.unit
+async def test_revoke_all_drops_the_shared_tier():
+    redis = FakeRedis()
+    worker, other_worker = AuthCache(redis_client=redis), AuthCache(redis_client=redis)
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return {"id": "u", "role": len(loads)}, True
+
+    await worker.get_or_load("tok", "token", loader)
+    assert (await other_worker.get_or_load("tok", "token", loader))["role"] == 1
+
+    listener = RevocationListener(worker, redis_client=redis, channel="revocations")
+    await listener.handle(json.dumps({"all": True}))
+    other_worker.clear_local()  # Its own listener got the message too
+
+    assert (await other_worker.get_or_load("tok", "token", loader))["role"] == 2
+    assert len(loads) == 2
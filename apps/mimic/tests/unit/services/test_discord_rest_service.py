@@ -22,7 +22,7 @@ class TestSendFollowup:
         expected_url = f"{DISCORD_API_BASE}/webhooks/{app_id}/{token}"
         mock_response_data = {"id": "msg-1", "content": content}
 
-        with patch("src.services.discord_rest_service.httpx.AsyncClient") as MockClient:
+        with patch("httpx.AsyncClient") as MockClient:
             mock_client = AsyncMock()
             # httpx.Response methods are synchronous, so use MagicMock
             mock_resp = MagicMock()
@@ -53,7 +53,7 @@ class TestSendFollowup:
         content = "Results:"
         embeds = [{"title": "Test", "description": "Embed content"}]
 
-        with patch("src.services.discord_rest_service.httpx.AsyncClient") as MockClient:
+        with patch("httpx.AsyncClient") as MockClient:
             mock_client = AsyncMock()
             mock_resp = MagicMock()
             mock_resp.json.return_value = {"id": "msg-2"}
@@ -81,7 +81,7 @@ class TestSendFollowup:
         app_id = "123456789"
         token = "interaction-token-abc"
 
-        with patch("src.services.discord_rest_service.httpx.AsyncClient") as MockClient:
+        with patch("httpx.AsyncClient") as MockClient:
             mock_client = AsyncMock()
             mock_resp = MagicMock()
             mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -1,7 +1,14 @@
 """Unit tests for key encryption service"""
 
 import pytest
-from src.services.key_encryption import KeyEncryptionService
+from src.services import key_encryption
+from src.services.key_encryption import (
+    DecryptedSecretCache,
+    KeyEncryptionService,
+    Keyring,
+    parse_encryption_keys,
+    reencrypt_stored_secrets,
+)
 
 
 @pytest.fixture
@@ -74,3 +81,100 @@ def test_encrypt_long_string(encryption_service):
     decrypted = encryption_service.decrypt(encrypted)
     assert decrypted == long_string
 
+
+@pytest.mark.unit
+def test_keyring_is_derived_once_per_process():
+    """Test that services share one derived keyring"""
+    assert KeyEncryptionService().keyring is KeyEncryptionService().keyring
+
+
+@pytest.mark.unit
+def test_rotation_keeps_old_ciphertexts_readable():
+    """Test that a new primary version still decrypts older versions"""
+    old = Keyring({1: "legacy-secret"})
+    new = Keyring({1: "legacy-secret", 2: "new-secret"})
+
+    legacy_ciphertext = old.encrypt("secret")
+    rotated = new.rotate(legacy_ciphertext)
+
+    assert not legacy_ciphertext.startswith("v")
+    assert rotated.startswith("v2:")
+    assert new.decrypt(legacy_ciphertext) == new.decrypt(rotated) == "secret"
+    assert new.needs_rotation(legacy_ciphertext) and not new.needs_rotation(rotated)
+    assert new.rotate(rotated) == rotated
+
+
+@pytest.mark.unit
+def test_unknown_key_version_is_rejected():
+    """Test decrypting with a key version that is not configured"""
+    ciphertext = Keyring({1: "a", 3: "b"}).encrypt("secret")
+
+    with pytest.raises(ValueError):
+        Keyring({1: "a"}).decrypt(ciphertext)
+
+
+@pytest.mark.unit
+def test_parse_encryption_keys():
+    """Test ENCRYPTION_KEYS parsing"""
+    assert parse_encryption_keys("2:abc, 3:d:e") == {2: "abc", 3: "d:e"}
+    assert parse_encryption_keys("") == {}
+    with pytest.raises(ValueError):
+        parse_encryption_keys("1:shadows-encryption-key")
+    with pytest.raises(ValueError):
+        parse_encryption_keys("no-version")
+
+
+@pytest.mark.unit
+def test_decrypt_cached(encryption_service, monkeypatch):
+    """Test that hot secrets are decrypted once and expire with the TTL"""
+    cache = DecryptedSecretCache(ttl=60)
+    monkeypatch.setattr(key_encryption, "_decrypted_cache", cache)
+    ciphertext = encryption_service.encrypt("signing-secret")
+    calls = []
+    real_decrypt = encryption_service.keyring.decrypt
+    monkeypatch.setattr(encryption_service.keyring, "decrypt", lambda c: calls.append(c) or real_decrypt(c))
+
+    assert encryption_service.decrypt_cached(ciphertext) == "signing-secret"
+    assert encryption_service.decrypt_cached(ciphertext) == "signing-secret"
+    assert len(calls) == 1
+
+    cache.ttl = 0
+    cache.clear()
+    encryption_service.decrypt_cached(ciphertext)
+    encryption_service.decrypt_cached(ciphertext)
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+def test_reencrypt_stored_secrets_moves_rows_to_primary_key():
+    """Test the background re-encryption job"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.database import Base
+    from src.database.models import (
+        Integration, IntegrationCredential, IntegrationInboundConfig, ProviderKey, User,
+    )
+
+    engine = create_engine("sqlite:///:memory:")
+    models = [User, ProviderKey, Integration, IntegrationCredential, IntegrationInboundConfig]
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in models])
+    db = sessionmaker(bind=engine)()
+
+    old = Keyring({1: "legacy-secret"})
+    new = Keyring({1: "legacy-secret", 2: "new-secret"})
+    db.add(User(id="u1", email="u1@example.com", password_hash="x"))
+    for i in range(5):
+        db.add(ProviderKey(
+            id=f"pk{i}", user_id="u1", provider_type="email",
+            encrypted_api_key=old.encrypt(f"key-{i}"),
+        ))
+    db.commit()
+
+    counts = reencrypt_stored_secrets(db, batch_size=2, keyring=new)
+
+    assert counts["provider_keys.encrypted_api_key"] == 5
+    rows = db.query(ProviderKey).order_by(ProviderKey.id).all()
+    assert all(row.encrypted_api_key.startswith("v2:") for row in rows)
+    assert [new.decrypt(row.encrypted_api_key) for row in rows] == [f"key-{i}" for i in range(5)]
+    # Rerunning finds nothing left to rotate
+    assert reencrypt_stored_secrets(db, keyring=new)["provider_keys.encrypted_api_key"] == 0
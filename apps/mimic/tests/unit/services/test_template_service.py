@@ -0,0 +1,104 @@
+"""Unit tests for compiled, cached system templates."""
+
+import pytest
+
+from src.services.template_service import (
+    CompiledContent,
+    TemplateCache,
+    TemplateNotFoundError,
+    TemplateService,
+    system_templates,
+)
+
+
+@pytest.fixture
+def service(db_session):
+    return TemplateService(db_session, cache=TemplateCache(ttl=30))
+
+
+@pytest.mark.unit
+def test_content_renders_literals_and_variables():
+    content = CompiledContent.parse("Hi {{name}}, join {{org}}{{suffix}}!")
+
+    assert content.parts == ("Hi ", "name", ", join ", "org", "", "suffix", "!")
+    assert content.render({"name": "Ada", "org": "Acme", "suffix": 1}) == "Hi Ada, join Acme1!"
+    # Missing variables keep their placeholder
+    assert content.render({"name": "Ada"}) == "Hi Ada, join {{org}}{{suffix}}!"
+
+
+@pytest.mark.unit
+def test_org_template_overrides_platform_template(service):
+    service.create_template("welcome", "Welcome {{name}}", "Platform body")
+    service.create_template("welcome", "Hello {{name}}", "Org body", organization_id="org-1")
+
+    assert service.get_compiled("welcome", "org-1").organization_id == "org-1"
+    assert service.get_compiled("welcome", "org-2").organization_id is None
+    assert service.get_template("welcome").organization_id is None
+    with pytest.raises(TemplateNotFoundError):
+        service.get_compiled("missing", "org-1")
+
+
+@pytest.mark.unit
+def test_cached_lookup_skips_the_database(service, db_session, monkeypatch):
+    service.create_template("invite", "Join {{org}}", "Click {{link}}")
+    first = service.get_compiled("invite", "org-1")
+
+    def no_query(*args, **kwargs):
+        raise AssertionError("cached lookup hit the database")
+
+    monkeypatch.setattr(db_session, "query", no_query)
+    assert service.get_compiled("invite", "org-1") is first
+    assert service.cache.hits == 1
+
+
+@pytest.mark.unit
+def test_create_and_update_invalidate_the_cache(service):
+    platform = service.create_template("reset", "Reset", "Code {{code}}")
+    assert service.get_compiled("reset", "org-1").id == platform.id
+
+    # A new org template shadows the cached platform one straight away
+    org_template = service.create_template("reset", "Reset", "Your code: {{code}}", organization_id="org-1")
+    assert service.get_compiled("reset", "org-1").id == org_template.id
+
+    updated = service.update_template(org_template.id, content_text="Use {{code}} within {{minutes}} min")
+    compiled = service.get_compiled("reset", "org-1")
+
+    assert updated.version == 2
+    assert sorted(updated.variables) == ["code", "minutes"]
+    assert compiled.version == 2
+    assert service.render_template(compiled, {"code": "123", "minutes": 5})[1] == "Use 123 within 5 min"
+
+
+@pytest.mark.unit
+def test_render_many_matches_single_renders(service):
+    template = service.create_template(
+        "digest", "{{count}} updates", "Hi {{name}}", content_html="<p>Hi {{name}}</p>"
+    )
+    contexts = [{"name": f"user-{i}", "count": i} for i in range(3)]
+
+    rendered = service.render_many(template, contexts)
+
+    assert rendered == [service.render_template(template, c) for c in contexts]
+    assert rendered[2] == ("2 updates", "Hi user-2", "<p>Hi user-2</p>")
+
+
+@pytest.mark.unit
+def test_injected_empty_cache_is_used(service):
+    assert len(service.cache) == 0
+    assert service.cache is not system_templates
+
+
+@pytest.mark.unit
+def test_recreated_template_is_not_served_from_another_workers_cache(service, db_session):
+    other_worker = TemplateService(db_session, cache=TemplateCache(ttl=0))
+    old = service.create_template("notice", "Old subject", "Old body")
+    stale = other_worker.get_compiled("notice")
+    assert stale.subject.render({}) == "Old subject"
+
+    service.update_template(old.id, is_active=False)
+    new = service.create_template("notice", "New subject", "New body")
+    assert new.version == stale.version == 1
+
+    compiled = other_worker.get_compiled("notice")
+    assert compiled.id == new.id
+    assert service.render_template(compiled, {})[:2] == ("New subject", "New body")
@@ -0,0 +1,209 @@
+"""Unit tests for stored gateway webhook events and their dispatcher."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import src.services.webhook_dispatcher as webhook_dispatcher
+from src.database.models import WebhookDelivery, WebhookEvent
+from src.services.webhook_dispatcher import dispatch_pending_events, store_webhook_event
+
+
+class FakeBroker:
+    """Records sent tasks; fails the sends listed in ``failures``."""
+
+    def __init__(self, failures=()):
+        self.sent = []
+        self.failures = list(failures)
+
+    def send_task(self, task_name, kwargs):
+        if self.failures and self.failures.pop(0):
+            raise ConnectionError("broker unavailable")
+        self.sent.append((task_name, kwargs["webhook_event_id"]))
+        return SimpleNamespace(id=f"task-{len(self.sent)}")
+
+
+@pytest.fixture
+def session_factory(db_session):
+    """Sessions on the test database, as the ingest pool would open them."""
+    return sessionmaker(bind=db_session.get_bind())
+
+
+def stripe_event(db_session, event_id, customer, event_type="customer.subscription.updated", offset=0):
+    event = WebhookEvent(
+        id=event_id,
+        provider="stripe",
+        event_type=event_type,
+        event_id=f"evt_{event_id}",
+        payload={"object": {"id": f"sub_{event_id}", "customer": customer}},
+        status="received",
+        ordering_key=webhook_dispatcher.ordering_key("stripe", {"object": {"customer": customer}}),
+        created_at=datetime(2026, 1, 1) + timedelta(seconds=offset),
+    )
+    db_session.add(event)
+    db_session.commit()
+    return event
+
+
+def finish_deliveries(db_session, event_id):
+    """Mark an event's routing tasks as finished, as the tasks themselves do."""
+    for delivery in db_session.query(WebhookDelivery).filter(WebhookDelivery.event_id == event_id):
+        delivery.status = "success"
+    db_session.commit()
+
+
+@pytest.mark.unit
+def test_store_is_idempotent_per_provider_event(db_session, session_factory):
+    payload = {"object": {"object": "customer", "id": "cus_1"}}
+
+    first = store_webhook_event("stripe", "customer.updated", "evt_1", payload, session_factory=session_factory)
+    second = store_webhook_event("stripe", "customer.updated", "evt_1", payload, session_factory=session_factory)
+
+    assert first[1] is True
+    assert second == (first[0], False)
+    event = db_session.query(WebhookEvent).one()
+    assert (event.status, event.ordering_key) == ("received", "stripe:cus_1")
+
+
+@pytest.mark.unit
+def test_failed_event_holds_back_later_events_of_the_same_customer(db_session):
+    first = stripe_event(db_session, "a1", "cus_a", offset=0)
+    stripe_event(db_session, "a2", "cus_a", offset=1)
+    stripe_event(db_session, "b1", "cus_b", offset=2)
+    broker = FakeBroker(failures=[True])
+
+    counts = dispatch_pending_events(db_session, broker.send_task)
+
+    assert counts == {"delivered": 1, "retrying": 1, "dead_letter": 0, "deferred": 1}
+    assert [event_id for _, event_id in broker.sent] == ["b1"]
+    assert first.status == "retrying" and first.next_attempt_at > datetime.utcnow()
+
+    # Still not due: cus_a stays blocked and its later event is not even fetched
+    assert dispatch_pending_events(db_session, broker.send_task) == {
+        "delivered": 0, "retrying": 0, "dead_letter": 0, "deferred": 0
+    }
+
+    first.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    dispatch_pending_events(db_session, broker.send_task)
+    finish_deliveries(db_session, "a1")
+    dispatch_pending_events(db_session, broker.send_task)
+
+    assert [event_id for _, event_id in broker.sent] == ["b1", "a1", "a2"]
+    assert {e.status for e in db_session.query(WebhookEvent)} == {"delivered"}
+
+
+@pytest.mark.unit
+def test_later_event_waits_for_the_earlier_routing_task_to_finish(db_session):
+    stripe_event(db_session, "a1", "cus_a", event_type="customer.subscription.updated", offset=0)
+    stripe_event(db_session, "a2", "cus_a", event_type="customer.subscription.deleted", offset=1)
+    stripe_event(db_session, "b1", "cus_b", offset=2)
+    broker = FakeBroker()
+
+    first = dispatch_pending_events(db_session, broker.send_task)
+    # a1's task is still queued or running on a worker
+    second = dispatch_pending_events(db_session, broker.send_task)
+    finish_deliveries(db_session, "a1")
+    dispatch_pending_events(db_session, broker.send_task)
+
+    assert first["deferred"] == 1
+    assert second == {"delivered": 0, "retrying": 0, "dead_letter": 0, "deferred": 0}
+    assert [event_id for _, event_id in broker.sent] == ["a1", "b1", "a2"]
+
+
+@pytest.mark.unit
+def test_lost_routing_task_stops_holding_back_its_key(db_session, monkeypatch):
+    stripe_event(db_session, "a1", "cus_a", offset=0)
+    stripe_event(db_session, "a2", "cus_a", offset=1)
+    broker = FakeBroker()
+    dispatch_pending_events(db_session, broker.send_task)
+
+    monkeypatch.setattr(webhook_dispatcher.settings, "WEBHOOK_DISPATCH_ORDER_HOLD_SECONDS", 0)
+    dispatch_pending_events(db_session, broker.send_task)
+
+    assert [event_id for _, event_id in broker.sent] == ["a1", "a2"]
+
+
+@pytest.mark.unit
+def test_blocked_customer_does_not_starve_others(db_session):
+    waiting = stripe_event(db_session, "a0", "cus_a", offset=0)
+    waiting.status = "retrying"
+    waiting.next_attempt_at = datetime.utcnow() + timedelta(minutes=5)
+    db_session.commit()
+    for i in range(1, 6):
+        stripe_event(db_session, f"a{i}", "cus_a", offset=i)
+    stripe_event(db_session, "b1", "cus_b", offset=6)
+    broker = FakeBroker()
+
+    counts = dispatch_pending_events(db_session, broker.send_task, batch_size=5)
+
+    assert counts["delivered"] == 1
+    assert [event_id for _, event_id in broker.sent] == ["b1"]
+
+
+@pytest.mark.unit
+def test_retry_only_sends_tasks_not_sent_before(db_session, monkeypatch):
+    monkeypatch.setitem(webhook_dispatcher.EVENT_ROUTES["stripe"], "customer.subscription.updated", [
+        ("inkpass", "mimic.tasks.route_to_inkpass_subscription_updated"),
+        ("analytics", "mimic.tasks.record_subscription_change"),
+    ])
+    event = stripe_event(db_session, "a1", "cus_a")
+    broker = FakeBroker(failures=[False, True])
+
+    dispatch_pending_events(db_session, broker.send_task)
+    event.next_attempt_at = None
+    db_session.commit()
+    dispatch_pending_events(db_session, broker.send_task)
+
+    assert [task for task, _ in broker.sent] == [
+        "mimic.tasks.route_to_inkpass_subscription_updated",
+        "mimic.tasks.record_subscription_change",
+    ]
+    deliveries = db_session.query(WebhookDelivery).filter(WebhookDelivery.event_id == "a1").all()
+    assert sorted(d.status for d in deliveries) == ["dispatched", "dispatched"]
+    assert event.status == "delivered"
+
+
+@pytest.mark.unit
+def test_event_is_dead_lettered_after_max_attempts(db_session):
+    event = stripe_event(db_session, "a1", "cus_a")
+    later = stripe_event(db_session, "a2", "cus_a", offset=1)
+    broker = FakeBroker(failures=[True, True, False])
+
+    for _ in range(2):
+        dispatch_pending_events(db_session, broker.send_task, max_attempts=2)
+        if event.status == "retrying":
+            event.next_attempt_at = None
+            db_session.commit()
+
+    assert (event.status, event.retry_count) == ("dead_letter", 2)
+    assert "broker unavailable" in event.error_message
+    # A dead-lettered event no longer blocks its customer
+    assert later.status == "delivered"
+
+
+@pytest.mark.unit
+def test_resend_webhook_is_stored_and_acknowledged_before_dispatch(client, db_session, session_factory, monkeypatch):
+    monkeypatch.setattr(webhook_dispatcher, "SessionLocal", session_factory)
+    dispatch_requests = []
+    monkeypatch.setattr(
+        "src.api.routes.gateway_webhooks.request_dispatch", lambda: dispatch_requests.append(1)
+    )
+    delivered = {"type": "email.delivered", "data": {"email_id": "em_1"}}
+    opened = {"type": "email.opened", "data": {"email_id": "em_1"}}
+
+    response = client.post("/api/v1/gateway/webhooks/resend", json=delivered, headers={"svix-id": "msg_1"})
+    duplicate = client.post("/api/v1/gateway/webhooks/resend", json=delivered, headers={"svix-id": "msg_1"})
+    later = client.post("/api/v1/gateway/webhooks/resend", json=opened, headers={"svix-id": "msg_2"})
+
+    assert response.status_code == 200
+    event = db_session.query(WebhookEvent).filter(WebhookEvent.event_id == "msg_1").one()
+    assert response.json() == {"received": True, "event_type": "email.delivered", "event_id": event.id}
+    assert (event.status, event.ordering_key) == ("received", "resend:em_1")
+    assert duplicate.json()["status"] == "duplicate"
+    # Another event for the same email is not a duplicate; it shares the ordering key
+    assert later.json()["event_type"] == "email.opened" and "event_id" in later.json()
+    assert {e.ordering_key for e in db_session.query(WebhookEvent)} == {"resend:em_1"}
+    assert dispatch_requests == [1, 1]
@@ -0,0 +1,170 @@
+"""Unit tests for compiled webhook ingest pipelines."""
+
+import hashlib
+import hmac
+
+import pytest
+from jinja2.sandbox import SecurityError
+
+from src.database.models import (
+    CredentialType,
+    DestinationService,
+    InboundAuthMethod,
+    Integration,
+    IntegrationCredential,
+    IntegrationDirection,
+    IntegrationInboundConfig,
+    IntegrationProvider,
+    IntegrationStatus,
+)
+import src.services.webhook_pipeline as webhook_pipeline
+from src.api.routes.integrations import _transform_payload
+from src.services.key_encryption import KeyEncryptionService
+from src.services.webhook_pipeline import (
+    TemplateBudgetExceeded,
+    WebhookPipelineCache,
+    compile_template,
+    compile_webhook,
+    render_template,
+)
+
+
+@pytest.fixture
+def inbound_integration(db_session):
+    encryption_service = KeyEncryptionService()
+    integration = Integration(
+        id="pipeline-integration",
+        organization_id="org-1",
+        user_id="user-1",
+        name="Pipeline",
+        provider=IntegrationProvider.github,
+        direction=IntegrationDirection.inbound,
+        status=IntegrationStatus.active,
+    )
+    db_session.add(integration)
+    db_session.flush()
+    db_session.add(IntegrationCredential(
+        integration_id=integration.id,
+        credential_type=CredentialType.api_key,
+        encrypted_value=encryption_service.encrypt("key-123"),
+    ))
+    db_session.add(IntegrationInboundConfig(
+        id="pipeline-inbound",
+        integration_id=integration.id,
+        webhook_path="wh-pipeline",
+        auth_method=InboundAuthMethod.signature,
+        signature_secret=encryption_service.encrypt("hmac-secret"),
+        transform_template='{"event_type": "{{ action }}"}',
+        destination_service=DestinationService.tentacle,
+        is_active=True,
+    ))
+    db_session.commit()
+    return integration
+
+
+@pytest.mark.unit
+def test_pipeline_is_compiled_once_per_path(db_session, inbound_integration):
+    cache = WebhookPipelineCache(ttl=60)
+
+    first = cache.get_or_compile(db_session, "wh-pipeline")
+    second = cache.get_or_compile(db_session, "wh-pipeline")
+
+    assert first is second
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first.provider == "github"
+    assert first.destination_service == "tentacle"
+    assert render_template(first.template, action="opened") == '{"event_type": "opened"}'
+
+
+@pytest.mark.unit
+def test_unknown_path_is_not_cached(db_session):
+    cache = WebhookPipelineCache(ttl=60)
+
+    assert cache.get_or_compile(db_session, "wh-missing") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_invalidate_integration_drops_its_paths(db_session, inbound_integration):
+    cache = WebhookPipelineCache(ttl=60)
+    cache.get_or_compile(db_session, "wh-pipeline")
+
+    cache.invalidate_integration(inbound_integration.id)
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_compiled_verification(db_session, inbound_integration):
+    pipeline = WebhookPipelineCache(ttl=0).get_or_compile(db_session, "wh-pipeline")
+    body = b'{"action": "opened"}'
+    signature = hmac.new(b"hmac-secret", body, hashlib.sha256).hexdigest()
+
+    assert pipeline.verify_signature(body, None, f"sha256={signature}")
+    assert not pipeline.verify_signature(body, "0" * 64, None)
+    assert pipeline.verify_api_key("key-123")
+    assert not pipeline.verify_api_key("key-1234")
+    assert pipeline.verify_bearer("Bearer key-123")
+    assert not pipeline.verify_bearer("key-123")
+
+
+@pytest.mark.unit
+def test_template_syntax_error_is_kept_for_the_request(db_session, inbound_integration):
+    config = db_session.get(IntegrationInboundConfig, "pipeline-inbound")
+    config.transform_template = '{"event_type": "{{ action }"}'
+    db_session.commit()
+
+    pipeline = WebhookPipelineCache(ttl=0).get_or_compile(db_session, "wh-pipeline")
+
+    assert pipeline.template is None
+    assert pipeline.template_error and pipeline.template_error_line == 1
+
+    # Each event falls back to the raw payload with a fresh error
+    for _ in range(2):
+        transformed = _transform_payload(pipeline, {"action": "opened"}, "github")
+        assert (transformed.event_type, transformed.data) == ("webhook", {"action": "opened"})
+
+
+@pytest.mark.unit
+def test_compile_racing_an_invalidation_is_not_cached(db_session, inbound_integration, monkeypatch):
+    cache = WebhookPipelineCache(ttl=30)
+
+    def compile_then_invalidate(inbound_config):
+        compiled = compile_webhook(inbound_config)
+        cache.invalidate_integration(inbound_config.integration_id)
+        return compiled
+
+    monkeypatch.setattr(webhook_pipeline, "compile_webhook", compile_then_invalidate)
+    cache.get_or_compile(db_session, "wh-pipeline")
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_templates_render_in_an_immutable_sandbox():
+    payload = {"items": [1]}
+
+    with pytest.raises(SecurityError):
+        render_template(compile_template("{{ ''.__class__.__mro__ }}"))
+    with pytest.raises(SecurityError):
+        render_template(compile_template("{{ payload['items'].append(2) }}"), payload=payload)
+    assert payload == {"items": [1]}
+
+
+@pytest.mark.unit
+def test_render_time_budget():
+    template = compile_template(
+        "{% for i in range(100000) %}{% for j in range(100000) %}{% endfor %}{% endfor %}"
+    )
+
+    with pytest.raises(TemplateBudgetExceeded):
+        render_template(template, budget_seconds=0.05)
+
+
+@pytest.mark.unit
+def test_render_output_budget():
+    template = compile_template("{% for i in range(1000) %}xxxxxxxxxx{% endfor %}")
+
+    with pytest.raises(TemplateBudgetExceeded):
+        render_template(template, max_output_chars=5000)
+    assert len(render_template(template, max_output_chars=10000)) == 10000
@@ -1,7 +1,7 @@
 """Unit tests for workflow compiler service"""
 
 import pytest
-from src.services.workflow_compiler import WorkflowCompiler
+from src.services.workflow_compiler import WorkflowCompiler, WorkflowCompileError
 
 
 @pytest.fixture
@@ -157,3 +157,92 @@ def test_compile_multi_provider_workflow(compiler):
     # Should have multiple provider steps
     assert len(providers) >= 3
 
+
+@pytest.mark.unit
+def test_compile_emits_dependencies_for_parallel_branches(compiler):
+    """Test branches depend only on their own predecessors"""
+    workflow_json = {
+        "nodes": [
+            {"id": "start", "type": "trigger"},
+            {"id": "check", "type": "condition", "condition": "tier == 'pro'"},
+            {"id": "email", "type": "action", "provider": "email"},
+            {"id": "slack", "type": "action", "provider": "slack"},
+            {"id": "audit", "type": "action", "provider": "webhook"},
+            {"id": "done", "type": "action", "provider": "email"},
+            {"id": "orphan", "type": "action", "provider": "sms"},
+        ],
+        "edges": [
+            {"source": "start", "target": "check"},
+            {"source": "start", "target": "audit"},
+            {"source": "check", "target": "email", "condition": "true"},
+            {"source": "check", "target": "slack", "condition": "false"},
+            {"source": "email", "target": "done"},
+            {"source": "slack", "target": "done"},
+            {"source": "audit", "target": "done"},
+        ]
+    }
+
+    steps = {step["id"]: step for step in compiler.compile(workflow_json)["steps"]}
+    order = list(steps)
+
+    assert "orphan" not in steps
+    assert steps["check"]["depends_on"] == []
+    assert steps["audit"]["depends_on"] == []
+    assert steps["email"]["branch"] == {"check": "true"}
+    assert steps["slack"]["branch"] == {"check": "false"}
+    assert sorted(steps["done"]["depends_on"]) == ["audit", "email", "slack"]
+    assert all(order.index(dep) < order.index(step_id) for step_id in order for dep in steps[step_id]["depends_on"])
+
+
+@pytest.mark.unit
+def test_compile_rejects_cycles(compiler):
+    """Test a cycle reachable from the trigger is an error"""
+    workflow_json = {
+        "nodes": [
+            {"id": "1", "type": "trigger"},
+            {"id": "2", "type": "action"},
+            {"id": "3", "type": "action"},
+        ],
+        "edges": [
+            {"source": "1", "target": "2"},
+            {"source": "2", "target": "3"},
+            {"source": "3", "target": "2"},
+        ]
+    }
+
+    with pytest.raises(WorkflowCompileError, match="2, 3"):
+        compiler.compile(workflow_json)
+
+
+@pytest.mark.unit
+def test_compile_long_chain_without_recursion(compiler):
+    """Test a chain longer than the recursion limit compiles in order"""
+    count = 5000
+    workflow_json = {
+        "nodes": [{"id": "0", "type": "trigger"}]
+        + [{"id": str(i), "type": "action"} for i in range(1, count)],
+        "edges": [{"source": str(i), "target": str(i + 1)} for i in range(count - 1)],
+    }
+
+    steps = compiler.compile(workflow_json)["steps"]
+
+    assert [step["id"] for step in steps] == [str(i) for i in range(1, count)]
+    assert steps[-1]["depends_on"] == [str(count - 2)]
+
+
+@pytest.mark.unit
+def test_compile_is_cached_by_definition(compiler):
+    """Test identical definitions reuse the compiled spec"""
+    workflow_json = {
+        "nodes": [{"id": "1", "type": "trigger"}, {"id": "2", "type": "action"}],
+        "edges": [{"source": "1", "target": "2"}]
+    }
+
+    first = compiler.compile(workflow_json)
+    assert compiler.compile({"edges": workflow_json["edges"], "nodes": workflow_json["nodes"]}) is first
+
+    workflow_json["nodes"][1]["provider"] = "sms"
+    assert compiler.compile(workflow_json) is not first
+
+    # A version key skips hashing the definition
+    assert compiler.compile(workflow_json, version_key="wf-1:2") is compiler.compile({}, version_key="wf-1:2")
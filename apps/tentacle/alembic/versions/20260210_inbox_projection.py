@@ -0,0 +1,60 @@
+"""Add inbox projection table.
+
+Creates ``inbox_projections``, a denormalized row per inbox conversation
+holding the last assistant message preview, last activity time, unread
+count and title. ``ConversationStore.add_message`` keeps it current in the
+same transaction as the message insert, so inbox listing no longer scans
+message history with DISTINCT ON subqueries.
+
+Existing conversations are populated by the
+``src.core.tasks.backfill_inbox_projections`` Celery task, which should be
+run once after this migration.
+
+Revision ID: inbox_002
+Revises: memory_002
+Create Date: 2026-02-10 12:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers
+revision = "inbox_002"
+down_revision = "memory_002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create inbox_projections table and sort index."""
+    op.create_table(
+        "inbox_projections",
+        sa.Column(
+            "conversation_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("conversations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("user_id", sa.String(255), nullable=False),
+        sa.Column("source", sa.String(50), nullable=False, server_default="task"),
+        sa.Column("title", sa.Text(), nullable=True),
+        sa.Column("last_message_text", sa.Text(), nullable=True),
+        sa.Column("last_message_at", sa.DateTime(), nullable=True),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("unread_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("updated_at", sa.DateTime(), nullable=True, server_default=sa.func.now()),
+    )
+
+    # Matches the inbox sort order: newest activity first, conversation_id as tiebreaker
+    op.create_index(
+        "idx_inbox_projection_sort",
+        "inbox_projections",
+        ["user_id", "last_activity_at", "conversation_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop inbox_projections table."""
+    op.drop_index("idx_inbox_projection_sort", table_name="inbox_projections")
+    op.drop_table("inbox_projections")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark warm browser reuse for the Playwright plugins.
+
+Renders a local HTML fixture to PNG, first by launching Chromium per call
+(the previous behaviour), then through ``BrowserPool``. No network access
+is needed; requires ``playwright install chromium``.
+
+Usage:
+    python scripts/bench_browser_pool.py [--renders 20] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright  # noqa: E402
+
+from src.plugins.browser_pool import BrowserPool  # noqa: E402
+
+FIXTURE = """
+<!DOCTYPE html>
+<html><body style="margin:0;width:1200px;height:630px;background:#1DA1F2;
+display:flex;align-items:center;justify-content:center;font-family:sans-serif">
+<div style="color:white;font-size:48px;font-weight:600">Benchmark fixture {n}</div>
+</body></html>
+"""
+VIEWPORT = {"width": 1200, "height": 630}
+
+
+async def render_cold(n: int) -> bytes:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page(viewport=VIEWPORT)
+        await page.set_content(FIXTURE.format(n=n))
+        png = await page.screenshot(type="png")
+        await browser.close()
+    return png
+
+
+async def timed(label, render, renders: int, concurrency: int) -> None:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(n):
+        async with gate:
+            started = time.perf_counter()
+            await render(n)
+            return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*(one(n) for n in range(renders))))
+    elapsed = time.perf_counter() - started
+    p50 = latencies[len(latencies) // 2]
+    print(f"{label:<14} {renders / elapsed:6.1f} renders/s  p50 {p50 * 1000:7.0f} ms")
+
+
+async def main(renders: int, concurrency: int) -> None:
+    pool = BrowserPool(size=2, max_pages_per_browser=concurrency, max_contexts_per_browser=1000)
+
+    async def render_pooled(n: int) -> bytes:
+        async def shot(page):
+            await page.set_content(FIXTURE.format(n=n))
+            return await page.screenshot(type="png")
+
+        return await pool.run(shot, context_options={"viewport": VIEWPORT})
+
+    await asyncio.to_thread(pool.warm)
+    print(f"{renders} renders, {concurrency} concurrent")
+    await timed("cold launch", render_cold, renders, concurrency)
+    await timed("warm pool", render_pooled, renders, concurrency)
+    print(f"pool stats: {pool.stats}")
+    await asyncio.to_thread(pool.close)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--renders", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.renders, args.concurrency))
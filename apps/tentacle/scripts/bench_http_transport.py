@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTTP plugin's outbound transport against a local server.
+
+Compares a new ``httpx.AsyncClient`` per request (the previous behaviour)
+with the pooled ``OutboundHttpTransport`` at a fixed number of concurrent
+steps. The server is a local uvicorn app over plain HTTP, so the numbers
+measure connection setup and client overhead, not TLS or network latency.
+
+Usage:
+    python scripts/bench_http_transport.py [--requests 2000] [--concurrency 100]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from src.plugins.http_transport import OutboundHttpTransport  # noqa: E402
+
+BODY = b'{"name": "pikachu", "id": 25}'
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": BODY})
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run(label, send_one, total: int, concurrency: int) -> None:
+    gate = asyncio.Semaphore(concurrency)
+
+    async def step():
+        async with gate:
+            await send_one()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(step() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {total / elapsed:>9.0f} req/s  ({elapsed:.2f}s for {total})")
+
+
+async def main(total: int, concurrency: int) -> None:
+    port = _free_port()
+    server = start_server(port)
+    url = f"http://127.0.0.1:{port}/pokemon"
+
+    async def client_per_request():
+        async with httpx.AsyncClient(timeout=15) as client:
+            resp = await client.request("GET", url)
+            resp.json()
+
+    transport = OutboundHttpTransport(max_concurrency_per_host=concurrency)
+
+    async def pooled():
+        resp = await transport.request("GET", url, host="127.0.0.1", timeout=15)
+        resp.json()
+
+    print(f"{concurrency} concurrent steps against {url}")
+    await run("client per request", client_per_request, total, concurrency)
+    await run("pooled transport", pooled, total, concurrency)
+    await transport.aclose()
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark interpreted versus compiled SchemaValidator validation.
+
+Replays step payloads through ``validate_inputs`` and ``validate_outputs``
+with ``SchemaValidator(compiled=False)`` (the schema dict is interpreted on
+every call) and with the default compiled validator, after checking that
+both produce identical results.
+
+Payloads come from a JSONL file, one recorded step per line:
+    {"inputs_schema": {...}, "inputs": {...}, "outputs_schema": {...}, "outputs": {...}}
+Without ``--payloads`` a built-in sample is used, modelled on the seeded
+primitive schemas (scripts/seed_capabilities.py).
+
+Usage:
+    python scripts/bench_schema_validator.py [--payloads steps.jsonl] [--rounds 2000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structlog  # noqa: E402
+
+from src.validation.schema_validator import SchemaValidator  # noqa: E402
+
+SAMPLE_STEPS = [
+    {
+        "inputs_schema": {
+            "url": {"type": "string", "required": True},
+            "headers": {"type": "dict", "required": False},
+        },
+        "inputs": {"url": "https://pokeapi.co/api/v2/pokemon/25", "headers": {"Accept": "application/json"}},
+        "outputs_schema": {
+            "status_code": {"type": "int"},
+            "body": {"type": "string"},
+            "headers": {"type": "dict"},
+        },
+        "outputs": {"status_code": 200, "body": '{"name": "pikachu"}', "headers": {"content-type": "application/json"}},
+    },
+    {
+        "inputs_schema": {
+            "data": {"type": "dict", "required": True},
+            "indent": {"type": "int", "required": False, "default": 2, "min": 0, "max": 8},
+        },
+        "inputs": {"data": {"a": 1, "b": [1, 2, 3]}, "indent": "4"},
+        "outputs_schema": {"json_string": {"type": "string"}},
+        "outputs": {"json_string": '{"a": 1}'},
+    },
+    {
+        "inputs_schema": {
+            "items": {"type": "list", "required": True, "max_length": 1000},
+            "condition": {"type": "string", "required": True, "min_length": 1},
+        },
+        "inputs": {"items": list(range(50)), "condition": "item > 10"},
+        "outputs_schema": {"filtered": {"type": "list"}, "count": {"type": "int"}},
+        "outputs": {"filtered": list(range(11, 50)), "count": 39},
+    },
+    {
+        "inputs_schema": {
+            "query": {"type": "string", "required": True},
+            "max_results": {"type": "int", "min": 1, "max": 50},
+            "depth": {"type": "string", "enum": ["basic", "advanced"]},
+            "include_images": {"type": "bool"},
+        },
+        "inputs": {"query": "latest AI research", "max_results": 10, "depth": "basic", "include_images": "false"},
+        "outputs_schema": {
+            "results": {"type": "list"},
+            "sources": {"type": "list"},
+            "result_count": {"type": "int"},
+            "summary": {"type": "string", "nullable": True},
+        },
+        "outputs": {"results": [{"title": "t"}], "sources": ["https://example.com"], "result_count": 1},
+    },
+]
+
+
+def load_steps(path):
+    if not path:
+        return SAMPLE_STEPS
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run(validator, steps):
+    for step in steps:
+        validator.validate_inputs(step.get("inputs", {}), step.get("inputs_schema", {}))
+        validator.validate_outputs(step.get("outputs", {}), step.get("outputs_schema", {}))
+
+
+def timed(label, validator, steps, rounds):
+    run(validator, steps)  # warm-up (and compilation, for the compiled validator)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        run(validator, steps)
+    elapsed = time.perf_counter() - started
+    calls = rounds * len(steps) * 2
+    print(f"{label:<12} {calls / elapsed:>10.0f} validations/s  {elapsed / calls * 1e6:6.2f} us/validation")
+
+
+def main(path, rounds):
+    # Coercion debug lines would otherwise dominate the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+    steps = load_steps(path)
+    interpreted = SchemaValidator(compiled=False)
+    compiled = SchemaValidator()
+
+    for step in steps:
+        for method, data_key, schema_key in (
+            ("validate_inputs", "inputs", "inputs_schema"),
+            ("validate_outputs", "outputs", "outputs_schema"),
+        ):
+            data, schema = step.get(data_key, {}), step.get(schema_key, {})
+            expected = getattr(interpreted, method)(data, schema)
+            actual = getattr(compiled, method)(data, schema)
+            if (actual.to_dict(), actual.coerced_data) != (expected.to_dict(), expected.coerced_data):
+                sys.exit(f"Result mismatch in {method} for {data!r}")
+
+    print(f"{len(steps)} steps x {rounds} rounds (inputs + outputs)")
+    timed("interpreted", interpreted, steps, rounds)
+    timed("compiled", compiled, steps, rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--payloads", help="JSONL file of recorded step payloads")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.payloads, args.rounds)
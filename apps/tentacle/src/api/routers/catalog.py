@@ -16,9 +16,9 @@ async def list_plugins(
 ):
     """List available plugins for discovery and UI tooling."""
     items = []
-    for name, plugin in plugin_registry._plugins.items():  # type: ignore[attr-defined]
+    for plugin in plugin_registry.definitions():
         items.append({
-            "name": name,
+            "name": plugin.name,
             "description": plugin.description,
             "category": plugin.category,
             "inputs_schema": plugin.inputs_schema,
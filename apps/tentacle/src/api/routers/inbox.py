@@ -246,13 +246,17 @@ async def list_inbox(
     ),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor from a previous page's next_cursor"
+    ),
     user: AuthUser = Depends(auth_middleware.require_permission("inbox", "view")),
     use_cases: InboxUseCases = Depends(get_inbox_use_cases),
 ):
     """List inbox conversations for the authenticated user.
 
     Returns a paginated list of inbox items with the latest message preview,
-    associated task goal/status, and read/priority indicators.
+    associated task goal/status, and read/priority indicators. Pass the
+    returned ``next_cursor`` back as ``cursor`` for stable keyset paging.
     """
     try:
         resolved_use_cases = _resolve_inbox_use_cases(use_cases)
@@ -263,6 +267,7 @@ async def list_inbox(
             search_text=q,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
         return result
     except ValueError as e:
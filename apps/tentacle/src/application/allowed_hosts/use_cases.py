@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple
 
-from src.domain.allowed_hosts import AllowedHostOperationsPort
+from src.domain.allowed_hosts import AllowedHostOperationsPort, HostCheck
 
 
 @dataclass
@@ -41,3 +41,9 @@ class AllowedHostUseCases:
     ) -> Tuple[bool, Optional[str]]:
         return await self.host_ops.is_host_allowed(url=url, environment=environment)
 
+    async def check_host(
+        self,
+        url: str,
+        environment: Optional[str] = None,
+    ) -> HostCheck:
+        return await self.host_ops.check_host(url=url, environment=environment)
@@ -59,6 +59,7 @@ class InboxUseCases:
         search_text: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         exclude_archived = read_status is None
         effective_read_status = read_status
@@ -73,6 +74,7 @@ class InboxUseCases:
             exclude_archived=exclude_archived,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
     async def bulk_update_status(
@@ -57,7 +57,8 @@ def _collect_plugins() -> Dict[str, Dict[str, Any]]:
     # 1. PluginRegistry — rich metadata (description, category, schemas)
     from src.plugins.registry import registry as plugin_registry
 
-    for name, defn in plugin_registry._plugins.items():
+    for defn in plugin_registry.definitions():
+        name = defn.name
         if name in _SKIP_NAMESPACES:
             continue
         first_line = (defn.description or "").strip().split("\n")[0]
@@ -99,6 +99,9 @@ class UnifiedCapabilityRegistry:
         self._primitive_cache: Dict[str, Primitive] = {}
         self._plugin_cache: Dict[str, Plugin] = {}
 
+        # Bumped on every (re)load so consumers can invalidate derived data
+        self.version = 0
+
     def _agent_variants(self, agent_type: str) -> List[AgentCapability]:
         """Normalize cache entries to a list for backward compatibility."""
         raw = self._agent_cache.get(agent_type)
@@ -163,6 +166,8 @@ class UnifiedCapabilityRegistry:
             for plugin in plugins_result.scalars():
                 self._plugin_cache[plugin.namespace] = plugin
 
+        self.version += 1
+
     async def refresh(self) -> None:
         """Refresh the caches from database."""
         self._agent_cache.clear()
@@ -105,6 +105,38 @@ class Settings(BaseSettings):
     INBOX_CREATE_TASK_WAIT_TIMEOUT_SECONDS: int = 90
     INBOX_CREATE_TASK_WAIT_POLL_INTERVAL_SECONDS: float = 1.0
     INBOX_CREATE_TASK_WAIT_MAX_TIMEOUT_SECONDS: int = 300
+
+    # Inbox chat history window (estimated tokens)
+    INBOX_HISTORY_TOKEN_BUDGET: int = 6000
+    INBOX_HISTORY_SUMMARY_TOKEN_BUDGET: int = 800
+
+    # Plugins - comma-separated plugin names or categories this process may
+    # load (empty = all). Workers with an allowlist preload those plugins.
+    PLUGIN_ALLOWLIST: str = ""
+    # Bounded pools for plugin handlers declared as thread/process mode
+    PLUGIN_THREAD_POOL_SIZE: int = 8
+    PLUGIN_PROCESS_POOL_SIZE: int = 2
+
+    # HTTP plugin SSRF checks - DNS answer cache (upper bound; the system
+    # resolver does not report record TTLs) and allowlist snapshot age
+    HTTP_DNS_CACHE_TTL_SECONDS: int = 60
+    HTTP_DNS_NEGATIVE_CACHE_TTL_SECONDS: int = 10
+    ALLOWED_HOSTS_SNAPSHOT_MAX_AGE_SECONDS: int = 60
+    # HTTP plugin outbound transport - pooled clients per destination host.
+    # HTTP_PLUGIN_HOST_CONCURRENCY overrides the cap per host, e.g.
+    # "api.github.com=5,pokeapi.co=2".
+    HTTP_PLUGIN_MAX_CONCURRENCY_PER_HOST: int = 20
+    HTTP_PLUGIN_HOST_CONCURRENCY: str = ""
+    HTTP_PLUGIN_MAX_HOST_POOLS: int = 256
+    HTTP_PLUGIN_HTTP2: bool = True
+    HTTP_PLUGIN_MAX_RESPONSE_BYTES: int = 10 * 1024 * 1024
+    # Playwright plugins - warm browsers per worker process. A browser is
+    # replaced after serving PLAYWRIGHT_MAX_CONTEXTS_PER_BROWSER contexts.
+    PLAYWRIGHT_POOL_SIZE: int = 2
+    PLAYWRIGHT_MAX_PAGES_PER_BROWSER: int = 4
+    PLAYWRIGHT_MAX_CONTEXTS_PER_BROWSER: int = 100
+    PLAYWRIGHT_POOL_ACQUIRE_TIMEOUT_SECONDS: float = 60.0
+    PLAYWRIGHT_POOL_PREWARM: bool = False
     
     # Monitoring
     ENABLE_METRICS: bool = True
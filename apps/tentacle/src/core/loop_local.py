@@ -0,0 +1,42 @@
+"""Per-event-loop singletons.
+
+Async clients (httpx, redis, asyncpg engines) are bound to the event loop
+that created them, and Celery tasks each run on a fresh ``asyncio.run``
+loop. ``LoopLocal`` keeps one lazily created value per running loop and
+drops values belonging to closed loops when a new loop shows up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """A value created once per running event loop by *factory*."""
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._values: Dict[asyncio.AbstractEventLoop, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            try:
+                return self._values[loop]
+            except KeyError:
+                pass
+            # Values of closed loops can no longer be used (or closed cleanly)
+            for stale in [lp for lp in self._values if lp.is_closed()]:
+                del self._values[stale]
+            value = self._values[loop] = self._factory()
+            return value
+
+    def pop(self) -> Optional[T]:
+        """Forget the current loop's value and return it, if any."""
+        with self._lock:
+            return self._values.pop(asyncio.get_running_loop(), None)
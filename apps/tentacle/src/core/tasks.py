@@ -5,7 +5,12 @@
 
 import os
 from celery import Task
-from celery.signals import worker_init, worker_shutdown
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
 from src.core.celery_app import app
 import structlog
 import asyncio
@@ -36,6 +41,54 @@ def init_worker_db(**kwargs):
         _db_initialized = False
 
 
+@worker_init.connect
+def preload_worker_plugins(**kwargs):
+    """Import allowlisted plugins before the pool forks so children share them."""
+    from src.core.config import settings
+
+    if not settings.PLUGIN_ALLOWLIST:
+        return
+    try:
+        from src.plugins.registry import registry
+
+        report = registry.preload()
+        logger.info(
+            "Celery worker plugins preloaded",
+            modules=len(report),
+            seconds=round(sum(s.seconds for s in report), 3),
+            rss_delta_bytes=sum(s.rss_delta_bytes or 0 for s in report),
+        )
+    except Exception as e:
+        logger.error("Failed to preload Celery worker plugins", error=str(e))
+
+
+@worker_process_init.connect
+def warm_browser_pool(**kwargs):
+    """Launch pooled browsers in each worker child (threads do not survive fork)."""
+    from src.core.config import settings
+    import importlib.util
+
+    if not settings.PLAYWRIGHT_POOL_PREWARM or importlib.util.find_spec("playwright") is None:
+        return
+    try:
+        from src.plugins.browser_pool import browser_pool
+
+        browsers = browser_pool.warm()
+        logger.info("Celery worker browser pool warmed", browsers=browsers)
+    except Exception as e:
+        logger.error("Failed to warm Celery worker browser pool", error=str(e))
+
+
+@worker_process_shutdown.connect
+def close_browser_pool(**kwargs):
+    """Close pooled browsers so no Chromium processes outlive the child."""
+    import sys
+
+    pool_module = sys.modules.get("src.plugins.browser_pool")
+    if pool_module is not None:
+        pool_module.browser_pool.close()
+
+
 @worker_shutdown.connect
 def shutdown_worker_db(**kwargs):
     """Close database connection when Celery worker stops."""
@@ -625,3 +678,38 @@ def retry_failed_memory_embeddings(batch_size: int = 50):
         }
 
     return asyncio.run(_execute())
+
+
+@app.task(name='src.core.tasks.backfill_inbox_projections')
+def backfill_inbox_projections(batch_size: int = 500):
+    """
+    Build inbox projection rows from existing conversations and messages.
+
+    Run once after the inbox_002 migration. Safe to re-run: rows are
+    recomputed from message history and upserted.
+
+    Args:
+        batch_size: Number of conversations rebuilt per transaction
+
+    Returns:
+        dict with the number of projection rows written
+    """
+    async def _execute():
+        from src.database.conversation_store import ConversationStore
+
+        logger.info("Starting inbox projection backfill", batch_size=batch_size)
+
+        try:
+            db = await get_shared_db()
+            rows = await ConversationStore(db).backfill_inbox_projections(batch_size=batch_size)
+            logger.info("Inbox projection backfill complete", rows=rows)
+            return {"ok": True, "rows": rows}
+        except Exception as e:
+            logger.error(
+                "Error during inbox projection backfill",
+                error=str(e),
+                exc_info=True,
+            )
+            return {"ok": False, "error": str(e)}
+
+    return asyncio.run(_execute())
@@ -6,24 +6,59 @@
 
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+import base64
 import uuid
 import re
 from decimal import Decimal
-from sqlalchemy import select, update, and_, or_, func, exists
+from sqlalchemy import (
+    select, insert, update, and_, or_, func, exists, case, literal, true, tuple_,
+    DateTime, Integer, Text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 import structlog
 
 from src.interfaces.database import Database
 from src.database.models import (
     Conversation, Message, ConversationMetrics,
     ConversationStatus, TriggerType, MessageType, MessageDirection,
-    ReadStatus, InboxPriority
+    ReadStatus, InboxPriority, InboxProjection
 )
 from src.database.task_models import Task
 
 logger = structlog.get_logger()
 
+# Truncation applied to denormalized inbox projection text columns
+INBOX_TITLE_CHARS = 100
+INBOX_PREVIEW_CHARS = 500
+
+
+def encode_keyset_cursor(position: datetime, row_id: str) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque URL-safe cursor."""
+    raw = f"{position.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_keyset_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        position, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(position), uuid.UUID(row_id)
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def message_cursor(message: Message) -> str:
+    """Keyset cursor positioned at *message*, for :meth:`ConversationStore.get_messages`."""
+    return encode_keyset_cursor(message.timestamp, str(message.id))
+
 
 class ConversationTrigger:
     """Conversation trigger information."""
@@ -205,54 +240,80 @@ class ConversationStore:
         message_data: MessageData
     ) -> bool:
         """Add a message to a conversation."""
+        return await self.add_messages(conversation_id, [message_data]) > 0
+
+    async def add_messages(
+        self,
+        conversation_id: str,
+        messages: List[MessageData]
+    ) -> int:
+        """Append several messages to a conversation in one transaction.
+
+        Inserts all rows with a single multi-row INSERT, then updates the
+        conversation metrics and inbox projection once for the whole batch.
+        Returns the number of messages written.
+        """
+        if not messages:
+            return 0
+
+        # NOTE: Data masking disabled - it was destructively replacing
+        # user content (emails, phones) making features like "add contact"
+        # impossible. See PR for details.
+        # if message_data.content.text:
+        #     masked_text, masked_fields = self.masker.mask(message_data.content.text)
+        #     message_data.content.text = masked_text
+        #     message_data.content.masked_fields.extend(masked_fields)
+
         async with self.db.get_session() as session:
-            # NOTE: Data masking disabled - it was destructively replacing
-            # user content (emails, phones) making features like "add contact"
-            # impossible. See PR for details.
-            # if message_data.content.text:
-            #     masked_text, masked_fields = self.masker.mask(message_data.content.text)
-            #     message_data.content.text = masked_text
-            #     message_data.content.masked_fields.extend(masked_fields)
-            
-            # Create message
-            message = Message(
-                id=uuid.UUID(message_data.id),
-                conversation_id=uuid.UUID(conversation_id),
-                agent_id=message_data.agent_id,
-                timestamp=message_data.timestamp,
-                message_type=message_data.message_type,
-                direction=message_data.direction,
-                role=message_data.content.role,
-                content_text=message_data.content.text,
-                content_data=message_data.content.data,
-                tool_calls=message_data.content.tool_calls,
-                masked_fields=message_data.content.masked_fields,
-                model=message_data.metadata.model,
-                temperature=message_data.metadata.temperature,
-                prompt_tokens=message_data.metadata.tokens.get('prompt_tokens', message_data.metadata.tokens.get('prompt')) if message_data.metadata.tokens else None,
-                completion_tokens=message_data.metadata.tokens.get('completion_tokens', message_data.metadata.tokens.get('completion')) if message_data.metadata.tokens else None,
-                total_tokens=message_data.metadata.tokens.get('total_tokens', message_data.metadata.tokens.get('total')) if message_data.metadata.tokens else None,
-                latency_ms=message_data.metadata.latency_ms,
-                cost_amount=Decimal(str(message_data.cost.amount)) if message_data.cost else None,
-                cost_currency=message_data.cost.currency if message_data.cost else None,
-                error=message_data.metadata.error,
-                retry_count=message_data.metadata.retry_count,
-                parent_message_id=uuid.UUID(message_data.parent_message_id) if message_data.parent_message_id else None
+            await session.execute(
+                insert(Message).values(
+                    [self._message_row(conversation_id, m) for m in messages]
+                )
             )
-            
-            session.add(message)
-            
+
             # Update metrics
-            await self._update_metrics(session, conversation_id, message_data)
-            
+            await self._update_metrics(session, conversation_id, messages)
+
+            # Keep the inbox projection in step with the message history
+            await self._upsert_inbox_projection(session, conversation_id, messages)
+
             await session.commit()
-            
-            logger.debug("Added message to conversation",
+
+            logger.debug("Added messages to conversation",
                         conversation_id=conversation_id,
-                        message_id=str(message.id),
-                        message_type=message_data.message_type.value)
-            
-            return True
+                        count=len(messages),
+                        message_types=sorted({m.message_type.value for m in messages}))
+
+            return len(messages)
+
+    @staticmethod
+    def _message_row(conversation_id: str, message_data: MessageData) -> Dict[str, Any]:
+        """Column values for one ``messages`` row."""
+        tokens = message_data.metadata.tokens
+        return {
+            "id": uuid.UUID(message_data.id),
+            "conversation_id": uuid.UUID(conversation_id),
+            "agent_id": message_data.agent_id,
+            "timestamp": message_data.timestamp,
+            "message_type": message_data.message_type,
+            "direction": message_data.direction,
+            "role": message_data.content.role,
+            "content_text": message_data.content.text,
+            "content_data": message_data.content.data,
+            "tool_calls": message_data.content.tool_calls,
+            "masked_fields": message_data.content.masked_fields,
+            "model": message_data.metadata.model,
+            "temperature": message_data.metadata.temperature,
+            "prompt_tokens": tokens.get('prompt_tokens', tokens.get('prompt')) if tokens else None,
+            "completion_tokens": tokens.get('completion_tokens', tokens.get('completion')) if tokens else None,
+            "total_tokens": tokens.get('total_tokens', tokens.get('total')) if tokens else None,
+            "latency_ms": message_data.metadata.latency_ms,
+            "cost_amount": Decimal(str(message_data.cost.amount)) if message_data.cost else None,
+            "cost_currency": message_data.cost.currency if message_data.cost else None,
+            "error": message_data.metadata.error,
+            "retry_count": message_data.metadata.retry_count,
+            "parent_message_id": uuid.UUID(message_data.parent_message_id) if message_data.parent_message_id else None,
+        }
     
     async def end_conversation(
         self,
@@ -412,52 +473,61 @@ class ConversationStore:
                 token_usage=token_usage
             )
     
-    async def _update_metrics(self, session: AsyncSession, conversation_id: str, message_data: MessageData):
-        """Update conversation metrics."""
-        # Get existing metrics
+    async def _update_metrics(
+        self, session: AsyncSession, conversation_id: str, messages: List[MessageData]
+    ) -> Optional[int]:
+        """Apply a batch of messages to the conversation metrics row.
+
+        Counters are incremented in the database (``SET x = x + :n``) so
+        concurrent appends to the same conversation never lose updates.
+        Returns the new ``total_messages`` or None if no metrics row exists.
+        """
+        n = len(messages)
+        # Count one LLM call per prompt/response pair by incrementing on response only
+        llm_calls = sum(1 for m in messages if m.message_type == MessageType.LLM_RESPONSE)
+        tool_calls = sum(1 for m in messages if m.message_type == MessageType.TOOL_CALL)
+        errors = sum(1 for m in messages if m.message_type == MessageType.ERROR)
+        tokens = 0
+        cost = Decimal('0.0')
+        latencies = []
+        for m in messages:
+            if m.metadata.tokens:
+                tks = m.metadata.tokens
+                tokens += tks.get('total_tokens', tks.get('total', 0)) or 0
+            if m.cost:
+                cost += Decimal(str(m.cost.amount))
+            if m.metadata.latency_ms:
+                latencies.append(m.metadata.latency_ms)
+
+        values: Dict[str, Any] = {
+            "total_messages": ConversationMetrics.total_messages + n,
+            "total_llm_calls": ConversationMetrics.total_llm_calls + llm_calls,
+            "total_tool_calls": ConversationMetrics.total_tool_calls + tool_calls,
+            "total_errors": ConversationMetrics.total_errors + errors,
+            "total_tokens": ConversationMetrics.total_tokens + tokens,
+            "total_cost": ConversationMetrics.total_cost + cost,
+            "updated_at": datetime.utcnow(),
+        }
+        if latencies:
+            # Running average over all messages, computed from the pre-update row
+            latency_sum = float(sum(latencies))
+            values["average_latency_ms"] = case(
+                (
+                    ConversationMetrics.average_latency_ms > 0,
+                    (ConversationMetrics.average_latency_ms * ConversationMetrics.total_messages + latency_sum)
+                    / (ConversationMetrics.total_messages + n),
+                ),
+                else_=latency_sum / len(latencies),
+            )
+            values["max_latency_ms"] = func.greatest(ConversationMetrics.max_latency_ms, max(latencies))
+
         result = await session.execute(
-            select(ConversationMetrics)
+            update(ConversationMetrics)
             .where(ConversationMetrics.conversation_id == uuid.UUID(conversation_id))
+            .values(**values)
+            .returning(ConversationMetrics.total_messages)
         )
-        
-        metrics = result.scalar_one_or_none()
-        
-        if metrics:
-            metrics.total_messages += 1
-            
-            # Count one LLM call per prompt/response pair by incrementing on response only
-            if message_data.message_type == MessageType.LLM_RESPONSE:
-                metrics.total_llm_calls += 1
-            
-            if message_data.message_type == MessageType.TOOL_CALL:
-                metrics.total_tool_calls += 1
-            
-            if message_data.message_type == MessageType.ERROR:
-                metrics.total_errors += 1
-            
-            if message_data.metadata.tokens:
-                tks = message_data.metadata.tokens
-                total = tks.get('total_tokens', tks.get('total', 0))
-                metrics.total_tokens += total or 0
-            
-            if message_data.cost:
-                metrics.total_cost += Decimal(str(message_data.cost.amount))
-            
-            if message_data.metadata.latency_ms:
-                # Update average latency
-                if metrics.average_latency_ms > 0:
-                    metrics.average_latency_ms = (
-                        (metrics.average_latency_ms * (metrics.total_messages - 1) + message_data.metadata.latency_ms) 
-                        / metrics.total_messages
-                    )
-                else:
-                    metrics.average_latency_ms = float(message_data.metadata.latency_ms)
-                
-                # Update max latency
-                if message_data.metadata.latency_ms > metrics.max_latency_ms:
-                    metrics.max_latency_ms = message_data.metadata.latency_ms
-            
-            metrics.updated_at = datetime.utcnow()
+        return result.scalar_one_or_none()
 
     async def _get_or_create_metrics(self, conversation_id):
         """Get existing metrics or create a new row for the conversation.
@@ -494,15 +564,282 @@ class ConversationStore:
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
-    async def get_messages(self, conversation_id: str) -> List[Message]:
-        """Get all messages for a conversation."""
+    async def get_messages(
+        self,
+        conversation_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        newest_first: bool = False,
+    ) -> List[Message]:
+        """Get messages for a conversation, optionally one keyset page at a time.
+
+        Without *limit* every message is returned (oldest first). With
+        *limit*, pass :func:`message_cursor` of the last message received as
+        *cursor* to fetch the next page; pages walk forward in time, or
+        backward from the newest message when *newest_first* is set.
+
+        Raises:
+            ValueError: If *cursor* is malformed.
+        """
         async with self.db.get_session() as session:
             stmt = select(Message).where(
                 Message.conversation_id == uuid.UUID(conversation_id)
-            ).order_by(Message.timestamp.asc())
+            )
+
+            position = tuple_(Message.timestamp, Message.id)
+            if cursor:
+                cursor_at, cursor_id = decode_keyset_cursor(cursor)
+                boundary = tuple_(cursor_at, cursor_id)
+                stmt = stmt.where(position < boundary if newest_first else position > boundary)
+
+            if newest_first:
+                stmt = stmt.order_by(Message.timestamp.desc(), Message.id.desc())
+            else:
+                stmt = stmt.order_by(Message.timestamp.asc(), Message.id.asc())
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
+    # ---- Inbox Projection Maintenance ----
+
+    async def _upsert_inbox_projection(
+        self, session: AsyncSession, conversation_id: str, messages: List[MessageData]
+    ) -> None:
+        """Fold appended messages into the conversation's inbox projection.
+
+        Runs inside the ``add_messages`` transaction. Only conversations that
+        already belong to an inbox (``user_id`` and ``read_status`` set) get a
+        row; for any other conversation the INSERT ... SELECT matches nothing.
+        """
+        ordered = sorted(messages, key=lambda m: m.timestamp)
+        user_msgs = [m for m in ordered if m.content.role == "user"]
+        assistant_msgs = [m for m in ordered if m.content.role == "assistant"]
+        last_assistant = assistant_msgs[-1] if assistant_msgs else None
+        first_user_text = next((m.content.text for m in user_msgs if m.content.text), None)
+        last_user_at = user_msgs[-1].timestamp if user_msgs else None
+        # Assistant messages after the user's latest message in this batch
+        new_unread = sum(
+            1 for m in assistant_msgs if last_user_at is None or m.timestamp > last_user_at
+        )
+        preview = last_assistant.content.text if last_assistant else None
+
+        source_row = select(
+            Conversation.id,
+            Conversation.user_id,
+            case((Conversation.root_agent_id == "inbox_chat", "inbox"), else_="task"),
+            literal(first_user_text[:INBOX_TITLE_CHARS] if first_user_text else None, Text),
+            literal(preview[:INBOX_PREVIEW_CHARS] if preview else None, Text),
+            literal(last_assistant.timestamp if last_assistant else None, DateTime),
+            literal(ordered[-1].timestamp, DateTime),
+            literal(new_unread, Integer),
+        ).where(
+            and_(
+                Conversation.id == uuid.UUID(conversation_id),
+                Conversation.user_id.isnot(None),
+                Conversation.read_status.isnot(None),
+            )
+        )
+
+        stmt = pg_insert(InboxProjection).from_select(
+            [
+                "conversation_id", "user_id", "source", "title",
+                "last_message_text", "last_message_at", "last_activity_at", "unread_count",
+            ],
+            source_row,
+        )
+        excluded = stmt.excluded
+        values: Dict[str, Any] = {
+            "last_activity_at": func.greatest(InboxProjection.last_activity_at, excluded.last_activity_at),
+            "updated_at": datetime.utcnow(),
+        }
+        if last_assistant:
+            values["last_message_text"] = excluded.last_message_text
+            values["last_message_at"] = excluded.last_message_at
+        if user_msgs:
+            # A user reply means everything before it has been seen
+            values["title"] = func.coalesce(InboxProjection.title, excluded.title)
+            values["unread_count"] = excluded.unread_count
+        elif new_unread:
+            values["unread_count"] = InboxProjection.unread_count + excluded.unread_count
+
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[InboxProjection.conversation_id],
+                set_=values,
+            )
+        )
+
+    async def _rebuild_inbox_projections(
+        self, session: AsyncSession, conversation_ids: List[uuid.UUID]
+    ) -> int:
+        """Recompute projection rows for *conversation_ids* from their messages.
+
+        Used when a conversation joins an inbox after it already has messages,
+        and by the backfill job. Cost is bounded by the given conversations.
+        Returns the number of rows written.
+        """
+        if not conversation_ids:
+            return 0
+
+        assistant_msg = aliased(Message)
+        user_msg = aliased(Message)
+        any_msg = aliased(Message)
+        unread_msg = aliased(Message)
+
+        last_assistant = (
+            select(assistant_msg.content_text, assistant_msg.timestamp)
+            .where(
+                and_(
+                    assistant_msg.conversation_id == Conversation.id,
+                    assistant_msg.role == "assistant",
+                )
+            )
+            .order_by(assistant_msg.timestamp.desc())
+            .limit(1)
+            .lateral("last_assistant")
+        )
+        first_user_text = (
+            select(user_msg.content_text)
+            .where(and_(user_msg.conversation_id == Conversation.id, user_msg.role == "user"))
+            .order_by(user_msg.timestamp.asc())
+            .limit(1)
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
+        last_user_at = (
+            select(func.max(user_msg.timestamp))
+            .where(and_(user_msg.conversation_id == Conversation.id, user_msg.role == "user"))
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
+        last_activity_at = (
+            select(func.max(any_msg.timestamp))
+            .where(any_msg.conversation_id == Conversation.id)
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
+        # Assistant messages since the user last wrote in the conversation
+        unread_count = (
+            select(func.count(unread_msg.id))
+            .where(
+                and_(
+                    unread_msg.conversation_id == Conversation.id,
+                    unread_msg.role == "assistant",
+                    or_(last_user_at.is_(None), unread_msg.timestamp > last_user_at),
+                )
+            )
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
+
+        source_rows = (
+            select(
+                Conversation.id,
+                Conversation.user_id,
+                case((Conversation.root_agent_id == "inbox_chat", "inbox"), else_="task"),
+                func.left(first_user_text, INBOX_TITLE_CHARS),
+                func.left(last_assistant.c.content_text, INBOX_PREVIEW_CHARS),
+                last_assistant.c.timestamp,
+                func.coalesce(last_activity_at, Conversation.start_time),
+                case((Conversation.read_status == ReadStatus.UNREAD, unread_count), else_=0),
+            )
+            .select_from(Conversation)
+            .outerjoin(last_assistant, true())
+            .where(
+                and_(
+                    Conversation.id.in_(conversation_ids),
+                    Conversation.user_id.isnot(None),
+                    Conversation.read_status.isnot(None),
+                )
+            )
+        )
+
+        columns = [
+            "conversation_id", "user_id", "source", "title",
+            "last_message_text", "last_message_at", "last_activity_at", "unread_count",
+        ]
+        stmt = pg_insert(InboxProjection).from_select(columns, source_rows)
+        values: Dict[str, Any] = {c: stmt.excluded[c] for c in columns[1:]}
+        values["updated_at"] = datetime.utcnow()
+        result = await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[InboxProjection.conversation_id],
+                set_=values,
+            )
+        )
+        return result.rowcount
+
+    async def backfill_inbox_projections(self, batch_size: int = 500) -> int:
+        """Build inbox projection rows for every existing inbox conversation.
+
+        Walks inbox conversations in primary-key order, one transaction per
+        batch, so it can be re-run safely and interleaves with live traffic.
+        Returns the total number of rows written.
+        """
+        total = 0
+        last_id: Optional[uuid.UUID] = None
+        while True:
+            async with self.db.get_session() as session:
+                stmt = (
+                    select(Conversation.id)
+                    .where(
+                        and_(
+                            Conversation.user_id.isnot(None),
+                            Conversation.read_status.isnot(None),
+                        )
+                    )
+                    .order_by(Conversation.id)
+                    .limit(batch_size)
+                )
+                if last_id is not None:
+                    stmt = stmt.where(Conversation.id > last_id)
+                ids = list((await session.execute(stmt)).scalars().all())
+                if not ids:
+                    break
+
+                total += await self._rebuild_inbox_projections(session, ids)
+                await session.commit()
+                last_id = ids[-1]
+
+            logger.info("Backfilled inbox projection batch", rows=total, last_conversation_id=str(last_id))
+
+        return total
+
+    async def get_conversation_metadata(self, conversation_id: str) -> Dict[str, Any]:
+        """Return the conversation's ``extra_metadata`` (empty dict if unset)."""
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(Conversation.extra_metadata).where(
+                    Conversation.id == uuid.UUID(conversation_id)
+                )
+            )
+            return dict(result.scalar_one_or_none() or {})
+
+    async def update_conversation_metadata(
+        self, conversation_id: str, updates: Dict[str, Any]
+    ) -> None:
+        """Merge *updates* into the conversation's ``extra_metadata``.
+
+        The row is locked for the read-merge-write so concurrent updaters of
+        different keys do not overwrite each other.
+        """
+        async with self.db.get_session() as session:
+            result = await session.execute(
+                select(Conversation.extra_metadata)
+                .where(Conversation.id == uuid.UUID(conversation_id))
+                .with_for_update()
+            )
+            merged = dict(result.scalar_one_or_none() or {})
+            merged.update(updates)
+            await session.execute(
+                update(Conversation)
+                .where(Conversation.id == uuid.UUID(conversation_id))
+                .values(extra_metadata=merged)
+            )
+            await session.commit()
+
     # ---- Inbox Query Methods ----
 
     async def get_inbox_conversations(
@@ -514,81 +851,36 @@ class ConversationStore:
         exclude_archived: bool = False,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[dict]:
         """Query inbox conversations for a user with last message and task data.
 
-        Returns conversations WHERE user_id matches and read_status IS NOT NULL,
-        optionally filtered by read_status, priority, and search text.
-        Each result includes the latest assistant message and linked task information.
+        Reads from the ``inbox_projections`` table, ordered by last activity
+        (newest first). Returns conversations WHERE user_id matches and
+        read_status IS NOT NULL, optionally filtered by read_status, priority,
+        and search text. When *cursor* is given, keyset pagination is used and
+        *offset* is ignored.
+
+        Raises:
+            ValueError: If *cursor* is malformed.
         """
         async with self.db.get_session() as session:
-            # Subquery: latest assistant message per conversation
-            latest_msg_sq = (
-                select(
-                    Message.conversation_id,
-                    Message.content_text,
-                    Message.timestamp,
-                )
-                .where(Message.role == "assistant")
-                .order_by(Message.conversation_id, Message.timestamp.desc())
-                .distinct(Message.conversation_id)
-                .subquery("latest_msg")
-            )
-
-            # Subquery: first user message per conversation (used as title for inbox-source)
-            first_user_msg_sq = (
-                select(
-                    Message.conversation_id,
-                    Message.content_text,
-                )
-                .where(Message.role == "user")
-                .order_by(Message.conversation_id, Message.timestamp.asc())
-                .distinct(Message.conversation_id)
-                .subquery("first_user_msg")
-            )
-
-            # Subquery: latest task per conversation (avoid duplicates when
-            # multiple tasks reference the same conversation_id).
-            latest_task_sq = (
-                select(
-                    Task.conversation_id,
-                    Task.goal,
-                    Task.status,
-                    Task.id,
-                )
-                .order_by(Task.conversation_id, Task.created_at.desc())
-                .distinct(Task.conversation_id)
-                .subquery("latest_task")
-            )
-
-            # Build main query
             stmt = (
                 select(
-                    Conversation.id.label("conversation_id"),
+                    InboxProjection.conversation_id,
                     Conversation.read_status,
                     Conversation.priority,
-                    Conversation.root_agent_id,
-                    latest_msg_sq.c.content_text.label("last_message_text"),
-                    latest_msg_sq.c.timestamp.label("last_message_at"),
-                    first_user_msg_sq.c.content_text.label("first_user_message"),
-                    latest_task_sq.c.goal.label("task_goal"),
-                    latest_task_sq.c.status.label("task_status"),
-                    latest_task_sq.c.id.label("task_id"),
-                )
-                .outerjoin(
-                    latest_msg_sq,
-                    Conversation.id == latest_msg_sq.c.conversation_id,
-                )
-                .outerjoin(
-                    first_user_msg_sq,
-                    Conversation.id == first_user_msg_sq.c.conversation_id,
-                )
-                .outerjoin(
-                    latest_task_sq,
-                    latest_task_sq.c.conversation_id == Conversation.id,
+                    InboxProjection.source,
+                    InboxProjection.title,
+                    InboxProjection.last_message_text,
+                    InboxProjection.last_message_at,
+                    InboxProjection.last_activity_at,
+                    InboxProjection.unread_count,
                 )
+                .join(Conversation, Conversation.id == InboxProjection.conversation_id)
                 .where(
                     and_(
+                        InboxProjection.user_id == user_id,
                         Conversation.user_id == user_id,
                         Conversation.read_status.isnot(None),
                     )
@@ -608,36 +900,72 @@ class ConversationStore:
                     select(Message.id)
                     .where(
                         and_(
-                            Message.conversation_id == Conversation.id,
+                            Message.conversation_id == InboxProjection.conversation_id,
                             Message.content_text.ilike(pattern),
                         )
                     )
-                    .correlate(Conversation)
+                    .correlate(InboxProjection)
                     .exists()
                 )
                 stmt = stmt.where(msg_match)
 
-            stmt = stmt.order_by(latest_msg_sq.c.timestamp.desc().nullslast())
-            stmt = stmt.limit(limit).offset(offset)
+            if cursor:
+                cursor_at, cursor_id = decode_keyset_cursor(cursor)
+                stmt = stmt.where(
+                    tuple_(InboxProjection.last_activity_at, InboxProjection.conversation_id)
+                    < tuple_(cursor_at, cursor_id)
+                )
+
+            stmt = stmt.order_by(
+                InboxProjection.last_activity_at.desc(),
+                InboxProjection.conversation_id.desc(),
+            ).limit(limit)
+            if not cursor:
+                stmt = stmt.offset(offset)
 
             result = await session.execute(stmt)
             rows = result.all()
 
-            return [
-                {
+            tasks = await self._get_latest_tasks(session, [row.conversation_id for row in rows])
+
+            items = []
+            for row in rows:
+                task = tasks.get(row.conversation_id)
+                task_goal = task.goal if task else None
+                items.append({
                     "conversation_id": str(row.conversation_id),
                     "read_status": row.read_status.value if row.read_status else None,
                     "priority": row.priority.value if row.priority else None,
-                    "source": "inbox" if row.root_agent_id == "inbox_chat" else "task",
+                    "source": row.source,
                     "last_message_text": row.last_message_text,
                     "last_message_at": row.last_message_at.isoformat() if row.last_message_at else None,
-                    "task_goal": row.task_goal,
-                    "task_status": row.task_status,
-                    "task_id": str(row.task_id) if row.task_id else None,
-                    "title": row.task_goal or (row.first_user_message[:100] if row.first_user_message else None),
-                }
-                for row in rows
-            ]
+                    "last_activity_at": row.last_activity_at.isoformat(),
+                    "unread_count": row.unread_count if row.read_status == ReadStatus.UNREAD else 0,
+                    "task_goal": task_goal,
+                    "task_status": task.status if task else None,
+                    "task_id": str(task.id) if task else None,
+                    "title": task_goal or row.title,
+                })
+            return items
+
+    async def _get_latest_tasks(
+        self, session: AsyncSession, conversation_ids: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, Any]:
+        """Latest task per conversation, restricted to one inbox page."""
+        if not conversation_ids:
+            return {}
+        result = await session.execute(
+            select(
+                Task.conversation_id,
+                Task.goal,
+                Task.status,
+                Task.id,
+            )
+            .where(Task.conversation_id.in_(conversation_ids))
+            .order_by(Task.conversation_id, Task.created_at.desc())
+            .distinct(Task.conversation_id)
+        )
+        return {row.conversation_id: row for row in result.all()}
 
     async def get_unread_count(self, user_id: str) -> int:
         """Count unread inbox conversations for a user."""
@@ -680,6 +1008,8 @@ class ConversationStore:
                 .where(Conversation.id == uuid.UUID(conversation_id))
                 .values(read_status=read_status)
             )
+            if read_status != ReadStatus.UNREAD:
+                await self._reset_inbox_unread(session, [uuid.UUID(conversation_id)])
             await session.commit()
             return result.rowcount > 0
 
@@ -696,9 +1026,24 @@ class ConversationStore:
                 .where(Conversation.id.in_(uuids))
                 .values(read_status=read_status)
             )
+            if read_status != ReadStatus.UNREAD:
+                await self._reset_inbox_unread(session, uuids)
             await session.commit()
             return result.rowcount
 
+    async def _reset_inbox_unread(self, session: AsyncSession, conversation_ids: List[uuid.UUID]) -> None:
+        """Zero the projection unread counter once conversations are read."""
+        await session.execute(
+            update(InboxProjection)
+            .where(
+                and_(
+                    InboxProjection.conversation_id.in_(conversation_ids),
+                    InboxProjection.unread_count != 0,
+                )
+            )
+            .values(unread_count=0)
+        )
+
     async def get_conversation_user_id(self, conversation_id: str) -> Optional[str]:
         """Return the user_id of a conversation, or None if not found."""
         async with self.db.get_session() as session:
@@ -718,6 +1063,7 @@ class ConversationStore:
                 .where(Conversation.id == uuid.UUID(conversation_id))
                 .values(user_id=user_id)
             )
+            await self._rebuild_inbox_projections(session, [uuid.UUID(conversation_id)])
             await session.commit()
 
     async def set_inbox_fields(
@@ -738,6 +1084,7 @@ class ConversationStore:
                     priority=priority,
                 )
             )
+            await self._rebuild_inbox_projections(session, [uuid.UUID(conversation_id)])
             await session.commit()
 
     async def get_inbox_thread(self, conversation_id: str) -> Optional[dict]:
@@ -165,3 +165,29 @@ class ConversationMetrics(Base):
     __table_args__ = (
         Index("idx_metrics_conversation", "conversation_id"),
     )
+
+
+class InboxProjection(Base):
+    """Denormalized inbox row per (user, conversation).
+
+    Maintained in the same transaction as message appends so that inbox
+    listing reads one narrow row per conversation instead of scanning the
+    message history. Read status and priority stay authoritative on
+    ``conversations`` and are joined by primary key.
+    """
+    __tablename__ = "inbox_projections"
+
+    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(String(255), nullable=False)
+    source = Column(String(50), nullable=False, default="task")
+    title = Column(Text, nullable=True)  # First user message, truncated
+    last_message_text = Column(Text, nullable=True)  # Latest assistant message preview
+    last_message_at = Column(DateTime, nullable=True)
+    last_activity_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_inbox_projection_sort", "user_id", "last_activity_at", "conversation_id"),
+    )
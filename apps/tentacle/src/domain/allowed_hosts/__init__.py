@@ -1,6 +1,6 @@
 """Domain module for allowed host ports."""
 
+from src.domain.allowed_hosts.models import HostCheck
 from src.domain.allowed_hosts.ports import AllowedHostOperationsPort
 
-__all__ = ["AllowedHostOperationsPort"]
-
+__all__ = ["AllowedHostOperationsPort", "HostCheck"]
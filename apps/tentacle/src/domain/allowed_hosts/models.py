@@ -0,0 +1,21 @@
+"""Domain models for allowed host checks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class HostCheck:
+    """Outcome of an allowlist + SSRF check for an outbound URL.
+
+    ``addresses`` are the resolved IPs that passed the private-range check;
+    callers connect to one of them instead of resolving the host again, so
+    a DNS answer that changes after the check cannot redirect the request.
+    """
+
+    allowed: bool
+    error: Optional[str] = None
+    host: str = ""
+    addresses: List[str] = field(default_factory=list)
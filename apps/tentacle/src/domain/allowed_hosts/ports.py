@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, List, Optional, Protocol, Tuple
 
+from src.domain.allowed_hosts.models import HostCheck
+
 
 class AllowedHostOperationsPort(Protocol):
     """Port for host allowlist administration and checks."""
@@ -30,3 +32,9 @@ class AllowedHostOperationsPort(Protocol):
     ) -> Tuple[bool, Optional[str]]:
         ...
 
+    async def check_host(
+        self,
+        url: str,
+        environment: Optional[str] = None,
+    ) -> HostCheck:
+        ...
@@ -23,6 +23,7 @@ class InboxOperationsPort(Protocol):
         exclude_archived: bool,
         limit: int,
         offset: int,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         ...
 
@@ -14,6 +14,7 @@ Components:
 
 from src.eval.models import (
     AGENT_OUTPUT_FIELDS,
+    EvalRunStats,
     EvalTestResult,
     FormatRequirements,
     OptimizationAttempt,
@@ -34,6 +35,7 @@ from src.eval.models import (
 __all__ = [
     # Models
     "AGENT_OUTPUT_FIELDS",
+    "EvalRunStats",
     "EvalTestResult",
     "FormatRequirements",
     "OptimizationAttempt",
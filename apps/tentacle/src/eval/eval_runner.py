@@ -0,0 +1,135 @@
+"""
+Result cache and per-model rate limiting for prompt evaluation runs.
+
+The optimization loop evaluates the same (prompt, test case) pairs more
+than once: the rollback check evaluates the improved prompt, and the next
+iteration evaluates that same prompt again. ``EvalResultCache`` keys
+results on (prompt hash, test case fingerprint, model, temperature) so a
+repeated pair costs no LLM call.
+
+``ModelRateLimiter`` spaces out calls per model (requests per minute) so
+concurrent evaluation stays within provider limits.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from src.eval.models import EvalTestResult, TestCase
+
+CacheKey = Tuple[str, str, str, float]
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint_test_case(test_case: TestCase) -> str:
+    """Hash of everything that determines a test case's outcome.
+
+    Name, description, tags and priority are left out: editing them does
+    not change what the LLM is asked or how its output is scored.
+    """
+    data = test_case.to_dict()
+    relevant = {
+        "input_context": data["input_context"],
+        "expected_output_patterns": data["expected_output_patterns"],
+        "format_requirements": data["format_requirements"],
+    }
+    return _sha256(json.dumps(relevant, sort_keys=True, default=str))
+
+
+class EvalResultCache:
+    """In-memory LRU of test results keyed on prompt, case, model and temperature."""
+
+    def __init__(self, max_entries: int = 4096):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, EvalTestResult]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(prompt_text: str, test_case: TestCase, model: str, temperature: float) -> CacheKey:
+        return (_sha256(prompt_text), fingerprint_test_case(test_case), model, float(temperature))
+
+    def get(self, key: CacheKey) -> Optional[EvalTestResult]:
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: CacheKey, result: EvalTestResult) -> None:
+        # Errors (timeouts, provider outages) say nothing about the prompt
+        if result.error is not None:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class _Bucket:
+    capacity: float
+    tokens: float
+    updated: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ModelRateLimiter:
+    """Token bucket per model, refilled at ``requests_per_minute / 60`` per second.
+
+    Models without a configured limit (and no ``default_rpm``) are not
+    throttled. Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        default_rpm: Optional[int] = None,
+    ):
+        self._limits = dict(limits or {})
+        self._default_rpm = default_rpm
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def _bucket(self, model: str) -> Optional[_Bucket]:
+        rpm = self._limits.get(model, self._default_rpm)
+        if not rpm or rpm <= 0:
+            return None
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            bucket = _Bucket(capacity=float(rpm), tokens=float(rpm))
+            self._buckets[model] = bucket
+        return bucket
+
+    async def acquire(self, model: str) -> float:
+        """Wait for a call slot for *model*; returns the seconds waited."""
+        bucket = self._bucket(model)
+        if bucket is None:
+            return 0.0
+        rate = bucket.capacity / 60.0
+        waited = 0.0
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated) * rate)
+                bucket.updated = now
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return waited
+                delay = (1 - bucket.tokens) / rate
+                waited += delay
+                await asyncio.sleep(delay)
@@ -257,6 +257,9 @@ class EvalTestResult:
     raw_output: str  # The actual LLM output
     execution_time_ms: int = 0
     error: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached: bool = False  # Reused from an earlier run; no LLM call made
 
     @property
     def overall_score(self) -> float:
@@ -276,6 +279,48 @@ class EvalTestResult:
             "raw_output": self.raw_output[:500] + "..." if len(self.raw_output) > 500 else self.raw_output,
             "execution_time_ms": self.execution_time_ms,
             "error": self.error,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached": self.cached,
+        }
+
+
+@dataclass
+class EvalRunStats:
+    """Cost of an evaluation run (or the sum of several)."""
+
+    wall_clock_ms: int = 0
+    case_time_ms: int = 0  # Sum of per-case times; exceeds wall clock when cases overlap
+    llm_calls: int = 0
+    cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    early_stopped: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "EvalRunStats") -> None:
+        """Accumulate another run's stats into this one."""
+        self.wall_clock_ms += other.wall_clock_ms
+        self.case_time_ms += other.case_time_ms
+        self.llm_calls += other.llm_calls
+        self.cache_hits += other.cache_hits
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.early_stopped = self.early_stopped or other.early_stopped
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_clock_ms": self.wall_clock_ms,
+            "case_time_ms": self.case_time_ms,
+            "llm_calls": self.llm_calls,
+            "cache_hits": self.cache_hits,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "early_stopped": self.early_stopped,
         }
 
 
@@ -292,6 +337,13 @@ class PromptEvalResult:
     tests_failed: int
     total_tests: int
     execution_time_ms: int = 0
+    tests_skipped: int = 0  # Not run because the run stopped early
+    stats: EvalRunStats = field(default_factory=EvalRunStats)
+
+    @property
+    def early_stopped(self) -> bool:
+        """True when some cases were not run; they count as failed with score 0."""
+        return self.tests_skipped > 0
 
     def get_test_passed(self, test_case_id: str) -> bool:
         """Check if a specific test case passed."""
@@ -313,7 +365,10 @@ class PromptEvalResult:
             "tests_passed": self.tests_passed,
             "tests_failed": self.tests_failed,
             "total_tests": self.total_tests,
+            "tests_skipped": self.tests_skipped,
+            "early_stopped": self.early_stopped,
             "execution_time_ms": self.execution_time_ms,
+            "stats": self.stats.to_dict(),
             "test_results": [r.to_dict() for r in self.test_results],
         }
 
@@ -380,6 +435,10 @@ class OptimizationConfig:
     optimizer_model: str = "openai/gpt-4o"
     eval_temperature: float = 0.3
     optimizer_temperature: float = 0.5
+    eval_concurrency: int = 5  # Test cases evaluated at once
+    eval_rate_limits: Dict[str, int] = field(default_factory=dict)  # Model -> requests per minute
+    cache_eval_results: bool = True
+    early_stop_unreachable: bool = True  # Stop an eval once thresholds cannot be met
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -393,6 +452,10 @@ class OptimizationConfig:
             "optimizer_model": self.optimizer_model,
             "eval_temperature": self.eval_temperature,
             "optimizer_temperature": self.optimizer_temperature,
+            "eval_concurrency": self.eval_concurrency,
+            "eval_rate_limits": self.eval_rate_limits,
+            "cache_eval_results": self.cache_eval_results,
+            "early_stop_unreachable": self.early_stop_unreachable,
         }
 
 
@@ -448,6 +511,7 @@ class OptimizationResult:
     improvement_summary: str
     execution_time_ms: int = 0
     run_id: Optional[UUID] = field(default_factory=uuid4)
+    eval_stats: EvalRunStats = field(default_factory=EvalRunStats)  # Summed over every eval
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -460,6 +524,7 @@ class OptimizationResult:
             "final_score": self.final_score,
             "improvement_summary": self.improvement_summary,
             "execution_time_ms": self.execution_time_ms,
+            "eval_stats": self.eval_stats.to_dict(),
             "final_eval": self.final_eval.to_dict(),
             "history": [h.to_dict() for h in self.history],
         }
@@ -16,7 +16,9 @@ from typing import List, Optional
 
 import structlog
 
+from src.eval.eval_runner import EvalResultCache, ModelRateLimiter
 from src.eval.models import (
+    EvalRunStats,
     OptimizationAttempt,
     OptimizationConfig,
     OptimizationContext,
@@ -54,13 +56,17 @@ class OptimizationLoopController:
 
         Args:
             config: Configuration for the optimization loop
-            eval_agent: PromptEvalAgent instance (created if not provided)
+            eval_agent: PromptEvalAgent instance (created from the config's
+                concurrency, rate limit and cache settings if not provided)
             optimizer_agent: PromptOptimizerAgent instance (created if not provided)
         """
         self.config = config or OptimizationConfig()
         self.eval_agent = eval_agent or PromptEvalAgent(
             default_model=self.config.eval_model,
             default_temperature=self.config.eval_temperature,
+            max_concurrency=self.config.eval_concurrency,
+            rate_limiter=ModelRateLimiter(self.config.eval_rate_limits),
+            result_cache=EvalResultCache() if self.config.cache_eval_results else None,
         )
         self.optimizer_agent = optimizer_agent or PromptOptimizerAgent(
             llm_model=self.config.optimizer_model,
@@ -91,6 +97,7 @@ class OptimizationLoopController:
         best_prompt = prompt_text
         best_score = 0.0
         best_eval: Optional[PromptEvalResult] = None
+        eval_stats = EvalRunStats()
 
         logger.info(
             "optimization_loop_started",
@@ -107,8 +114,12 @@ class OptimizationLoopController:
                 current_prompt,
                 test_cases,
                 llm_model=self.config.eval_model,
+                **self._early_stop_thresholds(),
             )
+            eval_stats.add(eval_result.stats)
 
+            # An early-stopped eval scores its skipped cases as 0, so this is
+            # comparable with full evals for best tracking and rollback
             score = self._calculate_score(eval_result)
 
             # Track history
@@ -129,6 +140,10 @@ class OptimizationLoopController:
                 score=score,
                 tests_passed=eval_result.tests_passed,
                 tests_failed=eval_result.tests_failed,
+                tests_skipped=eval_result.tests_skipped,
+                wall_clock_ms=eval_result.stats.wall_clock_ms,
+                total_tokens=eval_result.stats.total_tokens,
+                cache_hits=eval_result.stats.cache_hits,
             )
 
             # Track best
@@ -156,14 +171,16 @@ class OptimizationLoopController:
                     final_score=score,
                     improvement_summary=self._generate_summary(history),
                     execution_time_ms=int((time.time() - start_time) * 1000),
+                    eval_stats=eval_stats,
                 )
 
             # Last iteration - don't optimize, just return best
             if iteration == self.config.max_iterations - 1:
                 break
 
-            # ANALYZE FAILURES
-            failed_tests = [tc for tc in test_cases if not eval_result.get_test_passed(tc.id)]
+            # ANALYZE FAILURES (cases skipped by an early stop have no result to learn from)
+            failed_ids = {r.test_case_id for r in eval_result.get_failed_tests()}
+            failed_tests = [tc for tc in test_cases if tc.id in failed_ids]
             failure_analysis = self._analyze_failures(eval_result, failed_tests)
 
             # OPTIMIZE PHASE
@@ -188,12 +205,14 @@ class OptimizationLoopController:
 
             # ROLLBACK CHECK
             if self.config.enable_rollback and iteration > 0:
-                # Quick eval of improved prompt
+                # Quick eval of improved prompt. Runs in full: the score is
+                # compared, and the results are cached for the next iteration.
                 new_eval = await self.eval_agent.evaluate(
                     improvement.improved_prompt,
                     test_cases,
                     llm_model=self.config.eval_model,
                 )
+                eval_stats.add(new_eval.stats)
                 new_score = self._calculate_score(new_eval)
 
                 if new_score < score * 0.9:  # More than 10% worse
@@ -216,6 +235,8 @@ class OptimizationLoopController:
             "optimization_max_iterations",
             iterations=self.config.max_iterations,
             best_score=best_score,
+            total_tokens=eval_stats.total_tokens,
+            cache_hits=eval_stats.cache_hits,
         )
 
         return OptimizationResult(
@@ -230,8 +251,18 @@ class OptimizationLoopController:
             final_score=best_score,
             improvement_summary=self._generate_summary(history),
             execution_time_ms=int((time.time() - start_time) * 1000),
+            eval_stats=eval_stats,
         )
 
+    def _early_stop_thresholds(self) -> dict:
+        """Thresholds that let an iteration's eval stop once it cannot pass."""
+        if not self.config.early_stop_unreachable:
+            return {}
+        return {
+            "min_pass_rate": self.config.pass_threshold,
+            "min_format_score": self.config.format_threshold,
+        }
+
     def _calculate_score(self, eval_result: PromptEvalResult) -> float:
         """
         Calculate composite score from eval result.
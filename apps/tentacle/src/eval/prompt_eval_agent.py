@@ -8,14 +8,19 @@ This agent evaluates prompt effectiveness by:
 4. Returning detailed pass/fail results
 """
 
+import asyncio
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import structlog
 
+from src.eval.eval_runner import EvalResultCache, ModelRateLimiter
 from src.eval.format_validators import FormatValidator, TemplateSyntaxValidator
 from src.eval.models import (
+    EvalRunStats,
     EvalTestResult,
     FormatRequirements,
     OutputPattern,
@@ -23,7 +28,7 @@ from src.eval.models import (
     TestCase,
     get_template_syntax_rules,
 )
-from src.interfaces.llm import LLMMessage
+from src.interfaces.llm import LLMMessage, LLMResponse
 from src.llm.openrouter_client import OpenRouterClient
 
 logger = structlog.get_logger(__name__)
@@ -43,6 +48,9 @@ class PromptEvalAgent:
         llm_client: Optional[OpenRouterClient] = None,
         default_model: str = "x-ai/grok-2-1212",
         default_temperature: float = 0.3,
+        max_concurrency: int = 5,
+        rate_limiter: Optional[ModelRateLimiter] = None,
+        result_cache: Optional[EvalResultCache] = None,
     ):
         """
         Initialize the eval agent.
@@ -51,10 +59,16 @@ class PromptEvalAgent:
             llm_client: Optional LLM client. Created if not provided.
             default_model: Default model for generating test outputs.
             default_temperature: Default temperature for LLM calls.
+            max_concurrency: Test cases evaluated at once.
+            rate_limiter: Per-model request limits. Unlimited if not provided.
+            result_cache: Cache of earlier results. Caching is off if not provided.
         """
         self.llm_client = llm_client or OpenRouterClient()
         self.default_model = default_model
         self.default_temperature = default_temperature
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter or ModelRateLimiter()
+        self.result_cache = result_cache
         self.format_validator = FormatValidator()
 
     async def evaluate(
@@ -63,15 +77,24 @@ class PromptEvalAgent:
         test_cases: List[TestCase],
         llm_model: Optional[str] = None,
         temperature: Optional[float] = None,
+        min_pass_rate: Optional[float] = None,
+        min_format_score: Optional[float] = None,
     ) -> PromptEvalResult:
         """
         Run the prompt against all test cases and return aggregated results.
 
+        Up to ``max_concurrency`` cases run at once, started in priority
+        order. When ``min_pass_rate`` or ``min_format_score`` is given, the
+        run stops as soon as that threshold can no longer be reached; the
+        cases not yet finished are counted in ``tests_skipped`` and score 0.
+
         Args:
             prompt_text: The prompt to evaluate
             test_cases: Test cases to run
             llm_model: Model to use (defaults to default_model)
             temperature: Temperature to use (defaults to default_temperature)
+            min_pass_rate: Stop early once this pass rate is unreachable
+            min_format_score: Stop early once this average format score is unreachable
 
         Returns:
             PromptEvalResult with pass/fail per test case and analysis
@@ -80,52 +103,76 @@ class PromptEvalAgent:
         temp = temperature if temperature is not None else self.default_temperature
 
         start_time = time.time()
-        test_results: List[EvalTestResult] = []
+        stats = EvalRunStats()
 
-        # Sort by priority (higher first)
+        # Sort by priority (higher first); the semaphore admits tasks in creation order
         sorted_cases = sorted(test_cases, key=lambda tc: tc.priority, reverse=True)
-
-        for test_case in sorted_cases:
-            try:
-                result = await self.evaluate_single(prompt_text, test_case, model, temp)
-                test_results.append(result)
-            except Exception as e:
-                logger.error(
-                    "test_case_evaluation_failed",
-                    test_case_id=test_case.id,
-                    error=str(e),
-                )
-                test_results.append(
-                    EvalTestResult(
-                        test_case_id=test_case.id,
-                        test_case_name=test_case.name,
-                        passed=False,
-                        content_score=0.0,
-                        format_score=0.0,
-                        pattern_matches={},
-                        format_violations=[f"Evaluation error: {str(e)}"],
-                        raw_output="",
-                        error=str(e),
+        total_tests = len(sorted_cases)
+        finished: Dict[int, EvalTestResult] = {}
+        gate = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_case(index: int, test_case: TestCase) -> None:
+            async with gate:
+                if stats.early_stopped:
+                    return
+                finished[index] = await self._evaluate_case(prompt_text, test_case, model, temp)
+                if len(finished) < total_tests and self._thresholds_unreachable(
+                    list(finished.values()), total_tests, min_pass_rate, min_format_score
+                ):
+                    stats.early_stopped = True
+                    logger.info(
+                        "eval_early_stopped",
+                        completed=len(finished),
+                        total=total_tests,
                     )
-                )
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+
+        async with self._client_session():
+            tasks = [
+                asyncio.ensure_future(run_case(index, test_case))
+                for index, test_case in enumerate(sorted_cases)
+            ]
+            try:
+                if tasks:
+                    await asyncio.wait(tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        test_results = [finished[index] for index in sorted(finished)]
 
         # Aggregate results
         tests_passed = sum(1 for r in test_results if r.passed)
         tests_failed = len(test_results) - tests_passed
-        total_tests = len(test_results)
+        tests_skipped = total_tests - len(test_results)
 
+        # Cases skipped by an early stop score 0, so scores of early-stopped
+        # and full runs stay comparable (a partial run is never overrated)
         content_scores = [r.content_score for r in test_results]
         format_scores = [r.format_score for r in test_results]
 
-        avg_content_score = sum(content_scores) / len(content_scores) if content_scores else 0.0
-        avg_format_score = sum(format_scores) / len(format_scores) if format_scores else 0.0
+        avg_content_score = sum(content_scores) / total_tests if total_tests else 0.0
+        avg_format_score = sum(format_scores) / total_tests if total_tests else 0.0
         overall_score = (avg_content_score * 0.6) + (avg_format_score * 0.4)
 
-        # Pass threshold: 90% of tests must pass
+        # Pass threshold: 90% of tests must pass (skipped tests count as not passed)
         passed = (tests_passed / total_tests) >= 0.9 if total_tests > 0 else True
 
         execution_time_ms = int((time.time() - start_time) * 1000)
 
+        for r in test_results:
+            if r.cached:
+                stats.cache_hits += 1
+                continue
+            stats.llm_calls += 1
+            stats.case_time_ms += r.execution_time_ms
+            stats.prompt_tokens += r.prompt_tokens
+            stats.completion_tokens += r.completion_tokens
+        stats.wall_clock_ms = execution_time_ms
+
         return PromptEvalResult(
             passed=passed,
             overall_score=overall_score,
@@ -136,8 +183,90 @@ class PromptEvalAgent:
             tests_failed=tests_failed,
             total_tests=total_tests,
             execution_time_ms=execution_time_ms,
+            tests_skipped=tests_skipped,
+            stats=stats,
         )
 
+    async def _evaluate_case(
+        self,
+        prompt_text: str,
+        test_case: TestCase,
+        model: str,
+        temperature: float,
+    ) -> EvalTestResult:
+        """Evaluate one case, reusing a cached result and turning errors into failures."""
+        key = None
+        if self.result_cache is not None:
+            key = self.result_cache.key(prompt_text, test_case, model, temperature)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return replace(cached, cached=True)
+
+        try:
+            result = await self.evaluate_single(prompt_text, test_case, model, temperature)
+        except Exception as e:
+            logger.error(
+                "test_case_evaluation_failed",
+                test_case_id=test_case.id,
+                error=str(e),
+            )
+            return EvalTestResult(
+                test_case_id=test_case.id,
+                test_case_name=test_case.name,
+                passed=False,
+                content_score=0.0,
+                format_score=0.0,
+                pattern_matches={},
+                format_violations=[f"Evaluation error: {str(e)}"],
+                raw_output="",
+                error=str(e),
+            )
+
+        if key is not None:
+            self.result_cache.put(key, result)
+        return result
+
+    @staticmethod
+    def _thresholds_unreachable(
+        results: List[EvalTestResult],
+        total_tests: int,
+        min_pass_rate: Optional[float],
+        min_format_score: Optional[float],
+    ) -> bool:
+        """True if no outcome of the remaining cases can meet the thresholds."""
+        remaining = total_tests - len(results)
+        if min_pass_rate is not None:
+            best_passed = sum(1 for r in results if r.passed) + remaining
+            if best_passed / total_tests < min_pass_rate:
+                return True
+        if min_format_score is not None:
+            best_format = (sum(r.format_score for r in results) + remaining) / total_tests
+            if best_format < min_format_score:
+                return True
+        return False
+
+    @asynccontextmanager
+    async def _client_session(self) -> AsyncIterator[None]:
+        """
+        Keep the OpenRouter HTTP session open for a whole run.
+
+        Entering the client per call would let concurrent cases close each
+        other's session. Mocks and already-open clients are used as they are.
+        """
+        client = self.llm_client
+        if not isinstance(client, OpenRouterClient) or self._session_open(client):
+            yield
+            return
+        try:
+            async with client:
+                yield
+        finally:
+            client.client = None
+
+    @staticmethod
+    def _session_open(client: OpenRouterClient) -> bool:
+        return client.client is not None and not client.client.is_closed
+
     async def evaluate_single(
         self,
         prompt_text: str,
@@ -163,12 +292,14 @@ class PromptEvalAgent:
         user_message = self._build_user_message(test_case)
 
         # Call LLM with the prompt
-        raw_output = await self._call_llm(
+        response = await self._call_llm(
             prompt_text=prompt_text,
             user_message=user_message,
             model=llm_model,
             temperature=temperature,
         )
+        raw_output = response.content
+        prompt_tokens, completion_tokens = self._token_counts(response)
 
         # Validate format
         format_score, format_violations = self.validate_format(
@@ -197,8 +328,18 @@ class PromptEvalAgent:
             format_violations=format_violations,
             raw_output=raw_output,
             execution_time_ms=execution_time_ms,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
         )
 
+    @staticmethod
+    def _token_counts(response: LLMResponse) -> Tuple[int, int]:
+        """(prompt, completion) tokens from the provider's usage block, if any."""
+        usage = getattr(response, "usage", None)
+        if not isinstance(usage, dict):
+            return 0, 0
+        return int(usage.get("prompt_tokens") or 0), int(usage.get("completion_tokens") or 0)
+
     def validate_format(
         self,
         output: str,
@@ -377,10 +518,12 @@ class PromptEvalAgent:
         user_message: str,
         model: str,
         temperature: float,
-    ) -> str:
+    ) -> LLMResponse:
         """
         Call the LLM with the prompt and user message.
 
+        Waits for the model's rate limit first.
+
         Args:
             prompt_text: System prompt to use
             user_message: User message to send
@@ -388,35 +531,35 @@ class PromptEvalAgent:
             temperature: Temperature for generation
 
         Returns:
-            LLM response content
+            LLM response (content and token usage)
         """
         messages = [
             LLMMessage(role="system", content=prompt_text),
             LLMMessage(role="user", content=user_message),
         ]
 
+        await self.rate_limiter.acquire(model)
+
         try:
             client = self.llm_client
 
-            # If the client supports async context manager (needs HTTP init),
-            # initialize it. Mocks and pre-initialized clients skip this.
-            if hasattr(client, "__aenter__") and isinstance(client, OpenRouterClient):
+            # An OpenRouter client needs its HTTP session; evaluate() opens it
+            # once per run, a direct evaluate_single() call opens it here.
+            # Mocks and pre-initialized clients skip this.
+            if isinstance(client, OpenRouterClient) and not self._session_open(client):
                 async with client:
-                    response = await client.create_completion(
+                    return await client.create_completion(
                         messages=messages,
                         model=model,
                         temperature=temperature,
                         max_tokens=4000,
                     )
-                    return response.content
-            else:
-                response = await client.create_completion(
-                    messages=messages,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=4000,
-                )
-                return response.content
+            return await client.create_completion(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=4000,
+            )
         except Exception as e:
             logger.error("llm_call_failed", model=model, error=str(e))
             raise
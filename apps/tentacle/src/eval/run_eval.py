@@ -99,6 +99,7 @@ async def evaluate_prompt(
     print_result("Format Score", f"{result.format_score:.2f}")
     print_result("Tests Passed", f"{result.tests_passed}/{result.total_tests}")
     print_result("Execution Time", f"{result.execution_time_ms}ms")
+    print_result("Tokens", str(result.stats.total_tokens))
 
     # Print failed tests
     failed_tests = result.get_failed_tests()
@@ -177,6 +178,8 @@ async def optimize_prompt(
     print_result("Final Score", f"{result.final_score:.2f}")
     print_result("Improvement", f"{result.final_score - result.original_score:+.2f}")
     print_result("Execution Time", f"{result.execution_time_ms}ms")
+    print_result("LLM Calls", f"{result.eval_stats.llm_calls} ({result.eval_stats.cache_hits} cached)")
+    print_result("Tokens", str(result.eval_stats.total_tokens))
 
     print(f"\n  Summary: {result.improvement_summary}")
 
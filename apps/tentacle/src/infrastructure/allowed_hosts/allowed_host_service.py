@@ -1,14 +1,22 @@
-# REVIEW: DNS resolution is done inline per request; no caching and potential
-# REVIEW: latency/SSRF races.
 """Service for managing and checking allowed HTTP hosts with denylist and SSRF protection."""
 
 from typing import List, Set, Optional
 from urllib.parse import urlparse
 from datetime import datetime
 import ipaddress
-import socket
 import structlog
 from src.database.allowed_host_models import AllowedHost, Environment
+from src.domain.allowed_hosts.models import HostCheck
+from src.infrastructure.allowed_hosts.allowlist_snapshot import (
+    AllowlistSnapshot,
+    publish_allowlist_change,
+)
+from src.infrastructure.allowed_hosts.host_resolver import (
+    HostResolutionError,
+    HostResolver,
+    host_resolver,
+    is_private_ip,
+)
 from src.interfaces.database import Database
 from src.core.config import settings
 from sqlalchemy import select
@@ -27,22 +35,26 @@ DENYLISTED_HOSTS: Set[str] = {
     "169.254.169.254",  # Azure metadata service
 }
 
-# Private IP ranges (RFC 1918, link-local, loopback, etc.)
-PRIVATE_IP_RANGES = [
-    ipaddress.IPv4Network("10.0.0.0/8"),
-    ipaddress.IPv4Network("172.16.0.0/12"),
-    ipaddress.IPv4Network("192.168.0.0/16"),
-    ipaddress.IPv4Network("127.0.0.0/8"),
-    ipaddress.IPv4Network("169.254.0.0/16"),  # Link-local
-    ipaddress.IPv4Network("224.0.0.0/4"),  # Multicast
-]
-
 
 class AllowedHostService:
-    """Service for checking if a host is allowed for HTTP requests."""
+    """Service for checking if a host is allowed for HTTP requests.
+
+    Allowlist checks read an in-memory snapshot of enabled hosts per
+    environment and DNS answers come from a shared cache, so a check
+    normally touches neither Postgres nor the resolver.
+    """
     
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(
+        self,
+        database: Optional[Database] = None,
+        resolver: Optional[HostResolver] = None,
+    ):
         self.database = database or Database()
+        self.resolver = resolver or host_resolver
+        self._allowlist = AllowlistSnapshot(
+            loader=self._load_enabled_hosts,
+            max_age=settings.ALLOWED_HOSTS_SNAPSHOT_MAX_AGE_SECONDS,
+        )
     
     async def is_host_allowed(
         self, url: str, environment: Optional[str] = None
@@ -60,51 +72,57 @@ class AllowedHostService:
             - is_allowed: True if host is allowed, False otherwise
             - error_message: Human-readable error if not allowed, None if allowed
         """
+        check = await self.check_host(url, environment)
+        return check.allowed, check.error
+
+    async def check_host(self, url: str, environment: Optional[str] = None) -> HostCheck:
+        """Check *url* like ``is_host_allowed`` and return the vetted addresses.
+
+        Every A/AAAA record must be public; callers should connect to one of
+        ``HostCheck.addresses`` rather than resolving the host again.
+        """
         env = environment or settings.APP_ENV
+        host = ""
         try:
             parsed = urlparse(url)
             host = parsed.hostname or ""
 
             # 1. Check HTTPS requirement
             if parsed.scheme != "https":
-                return False, f"Only HTTPS URLs are allowed (got {parsed.scheme})"
+                return HostCheck(False, f"Only HTTPS URLs are allowed (got {parsed.scheme})", host)
 
             # 2. Check for IP literals (not allowed)
             if self._is_ip_literal(host):
-                return False, f"IP literal addresses are not allowed (use hostname): {host}"
+                return HostCheck(False, f"IP literal addresses are not allowed (use hostname): {host}", host)
 
             # 3. Check denylist first (denylist always wins)
             if host.lower() in DENYLISTED_HOSTS:
-                return False, f"Host '{host}' is in the denylist and cannot be allowed"
+                return HostCheck(False, f"Host '{host}' is in the denylist and cannot be allowed", host)
 
-            # 4. Check if host resolves to private IP (SSRF protection)
-            try:
-                resolved_ip = socket.gethostbyname(host)
-                if self._is_private_ip(resolved_ip):
-                    return False, f"Host '{host}' resolves to private IP '{resolved_ip}' (SSRF protection)"
-            except socket.gaierror:
-                # DNS resolution failed - we'll allow it but log a warning
-                logger.warning("DNS resolution failed for host", host=host)
-
-            # 5. Check allowlist in database
-            env_enum = Environment(env)
-            async with self.database.get_session() as session:
-                stmt = select(AllowedHost).where(
-                    AllowedHost.host == host,
-                    AllowedHost.environment == env_enum,
-                    AllowedHost.enabled == True
-                )
-                result = await session.execute(stmt)
-                allowed_host = result.scalar_one_or_none()
+            # 4. Check allowlist snapshot (before DNS, so unlisted hosts are never resolved)
+            Environment(env)  # Reject unknown environments before loading a snapshot
+            if not await self._allowlist.contains(host, env):
+                return HostCheck(False, f"Host '{host}' is not in the allowlist for environment '{env}'", host)
 
-                if allowed_host is None:
-                    return False, f"Host '{host}' is not in the allowlist for environment '{env}'"
+            # 5. Check that every resolved address is public (SSRF protection)
+            try:
+                addresses = await self.resolver.resolve(host)
+            except HostResolutionError as e:
+                return HostCheck(False, str(e), host)
+            for address in addresses:
+                if self._is_private_ip(address):
+                    return HostCheck(
+                        False, f"Host '{host}' resolves to private IP '{address}' (SSRF protection)", host
+                    )
 
-            return True, None
+            return HostCheck(True, None, host, addresses)
 
         except Exception as e:
             logger.error("Error checking host allowlist", url=url, error=str(e))
-            return False, f"Error checking host allowlist: {str(e)}"
+            return HostCheck(False, f"Error checking host allowlist: {str(e)}", host)
+
+    async def _load_enabled_hosts(self, environment: str) -> List[str]:
+        return [h.host for h in await self.get_allowed_hosts(environment)]
     
     def _is_ip_literal(self, host: str) -> bool:
         """Check if host is an IP literal (IPv4 or IPv6)."""
@@ -121,16 +139,8 @@ class AllowedHostService:
                 return False
     
     def _is_private_ip(self, ip_str: str) -> bool:
-        """Check if an IP address is in a private/reserved range."""
-        try:
-            ip = ipaddress.IPv4Address(ip_str)
-            for network in PRIVATE_IP_RANGES:
-                if ip in network:
-                    return True
-            return False
-        except ValueError:
-            # Not a valid IPv4 address
-            return False
+        """Check if an IP address (IPv4 or IPv6) is in a private/reserved range."""
+        return is_private_ip(ip_str)
     
     async def get_allowed_hosts(self, environment: Optional[str] = None) -> List[AllowedHost]:
         """
@@ -186,6 +196,7 @@ class AllowedHostService:
                 existing.updated_at = datetime.utcnow()
                 await session.commit()
                 await session.refresh(existing)
+                await publish_allowlist_change(environment)
                 return existing
             
             # Create new entry
@@ -199,6 +210,7 @@ class AllowedHostService:
             session.add(allowed_host)
             await session.commit()
             await session.refresh(allowed_host)
+            await publish_allowlist_change(environment)
             return allowed_host
     
     async def remove_allowed_host(
@@ -222,4 +234,5 @@ class AllowedHostService:
             
             allowed_host.enabled = False
             await session.commit()
+            await publish_allowlist_change(environment)
             return True
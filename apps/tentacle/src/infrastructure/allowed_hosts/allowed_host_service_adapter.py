@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, List, Optional, Tuple
 
-from src.domain.allowed_hosts import AllowedHostOperationsPort
+from src.domain.allowed_hosts import AllowedHostOperationsPort, HostCheck
 from src.infrastructure.allowed_hosts.allowed_host_service import AllowedHostService
 from src.interfaces.database import Database
 
@@ -41,3 +41,10 @@ class AllowedHostServiceAdapter(AllowedHostOperationsPort):
         environment: Optional[str] = None,
     ) -> Tuple[bool, Optional[str]]:
         return await self._service.is_host_allowed(url=url, environment=environment)
+
+    async def check_host(
+        self,
+        url: str,
+        environment: Optional[str] = None,
+    ) -> HostCheck:
+        return await self._service.check_host(url=url, environment=environment)
@@ -0,0 +1,144 @@
+"""In-memory, per-environment snapshot of the host allowlist.
+
+The HTTP plugin checks the allowlist on every request. Rather than querying
+``allowed_hosts`` each time, a snapshot of the enabled hosts per environment
+is loaded once and reused. Admin changes publish on a Redis channel; each
+process keeps one listener that drops its snapshots when a message arrives.
+``max_age`` is a safety net for missed messages (Redis restarts, or Celery
+tasks that finish before the listener connects).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+import redis.asyncio as redis_async
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+ALLOWED_HOSTS_CHANNEL = "tentacle:allowed_hosts:changed"
+ALL_ENVIRONMENTS = "*"
+LISTENER_RETRY_SECONDS = 30.0
+
+_snapshots: "weakref.WeakSet[AllowlistSnapshot]" = weakref.WeakSet()
+
+
+class AllowlistSnapshot:
+    """Caches the set of enabled hosts per environment.
+
+    ``loader(environment)`` returns the enabled host names for an
+    environment; it is only called when the snapshot is missing, stale or
+    invalidated. Loader errors propagate so callers fail closed.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[Iterable[str]]],
+        max_age: float,
+        subscribe: bool = True,
+    ) -> None:
+        self._loader = loader
+        self._max_age = max_age
+        self._subscribe = subscribe
+        # environment -> (loaded_at, hosts)
+        self._hosts: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        _snapshots.add(self)
+
+    async def hosts(self, environment: str) -> FrozenSet[str]:
+        if self._subscribe:
+            _listener.ensure_running()
+        with self._lock:
+            entry = self._hosts.get(environment)
+            generation = self._generation
+        if entry is not None and time.monotonic() - entry[0] < self._max_age:
+            return entry[1]
+
+        hosts = frozenset(h.lower() for h in await self._loader(environment))
+        with self._lock:
+            # An invalidation while loading means this result may be stale
+            if generation == self._generation:
+                self._hosts[environment] = (time.monotonic(), hosts)
+        return hosts
+
+    async def contains(self, host: str, environment: str) -> bool:
+        return host.lower() in await self.hosts(environment)
+
+    def invalidate(self, environment: Optional[str] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if environment is None or environment == ALL_ENVIRONMENTS:
+                self._hosts.clear()
+            else:
+                self._hosts.pop(environment, None)
+
+
+def invalidate_all(environment: Optional[str] = None) -> None:
+    """Invalidate every snapshot in this process."""
+    for snapshot in list(_snapshots):
+        snapshot.invalidate(environment)
+
+
+async def publish_allowlist_change(environment: str) -> None:
+    """Invalidate local snapshots and notify other processes.
+
+    Publishing is best effort: if Redis is unavailable, other processes
+    pick the change up when their snapshot reaches ``max_age``.
+    """
+    invalidate_all(environment)
+    try:
+        client = redis_async.from_url(settings.REDIS_URL, decode_responses=True)
+        try:
+            await client.publish(ALLOWED_HOSTS_CHANNEL, environment)
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.warning("Failed to publish allowlist change", environment=environment, error=str(e))
+
+
+class _InvalidationListener:
+    """One pub/sub subscription per process, restarted per event loop."""
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+        self._retry_at = 0.0
+
+    def ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        if time.monotonic() < self._retry_at:
+            return
+        # A new loop (or a dead listener) may have missed messages
+        invalidate_all()
+        self._task = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        try:
+            client = redis_async.from_url(settings.REDIS_URL, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(ALLOWED_HOSTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        invalidate_all(message["data"] or None)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self._retry_at = time.monotonic() + LISTENER_RETRY_SECONDS
+            logger.warning("Allowlist invalidation listener stopped", error=str(e))
+
+
+_listener = _InvalidationListener()
@@ -0,0 +1,143 @@
+"""Async, cached DNS resolution for SSRF checks."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Private IP ranges (RFC 1918, link-local, loopback, etc.)
+PRIVATE_IP_RANGES = [
+    ipaddress.IPv4Network("10.0.0.0/8"),
+    ipaddress.IPv4Network("172.16.0.0/12"),
+    ipaddress.IPv4Network("192.168.0.0/16"),
+    ipaddress.IPv4Network("127.0.0.0/8"),
+    ipaddress.IPv4Network("169.254.0.0/16"),  # Link-local
+    ipaddress.IPv4Network("224.0.0.0/4"),  # Multicast
+    ipaddress.IPv6Network("fc00::/7"),  # Unique local
+    ipaddress.IPv6Network("fe80::/10"),  # Link-local
+    ipaddress.IPv6Network("ff00::/8"),  # Multicast
+]
+
+
+def is_private_ip(ip_str: str) -> bool:
+    """Check if an IPv4 or IPv6 address is in a private/reserved range.
+
+    IPv4-mapped and 6to4/Teredo-embedded IPv6 addresses are checked as the
+    IPv4 address they reach. Anything that is not globally routable
+    (loopback, unspecified, documentation, CGNAT, ...) counts as private.
+    Strings that are not IP addresses are not private.
+    """
+    try:
+        ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address] = ipaddress.ip_address(ip_str)
+    except ValueError:
+        return False
+
+    if isinstance(ip, ipaddress.IPv6Address):
+        embedded = ip.ipv4_mapped or ip.sixtofour or (ip.teredo[1] if ip.teredo else None)
+        if embedded is not None:
+            return is_private_ip(str(embedded))
+
+    if any(ip in network for network in PRIVATE_IP_RANGES if network.version == ip.version):
+        return True
+    return not ip.is_global
+
+
+class HostResolutionError(Exception):
+    """A hostname could not be resolved."""
+
+
+class HostResolver:
+    """Resolves hostnames to every A/AAAA address without blocking the loop.
+
+    Lookups go through ``loop.getaddrinfo`` (the default executor), and
+    answers are cached per process: successful lookups for ``ttl`` seconds,
+    failures for ``negative_ttl`` seconds. The system resolver does not
+    expose record TTLs, so ``ttl`` is an upper bound on how stale a cached
+    answer can be. The cache is keyed by hostname only and shared across
+    event loops, since Celery tasks each run on their own loop.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, max_entries: int = 4096) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        # host -> (expires_at, addresses or error message)
+        self._cache: Dict[str, Tuple[float, Union[List[str], str]]] = {}
+        self._lock = threading.Lock()
+
+    async def resolve(self, host: str) -> List[str]:
+        """Return every address *host* resolves to, in resolver order.
+
+        Raises:
+            HostResolutionError: If the lookup fails or returns nothing.
+        """
+        host = host.lower().rstrip(".")
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(host)
+        if cached is not None and cached[0] > now:
+            answer = cached[1]
+            if isinstance(answer, str):
+                raise HostResolutionError(answer)
+            return list(answer)
+
+        try:
+            addresses = await self._lookup(host)
+        except (socket.gaierror, UnicodeError, OSError) as e:
+            message = f"DNS resolution failed for host '{host}': {e}"
+            logger.warning("DNS resolution failed for host", host=host, error=str(e))
+            self._store(host, self._negative_ttl, message)
+            raise HostResolutionError(message)
+
+        if not addresses:
+            message = f"DNS resolution returned no addresses for host '{host}'"
+            self._store(host, self._negative_ttl, message)
+            raise HostResolutionError(message)
+
+        self._store(host, self._ttl, addresses)
+        return list(addresses)
+
+    async def _lookup(self, host: str) -> List[str]:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(
+            host, 443, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+        )
+        addresses: List[str] = []
+        for _family, _type, _proto, _canonname, sockaddr in infos:
+            # Drop IPv6 zone ids ("fe80::1%eth0") so the address parses
+            address = str(sockaddr[0]).split("%", 1)[0]
+            if address not in addresses:
+                addresses.append(address)
+        return addresses
+
+    def _store(self, host: str, ttl: float, answer: Union[List[str], str]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._cache) >= self._max_entries:
+                expired = [h for h, (expires_at, _) in self._cache.items() if expires_at <= now]
+                for h in expired:
+                    del self._cache[h]
+                if len(self._cache) >= self._max_entries:
+                    # Still full: drop the entry closest to expiry
+                    del self._cache[min(self._cache, key=lambda h: self._cache[h][0])]
+            self._cache[host] = (now + ttl, answer)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+host_resolver = HostResolver(
+    ttl=settings.HTTP_DNS_CACHE_TTL_SECONDS,
+    negative_ttl=settings.HTTP_DNS_NEGATIVE_CACHE_TTL_SECONDS,
+)
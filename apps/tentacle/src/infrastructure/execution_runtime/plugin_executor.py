@@ -14,13 +14,25 @@ Usage:
         print(result.output)
 """
 
+import asyncio
 import importlib
+import time
 import structlog
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from src.plugins.handler_pools import (
+    ASYNC,
+    PROCESS,
+    THREAD,
+    HandlerTimeoutError,
+    handler_pools,
+    record_handler_timeout,
+    record_handler_timing,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -121,6 +133,62 @@ PLUGIN_REGISTRY: Dict[str, Tuple[str, str]] = {
 }
 
 
+# Timeout for plugins whose definition declares no ``timeout_seconds``
+# (None: no limit). Handlers offload their blocking sections via
+# src.plugins.handler_pools.
+DEFAULT_PLUGIN_TIMEOUT: Optional[float] = None
+
+_plugin_policies: Dict[str, Tuple[str, Optional[float]]] = {}
+
+
+def _plugin_policy(agent_type: str, module: Any, handler: Any) -> Tuple[str, Optional[float]]:
+    """``(execution_mode, timeout_seconds)`` from the definition that exports *handler*.
+
+    Plugin modules export their definitions as ``PLUGIN_DEFINITION`` or
+    ``*_PLUGIN_DEFINITION(S)`` (see src.plugins.manifest).
+    """
+    if agent_type not in _plugin_policies:
+        policy = (ASYNC, DEFAULT_PLUGIN_TIMEOUT)
+        for attr, value in vars(module).items():
+            if not attr.endswith(("PLUGIN_DEFINITION", "PLUGIN_DEFINITIONS")):
+                continue
+            definitions = value if isinstance(value, list) else [value]
+            for definition in definitions:
+                if isinstance(definition, dict) and definition.get("handler") is handler:
+                    policy = (
+                        definition.get("execution_mode", ASYNC),
+                        definition.get("timeout_seconds", DEFAULT_PLUGIN_TIMEOUT),
+                    )
+        _plugin_policies[agent_type] = policy
+    return _plugin_policies[agent_type]
+
+
+async def _run_plugin_handler(
+    agent_type: str,
+    module: Any,
+    handler: Any,
+    inputs: Dict[str, Any],
+    context: Any,
+) -> Dict[str, Any]:
+    """Run *handler* the way ``PluginRegistry.execute`` does for its mode.
+
+    Raises:
+        HandlerTimeoutError: If the handler exceeds its timeout.
+    """
+    mode, timeout = _plugin_policy(agent_type, module, handler)
+    if mode in (THREAD, PROCESS):
+        return await handler_pools.run(handler, inputs, context, mode=mode, name=agent_type, timeout=timeout)
+
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(handler(inputs, context), timeout)
+    except asyncio.TimeoutError:
+        record_handler_timeout(agent_type, ASYNC)
+        raise HandlerTimeoutError(f"{agent_type} exceeded {timeout}s timeout")
+    record_handler_timing(agent_type, ASYNC, 0.0, time.perf_counter() - started)
+    return result
+
+
 def _wrap_plugin_result(result: Dict[str, Any], start_time: datetime) -> ExecutionResult:
     """Wrap a plugin handler result in ExecutionResult format."""
     execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -182,7 +250,16 @@ async def execute_step(
             handler = getattr(module, handler_name)
 
             logger.debug("executing_plugin", agent_type=agent_type, handler=handler_name)
-            result = await handler(step.inputs, context)
+            try:
+                result = await _run_plugin_handler(agent_type, module, handler, step.inputs, context)
+            except HandlerTimeoutError as e:
+                logger.error("plugin_timeout", agent_type=agent_type, error=str(e))
+                return ExecutionResult(
+                    status="error",
+                    output=None,
+                    error=f"Plugin timed out: {e}",
+                    execution_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000),
+                )
 
             return _wrap_plugin_result(result, start_time)
 
@@ -0,0 +1,209 @@
+"""
+History window for inbox chat.
+
+Builds the LLM conversation history for a chat turn from the tail of the
+conversation only: messages are read newest-first in small keyset pages and
+packed into a token budget using a cheap local estimate. Messages that fall
+out of the window are folded into a rolling summary stored in the
+conversation metadata, so DB work and prompt size stay flat as threads grow.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.database.conversation_store import (
+    ConversationStore,
+    decode_keyset_cursor,
+    message_cursor,
+)
+from src.database.models import Message
+
+logger = structlog.get_logger(__name__)
+
+SUMMARY_METADATA_KEY = "history_summary"
+DEFAULT_MAX_MESSAGES = 50
+DEFAULT_PAGE_SIZE = 20
+MESSAGE_OVERHEAD_TOKENS = 4  # Role and framing per chat message
+STEP_OUTPUT_CHARS = 2000
+SUMMARY_LINE_CHARS = 200
+SUMMARY_FOLD_LIMIT = 100  # Max evicted messages folded into the summary per turn
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count locally: 1 token ≈ 4 characters."""
+    return (len(text) + 3) // 4
+
+
+def format_history_message(msg: Message) -> Optional[Dict[str, Any]]:
+    """Convert a stored message to OpenRouter format, or None if it is empty.
+
+    For task step messages, appends step output data so the LLM can
+    reference actual results (not just "Step — done.").
+    """
+    role = msg.role or "assistant"
+    content = msg.content_text or ""
+
+    # Skip empty messages
+    if not content.strip():
+        return None
+
+    # Enrich task step messages with their output data
+    if msg.content_data and msg.agent_id == "task_orchestrator":
+        outputs = msg.content_data.get("outputs")
+        if outputs:
+            # Truncate large outputs to avoid blowing up context
+            try:
+                outputs_str = json.dumps(outputs, default=str)
+                if len(outputs_str) > STEP_OUTPUT_CHARS:
+                    outputs_str = outputs_str[:STEP_OUTPUT_CHARS] + "… (truncated)"
+                content += f"\n\nStep output:\n```json\n{outputs_str}\n```"
+            except (TypeError, ValueError):
+                pass
+
+    return {"role": role, "content": content}
+
+
+def _summary_line(msg: Message) -> Optional[str]:
+    """One condensed line for the rolling summary, or None if empty."""
+    text = " ".join((msg.content_text or "").split())
+    if not text:
+        return None
+    if len(text) > SUMMARY_LINE_CHARS:
+        text = text[:SUMMARY_LINE_CHARS] + "…"
+    return f"{msg.role or 'assistant'}: {text}"
+
+
+def fold_summary(summary: str, lines: List[str], token_budget: int) -> str:
+    """Append *lines* to *summary*, dropping the oldest lines over budget."""
+    all_lines = [line for line in summary.splitlines() if line] + lines
+    total = sum(estimate_tokens(line) + 1 for line in all_lines)
+    start = 0
+    while start < len(all_lines) and total > token_budget:
+        total -= estimate_tokens(all_lines[start]) + 1
+        start += 1
+    return "\n".join(all_lines[start:])
+
+
+@dataclass
+class HistoryWindow:
+    """Chat history for one turn."""
+
+    messages: List[Dict[str, Any]]
+    summary: Optional[str] = None
+    estimated_tokens: int = 0
+
+
+class HistoryWindowLoader:
+    """Loads a token-budgeted tail of a conversation plus a rolling summary."""
+
+    def __init__(
+        self,
+        store: ConversationStore,
+        token_budget: int,
+        summary_token_budget: int,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        self._store = store
+        self._token_budget = token_budget
+        self._summary_token_budget = summary_token_budget
+        self._max_messages = max_messages
+        self._page_size = page_size
+
+    async def load(self, conversation_id: str) -> HistoryWindow:
+        """Return the newest messages that fit the budget, oldest first.
+
+        The newest message is always included, even if it alone exceeds the
+        budget. When older messages exist outside the window, the rolling
+        summary is brought up to date and returned alongside.
+        """
+        packed: List[Dict[str, Any]] = []
+        used = 0
+        scanned = 0
+        oldest_kept: Optional[Message] = None
+        cursor: Optional[str] = None
+        budget_exhausted = False
+        reached_start = False
+
+        while not budget_exhausted and not reached_start and scanned < self._max_messages:
+            limit = min(self._page_size, self._max_messages - scanned)
+            page = await self._store.get_messages(
+                conversation_id, limit=limit, cursor=cursor, newest_first=True
+            )
+            if len(page) < limit:
+                reached_start = True
+
+            for msg in page:
+                entry = format_history_message(msg)
+                if entry is not None:
+                    cost = estimate_tokens(entry["content"]) + MESSAGE_OVERHEAD_TOKENS
+                    if packed and used + cost > self._token_budget:
+                        budget_exhausted = True
+                        break
+                    packed.append(entry)
+                    used += cost
+                oldest_kept = msg
+                scanned += 1
+
+            if page:
+                cursor = message_cursor(page[-1])
+
+        packed.reverse()
+
+        summary: Optional[str] = None
+        if oldest_kept is not None and (budget_exhausted or not reached_start):
+            try:
+                summary = await self._update_summary(conversation_id, oldest_kept)
+            except Exception as e:
+                logger.warning(
+                    "Failed to update inbox history summary",
+                    conversation_id=conversation_id,
+                    error=str(e),
+                )
+
+        return HistoryWindow(messages=packed, summary=summary, estimated_tokens=used)
+
+    async def _update_summary(self, conversation_id: str, boundary: Message) -> Optional[str]:
+        """Fold messages older than *boundary* into the stored summary.
+
+        Only messages evicted since the last fold are read, so the cost per
+        turn is proportional to how far the window moved.
+        """
+        metadata = await self._store.get_conversation_metadata(conversation_id)
+        state = metadata.get(SUMMARY_METADATA_KEY) or {}
+        summary = state.get("text", "")
+        through = state.get("through")
+        boundary_pos = (boundary.timestamp, boundary.id)
+
+        if through:
+            if decode_keyset_cursor(through) >= boundary_pos:
+                return summary or None
+            evicted = await self._store.get_messages(
+                conversation_id, limit=SUMMARY_FOLD_LIMIT, cursor=through
+            )
+        else:
+            # First fold for this thread: only summarize the most recent evictions
+            evicted = await self._store.get_messages(
+                conversation_id,
+                limit=SUMMARY_FOLD_LIMIT,
+                cursor=message_cursor(boundary),
+                newest_first=True,
+            )
+            evicted.reverse()
+
+        evicted = [m for m in evicted if (m.timestamp, m.id) < boundary_pos]
+        if not evicted:
+            return summary or None
+
+        lines = [line for line in (_summary_line(m) for m in evicted) if line]
+        summary = fold_summary(summary, lines, self._summary_token_budget)
+        await self._store.update_conversation_metadata(
+            conversation_id,
+            {SUMMARY_METADATA_KEY: {"text": summary, "through": message_cursor(evicted[-1])}},
+        )
+        return summary or None
@@ -52,6 +52,7 @@ from src.application.tasks.providers import (
     get_task_use_cases as provider_get_task_use_cases,
     get_checkpoint_use_cases as provider_get_checkpoint_use_cases,
 )
+from src.infrastructure.inbox.history_window import HistoryWindowLoader
 from src.infrastructure.inbox.inbox_tool_registry import get_inbox_tool_registry
 
 logger = structlog.get_logger(__name__)
@@ -96,6 +97,11 @@ class InboxChatService:
         self._store = conversation_store
         self._registry = get_inbox_tool_registry()
         self._tool_executor = ToolExecutor(registry=self._registry)
+        self._history_loader = HistoryWindowLoader(
+            conversation_store,
+            token_budget=settings.INBOX_HISTORY_TOKEN_BUDGET,
+            summary_token_budget=settings.INBOX_HISTORY_SUMMARY_TOKEN_BUDGET,
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -144,8 +150,9 @@ class InboxChatService:
         # 3. Emit "thinking" status
         yield _sse({"status": "thinking"})
 
-        # 4. Load conversation history
-        history = await self._load_history(conv_id)
+        # 4. Load conversation history (token-budgeted tail + rolling summary)
+        history_window = await self._history_loader.load(conv_id)
+        history = history_window.messages
 
         # 5. Build system prompt
         system_prompt = await self._build_system_prompt(
@@ -153,6 +160,7 @@ class InboxChatService:
             conversation_id=conv_id,
             onboarding=onboarding,
             file_references=file_references,
+            history_summary=history_window.summary,
         )
 
         # 6. Build tool context
@@ -254,9 +262,10 @@ class InboxChatService:
     async def _save_assistant_messages(
         self, conversation_id: str, chat_result: Dict[str, Any]
     ) -> None:
-        """Persist the assistant response (and tool call info)."""
+        """Persist the assistant response (and tool call info) in one batch."""
         response_text = chat_result.get("response", "")
         tool_calls_made = chat_result.get("tool_calls_made", [])
+        messages: List[MessageData] = []
 
         # Save tool call messages for context
         for tc in tool_calls_made:
@@ -276,7 +285,7 @@ class InboxChatService:
                 ),
                 metadata=MessageMetadata(),
             )
-            await self._store.add_message(conversation_id, tool_msg)
+            messages.append(tool_msg)
 
         # Save final assistant response
         if response_text:
@@ -291,54 +300,10 @@ class InboxChatService:
                 ),
                 metadata=MessageMetadata(),
             )
-            await self._store.add_message(conversation_id, assistant_msg)
-
-    # ------------------------------------------------------------------
-    # History loading
-    # ------------------------------------------------------------------
-
-    async def _load_history(self, conversation_id: str) -> List[Dict[str, Any]]:
-        """Load conversation history for LLM context.
-
-        Returns messages in OpenRouter format. Applies a sliding window
-        of the last 50 messages to prevent exceeding token limits.
-
-        For task step messages, appends step output data so the LLM can
-        reference actual results (not just "Step — done.").
-        """
-        messages = await self._store.get_messages(conversation_id)
+            messages.append(assistant_msg)
 
-        # Sliding window — keep last 50 messages
-        if len(messages) > 50:
-            messages = messages[-50:]
-
-        history: List[Dict[str, Any]] = []
-        for msg in messages:
-            role = msg.role or "assistant"
-            content = msg.content_text or ""
-
-            # Skip empty messages
-            if not content.strip():
-                continue
-
-            # Enrich task step messages with their output data
-            if msg.content_data and msg.agent_id == "task_orchestrator":
-                outputs = msg.content_data.get("outputs")
-                if outputs:
-                    # Truncate large outputs to avoid blowing up context
-                    import json
-
-                    try:
-                        outputs_str = json.dumps(outputs, default=str)
-                        if len(outputs_str) > 2000:
-                            outputs_str = outputs_str[:2000] + "… (truncated)"
-                        content += f"\n\nStep output:\n```json\n{outputs_str}\n```"
-                    except (TypeError, ValueError):
-                        pass
-
-            history.append({"role": role, "content": content})
-
-        return history
+        if messages:
+            await self._store.add_messages(conversation_id, messages)
 
     # ------------------------------------------------------------------
     # System prompt builder
@@ -350,6 +315,7 @@ class InboxChatService:
         conversation_id: str,
         onboarding: bool = False,
         file_references: Optional[List[Dict[str, Any]]] = None,
+        history_summary: Optional[str] = None,
     ) -> str:
         """Build the system prompt with world state and tool catalog."""
         # Load template
@@ -398,6 +364,14 @@ class InboxChatService:
         prompt = prompt.replace("{{WORLD_STATE}}", world_state)
         prompt = prompt.replace("{{CONVERSATION_TASKS}}", conversation_tasks)
 
+        # Older turns that no longer fit the history window
+        if history_summary:
+            prompt += (
+                "\n\n## Earlier in this conversation\n\n"
+                "Condensed log of older messages not shown verbatim below:\n"
+                f"{history_summary}"
+            )
+
         # Append file references section if present
         if file_references:
             prompt += "\n\n" + self._build_file_references_section(file_references)
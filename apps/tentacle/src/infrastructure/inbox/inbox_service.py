@@ -9,6 +9,7 @@ listing, filtering, status updates, thread retrieval, and follow-up
 task creation.
 """
 
+from datetime import datetime
 from typing import List, Optional
 import uuid as _uuid
 
@@ -17,6 +18,7 @@ import structlog
 from src.database.conversation_store import (
     ConversationStore,
     ConversationTrigger,
+    encode_keyset_cursor,
 )
 from src.database.models import (
     ConversationStatus,
@@ -66,6 +68,7 @@ class InboxService:
         exclude_archived: bool = False,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> dict:
         """Return paginated inbox items for *user_id*.
 
@@ -76,10 +79,12 @@ class InboxService:
             search_text: Optional text to search in task goals (ILIKE).
             exclude_archived: When True, exclude archived conversations.
             limit: Max items per page.
-            offset: Pagination offset.
+            offset: Pagination offset (ignored when *cursor* is given).
+            cursor: Keyset cursor from a previous page's ``next_cursor``.
 
         Returns:
-            ``{"items": [...], "total": int, "limit": int, "offset": int}``
+            ``{"items": [...], "total": int, "limit": int, "offset": int,
+            "next_cursor": str | None}``
         """
         rs_enum: Optional[ReadStatus] = None
         if read_status is not None:
@@ -97,8 +102,17 @@ class InboxService:
             exclude_archived=exclude_archived,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
+        next_cursor: Optional[str] = None
+        if items and len(items) == limit:
+            last = items[-1]
+            next_cursor = encode_keyset_cursor(
+                datetime.fromisoformat(last["last_activity_at"]),
+                last["conversation_id"],
+            )
+
         # Total count (separate query without pagination for accurate total)
         total = len(items)
         if total == limit:
@@ -116,6 +130,7 @@ class InboxService:
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
     async def get_unread_count(self, user_id: str) -> int:
@@ -29,6 +29,7 @@ class InboxServiceAdapter(InboxOperationsPort):
         exclude_archived: bool,
         limit: int,
         offset: int,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         return await self._service.list_inbox(
             user_id=user_id,
@@ -38,6 +39,7 @@ class InboxServiceAdapter(InboxOperationsPort):
             exclude_archived=exclude_archived,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
 
     async def bulk_update_status(self, conversation_ids: List[str], read_status: str) -> int:
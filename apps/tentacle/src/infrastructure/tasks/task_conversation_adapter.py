@@ -93,20 +93,14 @@ class TaskConversationAdapter(TaskConversationPort):
                 trigger=trigger,
             )
 
-            from sqlalchemy import update as sa_update
-            from src.database.models import Conversation
-
-            async with self._pg_store.db.get_session() as session:
-                await session.execute(
-                    sa_update(Conversation)
-                    .where(Conversation.id == conversation.id)
-                    .values(
-                        user_id=user_id,
-                        read_status=ReadStatus.UNREAD,
-                        priority=InboxPriority.NORMAL,
-                    )
-                )
-                await session.commit()
+            # Also builds the inbox projection row, so the conversation is
+            # listed before its first message arrives
+            await conversation_store.set_inbox_fields(
+                str(conversation.id),
+                user_id=user_id,
+                read_status=ReadStatus.UNREAD,
+                priority=InboxPriority.NORMAL,
+            )
 
             await self._pg_store.update_task(task_id, {
                 "conversation_id": conversation.id,
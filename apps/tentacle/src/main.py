@@ -163,6 +163,15 @@ async def lifespan(app: FastAPI):
         await event_bus.stop()
         logger.info("Event bus stopped")
 
+    # Close pooled Playwright browsers if a plugin started them
+    import sys
+    browser_pool_module = sys.modules.get("src.plugins.browser_pool")
+    if browser_pool_module is not None:
+        import asyncio
+        await asyncio.to_thread(browser_pool_module.browser_pool.close)
+
+    await MCPRegistry.shutdown()
+
     await db.disconnect()
     posthog_client.shutdown()
     logger.info("Shutting down Tentacle application")
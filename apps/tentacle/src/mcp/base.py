@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
 from pydantic import BaseModel
 import structlog
 
@@ -21,6 +23,40 @@ class MCPTool(BaseModel):
     category: str = "general"
 
 
+@dataclass
+class OperationLatency:
+    """Latency summary for one provider operation over its recent calls."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    recent_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    def record(self, elapsed_ms: float, ok: bool) -> None:
+        self.calls += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.recent_ms.append(elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent_ms)
+
+        def percentile(q: float) -> float:
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))], 3) if recent else 0.0
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
 class MCPProvider(ABC):
     """Base class for MCP (Model Context Protocol) providers"""
     
@@ -28,6 +64,7 @@ class MCPProvider(ABC):
         self.name = name
         self.config = config
         self._tools: Dict[str, MCPTool] = {}
+        self._latency: Dict[str, OperationLatency] = {}
     
     @abstractmethod
     async def initialize(self) -> None:
@@ -50,4 +87,19 @@ class MCPProvider(ABC):
     
     def get_tool(self, name: str) -> Optional[MCPTool]:
         """Get a specific tool by name"""
-        return self._tools.get(name)
\ No newline at end of file
+        return self._tools.get(name)
+
+    def record_operation(self, operation: str, elapsed_ms: float, ok: bool = True) -> None:
+        """Record the latency of one tool execution"""
+        stats = self._latency.get(operation)
+        if stats is None:
+            stats = self._latency[operation] = OperationLatency()
+        stats.record(elapsed_ms, ok)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-operation latency stats"""
+        return {operation: stats.to_dict() for operation, stats in self._latency.items()}
+
+    async def close(self) -> None:
+        """Release provider resources"""
+        pass
@@ -1,47 +1,133 @@
+import asyncio
+import codecs
 import os
-import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 from src.mcp.base import MCPProvider, MCPTool, MCPToolParameter
+from src.monitoring.metrics import mcp_operation_duration
 import structlog
 
 logger = structlog.get_logger()
 
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_READ_BYTES = 10 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_STAT_CACHE_TTL = 2.0
+STAT_CACHE_MAX_DIRS = 256
+
+
+class _StatCache:
+    """
+    Short-lived cache of directory listings (names, types, sizes).
+
+    Paging through a large directory would otherwise rescan and re-stat it
+    for every page. Entries expire after ``ttl`` seconds and are dropped as
+    soon as the provider itself writes into the directory.
+    """
+
+    def __init__(self, ttl: float, max_dirs: int = STAT_CACHE_MAX_DIRS):
+        self.ttl = ttl
+        self.max_dirs = max_dirs
+        self._entries: Dict[Path, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def get(self, dir_path: Path) -> Optional[List[Dict[str, Any]]]:
+        cached = self._entries.get(dir_path)
+        if cached is None:
+            return None
+        expires_at, items = cached
+        if time.monotonic() >= expires_at:
+            del self._entries[dir_path]
+            return None
+        return items
+
+    def put(self, dir_path: Path, items: List[Dict[str, Any]]) -> None:
+        if self.ttl <= 0:
+            return
+        if len(self._entries) >= self.max_dirs:
+            self._entries.clear()
+        self._entries[dir_path] = (time.monotonic() + self.ttl, items)
+
+    def invalidate(self, dir_path: Path) -> None:
+        self._entries.pop(dir_path, None)
+
 
 class FileSystemProvider(MCPProvider):
-    """MCP provider for filesystem operations"""
-    
+    """
+    MCP provider for filesystem operations.
+
+    File I/O runs on a small dedicated thread pool so a slow disk never
+    stalls the event loop. Reads are bounded by ``max_read_bytes`` and can
+    be ranged (``offset``/``length``); writes go to a temporary file that is
+    renamed over the target, so readers never see a partial file.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__("filesystem", config)
         self.base_path = Path(config.get("base_path", "/tmp/tentacle")).resolve()
-    
+        self.max_read_bytes = int(config.get("max_read_bytes", DEFAULT_MAX_READ_BYTES))
+        self.chunk_size = int(config.get("chunk_size", DEFAULT_CHUNK_SIZE))
+        self.page_size = int(config.get("list_page_size", DEFAULT_PAGE_SIZE))
+        self.fsync = bool(config.get("fsync", False))
+        self._stat_cache = _StatCache(float(config.get("stat_cache_ttl", DEFAULT_STAT_CACHE_TTL)))
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(config.get("max_workers", DEFAULT_MAX_WORKERS)),
+            thread_name_prefix="mcp-fs",
+        )
+
     async def initialize(self) -> None:
         """Initialize filesystem provider"""
         # Create base directory if it doesn't exist
-        self.base_path.mkdir(parents=True, exist_ok=True)
-        
+        await self._run(self.base_path.mkdir, parents=True, exist_ok=True)
+
         # Register tools
         self._register_tools()
-        
+
         logger.info(f"FileSystem provider initialized", base_path=str(self.base_path))
-    
+
+    async def close(self) -> None:
+        """Wait for in-flight file operations and stop the I/O threads"""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run blocking file I/O on the provider's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
     def _register_tools(self) -> None:
         """Register filesystem tools"""
-        
+
         # Read file tool
         self.register_tool(MCPTool(
             name="read_file",
-            description="Read contents of a file",
+            description="Read contents of a file, optionally a byte range of it",
             parameters=[
                 MCPToolParameter(
                     name="path",
                     type="string",
                     description="File path relative to base directory"
+                ),
+                MCPToolParameter(
+                    name="offset",
+                    type="integer",
+                    description="Byte offset to start reading at (use next_offset to continue)",
+                    required=False,
+                    default=0
+                ),
+                MCPToolParameter(
+                    name="length",
+                    type="integer",
+                    description=f"Maximum bytes to read (capped at {self.max_read_bytes})",
+                    required=False
                 )
             ],
             category="filesystem"
         ))
-        
+
         # Write file tool
         self.register_tool(MCPTool(
             name="write_file",
@@ -60,11 +146,11 @@ class FileSystemProvider(MCPProvider):
             ],
             category="filesystem"
         ))
-        
+
         # List directory tool
         self.register_tool(MCPTool(
             name="list_directory",
-            description="List contents of a directory",
+            description="List contents of a directory, one page at a time",
             parameters=[
                 MCPToolParameter(
                     name="path",
@@ -72,11 +158,24 @@ class FileSystemProvider(MCPProvider):
                     description="Directory path relative to base directory",
                     required=False,
                     default="."
+                ),
+                MCPToolParameter(
+                    name="cursor",
+                    type="string",
+                    description="next_cursor from the previous page",
+                    required=False
+                ),
+                MCPToolParameter(
+                    name="limit",
+                    type="integer",
+                    description=f"Items per page (max {MAX_PAGE_SIZE})",
+                    required=False,
+                    default=self.page_size
                 )
             ],
             category="filesystem"
         ))
-        
+
         # Create directory tool
         self.register_tool(MCPTool(
             name="create_directory",
@@ -90,25 +189,43 @@ class FileSystemProvider(MCPProvider):
             ],
             category="filesystem"
         ))
-    
+
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
         """Execute a filesystem tool"""
-        
+
         if tool_name == "read_file":
-            return await self._read_file(parameters["path"])
-        
+            operation = self._read_file(
+                parameters["path"],
+                offset=parameters.get("offset", 0),
+                length=parameters.get("length"),
+            )
+
         elif tool_name == "write_file":
-            return await self._write_file(parameters["path"], parameters["content"])
-        
+            operation = self._write_file(parameters["path"], parameters["content"])
+
         elif tool_name == "list_directory":
-            return await self._list_directory(parameters.get("path", "."))
-        
+            operation = self._list_directory(
+                parameters.get("path", "."),
+                cursor=parameters.get("cursor"),
+                limit=parameters.get("limit"),
+            )
+
         elif tool_name == "create_directory":
-            return await self._create_directory(parameters["path"])
-        
+            operation = self._create_directory(parameters["path"])
+
         else:
             raise ValueError(f"Unknown tool: {tool_name}")
 
+        started = time.perf_counter()
+        result = await operation
+        elapsed = time.perf_counter() - started
+        ok = bool(result.get("success"))
+        self.record_operation(tool_name, elapsed * 1000, ok)
+        mcp_operation_duration.labels(
+            provider=self.name, operation=tool_name, status="success" if ok else "error"
+        ).observe(elapsed)
+        return result
+
     def _resolve_safe_path(self, path: str) -> Path:
         """Resolve a user path and enforce base-path confinement."""
         requested = (self.base_path / path).resolve()
@@ -117,69 +234,236 @@ class FileSystemProvider(MCPProvider):
         except ValueError as exc:
             raise ValueError("Path escapes configured base directory") from exc
         return requested
-    
-    async def _read_file(self, path: str) -> Dict[str, Any]:
-        """Read file contents"""
+
+    @staticmethod
+    def _non_negative_int(name: str, value: Any) -> int:
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be an integer") from None
+        if number < 0:
+            raise ValueError(f"{name} must not be negative")
+        return number
+
+    async def _read_file(
+        self, path: str, offset: Any = 0, length: Any = None
+    ) -> Dict[str, Any]:
+        """Read up to ``max_read_bytes`` of a file, starting at ``offset``"""
         try:
             file_path = self._resolve_safe_path(path)
-            
-            if not file_path.exists():
+            offset = self._non_negative_int("offset", offset or 0)
+            limit = self.max_read_bytes
+            if length is not None:
+                limit = min(limit, self._non_negative_int("length", length))
+
+            try:
+                data, size = await self._run(self._read_range, file_path, offset, limit)
+            except FileNotFoundError:
                 return {"success": False, "error": "File not found"}
-            
-            with open(file_path, 'r', encoding="utf-8") as f:
-                content = f.read()
-            
-            return {"success": True, "content": content}
-            
+
+            # Never split a UTF-8 sequence at the end of the range; the
+            # undecoded tail is re-read from next_offset.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            content = decoder.decode(data, final=offset + len(data) >= size)
+            consumed = len(data) - len(decoder.getstate()[0])
+            next_offset = offset + consumed
+
+            return {
+                "success": True,
+                "content": content,
+                "size": size,
+                "offset": offset,
+                "bytes_read": consumed,
+                "next_offset": next_offset,
+                "truncated": next_offset < size,
+            }
+
         except Exception as e:
             logger.error(f"Error reading file", path=path, error=str(e))
             return {"success": False, "error": str(e)}
-    
+
+    def _read_range(self, file_path: Path, offset: int, limit: int) -> Tuple[bytes, int]:
+        """Read ``limit`` bytes at ``offset`` in ``chunk_size`` pieces (worker thread)"""
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(offset)
+            remaining = min(limit, max(0, size - offset))
+            buffer = bytearray(remaining)
+            view = memoryview(buffer)
+            filled = 0
+            while filled < remaining:
+                read = f.readinto(view[filled:filled + self.chunk_size])
+                if not read:
+                    break
+                filled += read
+            return bytes(view[:filled]), size
+
+    async def stream_file(
+        self, path: str, offset: int = 0, length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield a file's bytes in ``chunk_size`` chunks.
+
+        Unlike ``read_file`` this is not capped at ``max_read_bytes``; only
+        one chunk is held in memory at a time.
+        """
+        file_path = self._resolve_safe_path(path)
+        f = await self._run(open, file_path, "rb")
+        try:
+            await self._run(f.seek, offset)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await self._run(f.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await self._run(f.close)
+
     async def _write_file(self, path: str, content: str) -> Dict[str, Any]:
         """Write file contents"""
         try:
             file_path = self._resolve_safe_path(path)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding="utf-8") as f:
-                f.write(content)
-            
+            await self._run(self._write_atomic, file_path, [content.encode("utf-8")])
+            self._stat_cache.invalidate(file_path.parent)
+
             return {"success": True, "path": str(file_path)}
-            
+
         except Exception as e:
             logger.error(f"Error writing file", path=path, error=str(e))
             return {"success": False, "error": str(e)}
-    
-    async def _list_directory(self, path: str) -> Dict[str, Any]:
-        """List directory contents"""
+
+    async def write_stream(
+        self, path: str, chunks: AsyncIterable[Union[str, bytes]]
+    ) -> Dict[str, Any]:
+        """
+        Write a file from an async stream of chunks.
+
+        Chunks are written to a temporary file beside the target as they
+        arrive and renamed into place once the stream ends; if the stream
+        fails the target is left untouched.
+        """
+        file_path = self._resolve_safe_path(path)
+        await self._run(file_path.parent.mkdir, parents=True, exist_ok=True)
+        temp_path, fd = await self._run(self._open_temp, file_path)
+        written = 0
+        try:
+            async for chunk in chunks:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                await self._run(self._write_all, fd, data)
+                written += len(data)
+            await self._run(self._commit, fd, temp_path, file_path)
+        except BaseException:
+            await self._run(self._discard, fd, temp_path)
+            raise
+        self._stat_cache.invalidate(file_path.parent)
+        return {"success": True, "path": str(file_path), "bytes_written": written}
+
+    def _write_atomic(self, file_path: Path, parts: List[bytes]) -> None:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path, fd = self._open_temp(file_path)
+        try:
+            for data in parts:
+                self._write_all(fd, data)
+            self._commit(fd, temp_path, file_path)
+        except BaseException:
+            self._discard(fd, temp_path)
+            raise
+
+    @staticmethod
+    def _open_temp(file_path: Path) -> Tuple[Path, int]:
+        # Same directory as the target so the final rename stays atomic;
+        # 0o666 lets the umask apply as it would for a plain open().
+        temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        return temp_path, fd
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _commit(self, fd: int, temp_path: Path, file_path: Path) -> None:
+        try:
+            if self.fsync:
+                os.fsync(fd)
+            try:
+                os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+        finally:
+            os.close(fd)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _discard(fd: int, temp_path: Path) -> None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+
+    async def _list_directory(
+        self, path: str, cursor: Optional[str] = None, limit: Any = None
+    ) -> Dict[str, Any]:
+        """List one page of directory contents, sorted by name"""
         try:
             dir_path = self._resolve_safe_path(path)
-            
-            if not dir_path.exists():
-                return {"success": False, "error": "Directory not found"}
-            
-            items = []
-            for item in dir_path.iterdir():
-                items.append({
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None
-                })
-            
-            return {"success": True, "items": items}
-            
+            start = self._non_negative_int("cursor", cursor) if cursor else 0
+            page_size = self.page_size if limit is None else self._non_negative_int("limit", limit)
+            page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+            items = self._stat_cache.get(dir_path)
+            if items is None:
+                try:
+                    items = await self._run(self._scan_directory, dir_path)
+                except FileNotFoundError:
+                    return {"success": False, "error": "Directory not found"}
+                self._stat_cache.put(dir_path, items)
+
+            end = start + page_size
+            return {
+                "success": True,
+                "items": items[start:end],
+                "total": len(items),
+                "next_cursor": str(end) if end < len(items) else None,
+            }
+
         except Exception as e:
             logger.error(f"Error listing directory", path=path, error=str(e))
             return {"success": False, "error": str(e)}
-    
+
+    @staticmethod
+    def _scan_directory(dir_path: Path) -> List[Dict[str, Any]]:
+        items = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir()
+                is_file = not is_dir and entry.is_file()
+                items.append({
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "size": entry.stat().st_size if is_file else None
+                })
+        items.sort(key=lambda item: item["name"])
+        return items
+
     async def _create_directory(self, path: str) -> Dict[str, Any]:
         """Create directory"""
         try:
             dir_path = self._resolve_safe_path(path)
-            dir_path.mkdir(parents=True, exist_ok=True)
-            
+            await self._run(dir_path.mkdir, parents=True, exist_ok=True)
+            self._stat_cache.invalidate(dir_path.parent)
+
             return {"success": True, "path": str(dir_path)}
-            
+
         except Exception as e:
             logger.error(f"Error creating directory", path=path, error=str(e))
             return {"success": False, "error": str(e)}
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 from src.mcp.base import MCPProvider
 from src.mcp.filesystem_provider import FileSystemProvider
 from src.core.config import settings
@@ -81,6 +81,21 @@ class MCPRegistry:
         """Get all registered providers"""
         return list(cls._providers.values())
     
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get per-operation latency stats for every provider"""
+        return {name: provider.get_stats() for name, provider in cls._providers.items()}
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Close all providers"""
+        for name, provider in cls._providers.items():
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning("Error closing MCP provider", name=name, error=str(e))
+        cls._providers.clear()
+
     @classmethod
     def get_all_tools(cls) -> Dict[str, List[Dict]]:
         """Get all tools from all providers"""
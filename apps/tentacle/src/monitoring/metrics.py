@@ -111,6 +111,35 @@ connection_pool_active = Gauge(
     ['pool_type', 'pool_name']
 )
 
+# Plugin handler pool metrics
+plugin_handler_queue_wait = Histogram(
+    'tentacle_plugin_handler_queue_wait_seconds',
+    'Time a plugin handler waited for a pool worker',
+    ['plugin', 'mode'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+
+plugin_handler_duration = Histogram(
+    'tentacle_plugin_handler_seconds',
+    'Plugin handler execution time, excluding queue wait',
+    ['plugin', 'mode'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 120.0)
+)
+
+plugin_handler_timeouts = Counter(
+    'tentacle_plugin_handler_timeouts_total',
+    'Plugin handlers that exceeded their timeout',
+    ['plugin', 'mode']
+)
+
+# MCP provider metrics
+mcp_operation_duration = Histogram(
+    'tentacle_mcp_operation_seconds',
+    'MCP provider tool execution time',
+    ['provider', 'operation', 'status'],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+)
+
 # System info
 system_info = Info(
     'tentacle_system',
@@ -0,0 +1,298 @@
+"""
+Warm Chromium pool for the Playwright plugins.
+
+Launching Chromium takes about a second, which dominated every screenshot
+or PDF step, and concurrent steps each started their own browser. The pool
+keeps up to ``size`` browsers running per worker process and gives each
+call a fresh browser context (isolated cookies, storage and cache), which
+is closed afterwards.
+
+Playwright objects belong to the event loop that created them, while
+Celery runs every task on a new ``asyncio.run`` loop. The pool therefore
+owns a private event loop on a daemon thread; ``run()`` can be awaited
+from any loop and executes the page callback on the pool's loop.
+
+Limits:
+- ``max_pages_per_browser``: concurrent contexts per browser. Callers wait
+  (up to ``acquire_timeout``) when every browser is busy.
+- ``max_contexts_per_browser``: contexts served before a browser is closed
+  and replaced, bounding memory growth from long-lived renderers.
+
+A browser that disconnects (crash, OOM kill) is dropped and replaced on
+the next call; a call that failed because its browser died is retried
+once on a fresh browser.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+Launcher = Callable[[], Awaitable[Any]]
+
+
+class BrowserPoolTimeoutError(TimeoutError):
+    """No browser had a free page slot within the acquire timeout."""
+
+
+class _BrowserCrashed(Exception):
+    """The browser serving a call disconnected while it ran."""
+
+
+@dataclass
+class BrowserPoolStats:
+    launches: int = 0
+    contexts: int = 0
+    recycled: int = 0
+    crashed: int = 0
+    retries: int = 0
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Any
+    launched_at: float = field(default_factory=time.monotonic)
+    active: int = 0
+    served: int = 0
+    retiring: bool = False
+
+    @property
+    def alive(self) -> bool:
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    """Per-process pool of warm browsers on a dedicated event loop thread."""
+
+    def __init__(
+        self,
+        size: int,
+        max_pages_per_browser: int,
+        max_contexts_per_browser: int,
+        acquire_timeout: float = 60.0,
+        launcher: Optional[Launcher] = None,
+    ) -> None:
+        self._size = max(1, size)
+        self._max_pages = max(1, max_pages_per_browser)
+        self._max_contexts = max(1, max_contexts_per_browser)
+        self._acquire_timeout = acquire_timeout
+        self._launcher = launcher
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget per-process state (also used after fork)."""
+        self._pid = os.getpid()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._slots: List[_BrowserSlot] = []
+        self._launching = 0
+        self._changed: Optional[asyncio.Condition] = None
+        self._playwright: Any = None
+        self.stats = BrowserPoolStats()
+
+    # -- caller side -------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's thread and browsers do not exist here
+                self._reset()
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="browser-pool", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def run(
+        self,
+        fn: Callable[[Any], Awaitable[T]],
+        context_options: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """Run ``fn(page)`` on a new page in an isolated browser context.
+
+        *fn* executes on the pool's event loop and should only await
+        Playwright calls; its return value is handed back to the caller.
+
+        Raises:
+            BrowserPoolTimeoutError: If no page slot frees up in time.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_with_retry(fn, context_options or {}), loop
+        )
+        return await asyncio.wrap_future(future)
+
+    def warm(self, timeout: float = 60.0) -> int:
+        """Launch browsers up to ``size`` ahead of the first call."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._warm(), loop).result(timeout)
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Close every browser and stop the pool's loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                return
+            self._loop = None
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("Browser pool did not close cleanly", error=str(e))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout)
+            with self._lock:
+                self._reset()
+
+    # -- pool loop side ----------------------------------------------------
+
+    def _condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def _launch(self) -> Any:
+        if self._launcher is not None:
+            return await self._launcher()
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch()
+
+    async def _add_browser(self) -> None:
+        self._launching += 1
+        try:
+            browser = await self._launch()
+        finally:
+            self._launching -= 1
+        self.stats.launches += 1
+        self._slots.append(_BrowserSlot(browser))
+        logger.info("browser_pool_launched", browsers=len(self._slots))
+
+    async def _warm(self) -> int:
+        while len(self._slots) + self._launching < self._size:
+            await self._add_browser()
+        return len(self._slots)
+
+    def _prune(self) -> None:
+        """Drop crashed browsers and close drained retiring ones."""
+        for slot in list(self._slots):
+            if not slot.alive:
+                self._slots.remove(slot)
+                self.stats.crashed += 1
+                logger.warning("browser_pool_crash_detected", served=slot.served)
+            elif slot.retiring and slot.active == 0:
+                self._slots.remove(slot)
+                self.stats.recycled += 1
+                asyncio.ensure_future(self._close_browser(slot.browser))
+
+    async def _close_browser(self, browser: Any) -> None:
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.debug("Closing pooled browser failed", error=str(e))
+
+    async def _acquire(self) -> _BrowserSlot:
+        changed = self._condition()
+        deadline = time.monotonic() + self._acquire_timeout
+        async with changed:
+            while True:
+                self._prune()
+                ready = [
+                    s for s in self._slots if not s.retiring and s.active < self._max_pages
+                ]
+                if ready:
+                    slot = min(ready, key=lambda s: s.active)
+                    slot.active += 1
+                    return slot
+                if len(self._slots) + self._launching < self._size:
+                    changed.release()
+                    try:
+                        await self._add_browser()
+                    finally:
+                        await changed.acquire()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserPoolTimeoutError(
+                        f"No browser page slot within {self._acquire_timeout}s"
+                    )
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _release(self, slot: _BrowserSlot) -> None:
+        changed = self._condition()
+        async with changed:
+            slot.active -= 1
+            slot.served += 1
+            if slot.served >= self._max_contexts:
+                slot.retiring = True
+            self._prune()
+            changed.notify_all()
+
+    async def _run_once(self, fn: Callable[[Any], Awaitable[T]], options: Dict[str, Any]) -> T:
+        slot = await self._acquire()
+        try:
+            context = await slot.browser.new_context(**options)
+            self.stats.contexts += 1
+            try:
+                page = await context.new_page()
+                return await fn(page)
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug("Closing browser context failed", error=str(e))
+        except Exception as e:
+            if not slot.alive:
+                raise _BrowserCrashed(str(e)) from e
+            raise
+        finally:
+            await self._release(slot)
+
+    async def _run_with_retry(self, fn: Callable[[Any], Awaitable[T]], options: Dict[str, Any]) -> T:
+        # Only a dead browser is worth retrying; page errors are the caller's
+        try:
+            return await self._run_once(fn, options)
+        except _BrowserCrashed as e:
+            self.stats.retries += 1
+            logger.warning("browser_pool_retry_after_crash", error=str(e))
+        try:
+            return await self._run_once(fn, options)
+        except _BrowserCrashed as e:
+            raise e.__cause__ or e
+
+    async def _close_all(self) -> None:
+        slots, self._slots = self._slots, []
+        for slot in slots:
+            await self._close_browser(slot.browser)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+browser_pool = BrowserPool(
+    size=settings.PLAYWRIGHT_POOL_SIZE,
+    max_pages_per_browser=settings.PLAYWRIGHT_MAX_PAGES_PER_BROWSER,
+    max_contexts_per_browser=settings.PLAYWRIGHT_MAX_CONTEXTS_PER_BROWSER,
+    acquire_timeout=settings.PLAYWRIGHT_POOL_ACQUIRE_TIMEOUT_SECONDS,
+)
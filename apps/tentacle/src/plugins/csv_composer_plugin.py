@@ -19,6 +19,8 @@ import json
 import structlog
 from typing import Any, Dict, List
 
+from src.plugins.handler_pools import offload
+
 logger = structlog.get_logger(__name__)
 
 
@@ -62,6 +64,11 @@ def _generate_csv(data: List, headers: List[str] = None, delimiter: str = ",") -
     return output.getvalue()
 
 
+def _count_csv_rows(csv_text: str, delimiter: str = ",") -> int:
+    """Parse CSV text fully to validate it; returns the row count."""
+    return sum(1 for _ in csv.reader(io.StringIO(csv_text), delimiter=delimiter))
+
+
 def _csv_to_records(csv_text: str, delimiter: str = ",") -> List[Dict[str, Any]]:
     """Parse CSV text into list of dicts for StructuredDataContent."""
     reader = csv.DictReader(io.StringIO(csv_text), delimiter=delimiter)
@@ -120,13 +127,11 @@ async def csv_composer_handler(inputs: Dict[str, Any], context=None) -> Dict[str
                     "filename": "",
                     "size_bytes": 0,
                 }
-            csv_content = _generate_csv(data, headers, delimiter)
+            csv_content = await offload(_generate_csv, data, headers, delimiter)
         else:
             # Validate csv_text by parsing it
             try:
-                reader = csv.reader(io.StringIO(csv_text), delimiter=delimiter)
-                rows = list(reader)
-                if not rows:
+                if not await offload(_count_csv_rows, csv_text, delimiter):
                     return {
                         "error": "csv_text is empty",
                         "file_id": "",
@@ -211,7 +216,7 @@ async def csv_composer_handler(inputs: Dict[str, Any], context=None) -> Dict[str
 
         if include_preview:
             try:
-                records = _csv_to_records(csv_content, delimiter)
+                records = await offload(_csv_to_records, csv_content, delimiter)
                 total_count = len(records)
                 preview_data = records[:preview_limit]
             except Exception:
@@ -274,4 +279,5 @@ PLUGIN_DEFINITION = {
         "total_count": {"type": "integer", "description": "Total row count"},
     },
     "category": "document",
+    "timeout_seconds": 120,
 }
@@ -470,3 +470,166 @@ PLUGIN_HANDLERS = {
     "read_file": read_file_handler,
     "list_files": list_files_handler,
 }
+
+
+FILE_OPERATIONS_PLUGIN_DEFINITIONS = [
+    {
+        "name": "write_csv",
+        "description": "Write data to a CSV file from list of dicts or list of lists",
+        "handler": write_csv_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "data": {"type": "array"},
+                "file_path": {"type": "string"},
+                "headers": {"type": "array", "items": {"type": "string"}},
+                "delimiter": {"type": "string"},
+                "append": {"type": "boolean"}
+            },
+            "required": ["data", "file_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "rows_written": {"type": "integer"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+    {
+        "name": "csv_from_text",
+        "description": "Save CSV text content (e.g., from LLM output) to a file",
+        "handler": csv_from_text_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "csv_text": {"type": "string"},
+                "file_path": {"type": "string"},
+                "skip_validation": {"type": "boolean"}
+            },
+            "required": ["csv_text", "file_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "rows_written": {"type": "integer"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+    {
+        "name": "write_json",
+        "description": "Write data to a JSON file with optional formatting",
+        "handler": write_json_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "data": {},  # Can be any JSON-serializable data
+                "file_path": {"type": "string"},
+                "indent": {"type": "integer"},
+                "append_to_array": {"type": "boolean"}
+            },
+            "required": ["data", "file_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+    {
+        "name": "write_text",
+        "description": "Write text content to a file",
+        "handler": write_text_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "content": {"type": "string"},
+                "file_path": {"type": "string"},
+                "append": {"type": "boolean"},
+                "encoding": {"type": "string"}
+            },
+            "required": ["content", "file_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "size_bytes": {"type": "integer"},
+                "lines_written": {"type": "integer"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+    {
+        "name": "read_file",
+        "description": "Read content from a text file",
+        "handler": read_file_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string"},
+                "encoding": {"type": "string"},
+                "max_bytes": {"type": "integer"}
+            },
+            "required": ["file_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "size_bytes": {"type": "integer"},
+                "lines": {"type": "integer"},
+                "truncated": {"type": "boolean"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+    {
+        "name": "list_files",
+        "description": "List files in a directory with optional glob pattern matching",
+        "handler": list_files_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "directory": {"type": "string"},
+                "pattern": {"type": "string"},
+                "recursive": {"type": "boolean"}
+            },
+            "required": ["directory"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "array", "items": {"type": "string"}},
+                "count": {"type": "integer"}
+            }
+        },
+        "category": "file_io",
+        # Handler bodies are blocking file I/O
+        "execution_mode": "thread",
+        "timeout_seconds": 60,
+    },
+]
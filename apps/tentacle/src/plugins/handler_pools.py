@@ -0,0 +1,176 @@
+"""
+Executor pools for blocking and CPU-bound plugin work.
+
+Plugin handlers run on the event loop of the API process or Celery worker.
+Synchronous work (CSV parsing, markdown rendering, file writes) blocks every
+other coroutine on that loop, so it is sent to one of two bounded pools:
+
+- ``thread``: blocking I/O and light CPU work. Timeouts are soft: the caller
+  stops waiting but the thread finishes in the background.
+- ``process``: heavy CPU work. Functions and arguments must be picklable.
+  A timeout kills the pool's worker processes and starts a fresh pool;
+  calls that were running alongside are retried once on the new pool.
+
+Both record queue wait and execution time separately, so pool saturation
+shows up as wait time rather than as slow handlers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+import structlog
+
+from src.core.config import settings
+from src.monitoring.metrics import (
+    plugin_handler_duration,
+    plugin_handler_queue_wait,
+    plugin_handler_timeouts,
+)
+
+logger = structlog.get_logger(__name__)
+
+ASYNC = "async"
+THREAD = "thread"
+PROCESS = "process"
+EXECUTION_MODES = (ASYNC, THREAD, PROCESS)
+
+
+class HandlerTimeoutError(TimeoutError):
+    """A plugin handler exceeded its timeout."""
+
+
+def _timed_call(fn: Callable[..., Any], args: Tuple[Any, ...], submitted_at: float) -> Tuple[Any, float, float]:
+    """Run *fn* in a pool worker; returns (result, queue wait, execution time).
+
+    Coroutine functions with blocking bodies run on a private event loop
+    owned by the worker.
+    """
+    started_at = time.time()
+    if inspect.iscoroutinefunction(fn):
+        result = asyncio.run(fn(*args))
+    else:
+        result = fn(*args)
+    return result, started_at - submitted_at, time.time() - started_at
+
+
+def record_handler_timing(name: str, mode: str, queue_wait: float, duration: float) -> None:
+    plugin_handler_queue_wait.labels(plugin=name, mode=mode).observe(max(queue_wait, 0.0))
+    plugin_handler_duration.labels(plugin=name, mode=mode).observe(duration)
+
+
+def record_handler_timeout(name: str, mode: str) -> None:
+    plugin_handler_timeouts.labels(plugin=name, mode=mode).inc()
+
+
+class HandlerPools:
+    """Lazily created, bounded thread and process pools shared per process.
+
+    Pools are independent of any event loop, so they are shared across the
+    ``asyncio.run`` loops Celery tasks create.
+    """
+
+    def __init__(self, thread_workers: int, process_workers: int) -> None:
+        self._thread_workers = thread_workers
+        self._process_workers = process_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self, mode: str) -> Executor:
+        with self._lock:
+            if mode == THREAD:
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        max_workers=self._thread_workers,
+                        thread_name_prefix="plugin-handler",
+                    )
+                return self._thread_pool
+            if mode == PROCESS:
+                if self._process_pool is None:
+                    # spawn: forking a process with live threads and event loops is unsafe
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self._process_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                return self._process_pool
+        raise ValueError(f"Unknown pool mode: {mode}")
+
+    def _recycle_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Kill *pool*'s workers; the next call creates a fresh pool."""
+        with self._lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+        # ProcessPoolExecutor cannot cancel a running call; killing the
+        # worker is the only way to stop it.
+        for proc in list((getattr(pool, "_processes", None) or {}).values()):
+            proc.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        mode: str = THREAD,
+        name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Run blocking *fn* in the *mode* pool and await its result.
+
+        Raises:
+            HandlerTimeoutError: If the call does not finish within *timeout*.
+        """
+        name = name or getattr(fn, "__qualname__", repr(fn))
+        loop = asyncio.get_running_loop()
+
+        for attempt in (1, 2):
+            pool = self._pool(mode)
+            future = loop.run_in_executor(pool, _timed_call, fn, args, time.time())
+            try:
+                result, queue_wait, duration = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                record_handler_timeout(name, mode)
+                if mode == PROCESS:
+                    self._recycle_process_pool(pool)
+                logger.warning("plugin_handler_timeout", plugin=name, mode=mode, timeout=timeout)
+                raise HandlerTimeoutError(f"{name} exceeded {timeout}s timeout")
+            except BrokenProcessPool:
+                # Another call's timeout killed this pool before we finished
+                self._recycle_process_pool(pool)
+                if attempt == 2:
+                    raise
+                continue
+
+            record_handler_timing(name, mode, queue_wait, duration)
+            return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pools = [p for p in (self._thread_pool, self._process_pool) if p is not None]
+            self._thread_pool = None
+            self._process_pool = None
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+handler_pools = HandlerPools(
+    thread_workers=settings.PLUGIN_THREAD_POOL_SIZE,
+    process_workers=settings.PLUGIN_PROCESS_POOL_SIZE,
+)
+
+
+async def offload(
+    fn: Callable[..., Any],
+    *args: Any,
+    mode: str = THREAD,
+    timeout: Optional[float] = None,
+) -> Any:
+    """Run blocking *fn* off the event loop using the shared pools."""
+    return await handler_pools.run(fn, *args, mode=mode, timeout=timeout)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict
-from urllib.parse import urlparse
+from typing import Any, Dict, Tuple
+from urllib.parse import ParseResult, urlparse
+import ipaddress
 import httpx
-import os
-import redis.asyncio as redis_async
 
 from src.application.allowed_hosts import AllowedHostUseCases
+from src.core.config import settings
+from src.core.loop_local import LoopLocal
+from src.domain.allowed_hosts import HostCheck
 from src.infrastructure.allowed_hosts import AllowedHostServiceAdapter
 from src.interfaces.database import Database
+from src.plugins.http_transport import ResponseTooLargeError, outbound_transport, rate_limiter
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -21,29 +24,45 @@ class HttpPluginError(Exception):
     pass
 
 
+# One set of use cases (database engine + allowlist snapshot) per event loop;
+# asyncpg connections cannot be shared across the loops Celery tasks create.
+_default_use_cases: LoopLocal[AllowedHostUseCases] = LoopLocal(
+    lambda: AllowedHostUseCases(host_ops=AllowedHostServiceAdapter(Database()))
+)
+
+
 class AllowedHostService:
-    """Test helper service that delegates to allowed-host use cases."""
+    """Delegates to allowed-host use cases.
+
+    Without an explicit database, instances share the current event loop's
+    use cases, so building one per request does not open a new engine.
+    """
 
     def __init__(self, database: Database | None = None):
-        db = database or Database()
-        self._use_cases = AllowedHostUseCases(
-            host_ops=AllowedHostServiceAdapter(db)
-        )
+        if database is None:
+            self._use_cases = _default_use_cases.get()
+        else:
+            self._use_cases = AllowedHostUseCases(
+                host_ops=AllowedHostServiceAdapter(database)
+            )
 
     async def is_host_allowed(self, url: str, environment: str | None = None):
         return await self._use_cases.check_host_allowed(url=url, environment=environment)
 
+    async def check_host(self, url: str, environment: str | None = None) -> HostCheck:
+        return await self._use_cases.check_host(url=url, environment=environment)
 
-async def _rate_limit(redis_url: str, key: str, max_calls: int, window_s: int) -> bool:
-    r = await redis_async.from_url(redis_url, decode_responses=True)
-    try:
-        pipe = r.pipeline()
-        pipe.incr(key)
-        pipe.expire(key, window_s)
-        count, _ = await pipe.execute()
-        return int(count) <= max_calls
-    finally:
-        await r.aclose()
+
+def _pin_to_address(parsed: ParseResult, address: str) -> Tuple[str, str]:
+    """Rewrite *parsed* to connect to *address*; returns (url, Host header).
+
+    The original hostname still goes in the Host header and as the TLS SNI
+    name, so virtual hosting and certificate verification are unchanged.
+    """
+    ip_host = f"[{address}]" if ipaddress.ip_address(address).version == 6 else address
+    port = f":{parsed.port}" if parsed.port else ""
+    host_header = f"{parsed.hostname}{port}"
+    return parsed._replace(netloc=f"{ip_host}{port}").geturl(), host_header
 
 
 async def http_request_handler(inputs: Dict[str, Any], context=None) -> Dict[str, Any]:
@@ -76,29 +95,45 @@ async def http_request_handler(inputs: Dict[str, Any], context=None) -> Dict[str
 
     # Check DB-based allowlist (no fallback - DB is the source of truth)
     service = AllowedHostService()
-    is_allowed, error_message = await service.is_host_allowed(url)
-    if not is_allowed:
-        raise HttpPluginError(error_message or f"Host '{host}' not allowed")
+    check = await service.check_host(url)
+    if not check.allowed:
+        raise HttpPluginError(check.error or f"Host '{host}' not allowed")
+    if not check.addresses:
+        raise HttpPluginError(f"Host '{host}' has no verified address")
+
+    # Connect to the address that passed the SSRF check instead of letting
+    # the client resolve the name again (DNS rebinding)
+    request_url, host_header = _pin_to_address(parsed, check.addresses[0])
+    headers = {k: v for k, v in headers.items() if k.lower() != "host"}
+    headers["Host"] = host_header
 
     # Rate limit
     rl = inputs.get("rate_limit") or {}
     max_calls = int(rl.get("max_calls", 0))
     window_s = int(rl.get("window_s", 60))
     if max_calls > 0:
-        redis_url = os.environ.get("REDIS_URL", "redis://redis:6379/0")
-        ok = await _rate_limit(redis_url, f"tentacle:plugin:http:{host}:rl:{window_s}", max_calls, window_s)
+        ok = await rate_limiter.acquire(
+            f"tentacle:plugin:http:{host}:tb:{max_calls}:{window_s}", max_calls, window_s
+        )
         if not ok:
             raise HttpPluginError("Rate limit exceeded")
 
-    async with httpx.AsyncClient(
-        timeout=timeout,
-        verify=verify,
-        follow_redirects=False  # Explicit SSRF protection - prevent redirect-based attacks
-    ) as client:
-        try:
-            resp = await client.request(method, url, headers=headers, params=params, json=body if isinstance(body, (dict, list)) else None, data=body if isinstance(body, (str, bytes)) else None)
-        except httpx.HTTPError as e:
-            raise HttpPluginError(str(e))
+    try:
+        resp = await outbound_transport.request(
+            method,
+            request_url,
+            host=host,
+            verify=verify,
+            timeout=timeout,
+            max_response_bytes=settings.HTTP_PLUGIN_MAX_RESPONSE_BYTES,
+            headers=headers,
+            params=params,
+            json=body if isinstance(body, (dict, list)) else None,
+            data=body if isinstance(body, (str, bytes)) else None,
+            extensions={"sni_hostname": host},
+        )
+    except (httpx.HTTPError, ResponseTooLargeError) as e:
+        raise HttpPluginError(str(e))
 
     content_type = resp.headers.get("content-type", "")
     result: Dict[str, Any] = {
@@ -0,0 +1,265 @@
+"""
+Shared outbound HTTP transport and rate limiting for the HTTP plugin.
+
+Each destination host gets its own pooled ``httpx.AsyncClient`` (keep-alive,
+HTTP/2 when ``h2`` is installed) and a concurrency cap. Clients are kept per
+hostname rather than per IP because the plugin connects to a pinned address:
+a pool keyed by IP could reuse a TLS session negotiated for another hostname
+served from the same address.
+
+httpx clients and Redis connections belong to the event loop that created
+them, so both are cached per loop; Celery tasks each get their own set.
+
+Rate limiting is a token bucket in Redis shared by all processes: it refills
+continuously at ``max_calls / window_s`` tokens per second up to
+``max_calls``, so a caller cannot burst twice at a window boundary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import redis.asyncio as redis_async
+import structlog
+
+from src.core.config import settings
+from src.core.loop_local import LoopLocal
+
+logger = structlog.get_logger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ResponseTooLargeError(Exception):
+    """The response body exceeded the configured size limit."""
+
+
+def parse_host_limits(value: str) -> Dict[str, int]:
+    """Parse ``"api.example.com=5, other.example.com=2"`` into a dict."""
+    limits: Dict[str, int] = {}
+    for item in value.split(","):
+        host, sep, limit = item.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            limits[host.strip().lower()] = max(1, int(limit))
+        except ValueError:
+            logger.warning("Invalid per-host HTTP concurrency limit", entry=item.strip())
+    return limits
+
+
+@dataclass
+class BufferedResponse:
+    """Response whose body was read within the size limit."""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    encoding: str = "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+@dataclass
+class _HostPool:
+    client: httpx.AsyncClient
+    semaphore: asyncio.Semaphore
+    in_flight: int = 0
+
+
+class OutboundHttpTransport:
+    """Per-host pooled clients with concurrency caps and streamed size limits."""
+
+    def __init__(
+        self,
+        max_concurrency_per_host: int,
+        host_limits: Optional[Dict[str, int]] = None,
+        max_host_pools: int = 256,
+        http2: bool = HTTP2_AVAILABLE,
+        keepalive_expiry: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._max_concurrency = max_concurrency_per_host
+        self._host_limits = host_limits or {}
+        self._max_host_pools = max_host_pools
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._keepalive_expiry = keepalive_expiry
+        self._transport = transport
+        self._pools: LoopLocal["OrderedDict[Tuple[str, bool], _HostPool]"] = LoopLocal(OrderedDict)
+
+    def concurrency_limit(self, host: str) -> int:
+        return self._host_limits.get(host.lower(), self._max_concurrency)
+
+    def _new_pool(self, host: str, verify: bool) -> _HostPool:
+        limit = self.concurrency_limit(host)
+        client = httpx.AsyncClient(
+            verify=verify,
+            http2=self._http2,
+            follow_redirects=False,  # Explicit SSRF protection - prevent redirect-based attacks
+            limits=httpx.Limits(
+                max_connections=limit,
+                max_keepalive_connections=limit,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+            transport=self._transport,
+        )
+        return _HostPool(client=client, semaphore=asyncio.Semaphore(limit))
+
+    async def _pool(self, host: str, verify: bool) -> _HostPool:
+        pools = self._pools.get()
+        key = (host.lower(), verify)
+        pool = pools.get(key)
+        if pool is not None:
+            pools.move_to_end(key)
+            return pool
+
+        # Evict least recently used idle hosts to bound open connections
+        for old_key in [k for k, p in pools.items() if p.in_flight == 0]:
+            if len(pools) < self._max_host_pools:
+                break
+            await pools.pop(old_key).client.aclose()
+
+        pool = pools[key] = self._new_pool(host, verify)
+        return pool
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        host: str,
+        verify: bool = True,
+        timeout: float = 15.0,
+        max_response_bytes: Optional[int] = None,
+        **kwargs: Any,
+    ) -> BufferedResponse:
+        """Send a request through *host*'s pool and read the body.
+
+        Waiting for a concurrency slot counts against *timeout*.
+
+        Raises:
+            httpx.HTTPError: Transport errors, including ``PoolTimeout`` when
+                no slot frees up in time.
+            ResponseTooLargeError: The body exceeds *max_response_bytes*.
+        """
+        pool = await self._pool(host, verify)
+        pool.in_flight += 1
+        try:
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(pool.semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                raise httpx.PoolTimeout(f"No connection slot for '{host}' within {timeout}s")
+            try:
+                remaining = max(timeout - (time.monotonic() - started), 0.001)
+                async with pool.client.stream(method, url, timeout=remaining, **kwargs) as resp:
+                    content = await _read_limited(resp, max_response_bytes)
+                    return BufferedResponse(
+                        status_code=resp.status_code,
+                        headers=resp.headers,
+                        content=content,
+                        encoding=resp.encoding or "utf-8",
+                    )
+            finally:
+                pool.semaphore.release()
+        finally:
+            pool.in_flight -= 1
+
+    async def aclose(self) -> None:
+        """Close the current event loop's clients."""
+        pools = self._pools.pop() or {}
+        for pool in pools.values():
+            await pool.client.aclose()
+
+
+async def _read_limited(resp: httpx.Response, max_bytes: Optional[int]) -> bytes:
+    if max_bytes is not None:
+        declared = resp.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ResponseTooLargeError(
+                f"Response body of {declared} bytes exceeds the {max_bytes} byte limit"
+            )
+    chunks = []
+    received = 0
+    async for chunk in resp.aiter_bytes():
+        received += len(chunk)
+        if max_bytes is not None and received > max_bytes:
+            raise ResponseTooLargeError(f"Response body exceeds the {max_bytes} byte limit")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+# KEYS[1] = bucket; ARGV = capacity, refill tokens/second, now (seconds)
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return allowed
+"""
+
+
+class TokenBucketRateLimiter:
+    """Redis token bucket on a pooled client, one pool per event loop."""
+
+    def __init__(self, redis_url: str, max_connections: int = 20) -> None:
+        self._redis_url = redis_url
+        self._max_connections = max_connections
+        self._scripts: LoopLocal[Any] = LoopLocal(self._register_script)
+
+    def _register_script(self) -> Any:
+        client = redis_async.Redis(
+            connection_pool=redis_async.ConnectionPool.from_url(
+                self._redis_url,
+                max_connections=self._max_connections,
+                decode_responses=True,
+            )
+        )
+        return client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self, key: str, max_calls: int, window_s: float) -> bool:
+        """Take one token from *key*'s bucket; False if it is empty."""
+        script = self._scripts.get()
+        allowed = await script(
+            keys=[key],
+            args=[max_calls, max_calls / max(window_s, 1e-3), time.time()],
+        )
+        return int(allowed) == 1
+
+
+outbound_transport = OutboundHttpTransport(
+    max_concurrency_per_host=settings.HTTP_PLUGIN_MAX_CONCURRENCY_PER_HOST,
+    host_limits=parse_host_limits(settings.HTTP_PLUGIN_HOST_CONCURRENCY),
+    max_host_pools=settings.HTTP_PLUGIN_MAX_HOST_POOLS,
+    http2=settings.HTTP_PLUGIN_HTTP2,
+)
+rate_limiter = TokenBucketRateLimiter(settings.REDIS_URL)
@@ -0,0 +1,103 @@
+"""
+Plugin manifest.
+
+Metadata for every lazily loaded plugin (name, description, category,
+schemas and a ``module:function`` entry point) is kept in ``manifest.json``
+so the registry can list plugins without importing their modules. The JSON
+is generated from the ``*_PLUGIN_DEFINITIONS`` exported by each plugin
+module; regenerate it after changing a definition:
+
+    python -m src.plugins.manifest
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# (module, definitions attribute, optional packages the module needs)
+PLUGIN_SOURCES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("src.plugins.text_processing_plugin", "TEXT_PROCESSING_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.playwright_plugin", "PLAYWRIGHT_PLUGIN_DEFINITIONS", ("playwright",)),
+    ("src.plugins.file_operations_plugin", "FILE_OPERATIONS_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.http_plugin", "HTTP_PLUGIN_DEFINITION", ()),
+    ("src.plugins.google", "GOOGLE_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.den_file_plugin", "DEN_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.image_generation_plugin", "IMAGE_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.agent_storage_plugin", "AGENT_STORAGE_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.document_db_plugin", "DOCUMENT_DB_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.markdown_composer_plugin", "PLUGIN_DEFINITION", ()),
+    ("src.plugins.discord_followup_plugin", "DISCORD_FOLLOWUP_PLUGIN_DEFINITIONS", ()),
+    ("src.plugins.csv_composer_plugin", "PLUGIN_DEFINITION", ()),
+    ("src.plugins.workspace_csv_plugin", "WORKSPACE_CSV_PLUGIN_DEFINITIONS", ()),
+]
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> List[Dict[str, Any]]:
+    """Read manifest entries without importing any plugin module."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["plugins"]
+
+
+def manifest_entry(definition: Dict[str, Any], requires: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Convert a plugin definition dict into a manifest entry."""
+    handler = definition["handler"]
+    entry = {
+        "name": definition["name"],
+        "description": definition["description"],
+        "category": definition.get("category", "custom"),
+        "inputs_schema": definition.get("inputs_schema"),
+        "outputs_schema": definition.get("outputs_schema"),
+        "entry_point": f"{handler.__module__}:{handler.__qualname__}",
+    }
+    for key in ("execution_mode", "timeout_seconds"):
+        if key in definition:
+            entry[key] = definition[key]
+    if requires:
+        entry["requires"] = list(requires)
+    return entry
+
+
+def _from_module(entry: Dict[str, Any], module_name: str) -> bool:
+    target = entry["entry_point"].split(":", 1)[0]
+    return target == module_name or target.startswith(module_name + ".")
+
+
+def build_manifest(existing: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Build manifest entries by importing every plugin source.
+
+    Sources whose optional packages are not installed keep their entries
+    from *existing*, so regenerating without them does not drop plugins.
+    """
+    entries: List[Dict[str, Any]] = []
+    for module_name, attr, requires in PLUGIN_SOURCES:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            if not requires:
+                raise
+            entries.extend(e for e in existing or [] if _from_module(e, module_name))
+            continue
+        definitions = getattr(module, attr)
+        if isinstance(definitions, dict):
+            definitions = [definitions]
+        entries.extend(manifest_entry(d, requires) for d in definitions)
+    return entries
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> int:
+    """Regenerate ``manifest.json``; returns the number of entries."""
+    existing = load_manifest(path) if path.exists() else None
+    entries = build_manifest(existing)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"plugins": entries}, f, indent=2)
+        f.write("\n")
+    return len(entries)
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()} plugin entries to {MANIFEST_PATH}")
@@ -23,8 +23,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from src.plugins.handler_pools import PROCESS, offload
+
 logger = structlog.get_logger(__name__)
 
+# Bounds the process-pool render; a runaway worker is killed, not awaited
+MARKDOWN_RENDER_TIMEOUT = 60
+
 
 def _markdown_to_html(markdown_content: str, title: str, document_type: str) -> str:
     """Convert markdown to styled HTML document."""
@@ -178,6 +183,11 @@ def _markdown_to_html(markdown_content: str, title: str, document_type: str) ->
     """
 
 
+def _write_file(file_path: Path, data: bytes) -> None:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(data)
+
+
 async def pdf_composer_handler(inputs: Dict[str, Any], context=None) -> Dict[str, Any]:
     """
     Convert markdown content to a professionally styled PDF.
@@ -212,7 +222,15 @@ async def pdf_composer_handler(inputs: Dict[str, Any], context=None) -> Dict[str
     try:
         # Step 1: Convert markdown to styled HTML
         logger.info("pdf_composer_converting_markdown", title=title, document_type=document_type)
-        html_content = _markdown_to_html(content, title, document_type)
+        # Regex-heavy on long documents; render in the process pool
+        html_content = await offload(
+            _markdown_to_html,
+            content,
+            title,
+            document_type,
+            mode=PROCESS,
+            timeout=MARKDOWN_RENDER_TIMEOUT,
+        )
 
         # Step 2: Convert HTML to PDF using Playwright
         from playwright.async_api import async_playwright
@@ -305,8 +323,7 @@ async def pdf_composer_handler(inputs: Dict[str, Any], context=None) -> Dict[str
 
         # Also save locally as fallback
         file_path = Path(output_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_bytes(pdf_bytes)
+        await offload(_write_file, file_path, pdf_bytes)
         result["file_path"] = str(file_path)
 
         logger.info(
@@ -352,4 +369,5 @@ PLUGIN_DEFINITION = {
         "content_type": {"type": "string", "description": "MIME type (application/pdf)"},
     },
     "category": "document",
+    "timeout_seconds": 180,
 }
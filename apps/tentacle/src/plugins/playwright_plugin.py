@@ -5,13 +5,17 @@ This plugin provides browser automation capabilities including:
 - Web page rendering
 - PDF generation
 - HTML to image conversion
+
+Pages come from the shared warm browser pool (see ``browser_pool``), one
+isolated browser context per call.
 """
 
 from typing import Any, Dict
 import asyncio
 import base64
 from pathlib import Path
-from playwright.async_api import async_playwright
+
+from src.plugins.browser_pool import browser_pool
 
 
 async def generate_tweet_image_handler(inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -97,21 +101,20 @@ async def generate_tweet_image_handler(inputs: Dict[str, Any]) -> Dict[str, Any]
     </html>
     """
 
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page(viewport={"width": width, "height": height})
-
-            # Set the HTML content
-            await page.set_content(html_content)
+    async def render(page) -> bytes:
+        # Set the HTML content
+        await page.set_content(html_content)
 
-            # Wait for fonts to load
-            await page.wait_for_timeout(500)
+        # Wait for fonts to load
+        await page.wait_for_timeout(500)
 
-            # Take screenshot
-            screenshot_bytes = await page.screenshot(type="png", full_page=False)
+        # Take screenshot
+        return await page.screenshot(type="png", full_page=False)
 
-            await browser.close()
+    try:
+        screenshot_bytes = await browser_pool.run(
+            render, context_options={"viewport": {"width": width, "height": height}}
+        )
 
         # Encode to base64 for storage/transmission
         base64_image = base64.b64encode(screenshot_bytes).decode('utf-8')
@@ -169,25 +172,24 @@ async def screenshot_url_handler(inputs: Dict[str, Any]) -> Dict[str, Any]:
     if not url:
         return {"result": "", "error": "No url provided"}
 
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page(viewport={"width": width, "height": height})
-
-            # Navigate to URL
-            await page.goto(url, wait_until="networkidle")
+    async def capture(page) -> bytes:
+        # Navigate to URL
+        await page.goto(url, wait_until="networkidle")
 
-            # Wait for specific selector if provided
-            if wait_for_selector:
-                await page.wait_for_selector(wait_for_selector, timeout=10000)
+        # Wait for specific selector if provided
+        if wait_for_selector:
+            await page.wait_for_selector(wait_for_selector, timeout=10000)
 
-            # Take screenshot
-            screenshot_bytes = await page.screenshot(
-                type="png",
-                full_page=full_page
-            )
+        # Take screenshot
+        return await page.screenshot(
+            type="png",
+            full_page=full_page
+        )
 
-            await browser.close()
+    try:
+        screenshot_bytes = await browser_pool.run(
+            capture, context_options={"viewport": {"width": width, "height": height}}
+        )
 
         # Encode to base64
         base64_image = base64.b64encode(screenshot_bytes).decode('utf-8')
@@ -239,21 +241,18 @@ async def html_to_pdf_handler(inputs: Dict[str, Any], context=None) -> Dict[str,
     if not output_path:
         return {"result": "", "error": "No output_path provided"}
 
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
-
-            # Set HTML content
-            await page.set_content(html)
+    async def print_pdf(page) -> bytes:
+        # Set HTML content
+        await page.set_content(html)
 
-            # Wait for rendering
-            await page.wait_for_timeout(500)
+        # Wait for rendering
+        await page.wait_for_timeout(500)
 
-            # Generate PDF
-            pdf_bytes = await page.pdf(format=page_format)
+        # Generate PDF
+        return await page.pdf(format=page_format)
 
-            await browser.close()
+    try:
+        pdf_bytes = await browser_pool.run(print_pdf)
 
         # Save to file
         file_path = Path(output_path)
@@ -283,3 +282,88 @@ PLUGIN_HANDLERS = {
     "screenshot_url": screenshot_url_handler,
     "html_to_pdf": html_to_pdf_handler,
 }
+
+
+PLAYWRIGHT_PLUGIN_DEFINITIONS = [
+    {
+        "name": "generate_tweet_image",
+        "description": "Generate a visually appealing image for a tweet with custom styling",
+        "handler": generate_tweet_image_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "tweet_text": {"type": "string"},
+                "image_prompt": {"type": "string"},
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
+                "background_color": {"type": "string"},
+                "text_color": {"type": "string"},
+                "font_size": {"type": "integer"},
+                "output_path": {"type": "string"}
+            },
+            "required": ["tweet_text"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "file_path": {"type": "string"},
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "automation",
+    },
+    {
+        "name": "screenshot_url",
+        "description": "Take a screenshot of any URL using Playwright",
+        "handler": screenshot_url_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "url": {"type": "string"},
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
+                "full_page": {"type": "boolean"},
+                "output_path": {"type": "string"},
+                "wait_for_selector": {"type": "string"}
+            },
+            "required": ["url"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "file_path": {"type": "string"},
+                "url": {"type": "string"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "automation",
+    },
+    {
+        "name": "html_to_pdf",
+        "description": "Convert HTML content to PDF using Playwright",
+        "handler": html_to_pdf_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "html": {"type": "string"},
+                "output_path": {"type": "string"},
+                "format": {"type": "string"}
+            },
+            "required": ["html", "output_path"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "file_path": {"type": "string"},
+                "size_bytes": {"type": "integer"}
+            }
+        },
+        "category": "automation",
+        "timeout_seconds": 120,
+    },
+]
@@ -1,8 +1,41 @@
+"""
+Central plugin registry.
+
+Built-in utility plugins are registered directly. Every other plugin is
+registered from ``manifest.json`` by metadata only and its module is
+imported the first time the plugin is looked up, so processes that never
+run e.g. the Google or Playwright plugins never pay for their imports.
+Set ``PLUGIN_ALLOWLIST`` to restrict a process (such as a specialised
+Celery queue) to the plugins it actually runs.
+"""
+
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+import asyncio
+import importlib
+import importlib.util
 import inspect
+import sys
+import threading
+import time
+
+import structlog
+
+from src.core.config import settings
+from .handler_pools import (
+    ASYNC,
+    PROCESS,
+    THREAD,
+    HandlerTimeoutError,
+    handler_pools,
+    record_handler_timeout,
+    record_handler_timing,
+)
+from .manifest import load_manifest
+
+logger = structlog.get_logger(__name__)
 
 
 Handler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]] | Dict[str, Any]]
@@ -12,32 +45,183 @@ Handler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]] | Dict[str, Any]]
 class PluginDefinition:
     name: str
     description: str
-    handler: Handler
+    handler: Optional[Handler]
     inputs_schema: Optional[Dict[str, Any]] = None
     outputs_schema: Optional[Dict[str, Any]] = None
     category: str = "custom"
+    # "module:function" resolved on first use when handler is None
+    entry_point: Optional[str] = None
+    # "async" runs on the event loop; "thread"/"process" use the handler pools
+    execution_mode: str = ASYNC
+    timeout_seconds: Optional[float] = None
+
+
+@dataclass
+class PluginLoadStats:
+    """Cost of importing one plugin module."""
+
+    module: str
+    seconds: float
+    rss_delta_bytes: Optional[int]
+    plugins: List[str] = field(default_factory=list)
+
+
+def _current_rss() -> Optional[int]:
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def parse_allowlist(value: Optional[str]) -> Optional[Set[str]]:
+    """Parse a comma-separated allowlist; empty means no restriction."""
+    names = {item.strip() for item in (value or "").split(",") if item.strip()}
+    return names or None
 
 
 class PluginRegistry:
     def __init__(self) -> None:
         self._plugins: Dict[str, PluginDefinition] = {}
+        self._load_stats: Dict[str, PluginLoadStats] = {}
+        self._load_lock = threading.RLock()
 
     def register(self, plugin: PluginDefinition) -> None:
         self._plugins[plugin.name] = plugin
 
+    def register_manifest(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        allowlist: Optional[Set[str]] = None,
+    ) -> int:
+        """Register manifest entries without importing their modules.
+
+        Args:
+            entries: Manifest entries (see ``src.plugins.manifest``).
+            allowlist: Plugin names or categories to keep; None keeps all.
+
+        Returns:
+            Number of plugins registered. Entries whose optional packages
+            are not installed are skipped.
+        """
+        count = 0
+        for entry in entries:
+            if allowlist is not None and not {entry["name"], entry.get("category")} & allowlist:
+                continue
+            missing = [pkg for pkg in entry.get("requires", []) if importlib.util.find_spec(pkg) is None]
+            if missing:
+                logger.debug("plugin_skipped_missing_dependency", plugin=entry["name"], missing=missing)
+                continue
+            self.register(
+                PluginDefinition(
+                    name=entry["name"],
+                    description=entry["description"],
+                    handler=None,
+                    inputs_schema=entry.get("inputs_schema"),
+                    outputs_schema=entry.get("outputs_schema"),
+                    category=entry.get("category", "custom"),
+                    entry_point=entry["entry_point"],
+                    execution_mode=entry.get("execution_mode", ASYNC),
+                    timeout_seconds=entry.get("timeout_seconds"),
+                )
+            )
+            count += 1
+        return count
+
     def get(self, name: str) -> Optional[PluginDefinition]:
-        return self._plugins.get(name)
+        plugin = self._plugins.get(name)
+        if plugin is not None and plugin.handler is None and not self._resolve(plugin):
+            return None
+        return plugin
+
+    def definitions(self) -> List[PluginDefinition]:
+        """All registered plugins. Metadata only; handlers are not loaded."""
+        return list(self._plugins.values())
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> List[PluginLoadStats]:
+        """Import the modules behind *names* (default: every registered plugin)."""
+        for name in list(names if names is not None else self._plugins):
+            self.get(name)
+        return self.load_report()
+
+    def load_report(self) -> List[PluginLoadStats]:
+        """Import cost of each plugin module loaded so far, slowest first."""
+        return sorted(self._load_stats.values(), key=lambda s: s.seconds, reverse=True)
+
+    def _resolve(self, plugin: PluginDefinition) -> bool:
+        module_name, _, attr = (plugin.entry_point or "").partition(":")
+        with self._load_lock:
+            if plugin.handler is not None:
+                return True
+            try:
+                target: Any = self._import(module_name)
+                for part in attr.split("."):
+                    target = getattr(target, part)
+            except Exception as e:
+                logger.error(
+                    "plugin_load_failed",
+                    plugin=plugin.name,
+                    entry_point=plugin.entry_point,
+                    error=str(e),
+                )
+                self._plugins.pop(plugin.name, None)
+                return False
+            plugin.handler = target
+            return True
+
+    def _import(self, module_name: str) -> Any:
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+        rss_before = _current_rss()
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        seconds = time.perf_counter() - started
+        rss_after = _current_rss()
+        stats = PluginLoadStats(
+            module=module_name,
+            seconds=seconds,
+            rss_delta_bytes=rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+            plugins=[
+                p.name for p in self._plugins.values()
+                if (p.entry_point or "").partition(":")[0] == module_name
+            ],
+        )
+        self._load_stats[module_name] = stats
+        logger.info(
+            "plugin_module_loaded",
+            module=module_name,
+            seconds=round(seconds, 4),
+            rss_delta_bytes=stats.rss_delta_bytes,
+            plugins=stats.plugins,
+        )
+        return module
 
     async def execute(self, name: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
         plugin = self.get(name)
         if not plugin:
             raise ValueError(f"Plugin not found: {name}")
         fn = plugin.handler
-        if inspect.iscoroutinefunction(fn):
-            return await fn(inputs)
-        result = fn(inputs)
-        if inspect.isawaitable(result):
-            return await result  # type: ignore
+        if plugin.execution_mode in (THREAD, PROCESS):
+            return await handler_pools.run(
+                fn,
+                inputs,
+                mode=plugin.execution_mode,
+                name=name,
+                timeout=plugin.timeout_seconds,
+            )
+
+        started = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(fn):
+                result = await asyncio.wait_for(fn(inputs), plugin.timeout_seconds)
+            else:
+                result = fn(inputs)
+                if inspect.isawaitable(result):
+                    result = await asyncio.wait_for(result, plugin.timeout_seconds)  # type: ignore
+        except asyncio.TimeoutError:
+            record_handler_timeout(name, ASYNC)
+            raise HandlerTimeoutError(f"{name} exceeded {plugin.timeout_seconds}s timeout")
+        record_handler_timing(name, ASYNC, 0.0, time.perf_counter() - started)
         return result  # type: ignore
 
 
@@ -250,401 +434,5 @@ registry.register(
 )
 
 
-# Register text processing plugins
-from .text_processing_plugin import PLUGIN_HANDLERS
-
-registry.register(
-    PluginDefinition(
-        name="clean_yaml_fences",
-        description="Remove markdown code fences and clean YAML content",
-        handler=PLUGIN_HANDLERS["clean_yaml_fences"],
-        inputs_schema={
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "original_length": {"type": "integer"},
-                "cleaned_length": {"type": "integer"}
-            }
-        },
-        category="text",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="extract_code_block",
-        description="Extract content from markdown code blocks",
-        handler=PLUGIN_HANDLERS["extract_code_block"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "text": {"type": "string"},
-                "language": {"type": "string"}
-            },
-            "required": ["text"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "found": {"type": "boolean"}
-            }
-        },
-        category="text",
-    )
-)
-
-
-# Register Playwright automation plugins (optional - requires playwright)
-try:
-    from .playwright_plugin import PLUGIN_HANDLERS as PLAYWRIGHT_HANDLERS
-    _PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_HANDLERS = {}
-    _PLAYWRIGHT_AVAILABLE = False
-
-if _PLAYWRIGHT_AVAILABLE:
-    registry.register(
-        PluginDefinition(
-            name="generate_tweet_image",
-            description="Generate a visually appealing image for a tweet with custom styling",
-            handler=PLAYWRIGHT_HANDLERS["generate_tweet_image"],
-            inputs_schema={
-                "type": "object",
-                "properties": {
-                    "tweet_text": {"type": "string"},
-                    "image_prompt": {"type": "string"},
-                    "width": {"type": "integer"},
-                    "height": {"type": "integer"},
-                    "background_color": {"type": "string"},
-                    "text_color": {"type": "string"},
-                    "font_size": {"type": "integer"},
-                    "output_path": {"type": "string"}
-                },
-                "required": ["tweet_text"]
-            },
-            outputs_schema={
-                "type": "object",
-                "properties": {
-                    "result": {"type": "string"},
-                    "file_path": {"type": "string"},
-                    "width": {"type": "integer"},
-                    "height": {"type": "integer"},
-                    "size_bytes": {"type": "integer"}
-                }
-            },
-            category="automation",
-        )
-    )
-
-    registry.register(
-        PluginDefinition(
-            name="screenshot_url",
-            description="Take a screenshot of any URL using Playwright",
-            handler=PLAYWRIGHT_HANDLERS["screenshot_url"],
-            inputs_schema={
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string"},
-                    "width": {"type": "integer"},
-                    "height": {"type": "integer"},
-                    "full_page": {"type": "boolean"},
-                    "output_path": {"type": "string"},
-                    "wait_for_selector": {"type": "string"}
-                },
-                "required": ["url"]
-            },
-            outputs_schema={
-                "type": "object",
-                "properties": {
-                    "result": {"type": "string"},
-                    "file_path": {"type": "string"},
-                    "url": {"type": "string"},
-                    "size_bytes": {"type": "integer"}
-                }
-            },
-            category="automation",
-        )
-    )
-
-    registry.register(
-        PluginDefinition(
-            name="html_to_pdf",
-            description="Convert HTML content to PDF using Playwright",
-            handler=PLAYWRIGHT_HANDLERS["html_to_pdf"],
-            inputs_schema={
-                "type": "object",
-                "properties": {
-                    "html": {"type": "string"},
-                    "output_path": {"type": "string"},
-                    "format": {"type": "string"}
-                },
-                "required": ["html", "output_path"]
-            },
-            outputs_schema={
-                "type": "object",
-                "properties": {
-                    "result": {"type": "string"},
-                    "file_path": {"type": "string"},
-                    "size_bytes": {"type": "integer"}
-                }
-            },
-            category="automation",
-        )
-    )
-
-
-# Register file operations plugins
-from .file_operations_plugin import PLUGIN_HANDLERS as FILE_HANDLERS
-
-registry.register(
-    PluginDefinition(
-        name="write_csv",
-        description="Write data to a CSV file from list of dicts or list of lists",
-        handler=FILE_HANDLERS["write_csv"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "data": {"type": "array"},
-                "file_path": {"type": "string"},
-                "headers": {"type": "array", "items": {"type": "string"}},
-                "delimiter": {"type": "string"},
-                "append": {"type": "boolean"}
-            },
-            "required": ["data", "file_path"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "rows_written": {"type": "integer"},
-                "size_bytes": {"type": "integer"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="csv_from_text",
-        description="Save CSV text content (e.g., from LLM output) to a file",
-        handler=FILE_HANDLERS["csv_from_text"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "csv_text": {"type": "string"},
-                "file_path": {"type": "string"},
-                "skip_validation": {"type": "boolean"}
-            },
-            "required": ["csv_text", "file_path"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "rows_written": {"type": "integer"},
-                "size_bytes": {"type": "integer"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="write_json",
-        description="Write data to a JSON file with optional formatting",
-        handler=FILE_HANDLERS["write_json"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "data": {},  # Can be any JSON-serializable data
-                "file_path": {"type": "string"},
-                "indent": {"type": "integer"},
-                "append_to_array": {"type": "boolean"}
-            },
-            "required": ["data", "file_path"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "size_bytes": {"type": "integer"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="write_text",
-        description="Write text content to a file",
-        handler=FILE_HANDLERS["write_text"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "content": {"type": "string"},
-                "file_path": {"type": "string"},
-                "append": {"type": "boolean"},
-                "encoding": {"type": "string"}
-            },
-            "required": ["content", "file_path"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "size_bytes": {"type": "integer"},
-                "lines_written": {"type": "integer"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="read_file",
-        description="Read content from a text file",
-        handler=FILE_HANDLERS["read_file"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "file_path": {"type": "string"},
-                "encoding": {"type": "string"},
-                "max_bytes": {"type": "integer"}
-            },
-            "required": ["file_path"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "string"},
-                "size_bytes": {"type": "integer"},
-                "lines": {"type": "integer"},
-                "truncated": {"type": "boolean"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-registry.register(
-    PluginDefinition(
-        name="list_files",
-        description="List files in a directory with optional glob pattern matching",
-        handler=FILE_HANDLERS["list_files"],
-        inputs_schema={
-            "type": "object",
-            "properties": {
-                "directory": {"type": "string"},
-                "pattern": {"type": "string"},
-                "recursive": {"type": "boolean"}
-            },
-            "required": ["directory"]
-        },
-        outputs_schema={
-            "type": "object",
-            "properties": {
-                "result": {"type": "array", "items": {"type": "string"}},
-                "count": {"type": "integer"}
-            }
-        },
-        category="file_io",
-    )
-)
-
-
-# Register HTTP plugin
-from .http_plugin import HTTP_PLUGIN_DEFINITION
-
-registry.register(
-    PluginDefinition(**HTTP_PLUGIN_DEFINITION)
-)
-
-
-# Register Google plugins
-from .google import GOOGLE_PLUGIN_DEFINITIONS
-
-for plugin_def in GOOGLE_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register Den file plugins
-from .den_file_plugin import DEN_PLUGIN_DEFINITIONS
-
-for plugin_def in DEN_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register image generation plugins
-from .image_generation_plugin import IMAGE_PLUGIN_DEFINITIONS
-
-for plugin_def in IMAGE_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register agent storage plugins
-from .agent_storage_plugin import AGENT_STORAGE_PLUGIN_DEFINITIONS
-
-for plugin_def in AGENT_STORAGE_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register document DB plugins
-from .document_db_plugin import DOCUMENT_DB_PLUGIN_DEFINITIONS
-
-for plugin_def in DOCUMENT_DB_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register markdown composer plugin
-from .markdown_composer_plugin import PLUGIN_DEFINITION as MARKDOWN_COMPOSER_DEFINITION
-
-registry.register(
-    PluginDefinition(**MARKDOWN_COMPOSER_DEFINITION)
-)
-
-
-# Register Discord followup plugins (for responding to slash commands)
-from .discord_followup_plugin import DISCORD_FOLLOWUP_PLUGIN_DEFINITIONS
-
-for plugin_def in DISCORD_FOLLOWUP_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
-
-# Register CSV composer plugin
-from .csv_composer_plugin import PLUGIN_DEFINITION as CSV_COMPOSER_DEFINITION
-
-registry.register(
-    PluginDefinition(**CSV_COMPOSER_DEFINITION)
-)
-
-
-# Register workspace CSV plugins
-from .workspace_csv_plugin import WORKSPACE_CSV_PLUGIN_DEFINITIONS
-
-for plugin_def in WORKSPACE_CSV_PLUGIN_DEFINITIONS:
-    registry.register(
-        PluginDefinition(**plugin_def)
-    )
-
+# Manifest plugins: registered by metadata, imported on first use
+registry.register_manifest(load_manifest(), allowlist=parse_allowlist(settings.PLUGIN_ALLOWLIST))
@@ -107,3 +107,47 @@ PLUGIN_HANDLERS = {
     "extract_code_block": extract_code_block_handler,
     "strip_whitespace": strip_whitespace_handler,
 }
+
+
+TEXT_PROCESSING_PLUGIN_DEFINITIONS = [
+    {
+        "name": "clean_yaml_fences",
+        "description": "Remove markdown code fences and clean YAML content",
+        "handler": clean_yaml_fences_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "original_length": {"type": "integer"},
+                "cleaned_length": {"type": "integer"}
+            }
+        },
+        "category": "text",
+    },
+    {
+        "name": "extract_code_block",
+        "description": "Extract content from markdown code blocks",
+        "handler": extract_code_block_handler,
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "language": {"type": "string"}
+            },
+            "required": ["text"]
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {
+                "result": {"type": "string"},
+                "found": {"type": "boolean"}
+            }
+        },
+        "category": "text",
+    },
+]
@@ -10,11 +10,12 @@ import csv
 import io
 import json
 import structlog
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.application.workspace import WorkspaceUseCases
 from src.infrastructure.workspace import WorkspaceServiceAdapter
 from src.interfaces.database import Database
+from src.plugins.handler_pools import offload
 
 logger = structlog.get_logger(__name__)
 
@@ -107,6 +108,77 @@ def _flatten_object(obj: Dict[str, Any], include_metadata: bool = True) -> Dict[
     return flat
 
 
+def _build_export_csv(
+    objects: List[Dict[str, Any]],
+    include_metadata: bool,
+    columns: Optional[List[str]],
+    delimiter: str,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Flatten workspace objects and render them as CSV text."""
+    # Flatten objects
+    flat_objects = [_flatten_object(obj, include_metadata) for obj in objects]
+
+    # Determine columns
+    if columns:
+        # Only include specified columns (plus metadata if requested)
+        meta_cols = ["id", "type", "created_at", "tags"] if include_metadata else []
+        all_cols = meta_cols + [c for c in columns if c not in meta_cols]
+        # Filter flat objects to only include specified columns
+        flat_objects = [
+            {k: row.get(k, "") for k in all_cols}
+            for row in flat_objects
+        ]
+        fieldnames = all_cols
+    else:
+        # Collect all unique keys preserving order
+        fieldnames = []
+        seen = set()
+        for obj in flat_objects:
+            for key in obj.keys():
+                if key not in seen:
+                    fieldnames.append(key)
+                    seen.add(key)
+
+    # Generate CSV
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fieldnames, delimiter=delimiter, extrasaction="ignore")
+    writer.writeheader()
+    for row in flat_objects:
+        writer.writerow(row)
+    return output.getvalue(), flat_objects
+
+
+def _parse_import_rows(
+    csv_text: str,
+    column_mapping: Dict[str, str],
+    skip_empty_rows: bool,
+) -> List[Dict[str, Any]]:
+    """Parse CSV text into row dicts, applying column mapping."""
+    # Parse CSV
+    reader = csv.DictReader(io.StringIO(csv_text))
+    rows = []
+    for row in reader:
+        # Apply column mapping
+        if column_mapping:
+            mapped = {}
+            for csv_col, value in row.items():
+                new_col = column_mapping.get(csv_col, csv_col)
+                mapped[new_col] = value
+            row = mapped
+
+        # Remove None key (DictReader overflow from extra delimiters)
+        row = {k: v for k, v in row.items() if k is not None}
+
+        # Skip empty rows
+        if skip_empty_rows and all(
+            not v or (isinstance(v, str) and v.strip() == "") for v in row.values()
+        ):
+            continue
+
+        rows.append(dict(row))
+    return rows
+
+
 async def workspace_export_csv_handler(inputs: Dict[str, Any], context=None) -> Dict[str, Any]:
     """
     Export workspace objects to CSV and upload to Den.
@@ -166,37 +238,10 @@ async def workspace_export_csv_handler(inputs: Dict[str, Any], context=None) ->
                 "total_count": 0,
             }
 
-        # Flatten objects
-        flat_objects = [_flatten_object(obj, include_metadata) for obj in objects]
-
-        # Determine columns
-        if columns:
-            # Only include specified columns (plus metadata if requested)
-            meta_cols = ["id", "type", "created_at", "tags"] if include_metadata else []
-            all_cols = meta_cols + [c for c in columns if c not in meta_cols]
-            # Filter flat objects to only include specified columns
-            flat_objects = [
-                {k: row.get(k, "") for k in all_cols}
-                for row in flat_objects
-            ]
-            fieldnames = all_cols
-        else:
-            # Collect all unique keys preserving order
-            fieldnames = []
-            seen = set()
-            for obj in flat_objects:
-                for key in obj.keys():
-                    if key not in seen:
-                        fieldnames.append(key)
-                        seen.add(key)
-
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames, delimiter=delimiter, extrasaction="ignore")
-        writer.writeheader()
-        for row in flat_objects:
-            writer.writerow(row)
-        csv_content = output.getvalue()
+        # Flatten and serialize off the event loop (up to `limit` objects)
+        csv_content, flat_objects = await offload(
+            _build_export_csv, objects, include_metadata, columns, delimiter
+        )
 
         # Generate filename
         if not filename:
@@ -326,28 +371,8 @@ async def workspace_import_csv_handler(inputs: Dict[str, Any], context=None) ->
         if not csv_text:
             return {"error": "No CSV content to import"}
 
-        # Parse CSV
-        reader = csv.DictReader(io.StringIO(csv_text))
-        rows = []
-        for row in reader:
-            # Apply column mapping
-            if column_mapping:
-                mapped = {}
-                for csv_col, value in row.items():
-                    new_col = column_mapping.get(csv_col, csv_col)
-                    mapped[new_col] = value
-                row = mapped
-
-            # Remove None key (DictReader overflow from extra delimiters)
-            row = {k: v for k, v in row.items() if k is not None}
-
-            # Skip empty rows
-            if skip_empty_rows and all(
-                not v or (isinstance(v, str) and v.strip() == "") for v in row.values()
-            ):
-                continue
-
-            rows.append(dict(row))
+        # Parse CSV off the event loop
+        rows = await offload(_parse_import_rows, csv_text, column_mapping, skip_empty_rows)
 
         if dry_run:
             return {
@@ -440,6 +465,7 @@ WORKSPACE_CSV_PLUGIN_DEFINITIONS = [
             },
         },
         "category": "workspace",
+        "timeout_seconds": 120,
     },
     {
         "name": "workspace_import_csv",
@@ -471,5 +497,6 @@ WORKSPACE_CSV_PLUGIN_DEFINITIONS = [
             },
         },
         "category": "workspace",
+        "timeout_seconds": 300,
     },
 ]
@@ -0,0 +1,214 @@
+"""
+Compiled agent schemas for plan validation.
+
+Plans are validated on every generation, replan and repair attempt, and at
+dispatch time for every step. Rather than re-reading the registry entry and
+re-deriving the required set, type checks and fuzzy-match candidates for
+each step, ``AgentSchemaCache`` compiles them once per agent type and keeps
+them until the registry reloads (``UnifiedCapabilityRegistry.version``).
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Schema type names (both JSON-schema and Python spellings) -> accepted types
+INPUT_TYPE_MAP: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "str": (str,),
+    "integer": (int,),
+    "int": (int,),
+    "number": (int, float),
+    "float": (int, float),
+    "boolean": (bool,),
+    "bool": (bool,),
+    "array": (list,),
+    "list": (list,),
+    "object": (dict,),
+    "dict": (dict,),
+}
+
+# Output fields assumed for steps whose agent declares no outputs schema
+FALLBACK_OUTPUT_FIELDS: FrozenSet[str] = frozenset({"output", "result", "content", "data"})
+
+
+class FieldMatcher:
+    """
+    Closest-name lookup over a fixed set of field names.
+
+    Lower-cased names and word sets are computed once; answers are memoized
+    because the LLM tends to repeat the same wrong name across steps and
+    retries. Candidates are tried in sorted order so suggestions are stable.
+    """
+
+    _MAX_MEMO = 256
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(sorted(names))
+        self.listing = ", ".join(self.names)
+        self._lower = tuple(name.lower() for name in self.names)
+        self._words = tuple(frozenset(lower.replace("_", " ").split()) for lower in self._lower)
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def closest(self, target: str) -> Optional[str]:
+        """Exact (case-insensitive), then prefix, contains, and word-overlap match."""
+        if target in self._memo:
+            return self._memo[target]
+        match = self._match(target.lower())
+        if len(self._memo) >= self._MAX_MEMO:
+            self._memo.clear()
+        self._memo[target] = match
+        return match
+
+    def _match(self, target: str) -> Optional[str]:
+        for name, lower in zip(self.names, self._lower):
+            if lower == target:
+                return name
+        for name, lower in zip(self.names, self._lower):
+            if lower.startswith(target) or target.startswith(lower):
+                return name
+        for name, lower in zip(self.names, self._lower):
+            if target in lower or lower in target:
+                return name
+
+        target_words = set(target.replace("_", " ").split())
+        best_match = None
+        best_overlap = 0
+        for name, words in zip(self.names, self._words):
+            overlap = len(target_words & words)
+            if overlap > best_overlap:
+                best_overlap = overlap
+                best_match = name
+        return best_match
+
+
+@dataclass(frozen=True)
+class FieldCheck:
+    """Value constraints for one input field, in schema order."""
+
+    name: str
+    enum: Optional[Tuple[Any, ...]] = None
+    expected_type: Optional[str] = None
+    python_types: Optional[Tuple[type, ...]] = None
+
+
+@dataclass(frozen=True)
+class CompiledAgentSchema:
+    """Everything plan validation needs to know about one agent type."""
+
+    agent_type: str
+    known: bool
+    unknown_suggestion: Optional[str] = None
+    has_inputs_schema: bool = False
+    required: Tuple[str, ...] = ()
+    input_fields: FrozenSet[str] = frozenset()
+    input_matcher: FieldMatcher = field(default_factory=lambda: FieldMatcher(()))
+    field_checks: Tuple[FieldCheck, ...] = ()
+    output_fields: FrozenSet[str] = FALLBACK_OUTPUT_FIELDS
+    output_matcher: FieldMatcher = field(default_factory=lambda: FieldMatcher(FALLBACK_OUTPUT_FIELDS))
+
+
+def _unknown_agent_suggestion(agent_type: str, available: Iterable[str]) -> Optional[str]:
+    """Suggest an agent sharing a word with *agent_type*, else list some."""
+    available = list(available)
+    step_words = set(agent_type.lower().replace("_", " ").split())
+    for avail in available:
+        if step_words & set(avail.lower().replace("_", " ").split()):
+            return f"Did you mean '{avail}'?"
+    if available:
+        return f"Available agents: {', '.join(sorted(available)[:10])}"
+    return None
+
+
+def compile_agent_schema(registry: Any, agent_type: str) -> CompiledAgentSchema:
+    """Build the compiled schema for *agent_type* from the registry."""
+    # Plugin types (discord_followup, http_fetch, etc.) are handled by
+    # plugin_executor, not the DB agent registry.
+    from src.infrastructure.execution_runtime.plugin_executor import is_plugin_type
+
+    is_plugin = is_plugin_type(agent_type)
+    config = registry.get_agent_config(agent_type)
+
+    if config is None and not is_plugin:
+        return CompiledAgentSchema(
+            agent_type=agent_type,
+            known=False,
+            unknown_suggestion=_unknown_agent_suggestion(agent_type, registry.available_types()),
+        )
+
+    output_fields = FALLBACK_OUTPUT_FIELDS
+    if not is_plugin and config.outputs_schema:
+        output_fields = frozenset(config.outputs_schema.keys())
+
+    inputs_schema = (config.inputs_schema if config is not None else None) or {}
+    checks = []
+    for name, spec in inputs_schema.items():
+        if not isinstance(spec, dict):
+            continue
+        enum = tuple(spec["enum"]) if spec.get("enum") is not None else None
+        expected_type = spec.get("type")
+        python_types = None
+        if expected_type and expected_type != "any":
+            python_types = INPUT_TYPE_MAP.get(expected_type.lower())
+        if enum is not None or python_types is not None:
+            checks.append(FieldCheck(name, enum, expected_type, python_types))
+
+    return CompiledAgentSchema(
+        agent_type=agent_type,
+        known=True,
+        has_inputs_schema=bool(inputs_schema),
+        required=tuple(
+            name for name, spec in inputs_schema.items()
+            if isinstance(spec, dict) and spec.get("required", False)
+        ),
+        input_fields=frozenset(inputs_schema.keys()),
+        input_matcher=FieldMatcher(inputs_schema.keys()),
+        field_checks=tuple(checks),
+        output_fields=output_fields,
+        output_matcher=FieldMatcher(output_fields),
+    )
+
+
+class AgentSchemaCache:
+    """
+    Compiled schemas per agent type, valid for one registry version.
+
+    A different registry object or a bumped ``version`` drops every entry.
+    Registries without a ``version`` attribute are cached for as long as
+    the same object is passed in.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._registry: Any = None
+        self._version: Any = None
+        self._entries: Dict[str, CompiledAgentSchema] = {}
+
+    def get(self, registry: Any, agent_type: str) -> CompiledAgentSchema:
+        version = getattr(registry, "version", None)
+        if registry is not self._registry or version != self._version:
+            if self._entries:
+                logger.debug("agent_schema_cache_invalidated", version=version)
+            self._registry = registry
+            self._version = version
+            self._entries = {}
+
+        compiled = self._entries.get(agent_type)
+        if compiled is None:
+            # Unknown types invented by the LLM also land here; keep it bounded
+            if len(self._entries) >= self._max_entries:
+                self._entries.clear()
+            compiled = compile_agent_schema(registry, agent_type)
+            self._entries[agent_type] = compiled
+        return compiled
+
+    def clear(self) -> None:
+        self._registry = None
+        self._version = None
+        self._entries = {}
+
+
+agent_schema_cache = AgentSchemaCache()
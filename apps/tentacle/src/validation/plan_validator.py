@@ -17,13 +17,35 @@ Key validations:
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import structlog
 
 from src.domain.tasks.models import TaskStep
+from src.validation.agent_schemas import (
+    AgentSchemaCache,
+    CompiledAgentSchema,
+    agent_schema_cache,
+)
 
 logger = structlog.get_logger(__name__)
 
+# {{step_ref.outputs.field_name}} or {{step_ref.output}}; also {{step_name.outputs.field_name}}
+_TEMPLATE_REF = re.compile(r'\{\{([a-zA-Z][a-zA-Z0-9_]*)\.(outputs?)(\.(\w+))?\}\}')
+
+
+def _template_strings(value: Any) -> Iterator[str]:
+    """Yield every string (keys included) in *value* that may hold a template."""
+    if isinstance(value, str):
+        if "{{" in value:
+            yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _template_strings(key)
+            yield from _template_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _template_strings(item)
+
 
 @dataclass
 class PlanValidationError:
@@ -113,12 +135,15 @@ class PlanValidator:
     Validates LLM-generated delegation plans against agent schemas.
 
     Uses the UnifiedCapabilityRegistry to look up agent schemas and
-    validates that generated plans use correct field names.
+    validates that generated plans use correct field names. Schemas are
+    compiled once per agent type and shared by every validator through
+    ``agent_schema_cache`` until the registry reloads.
     """
 
-    def __init__(self):
+    def __init__(self, schema_cache: Optional[AgentSchemaCache] = None):
         self._registry = None
         self._initialized = False
+        self._schemas = schema_cache or agent_schema_cache
 
     async def _get_registry(self):
         """Lazy load the registry."""
@@ -127,6 +152,10 @@ class PlanValidator:
             self._registry = await get_registry()
         return self._registry
 
+    async def _compiled(self, agent_type: str) -> CompiledAgentSchema:
+        registry = await self._get_registry()
+        return self._schemas.get(registry, agent_type)
+
     async def validate_plan(self, steps: List[TaskStep]) -> PlanValidationResult:
         """
         Validate a complete plan before execution.
@@ -146,32 +175,28 @@ class PlanValidator:
         """
         errors: List[PlanValidationError] = []
 
-        # Build step lookup and track outputs
+        # Compile every step's schema up front so template references can
+        # be checked against a prebuilt map of step outputs
+        schemas = [await self._compiled(step.agent_type) for step in steps]
         step_ids = {step.id for step in steps}
-        step_outputs: Dict[str, Set[str]] = {}  # step_id -> set of output field names
+        step_outputs: Dict[str, Tuple[int, CompiledAgentSchema]] = {
+            step.id: (position, schema)
+            for position, (step, schema) in enumerate(zip(steps, schemas))
+        }
 
-        for step in steps:
+        for position, (step, schema) in enumerate(zip(steps, schemas)):
             # 1. Validate agent type exists
-            agent_errors, outputs_schema = await self._validate_agent_type(step)
+            agent_errors = self._agent_type_errors(step, schema)
             errors.extend(agent_errors)
 
-            # Track expected outputs for this step (for template reference validation)
-            if outputs_schema:
-                step_outputs[step.id] = set(outputs_schema.keys())
-            else:
-                # Fallback: allow common output patterns
-                step_outputs[step.id] = {"output", "result", "content", "data"}
-
             # 2. Validate inputs against schema
             if not agent_errors:  # Only if agent type is valid
-                input_errors = await self._validate_step_inputs(step)
-                errors.extend(input_errors)
+                errors.extend(self._input_errors(step, schema))
 
             # 3. Validate template references
-            template_errors = self._validate_template_references(
-                step, step_ids, step_outputs
+            errors.extend(
+                self._validate_template_references(step, position, step_ids, step_outputs)
             )
-            errors.extend(template_errors)
 
         valid = len(errors) == 0
 
@@ -186,59 +211,26 @@ class PlanValidator:
 
         return PlanValidationResult(valid=valid, errors=errors)
 
-    async def _validate_agent_type(
-        self, step: TaskStep
-    ) -> tuple[List[PlanValidationError], Optional[Dict[str, Any]]]:
-        """
-        Validate that the agent type exists and return its outputs schema.
-
-        Returns:
-            Tuple of (errors, outputs_schema)
-        """
-        errors: List[PlanValidationError] = []
-        outputs_schema = None
-
-        # Plugin types (discord_followup, http_fetch, etc.) are handled by
-        # plugin_executor, not the DB agent registry. Skip validation for them.
-        from src.infrastructure.execution_runtime.plugin_executor import is_plugin_type
-        if is_plugin_type(step.agent_type):
-            return errors, None
-
-        registry = await self._get_registry()
-        agent_config = registry.get_agent_config(step.agent_type)
-
-        if agent_config is None:
-            # Try to find similar agent types for suggestion
-            available = registry.available_types()
-            suggestion = None
-
-            # Simple fuzzy match: find agents containing similar words
-            step_words = set(step.agent_type.lower().replace("_", " ").split())
-            for avail in available:
-                avail_words = set(avail.lower().replace("_", " ").split())
-                if step_words & avail_words:  # Any common words
-                    suggestion = f"Did you mean '{avail}'?"
-                    break
-
-            if not suggestion and available:
-                suggestion = f"Available agents: {', '.join(sorted(available)[:10])}"
-
-            errors.append(
-                PlanValidationError(
-                    step_id=step.id,
-                    field="agent_type",
-                    message=f"Unknown agent type '{step.agent_type}'",
-                    suggestion=suggestion,
-                )
+    @staticmethod
+    def _agent_type_errors(
+        step: TaskStep, schema: CompiledAgentSchema
+    ) -> List[PlanValidationError]:
+        if schema.known:
+            return []
+        return [
+            PlanValidationError(
+                step_id=step.id,
+                field="agent_type",
+                message=f"Unknown agent type '{step.agent_type}'",
+                suggestion=schema.unknown_suggestion,
             )
-        else:
-            outputs_schema = agent_config.outputs_schema
-
-        return errors, outputs_schema
+        ]
 
-    async def _validate_step_inputs(self, step: TaskStep) -> List[PlanValidationError]:
+    def _input_errors(
+        self, step: TaskStep, schema: CompiledAgentSchema
+    ) -> List[PlanValidationError]:
         """
-        Validate step inputs against the agent's inputs_schema.
+        Validate step inputs against the compiled inputs schema.
 
         Checks:
         - Required fields are present
@@ -247,23 +239,14 @@ class PlanValidator:
         """
         errors: List[PlanValidationError] = []
 
-        registry = await self._get_registry()
-        agent_config = registry.get_agent_config(step.agent_type)
-
-        if not agent_config or not agent_config.inputs_schema:
+        if not schema.has_inputs_schema:
             return errors
 
-        inputs_schema = agent_config.inputs_schema
         provided_inputs = step.inputs if step.inputs else {}
         provided_keys = set(provided_inputs.keys())
 
         # Check for required fields
-        required_fields = []
-        for field_name, spec in inputs_schema.items():
-            if isinstance(spec, dict) and spec.get("required", False):
-                required_fields.append(field_name)
-
-        for field_name in required_fields:
+        for field_name in schema.required:
             if field_name not in provided_keys:
                 # Check if there's a similar field name (common mistake)
                 similar = self._find_similar_field(field_name, provided_keys)
@@ -281,29 +264,28 @@ class PlanValidator:
                 )
 
         # Check for invalid field names
-        schema_fields = set(inputs_schema.keys())
-        for provided_field in provided_keys:
-            if provided_field not in schema_fields:
-                # Find the closest matching field for suggestion
-                closest = self._find_closest_field(provided_field, schema_fields)
-                suggestion = f"Valid inputs: {', '.join(sorted(schema_fields))}"
-                if closest:
-                    suggestion = f"Use '{closest}' instead of '{provided_field}'"
+        for provided_field in provided_keys - schema.input_fields:
+            # Find the closest matching field for suggestion
+            closest = schema.input_matcher.closest(provided_field)
+            suggestion = f"Valid inputs: {schema.input_matcher.listing}"
+            if closest:
+                suggestion = f"Use '{closest}' instead of '{provided_field}'"
 
-                errors.append(
-                    PlanValidationError(
-                        step_id=step.id,
-                        field=provided_field,
-                        message=f"Invalid input field '{provided_field}' for {step.agent_type}",
-                        suggestion=suggestion,
-                    )
+            errors.append(
+                PlanValidationError(
+                    step_id=step.id,
+                    field=provided_field,
+                    message=f"Invalid input field '{provided_field}' for {step.agent_type}",
+                    suggestion=suggestion,
                 )
+            )
 
         # Check enum constraints and type correctness
-        for field_name, spec in inputs_schema.items():
-            if not isinstance(spec, dict) or field_name not in provided_inputs:
+        for check in schema.field_checks:
+            if check.name not in provided_inputs:
                 continue
 
+            field_name = check.name
             value = provided_inputs[field_name]
 
             # Skip template variables - they'll be resolved at runtime
@@ -311,58 +293,30 @@ class PlanValidator:
                 continue
 
             # Enum validation
-            if "enum" in spec:
-                allowed_values = spec["enum"]
-                if value not in allowed_values:
-                    errors.append(
-                        PlanValidationError(
-                            step_id=step.id,
-                            field=field_name,
-                            message=f"Invalid value '{value}' for {field_name} in {step.agent_type}",
-                            suggestion=f"Allowed values: {', '.join(str(v) for v in allowed_values)}",
-                        )
+            if check.enum is not None and value not in check.enum:
+                errors.append(
+                    PlanValidationError(
+                        step_id=step.id,
+                        field=field_name,
+                        message=f"Invalid value '{value}' for {field_name} in {step.agent_type}",
+                        suggestion=f"Allowed values: {', '.join(str(v) for v in check.enum)}",
                     )
+                )
 
             # Type validation
-            expected_type = spec.get("type")
-            if expected_type and expected_type != "any":
-                type_error = self._check_input_type(value, expected_type)
-                if type_error:
-                    errors.append(
-                        PlanValidationError(
-                            step_id=step.id,
-                            field=field_name,
-                            message=f"Wrong type for '{field_name}' in {step.agent_type}: {type_error}",
-                            suggestion=self._type_fix_suggestion(field_name, value, expected_type),
-                        )
+            if check.python_types is not None and not isinstance(value, check.python_types):
+                type_error = f"expected {check.expected_type}, got {type(value).__name__}"
+                errors.append(
+                    PlanValidationError(
+                        step_id=step.id,
+                        field=field_name,
+                        message=f"Wrong type for '{field_name}' in {step.agent_type}: {type_error}",
+                        suggestion=self._type_fix_suggestion(field_name, value, check.expected_type),
                     )
+                )
 
         return errors
 
-    @staticmethod
-    def _check_input_type(value: Any, expected_type: str) -> Optional[str]:
-        """Check if a value matches the expected schema type. Returns error message or None."""
-        type_map = {
-            "string": (str,),
-            "str": (str,),
-            "integer": (int,),
-            "int": (int,),
-            "number": (int, float),
-            "float": (int, float),
-            "boolean": (bool,),
-            "bool": (bool,),
-            "array": (list,),
-            "list": (list,),
-            "object": (dict,),
-            "dict": (dict,),
-        }
-        expected_python_types = type_map.get(expected_type.lower())
-        if expected_python_types is None:
-            return None  # Unknown type, skip
-        if not isinstance(value, expected_python_types):
-            return f"expected {expected_type}, got {type(value).__name__}"
-        return None
-
     @staticmethod
     def _type_fix_suggestion(field_name: str, value: Any, expected_type: str) -> str:
         """Generate an actionable suggestion for fixing a type mismatch."""
@@ -379,8 +333,9 @@ class PlanValidator:
     def _validate_template_references(
         self,
         step: TaskStep,
+        position: int,
         valid_step_ids: Set[str],
-        step_outputs: Dict[str, Set[str]],
+        step_outputs: Dict[str, Tuple[int, CompiledAgentSchema]],
     ) -> List[PlanValidationError]:
         """
         Validate template references in step inputs.
@@ -388,69 +343,65 @@ class PlanValidator:
         Checks:
         - Referenced steps exist
         - Referenced output fields are valid for the source step's agent type
+          (for steps up to and including this one; later steps are not checked)
         """
         errors: List[PlanValidationError] = []
 
         if not step.inputs:
             return errors
 
-        # Convert inputs to string to find all template references
-        import json
-        inputs_str = json.dumps(step.inputs)
-
-        # Pattern: {{step_ref.outputs.field_name}} or {{step_ref.output}}
-        # Also handle {{step_name.outputs.field_name}}
-        template_pattern = r'\{\{([a-zA-Z][a-zA-Z0-9_]*)\.(outputs?)(\.(\w+))?\}\}'
+        for text in _template_strings(step.inputs):
+            for match in _TEMPLATE_REF.finditer(text):
+                ref_step = match.group(1)  # e.g., "step_1" or "research"
+                outputs_part = match.group(2)  # "output" or "outputs"
+                field_name = match.group(4)  # e.g., "results" or None
 
-        for match in re.finditer(template_pattern, inputs_str):
-            ref_step = match.group(1)  # e.g., "step_1" or "research"
-            outputs_part = match.group(2)  # "output" or "outputs"
-            field_name = match.group(4)  # e.g., "results" or None
-
-            # Check step reference exists
-            if ref_step not in valid_step_ids:
-                errors.append(
-                    PlanValidationError(
-                        step_id=step.id,
-                        field="inputs",
-                        message=f"Template references non-existent step '{ref_step}'",
-                        suggestion=f"Valid step IDs: {', '.join(sorted(valid_step_ids))}",
+                # Check step reference exists
+                if ref_step not in valid_step_ids:
+                    errors.append(
+                        PlanValidationError(
+                            step_id=step.id,
+                            field="inputs",
+                            message=f"Template references non-existent step '{ref_step}'",
+                            suggestion=f"Valid step IDs: {', '.join(sorted(valid_step_ids))}",
+                        )
                     )
-                )
-                continue
+                    continue
 
-            # Check for common syntax error: {{step_X.output}} (missing 's' and field)
-            if outputs_part == "output" and not field_name:
-                errors.append(
-                    PlanValidationError(
-                        step_id=step.id,
-                        field="inputs",
-                        message=f"Invalid template syntax '{{{{{ref_step}.output}}}}'",
-                        suggestion=f"Use '{{{{{ref_step}.outputs.<field_name>}}}}' with a specific field name",
+                # Check for common syntax error: {{step_X.output}} (missing 's' and field)
+                if outputs_part == "output" and not field_name:
+                    errors.append(
+                        PlanValidationError(
+                            step_id=step.id,
+                            field="inputs",
+                            message=f"Invalid template syntax '{{{{{ref_step}.output}}}}'",
+                            suggestion=f"Use '{{{{{ref_step}.outputs.<field_name>}}}}' with a specific field name",
+                        )
                     )
-                )
-                continue
+                    continue
 
-            # Check that outputs has a field name
-            if outputs_part == "outputs" and not field_name:
-                valid_outputs = step_outputs.get(ref_step, set())
-                errors.append(
-                    PlanValidationError(
-                        step_id=step.id,
-                        field="inputs",
-                        message=f"Template '{{{{{ref_step}.outputs}}}}' missing field name",
-                        suggestion=f"Add field name: '{{{{{ref_step}.outputs.<field>}}}}' - valid fields: {', '.join(sorted(valid_outputs))}",
+                ref_position, ref_schema = step_outputs[ref_step]
+                checkable = ref_position <= position
+                valid_outputs = ref_schema.output_matcher
+
+                # Check that outputs has a field name
+                if outputs_part == "outputs" and not field_name:
+                    listing = valid_outputs.listing if checkable else ""
+                    errors.append(
+                        PlanValidationError(
+                            step_id=step.id,
+                            field="inputs",
+                            message=f"Template '{{{{{ref_step}.outputs}}}}' missing field name",
+                            suggestion=f"Add field name: '{{{{{ref_step}.outputs.<field>}}}}' - valid fields: {listing}",
+                        )
                     )
-                )
-                continue
+                    continue
 
-            # Check that referenced output field is valid for the source step
-            if field_name and ref_step in step_outputs:
-                valid_outputs = step_outputs[ref_step]
-                if field_name not in valid_outputs:
+                # Check that referenced output field is valid for the source step
+                if checkable and field_name and field_name not in ref_schema.output_fields:
                     # Find closest matching field
-                    closest = self._find_closest_field(field_name, valid_outputs)
-                    suggestion = f"Valid outputs for {ref_step}: {', '.join(sorted(valid_outputs))}"
+                    closest = valid_outputs.closest(field_name)
+                    suggestion = f"Valid outputs for {ref_step}: {valid_outputs.listing}"
                     if closest:
                         suggestion = f"Use '{closest}' instead of '{field_name}'"
 
@@ -491,46 +442,6 @@ class PlanValidator:
 
         return None
 
-    def _find_closest_field(
-        self, target: str, candidates: Set[str]
-    ) -> Optional[str]:
-        """Find the closest matching field name using simple heuristics."""
-        if not candidates:
-            return None
-
-        target_lower = target.lower()
-
-        # Exact match (case insensitive)
-        for candidate in candidates:
-            if candidate.lower() == target_lower:
-                return candidate
-
-        # Prefix match
-        for candidate in candidates:
-            if candidate.lower().startswith(target_lower) or target_lower.startswith(
-                candidate.lower()
-            ):
-                return candidate
-
-        # Contains match
-        for candidate in candidates:
-            if target_lower in candidate.lower() or candidate.lower() in target_lower:
-                return candidate
-
-        # Word overlap
-        target_words = set(target_lower.replace("_", " ").split())
-        best_match = None
-        best_overlap = 0
-
-        for candidate in candidates:
-            candidate_words = set(candidate.lower().replace("_", " ").split())
-            overlap = len(target_words & candidate_words)
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_match = candidate
-
-        return best_match
-
     async def validate_step_inputs_at_runtime(
         self, step: TaskStep
     ) -> PlanValidationResult:
@@ -547,10 +458,10 @@ class PlanValidator:
         Returns:
             PlanValidationResult
         """
-        errors = await self._validate_step_inputs(step)
+        schema = await self._compiled(step.agent_type)
+        errors = self._input_errors(step, schema)
 
         # Also validate agent type
-        agent_errors, _ = await self._validate_agent_type(step)
-        errors.extend(agent_errors)
+        errors.extend(self._agent_type_errors(step, schema))
 
         return PlanValidationResult(valid=len(errors) == 0, errors=errors)
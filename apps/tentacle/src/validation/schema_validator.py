@@ -6,6 +6,8 @@ declarative schema definitions. Integrates with the Orchestrator for
 pre/post-execution validation.
 """
 
+import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Callable
 from enum import Enum
@@ -122,6 +124,81 @@ def _dict_to_list(d: dict) -> Optional[list]:
     return None
 
 
+def _type_name(value: Any) -> str:
+    """Get the schema type name for a Python value."""
+    if isinstance(value, bool):  # Must check before int
+        return "bool"
+    elif isinstance(value, int):
+        return "int"
+    elif isinstance(value, float):
+        return "float"
+    elif isinstance(value, str):
+        return "string"
+    elif isinstance(value, list):
+        return "list"
+    elif isinstance(value, dict):
+        return "dict"
+    return "any"
+
+
+# Schema type -> predicate equivalent to _types_match(_type_name(value), type)
+_TYPE_MATCHERS: Dict[str, Callable[[Any], bool]] = {
+    "bool": lambda v: isinstance(v, bool),
+    "int": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "string": lambda v: isinstance(v, str),
+    "list": lambda v: isinstance(v, list),
+    "dict": lambda v: isinstance(v, dict),
+}
+
+
+def _never(value: Any) -> bool:
+    return False
+
+
+# Shared empty result for fields that pass without findings; never mutated
+_NO_ERRORS: List[ValidationError] = []
+
+
+# (errors, warnings, coerced_value) for one field value
+FieldCheck = Callable[[Any], Tuple[List[ValidationError], List[ValidationError], Any]]
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A schema turned into per-field check closures."""
+
+    # (field, has_default, default) for required fields, in schema order
+    required: Tuple[Tuple[str, bool, Any], ...]
+    fields: Dict[str, FieldCheck]
+    # (field, nullable, expected_type, matches) for output checking
+    outputs: Tuple[Tuple[str, bool, str, Callable[[Any], bool]], ...]
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """Canonical JSON of a schema, used as its compile-cache key."""
+    return json.dumps(schema, sort_keys=True, default=repr)
+
+
+_compiled_schemas: "OrderedDict[Tuple[str, bool, int], CompiledSchema]" = OrderedDict()
+# id(schema) -> (schema, compiled); holding the schema keeps its id from being reused
+_compiled_by_identity: "OrderedDict[Tuple[int, bool, int], Tuple[Dict[str, Any], CompiledSchema]]" = OrderedDict()
+_MAX_COMPILED_SCHEMAS = 512
+
+
+def _remember(cache: OrderedDict, key: Any, value: Any) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _MAX_COMPILED_SCHEMAS:
+        cache.popitem(last=False)
+
+
+def clear_compiled_schemas() -> None:
+    """Drop every cached compilation (needed after editing a schema dict in place)."""
+    _compiled_schemas.clear()
+    _compiled_by_identity.clear()
+
+
 class SchemaValidator:
     """
     Validates data against schema definitions.
@@ -146,14 +223,195 @@ class SchemaValidator:
         ("dict", "list"): _dict_to_list,
     }
 
-    def __init__(self, enable_coercion: bool = True):
+    def __init__(self, enable_coercion: bool = True, compiled: bool = True):
         """
         Initialize validator.
 
         Args:
             enable_coercion: If True, attempt safe type coercions
+            compiled: If True, validate with cached compiled schemas; if
+                False, interpret the schema dict on every call (reference
+                behaviour, kept for benchmarking and comparison)
         """
         self.enable_coercion = enable_coercion
+        self.compiled = compiled
+
+    def compile(self, schema: Dict[str, Dict[str, Any]]) -> CompiledSchema:
+        """
+        Compile *schema* into check closures, reusing a cached compilation.
+
+        Compilations are shared by all validators and keyed on the schema's
+        canonical JSON, so equal schemas from different sources compile once.
+        A schema dict seen before is recognised by identity without
+        re-serialising it: treat schemas as immutable, or call
+        ``clear_compiled_schemas()`` after editing one in place.
+        """
+        coercions_id = id(self.SAFE_COERCIONS)
+        identity_key = (id(schema), self.enable_coercion, coercions_id)
+        seen = _compiled_by_identity.get(identity_key)
+        if seen is not None and seen[0] is schema:
+            return seen[1]
+
+        key = (schema_fingerprint(schema), self.enable_coercion, coercions_id)
+        compiled = _compiled_schemas.get(key)
+        if compiled is not None:
+            _remember(_compiled_schemas, key, compiled)
+            _remember(_compiled_by_identity, identity_key, (schema, compiled))
+            return compiled
+
+        compiled = CompiledSchema(
+            required=tuple(
+                (name, "default" in spec, spec.get("default"))
+                for name, spec in schema.items()
+                if spec.get("required", False)
+            ),
+            fields={name: self._compile_field(name, spec) for name, spec in schema.items()},
+            outputs=tuple(
+                (
+                    name,
+                    spec.get("nullable", False),
+                    spec.get("type", "any"),
+                    _TYPE_MATCHERS.get(spec.get("type", "any"), _never),
+                )
+                for name, spec in schema.items()
+            ),
+        )
+        _remember(_compiled_schemas, key, compiled)
+        _remember(_compiled_by_identity, identity_key, (schema, compiled))
+        return compiled
+
+    def _compile_field(self, field_name: str, spec: Dict[str, Any]) -> FieldCheck:
+        """Build the check for one field; mirrors _validate_field."""
+        nullable = spec.get("nullable", False)
+        required = spec.get("required", False)
+        expected_type = spec.get("type", "any")
+        check_type = expected_type != "any"
+        matches = _TYPE_MATCHERS.get(expected_type, _never)
+
+        # Source type -> coercion into expected_type
+        coercions: Optional[Dict[str, Callable[[Any], Optional[Any]]]] = None
+        if self.enable_coercion:
+            coercions = {
+                source: fn
+                for (source, target), fn in self.SAFE_COERCIONS.items()
+                if target == expected_type
+            }
+
+        has_enum = "enum" in spec
+        enum = spec.get("enum")
+        numeric = expected_type in ("int", "float")
+        has_min, minimum = "min" in spec, spec.get("min")
+        has_max, maximum = "max" in spec, spec.get("max")
+        sized = expected_type in ("string", "list")
+        has_min_length, min_length = "min_length" in spec, spec.get("min_length")
+        has_max_length, max_length = "max_length" in spec, spec.get("max_length")
+        mismatch_message = f"Type mismatch for '{field_name}'"
+        constrained = (
+            has_enum
+            or (numeric and (has_min or has_max))
+            or (sized and (has_min_length or has_max_length))
+        )
+
+        def check(value: Any) -> Tuple[List[ValidationError], List[ValidationError], Any]:
+            # Fast path: right type and nothing else to check
+            if value is not None and not constrained and (not check_type or matches(value)):
+                return _NO_ERRORS, _NO_ERRORS, value
+
+            errors: List[ValidationError] = []
+            warnings: List[ValidationError] = []
+
+            if value is None:
+                if not nullable and required:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Field '{field_name}' cannot be null",
+                        )
+                    )
+                return errors, warnings, None
+
+            coerced_value = value
+
+            # Fast path: no type name lookup or coercion when the type matches
+            if check_type and not matches(value):
+                actual_type = _type_name(value)
+                coerced = None
+                coerce = coercions.get(actual_type) if coercions is not None else None
+                if coerce is not None:
+                    try:
+                        coerced = coerce(value)
+                    except (ValueError, TypeError):
+                        coerced = None
+                if coerced is not None:
+                    logger.debug(
+                        "Coerced field value",
+                        field=field_name,
+                        from_type=actual_type,
+                        to_type=expected_type,
+                    )
+                    coerced_value = coerced
+                    warnings.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Coerced from {actual_type} to {expected_type}",
+                            severity="warning",
+                        )
+                    )
+                else:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=mismatch_message,
+                            expected=expected_type,
+                            actual=actual_type,
+                        )
+                    )
+
+            if has_enum and value not in enum:
+                errors.append(
+                    ValidationError(
+                        field=field_name,
+                        message=f"Value must be one of {enum}",
+                        expected=str(enum),
+                        actual=str(value),
+                    )
+                )
+
+            if numeric and isinstance(value, (int, float)):
+                if has_min and value < minimum:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Value {value} is below minimum {minimum}",
+                        )
+                    )
+                if has_max and value > maximum:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Value {value} exceeds maximum {maximum}",
+                        )
+                    )
+
+            if sized and hasattr(value, "__len__"):
+                if has_min_length and len(value) < min_length:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Length {len(value)} is below minimum {min_length}",
+                        )
+                    )
+                if has_max_length and len(value) > max_length:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Length {len(value)} exceeds maximum {max_length}",
+                        )
+                    )
+
+            return errors, warnings, coerced_value
+
+        return check
 
     def validate_inputs(
         self,
@@ -179,6 +437,109 @@ class SchemaValidator:
         warnings: List[ValidationError] = []
         coerced = dict(data) if self.enable_coercion else None
 
+        if self.compiled:
+            self._check_inputs_compiled(self.compile(schema), data, errors, warnings, coerced)
+        else:
+            self._check_inputs_interpreted(schema, data, errors, warnings, coerced)
+
+        valid = len(errors) == 0
+
+        if not valid:
+            logger.warning(
+                "Input validation failed",
+                agent_type=agent_type,
+                error_count=len(errors),
+                errors=[e.to_dict() for e in errors],
+            )
+
+        return ValidationResult(
+            valid=valid,
+            errors=errors,
+            warnings=warnings,
+            coerced_data=coerced if valid else None,
+        )
+
+    def validate_outputs(
+        self,
+        data: Dict[str, Any],
+        schema: Dict[str, Dict[str, Any]],
+        agent_type: str = "unknown",
+    ) -> ValidationResult:
+        """
+        Validate output data against schema.
+
+        Output validation is less strict - we don't fail on missing fields
+        but do type-check provided fields.
+        """
+        if not schema:
+            return ValidationResult(valid=True)
+
+        errors: List[ValidationError] = []
+        warnings: List[ValidationError] = []
+
+        if self.compiled:
+            self._check_outputs_compiled(self.compile(schema), data, errors, warnings)
+        else:
+            self._check_outputs_interpreted(schema, data, errors, warnings)
+
+        return ValidationResult(
+            valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+        )
+
+    def _check_inputs_compiled(
+        self,
+        compiled: CompiledSchema,
+        data: Dict[str, Any],
+        errors: List[ValidationError],
+        warnings: List[ValidationError],
+        coerced: Optional[Dict[str, Any]],
+    ) -> None:
+        for field_name, has_default, default in compiled.required:
+            if field_name not in data:
+                if has_default:
+                    if coerced is not None:
+                        coerced[field_name] = default
+                else:
+                    errors.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Required field '{field_name}' is missing",
+                            expected="value",
+                            actual="missing",
+                        )
+                    )
+
+        fields = compiled.fields
+        for field_name, value in data.items():
+            check = fields.get(field_name)
+            if check is None:
+                # Unknown field - warn but don't error (extensibility)
+                warnings.append(
+                    ValidationError(
+                        field=field_name,
+                        message=f"Unknown field '{field_name}' not in schema",
+                        severity="warning",
+                    )
+                )
+                continue
+
+            field_errors, field_warnings, coerced_value = check(value)
+            errors.extend(field_errors)
+            warnings.extend(field_warnings)
+
+            if coerced is not None and coerced_value is not None:
+                coerced[field_name] = coerced_value
+
+    def _check_inputs_interpreted(
+        self,
+        schema: Dict[str, Dict[str, Any]],
+        data: Dict[str, Any],
+        errors: List[ValidationError],
+        warnings: List[ValidationError],
+        coerced: Optional[Dict[str, Any]],
+    ) -> None:
         # Check for required fields
         for field_name, spec in schema.items():
             if spec.get("required", False) and field_name not in data:
@@ -218,41 +579,43 @@ class SchemaValidator:
             if coerced is not None and coerced_value is not None:
                 coerced[field_name] = coerced_value
 
-        valid = len(errors) == 0
-
-        if not valid:
-            logger.warning(
-                "Input validation failed",
-                agent_type=agent_type,
-                error_count=len(errors),
-                errors=[e.to_dict() for e in errors],
-            )
-
-        return ValidationResult(
-            valid=valid,
-            errors=errors,
-            warnings=warnings,
-            coerced_data=coerced if valid else None,
-        )
-
-    def validate_outputs(
+    def _check_outputs_compiled(
         self,
+        compiled: CompiledSchema,
         data: Dict[str, Any],
-        schema: Dict[str, Dict[str, Any]],
-        agent_type: str = "unknown",
-    ) -> ValidationResult:
-        """
-        Validate output data against schema.
-
-        Output validation is less strict - we don't fail on missing fields
-        but do type-check provided fields.
-        """
-        if not schema:
-            return ValidationResult(valid=True)
+        errors: List[ValidationError],
+        warnings: List[ValidationError],
+    ) -> None:
+        for field_name, nullable, expected_type, matches in compiled.outputs:
+            if field_name not in data:
+                if not nullable:
+                    warnings.append(
+                        ValidationError(
+                            field=field_name,
+                            message=f"Expected output field '{field_name}' is missing",
+                            severity="warning",
+                        )
+                    )
+                continue
 
-        errors: List[ValidationError] = []
-        warnings: List[ValidationError] = []
+            value = data[field_name]
+            if expected_type != "any" and value is not None and not matches(value):
+                errors.append(
+                    ValidationError(
+                        field=field_name,
+                        message="Output type mismatch",
+                        expected=expected_type,
+                        actual=_type_name(value),
+                    )
+                )
 
+    def _check_outputs_interpreted(
+        self,
+        schema: Dict[str, Dict[str, Any]],
+        data: Dict[str, Any],
+        errors: List[ValidationError],
+        warnings: List[ValidationError],
+    ) -> None:
         for field_name, spec in schema.items():
             if field_name not in data:
                 if not spec.get("nullable", False):
@@ -280,12 +643,6 @@ class SchemaValidator:
                         )
                     )
 
-        return ValidationResult(
-            valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-        )
-
     def _validate_field(
         self,
         field_name: str,
@@ -398,19 +755,7 @@ class SchemaValidator:
 
     def _get_type_name(self, value: Any) -> str:
         """Get the schema type name for a Python value."""
-        if isinstance(value, bool):  # Must check before int
-            return "bool"
-        elif isinstance(value, int):
-            return "int"
-        elif isinstance(value, float):
-            return "float"
-        elif isinstance(value, str):
-            return "string"
-        elif isinstance(value, list):
-            return "list"
-        elif isinstance(value, dict):
-            return "dict"
-        return "any"
+        return _type_name(value)
 
     def _types_match(self, actual: str, expected: str) -> bool:
         """Check if types match, with some flexibility."""
@@ -3,6 +3,7 @@
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from src.domain.allowed_hosts import HostCheck
 from src.plugins.http_plugin import http_request_handler, HttpPluginError
 from src.infrastructure.allowed_hosts.allowed_host_service import AllowedHostService
 # Import model to register with Base.metadata
@@ -33,7 +34,9 @@ async def test_http_plugin_allowed_host_from_db(test_db):
         # Also need to mock the host service used in http_plugin
         with patch('src.plugins.http_plugin.AllowedHostService') as mock_service_class:
             mock_service = AsyncMock()
-            mock_service.is_host_allowed = AsyncMock(return_value=(True, None))
+            mock_service.check_host = AsyncMock(
+                return_value=HostCheck(True, None, "httpbin.org", ["54.204.39.132"])
+            )
             mock_service_class.return_value = mock_service
 
             # Test HTTP plugin with allowed host
@@ -52,7 +55,7 @@ async def test_http_plugin_denied_host_from_db(test_db):
     # Don't add the host to allowlist - mock service returns not allowed
     with patch('src.plugins.http_plugin.AllowedHostService') as mock_service_class:
         mock_service = AsyncMock()
-        mock_service.is_host_allowed = AsyncMock(return_value=(False, "Host not in allowlist"))
+        mock_service.check_host = AsyncMock(return_value=HostCheck(False, "Host not in allowlist"))
         mock_service_class.return_value = mock_service
 
         # Test HTTP plugin with disallowed host
@@ -78,7 +81,7 @@ async def test_http_plugin_denylist_takes_precedence(test_db):
     # Mock the service to reject localhost even for http_plugin
     with patch('src.plugins.http_plugin.AllowedHostService') as mock_service_class:
         mock_service = AsyncMock()
-        mock_service.is_host_allowed = AsyncMock(return_value=(False, "Host is on denylist"))
+        mock_service.check_host = AsyncMock(return_value=HostCheck(False, "Host is on denylist"))
         mock_service_class.return_value = mock_service
 
         # Plugin should reject it
@@ -96,7 +99,7 @@ async def test_http_plugin_https_required(test_db):
     """Test that HTTP plugin requires HTTPS."""
     with patch('src.plugins.http_plugin.AllowedHostService') as mock_service_class:
         mock_service = AsyncMock()
-        mock_service.is_host_allowed = AsyncMock(return_value=(False, "Only HTTPS URLs are allowed"))
+        mock_service.check_host = AsyncMock(return_value=HostCheck(False, "Only HTTPS URLs are allowed"))
         mock_service_class.return_value = mock_service
 
         with pytest.raises(HttpPluginError) as exc_info:
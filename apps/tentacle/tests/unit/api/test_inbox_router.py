@@ -127,6 +127,7 @@ class TestListInbox:
             q=None,
             limit=50,
             offset=0,
+            cursor=None,
             user=mock_user,
         )
 
@@ -140,6 +141,7 @@ class TestListInbox:
             exclude_archived=True,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -150,6 +152,7 @@ class TestListInbox:
             q=None,
             limit=10,
             offset=5,
+            cursor=None,
             user=mock_user,
         )
 
@@ -161,6 +164,7 @@ class TestListInbox:
             exclude_archived=False,
             limit=10,
             offset=5,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -1,7 +1,11 @@
 import pytest
 import asyncio
 
-from src.plugins.http_plugin import http_request_handler, HttpPluginError
+import httpx
+
+from src.domain.allowed_hosts import HostCheck
+from src.plugins.http_plugin import _pin_to_address, http_request_handler, HttpPluginError
+from src.plugins.http_transport import OutboundHttpTransport
 
 
 @pytest.mark.asyncio
@@ -15,34 +19,26 @@ async def test_http_plugin_disallow_host():
 
 @pytest.mark.asyncio
 async def test_http_plugin_allowed_host_and_mock(monkeypatch):
-    class MockResp:
-        def __init__(self):
-            self.status_code = 200
-            self.headers = {"content-type": "application/json"}
-        def json(self):
-            return {"name": "pikachu"}
-        @property
-        def text(self):
-            return "{\"name\": \"pikachu\"}"
-
-    class MockClient:
-        def __init__(self, *a, **kw):
-            pass
-        async def __aenter__(self):
-            return self
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-        async def request(self, method, url, headers=None, params=None, json=None, data=None):
-            assert "pokeapi.co" in url
-            return MockResp()
+    def handler(request):
+        # Connects to the vetted address, not a fresh DNS answer
+        assert str(request.url) == "https://104.16.0.1/api/v2/pokemon/pikachu"
+        assert request.headers["Host"] == "pokeapi.co"
+        assert request.extensions["sni_hostname"] == "pokeapi.co"
+        return httpx.Response(200, json={"name": "pikachu"})
 
     import src.plugins.http_plugin as hp
-    monkeypatch.setattr(hp.httpx, "AsyncClient", MockClient)
+    monkeypatch.setattr(
+        hp,
+        "outbound_transport",
+        OutboundHttpTransport(max_concurrency_per_host=4, transport=httpx.MockTransport(handler)),
+    )
 
     # Mock the DB-based allowlist check
     from unittest.mock import AsyncMock
     mock_service = AsyncMock()
-    mock_service.is_host_allowed = AsyncMock(return_value=(True, None))
+    mock_service.check_host = AsyncMock(
+        return_value=HostCheck(True, None, "pokeapi.co", ["104.16.0.1", "2606:4700::6810:1"])
+    )
     monkeypatch.setattr(hp, "AllowedHostService", lambda: mock_service)
 
     res = await http_request_handler({
@@ -52,3 +48,11 @@ async def test_http_plugin_allowed_host_and_mock(monkeypatch):
     assert res["status"] == 200
     assert res["json"]["name"] == "pikachu"
 
+
+def test_pin_to_address_brackets_ipv6_and_keeps_port():
+    from urllib.parse import urlparse
+
+    url, host_header = _pin_to_address(urlparse("https://api.example.com:8443/v1?q=1"), "2606:4700::1")
+
+    assert url == "https://[2606:4700::1]:8443/v1?q=1"
+    assert host_header == "api.example.com:8443"
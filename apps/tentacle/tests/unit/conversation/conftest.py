@@ -0,0 +1,71 @@
+"""Fixtures for ConversationStore unit tests.
+
+Provides a recording session that captures executed statements so they can
+be compiled against the PostgreSQL dialect without a database.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.database.conversation_store import ConversationStore
+
+
+class RecordingSession:
+    """Async session stand-in that records executed statements.
+
+    *results* is a list of row lists returned by successive ``execute``
+    calls; once exhausted, further calls return no rows.
+    """
+
+    def __init__(self, results=None):
+        self.statements = []
+        self._results = list(results or [])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        rows = self._results.pop(0) if self._results else []
+        result = MagicMock()
+        result.all.return_value = rows
+        result.scalars.return_value.all.return_value = rows
+        result.scalar_one_or_none.return_value = None
+        result.rowcount = len(rows)
+        return result
+
+    async def commit(self):
+        pass
+
+    def add(self, obj):
+        pass
+
+
+@pytest.fixture
+def compile_pg():
+    """Compile a SQLAlchemy statement to PostgreSQL SQL text."""
+    def _compile(stmt, literal_binds: bool = False) -> str:
+        return str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": literal_binds},
+            )
+        )
+    return _compile
+
+
+@pytest.fixture
+def session():
+    return RecordingSession()
+
+
+@pytest.fixture
+def store(session):
+    db = MagicMock()
+    db.get_session = lambda: session
+    return ConversationStore(db)
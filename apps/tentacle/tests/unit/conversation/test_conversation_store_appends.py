@@ -0,0 +1,147 @@
+"""Unit tests for ConversationStore message appends and keyset reads."""
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.database.conversation_store import (
+    Cost,
+    MessageContent,
+    MessageData,
+    MessageMetadata,
+    decode_keyset_cursor,
+    message_cursor,
+)
+from src.database.models import MessageDirection, MessageType
+
+
+def _tool_result(text: str, latency_ms=None, tokens=None, cost=None) -> MessageData:
+    return MessageData(
+        agent_id="agent-1",
+        message_type=MessageType.TOOL_RESPONSE,
+        direction=MessageDirection.INBOUND,
+        content=MessageContent(role="tool", text=text),
+        metadata=MessageMetadata(latency_ms=latency_ms, tokens=tokens),
+        cost=Cost(cost) if cost is not None else None,
+    )
+
+
+class TestAddMessages:
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_multi_row_insert(self, store, session, compile_pg):
+        written = await store.add_messages(
+            str(uuid.uuid4()), [_tool_result(f"chunk {i}") for i in range(3)]
+        )
+
+        assert written == 3
+        sql = [compile_pg(s) for s in session.statements]
+        inserts = [s for s in sql if s.startswith("INSERT INTO messages")]
+        assert len(inserts) == 1
+        assert inserts[0].count("(%(id_m") == 3
+
+    @pytest.mark.asyncio
+    async def test_metrics_updated_once_per_batch(self, store, session, compile_pg):
+        await store.add_messages(
+            str(uuid.uuid4()), [_tool_result("a"), _tool_result("b")]
+        )
+
+        sql = [compile_pg(s) for s in session.statements]
+        metric_updates = [s for s in sql if s.startswith("UPDATE conversation_metrics")]
+        assert len(metric_updates) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_a_no_op(self, store, session):
+        assert await store.add_messages(str(uuid.uuid4()), []) == 0
+        assert session.statements == []
+
+    @pytest.mark.asyncio
+    async def test_add_message_delegates_to_batch(self, store, session, compile_pg):
+        assert await store.add_message(str(uuid.uuid4()), _tool_result("x")) is True
+
+        sql = [compile_pg(s) for s in session.statements]
+        assert sum(s.startswith("INSERT INTO messages") for s in sql) == 1
+
+
+class TestAtomicMetrics:
+    @pytest.mark.asyncio
+    async def test_counters_increment_in_database(self, store, session, compile_pg):
+        await store.add_messages(
+            str(uuid.uuid4()),
+            [
+                _tool_result("a", tokens={"total": 10}, cost=0.5),
+                _tool_result("b", tokens={"total_tokens": 5}),
+            ],
+        )
+
+        update = next(
+            compile_pg(s, literal_binds=True) for s in session.statements
+            if compile_pg(s).startswith("UPDATE conversation_metrics")
+        )
+        assert "total_messages=(conversation_metrics.total_messages + 2)" in update
+        assert "total_tokens=(conversation_metrics.total_tokens + 15)" in update
+        assert "total_cost=(conversation_metrics.total_cost + 0.5)" in update
+        assert "RETURNING conversation_metrics.total_messages" in update
+        # No read-modify-write: metrics are never selected first
+        assert not any(
+            compile_pg(s).startswith("SELECT conversation_metrics") for s in session.statements
+        )
+
+    @pytest.mark.asyncio
+    async def test_latency_uses_running_average_and_greatest(self, store, session, compile_pg):
+        await store.add_messages(
+            str(uuid.uuid4()), [_tool_result("a", latency_ms=100), _tool_result("b", latency_ms=300)]
+        )
+
+        update = next(
+            compile_pg(s, literal_binds=True) for s in session.statements
+            if compile_pg(s).startswith("UPDATE conversation_metrics")
+        )
+        assert "average_latency_ms=CASE WHEN (conversation_metrics.average_latency_ms > 0)" in update
+        assert "max_latency_ms=greatest(conversation_metrics.max_latency_ms, 300)" in update
+
+    @pytest.mark.asyncio
+    async def test_latency_untouched_without_measurements(self, store, session, compile_pg):
+        await store.add_messages(str(uuid.uuid4()), [_tool_result("a")])
+
+        update = next(
+            compile_pg(s) for s in session.statements
+            if compile_pg(s).startswith("UPDATE conversation_metrics")
+        )
+        assert "average_latency_ms" not in update
+        assert "max_latency_ms" not in update
+
+
+class TestGetMessagesKeyset:
+    @pytest.mark.asyncio
+    async def test_unbounded_by_default(self, store, session, compile_pg):
+        await store.get_messages(str(uuid.uuid4()))
+
+        sql = compile_pg(session.statements[0])
+        assert "ORDER BY messages.timestamp ASC, messages.id ASC" in sql
+        assert "LIMIT" not in sql
+
+    @pytest.mark.asyncio
+    async def test_forward_page_after_cursor(self, store, session, compile_pg):
+        cursor = message_cursor(SimpleNamespace(timestamp=datetime(2026, 2, 1), id=uuid.uuid4()))
+        await store.get_messages(str(uuid.uuid4()), limit=20, cursor=cursor)
+
+        sql = compile_pg(session.statements[0])
+        assert "(messages.timestamp, messages.id) >" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_newest_first_walks_backward(self, store, session, compile_pg):
+        cursor = message_cursor(SimpleNamespace(timestamp=datetime(2026, 2, 1), id=uuid.uuid4()))
+        await store.get_messages(str(uuid.uuid4()), limit=20, cursor=cursor, newest_first=True)
+
+        sql = compile_pg(session.statements[0])
+        assert "(messages.timestamp, messages.id) <" in sql
+        assert "ORDER BY messages.timestamp DESC, messages.id DESC" in sql
+
+    def test_message_cursor_round_trip(self):
+        msg = SimpleNamespace(timestamp=datetime(2026, 2, 1) + timedelta(microseconds=7), id=uuid.uuid4())
+        at, msg_id = decode_keyset_cursor(message_cursor(msg))
+        assert at == msg.timestamp
+        assert msg_id == msg.id
@@ -0,0 +1,142 @@
+"""Unit tests for the ConversationStore inbox projection.
+
+Statements are captured from a recording session and compiled against the
+PostgreSQL dialect, so no database is required.
+"""
+
+import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.conversation_store import (
+    MessageContent,
+    MessageData,
+    MessageMetadata,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
+from src.database.models import InboxPriority, MessageDirection, MessageType, ReadStatus
+
+from tests.unit.conversation.conftest import RecordingSession
+
+
+def _message(role: str, text: str = "hello") -> MessageData:
+    return MessageData(
+        agent_id="inbox_chat",
+        message_type=MessageType.LLM_RESPONSE if role == "assistant" else MessageType.LLM_PROMPT,
+        direction=MessageDirection.OUTBOUND if role == "assistant" else MessageDirection.INBOUND,
+        content=MessageContent(role=role, text=text),
+        metadata=MessageMetadata(),
+    )
+
+
+class TestInboxCursor:
+    def test_round_trip(self):
+        at = datetime(2026, 2, 10, 12, 30, 15, 123456)
+        conv_id = str(uuid.uuid4())
+        decoded_at, decoded_id = decode_keyset_cursor(encode_keyset_cursor(at, conv_id))
+        assert decoded_at == at
+        assert str(decoded_id) == conv_id
+
+    def test_malformed_cursor_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_keyset_cursor("not-a-cursor")
+
+
+class TestAddMessageProjection:
+    @pytest.mark.asyncio
+    async def test_assistant_message_upserts_projection(self, store, session, compile_pg):
+        await store.add_message(str(uuid.uuid4()), _message("assistant"))
+
+        sql = [compile_pg(s) for s in session.statements]
+        upserts = [s for s in sql if s.startswith("INSERT INTO inbox_projections")]
+        assert len(upserts) == 1
+        assert "ON CONFLICT (conversation_id) DO UPDATE" in upserts[0]
+        assert "last_message_text = excluded.last_message_text" in upserts[0]
+        assert "unread_count = (inbox_projections.unread_count +" in upserts[0]
+
+    @pytest.mark.asyncio
+    async def test_user_message_resets_unread_and_keeps_title(self, store, session, compile_pg):
+        await store.add_message(str(uuid.uuid4()), _message("user"))
+
+        upsert = next(
+            compile_pg(s) for s in session.statements
+            if compile_pg(s).startswith("INSERT INTO inbox_projections")
+        )
+        assert "title = coalesce(inbox_projections.title, excluded.title)" in upsert
+        assert "last_message_text = excluded" not in upsert
+
+
+class TestGetInboxConversations:
+    @pytest.mark.asyncio
+    async def test_reads_projection_without_message_scans(self, store, session, compile_pg):
+        await store.get_inbox_conversations("user-1")
+
+        sql = compile_pg(session.statements[0])
+        assert "FROM inbox_projections JOIN conversations" in sql
+        assert "DISTINCT ON" not in sql
+        assert "ORDER BY inbox_projections.last_activity_at DESC, inbox_projections.conversation_id DESC" in sql
+        assert "OFFSET" in sql
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_keyset_instead_of_offset(self, store, session, compile_pg):
+        cursor = encode_keyset_cursor(datetime(2026, 2, 10), str(uuid.uuid4()))
+        await store.get_inbox_conversations("user-1", cursor=cursor, offset=40)
+
+        sql = compile_pg(session.statements[0])
+        assert "(inbox_projections.last_activity_at, inbox_projections.conversation_id) <" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_rows_are_mapped_with_task_data(self, store):
+        conv_id = uuid.uuid4()
+        row = MagicMock(
+            conversation_id=conv_id,
+            read_status=ReadStatus.UNREAD,
+            priority=None,
+            source="inbox",
+            title="First question",
+            last_message_text="Latest answer",
+            last_message_at=datetime(2026, 2, 10, 9, 0),
+            last_activity_at=datetime(2026, 2, 10, 9, 5),
+            unread_count=2,
+        )
+        task = MagicMock(conversation_id=conv_id, goal="Plan the trip", status="running", id=uuid.uuid4())
+        store.db.get_session = lambda: RecordingSession(results=[[row], [task]])
+
+        items = await store.get_inbox_conversations("user-1")
+
+        assert items[0]["conversation_id"] == str(conv_id)
+        assert items[0]["last_message_text"] == "Latest answer"
+        assert items[0]["last_activity_at"] == "2026-02-10T09:05:00"
+        assert items[0]["unread_count"] == 2
+        assert items[0]["task_status"] == "running"
+        assert items[0]["title"] == "Plan the trip"
+
+
+class TestProjectionMaintenance:
+    @pytest.mark.asyncio
+    async def test_read_resets_unread_counter(self, store, session, compile_pg):
+        await store.update_read_status(str(uuid.uuid4()), ReadStatus.READ)
+
+        sql = [compile_pg(s) for s in session.statements]
+        assert any(s.startswith("UPDATE inbox_projections SET unread_count") for s in sql)
+
+    @pytest.mark.asyncio
+    async def test_marking_unread_leaves_counter(self, store, session, compile_pg):
+        await store.update_read_status(str(uuid.uuid4()), ReadStatus.UNREAD)
+
+        sql = [compile_pg(s) for s in session.statements]
+        assert not any("inbox_projections" in s for s in sql)
+
+    @pytest.mark.asyncio
+    async def test_joining_inbox_rebuilds_projection(self, store, session, compile_pg):
+        await store.set_inbox_fields(
+            str(uuid.uuid4()), "user-1", ReadStatus.UNREAD, InboxPriority.NORMAL
+        )
+
+        rebuild = compile_pg(session.statements[-1])
+        assert rebuild.startswith("INSERT INTO inbox_projections")
+        assert "LEFT OUTER JOIN LATERAL" in rebuild
@@ -2,10 +2,11 @@
 
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from urllib.parse import urlparse
 
 from src.infrastructure.allowed_hosts.allowed_host_service import AllowedHostService, DENYLISTED_HOSTS
+from src.infrastructure.allowed_hosts.host_resolver import HostResolver
 from src.database.allowed_host_models import AllowedHost, Environment
 from src.interfaces.database import Database
 
@@ -103,14 +104,15 @@ async def test_is_host_allowed_success(mock_database, mock_session):
         enabled=True
     )
     result_mock = MagicMock()
-    result_mock.scalar_one_or_none.return_value = allowed_host
+    result_mock.scalars.return_value.all.return_value = [allowed_host]
     mock_session.execute.return_value = result_mock
     
-    service = AllowedHostService(database=mock_database)
-    
     # Mock DNS resolution to return a public IP
-    with patch('socket.gethostbyname', return_value='93.184.216.34'):  # example.com IP
-        is_allowed, error = await service.is_host_allowed("https://example.com/api", "development")
+    resolver = HostResolver(ttl=60, negative_ttl=10)
+    resolver._lookup = AsyncMock(return_value=['93.184.216.34'])  # example.com IP
+    service = AllowedHostService(database=mock_database, resolver=resolver)
+    
+    is_allowed, error = await service.is_host_allowed("https://example.com/api", "development")
     
     assert is_allowed
     assert error is None
@@ -249,4 +251,9 @@ def test_is_private_ip():
     assert service._is_private_ip("169.254.1.1") is True
     assert service._is_private_ip("8.8.8.8") is False
     assert service._is_private_ip("93.184.216.34") is False  # example.com
+    assert service._is_private_ip("::1") is True
+    assert service._is_private_ip("fd00::1") is True
+    assert service._is_private_ip("fe80::1") is True
+    assert service._is_private_ip("::ffff:10.0.0.1") is True  # IPv4-mapped
+    assert service._is_private_ip("2606:4700::1") is False
 
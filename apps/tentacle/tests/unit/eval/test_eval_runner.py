@@ -0,0 +1,236 @@
+"""Unit tests for concurrent, cached prompt evaluation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.eval.eval_runner import EvalResultCache, ModelRateLimiter
+from src.eval.models import FormatRequirements, OptimizationConfig, OutputPattern, TestCase
+from src.eval.optimization_loop import OptimizationLoopController
+from src.eval.prompt_eval_agent import PromptEvalAgent
+
+GOOD = '{"steps": [{"inputs": {"data": "{{step_1.outputs.content}}"}}]}'
+BAD = '{"steps": []}'
+
+
+def _case(n, priority=0):
+    return TestCase(
+        id=f"test_{n}",
+        name=f"Test {n}",
+        input_context={"goal": f"Goal {n}"},
+        expected_output_patterns=[OutputPattern("contains", "step_1.outputs", "Has template")],
+        format_requirements=FormatRequirements(expected_type="json"),
+        priority=priority,
+    )
+
+
+def _response(content, usage=None):
+    response = MagicMock()
+    response.content = content
+    response.usage = usage if usage is not None else {"prompt_tokens": 10, "completion_tokens": 5}
+    return response
+
+
+def _agent(**kwargs):
+    agent = PromptEvalAgent(**kwargs)
+    agent.llm_client = MagicMock()
+    return agent
+
+
+class TestConcurrentEvaluation:
+    @pytest.mark.asyncio
+    async def test_cases_run_concurrently_up_to_limit(self):
+        agent = _agent(max_concurrency=3)
+        active = 0
+        peak = 0
+
+        async def complete(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _response(GOOD)
+
+        agent.llm_client.create_completion = complete
+
+        result = await agent.evaluate("prompt", [_case(n) for n in range(10)])
+
+        assert peak == 3
+        assert result.tests_passed == 10
+        assert result.stats.llm_calls == 10
+        assert result.stats.total_tokens == 150
+
+    @pytest.mark.asyncio
+    async def test_results_keep_priority_order(self):
+        agent = _agent(max_concurrency=4)
+        delays = {"Goal 0": 0.03, "Goal 1": 0.0, "Goal 2": 0.01}
+
+        async def complete(messages, **kwargs):
+            await asyncio.sleep(delays[messages[1].content.split(": ")[1]])
+            return _response(GOOD)
+
+        agent.llm_client.create_completion = complete
+        cases = [_case(0, priority=1), _case(1, priority=3), _case(2, priority=2)]
+
+        result = await agent.evaluate("prompt", cases)
+
+        assert [r.test_case_id for r in result.test_results] == ["test_1", "test_2", "test_0"]
+
+    @pytest.mark.asyncio
+    async def test_llm_error_becomes_failed_result(self):
+        agent = _agent()
+        agent.llm_client.create_completion = AsyncMock(
+            side_effect=[_response(GOOD), RuntimeError("provider down")]
+        )
+
+        result = await agent.evaluate("prompt", [_case(0), _case(1)])
+
+        assert result.tests_passed == 1
+        assert result.get_failed_tests()[0].error == "provider down"
+
+
+class TestEvalResultCache:
+    @pytest.mark.asyncio
+    async def test_repeat_evaluation_is_served_from_cache(self):
+        agent = _agent(result_cache=EvalResultCache())
+        agent.llm_client.create_completion = AsyncMock(return_value=_response(GOOD))
+        cases = [_case(0), _case(1)]
+
+        await agent.evaluate("prompt", cases)
+        again = await agent.evaluate("prompt", cases)
+
+        assert agent.llm_client.create_completion.await_count == 2
+        assert again.stats.cache_hits == 2
+        assert again.stats.llm_calls == 0
+        assert again.stats.total_tokens == 0
+        assert all(r.cached for r in again.test_results)
+
+    @pytest.mark.asyncio
+    async def test_cache_key_covers_prompt_model_and_temperature(self):
+        agent = _agent(result_cache=EvalResultCache())
+        agent.llm_client.create_completion = AsyncMock(return_value=_response(GOOD))
+        cases = [_case(0)]
+
+        await agent.evaluate("prompt", cases, llm_model="a")
+        await agent.evaluate("prompt v2", cases, llm_model="a")
+        await agent.evaluate("prompt", cases, llm_model="b")
+        await agent.evaluate("prompt", cases, llm_model="a", temperature=0.9)
+
+        assert agent.llm_client.create_completion.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        agent = _agent(result_cache=EvalResultCache())
+        agent.llm_client.create_completion = AsyncMock(
+            side_effect=[RuntimeError("timeout"), _response(GOOD)]
+        )
+
+        first = await agent.evaluate("prompt", [_case(0)])
+        second = await agent.evaluate("prompt", [_case(0)])
+
+        assert not first.passed
+        assert second.passed and second.stats.cache_hits == 0
+
+    def test_key_ignores_labels(self):
+        case = _case(0)
+        relabelled = _case(0, priority=9)
+        relabelled.name = "Renamed"
+
+        assert EvalResultCache.key("p", case, "m", 0.3) == EvalResultCache.key("p", relabelled, "m", 0.3)
+
+
+class TestEarlyStop:
+    @pytest.mark.asyncio
+    async def test_stops_once_pass_rate_is_unreachable(self):
+        agent = _agent(max_concurrency=1)
+        agent.llm_client.create_completion = AsyncMock(return_value=_response(BAD))
+
+        result = await agent.evaluate("prompt", [_case(n) for n in range(10)], min_pass_rate=0.9)
+
+        # Two failures out of ten make 90% unreachable
+        assert agent.llm_client.create_completion.await_count == 2
+        assert result.stats.early_stopped
+        assert result.tests_failed == 2
+        assert result.tests_skipped == 8
+        assert result.total_tests == 10
+        assert not result.passed
+
+    @pytest.mark.asyncio
+    async def test_skipped_cases_score_as_failures(self):
+        agent = _agent(max_concurrency=1)
+        agent.llm_client.create_completion = AsyncMock(
+            side_effect=[_response(GOOD), _response(BAD), _response(BAD)]
+        )
+
+        result = await agent.evaluate("prompt", [_case(n) for n in range(10)], min_pass_rate=0.9)
+
+        assert result.early_stopped and result.tests_skipped == 7
+        ran = result.test_results
+        assert result.content_score == pytest.approx(sum(r.content_score for r in ran) / 10)
+        assert result.format_score == pytest.approx(sum(r.format_score for r in ran) / 10)
+
+    @pytest.mark.asyncio
+    async def test_runs_to_completion_while_threshold_is_reachable(self):
+        agent = _agent(max_concurrency=1)
+        agent.llm_client.create_completion = AsyncMock(
+            side_effect=[_response(BAD)] + [_response(GOOD)] * 9
+        )
+
+        result = await agent.evaluate("prompt", [_case(n) for n in range(10)], min_pass_rate=0.9)
+
+        assert not result.stats.early_stopped
+        assert result.tests_passed == 9 and result.tests_skipped == 0
+
+
+class TestModelRateLimiter:
+    @pytest.mark.asyncio
+    async def test_unlimited_model_does_not_wait(self):
+        limiter = ModelRateLimiter({"slow-model": 60})
+
+        assert await limiter.acquire("other-model") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_waits_when_bucket_is_empty(self, monkeypatch):
+        limiter = ModelRateLimiter({"slow-model": 2})
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            limiter._buckets["slow-model"].updated -= delay
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        for _ in range(3):
+            await limiter.acquire("slow-model")
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(30.0, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_optimization_loop_reuses_rollback_eval_and_reports_stats():
+    config = OptimizationConfig(max_iterations=3, early_stop_unreachable=False)
+    controller = OptimizationLoopController(config=config, optimizer_agent=MagicMock())
+    controller.eval_agent.llm_client = MagicMock()
+
+    async def complete(messages, **kwargs):
+        return _response(GOOD if messages[0].content == "prompt v3" else BAD)
+
+    controller.eval_agent.llm_client.create_completion = complete
+    versions = iter(["prompt v2", "prompt v3"])
+
+    async def optimize(context):
+        return MagicMock(improved_prompt=next(versions), changes_explanation=[], specific_fixes=[])
+
+    controller.optimizer_agent.optimize = optimize
+
+    result = await controller.run("prompt v1", [_case(0), _case(1)])
+
+    assert result.success
+    assert result.final_prompt == "prompt v3"
+    # v1, v2, v3 (rollback check) evaluated once each; iteration 3 hits the cache
+    assert result.eval_stats.llm_calls == 6
+    assert result.eval_stats.cache_hits == 2
+    assert result.eval_stats.total_tokens == 90
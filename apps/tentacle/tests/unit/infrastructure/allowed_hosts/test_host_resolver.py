@@ -0,0 +1,171 @@
+"""Unit tests for the cached SSRF resolver and allowlist snapshot."""
+
+import socket
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.allowed_hosts.allowed_host_service import AllowedHostService
+from src.infrastructure.allowed_hosts.allowlist_snapshot import AllowlistSnapshot, invalidate_all
+from src.infrastructure.allowed_hosts.host_resolver import (
+    HostResolutionError,
+    HostResolver,
+    is_private_ip,
+)
+
+
+class TestHostResolver:
+    @pytest.mark.asyncio
+    async def test_positive_answers_are_cached(self):
+        resolver = HostResolver(ttl=60, negative_ttl=10)
+        resolver._lookup = AsyncMock(return_value=["93.184.216.34", "2606:2800::1"])
+
+        first = await resolver.resolve("Example.com.")
+        second = await resolver.resolve("example.com")
+
+        assert first == second == ["93.184.216.34", "2606:2800::1"]
+        resolver._lookup.assert_awaited_once_with("example.com")
+
+    @pytest.mark.asyncio
+    async def test_failures_are_negatively_cached(self):
+        resolver = HostResolver(ttl=60, negative_ttl=10)
+        resolver._lookup = AsyncMock(side_effect=socket.gaierror(-2, "Name or service not known"))
+
+        for _ in range(2):
+            with pytest.raises(HostResolutionError):
+                await resolver.resolve("nxdomain.example")
+
+        resolver._lookup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_answers_are_looked_up_again(self):
+        resolver = HostResolver(ttl=0, negative_ttl=0)
+        resolver._lookup = AsyncMock(side_effect=[["93.184.216.34"], ["93.184.216.35"]])
+
+        assert await resolver.resolve("example.com") == ["93.184.216.34"]
+        assert await resolver.resolve("example.com") == ["93.184.216.35"]
+
+    def test_cache_is_bounded(self):
+        resolver = HostResolver(ttl=60, negative_ttl=10, max_entries=2)
+        for host in ("a.example", "b.example", "c.example"):
+            resolver._store(host, 60, ["93.184.216.34"])
+
+        assert len(resolver._cache) == 2
+        assert "c.example" in resolver._cache
+
+
+@pytest.mark.parametrize(
+    "address,private",
+    [
+        ("fc00::1", True),
+        ("fe80::1", True),
+        ("ff02::1", True),
+        ("::", True),
+        ("::ffff:127.0.0.1", True),
+        ("2002:a00:1::", True),  # 6to4 wrapping 10.0.0.1
+        ("100.64.0.1", True),  # CGNAT
+        ("2001:4860:4860::8888", False),
+        ("::ffff:8.8.8.8", False),
+        ("not-an-ip", False),
+    ],
+)
+def test_is_private_ip_covers_ipv6(address, private):
+    assert is_private_ip(address) is private
+
+
+def _service(hosts, addresses):
+    """AllowedHostService with a stubbed allowlist query and resolver."""
+    database = MagicMock()
+    resolver = HostResolver(ttl=60, negative_ttl=10)
+    resolver._lookup = AsyncMock(return_value=addresses)
+    service = AllowedHostService(database=database, resolver=resolver)
+    service.get_allowed_hosts = AsyncMock(
+        return_value=[SimpleNamespace(host=h) for h in hosts]
+    )
+    service._allowlist._subscribe = False
+    return service
+
+
+class TestCheckHost:
+    @pytest.mark.asyncio
+    async def test_returns_vetted_addresses(self):
+        service = _service(["api.example.com"], ["93.184.216.34", "2606:2800::1"])
+
+        check = await service.check_host("https://api.example.com/v1", "development")
+
+        assert check.allowed
+        assert check.host == "api.example.com"
+        assert check.addresses == ["93.184.216.34", "2606:2800::1"]
+
+    @pytest.mark.asyncio
+    async def test_any_private_record_rejects_host(self):
+        service = _service(["api.example.com"], ["93.184.216.34", "fd12::1"])
+
+        check = await service.check_host("https://api.example.com/v1", "development")
+
+        assert not check.allowed
+        assert "fd12::1" in check.error
+        assert check.addresses == []
+
+    @pytest.mark.asyncio
+    async def test_dns_failure_fails_closed(self):
+        service = _service(["api.example.com"], [])
+        service.resolver._lookup = AsyncMock(side_effect=socket.gaierror(-2, "unknown"))
+
+        check = await service.check_host("https://api.example.com/v1", "development")
+
+        assert not check.allowed
+        assert "DNS resolution failed" in check.error
+
+    @pytest.mark.asyncio
+    async def test_unlisted_host_is_never_resolved(self):
+        service = _service(["api.example.com"], ["93.184.216.34"])
+
+        check = await service.check_host("https://other.example.com/", "development")
+
+        assert "not in the allowlist" in check.error
+        service.resolver._lookup.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_allowlist_is_loaded_once_per_environment(self):
+        service = _service(["api.example.com"], ["93.184.216.34"])
+
+        for _ in range(3):
+            await service.check_host("https://api.example.com/", "development")
+
+        service.get_allowed_hosts.assert_awaited_once_with("development")
+
+
+class TestAllowlistSnapshot:
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_environment(self):
+        loader = AsyncMock(side_effect=[["a.example"], ["a.example", "b.example"]])
+        snapshot = AllowlistSnapshot(loader, max_age=600, subscribe=False)
+
+        assert not await snapshot.contains("b.example", "development")
+        invalidate_all("development")
+        assert await snapshot.contains("B.example", "development")
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_is_not_overwritten(self):
+        snapshot = None
+
+        async def loader(environment):
+            snapshot.invalidate(environment)
+            return ["stale.example"]
+
+        snapshot = AllowlistSnapshot(loader, max_age=600, subscribe=False)
+        await snapshot.hosts("development")
+
+        assert "development" not in snapshot._hosts
+
+    @pytest.mark.asyncio
+    async def test_loader_errors_propagate(self):
+        snapshot = AllowlistSnapshot(
+            AsyncMock(side_effect=RuntimeError("db down")), max_age=600, subscribe=False
+        )
+
+        with pytest.raises(RuntimeError):
+            await snapshot.contains("a.example", "development")
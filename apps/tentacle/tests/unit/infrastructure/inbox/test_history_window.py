@@ -0,0 +1,168 @@
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.database.conversation_store import decode_keyset_cursor, message_cursor
+from src.infrastructure.inbox.history_window import (
+    SUMMARY_METADATA_KEY,
+    HistoryWindowLoader,
+    fold_summary,
+    format_history_message,
+)
+
+
+def _messages(count: int, chars: int = 40) -> list:
+    """Chronological fake messages alternating user/assistant."""
+    base = datetime(2026, 2, 1)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            timestamp=base + timedelta(minutes=i),
+            role="user" if i % 2 == 0 else "assistant",
+            content_text=f"m{i:03d} " + "x" * chars,
+            content_data=None,
+            agent_id="inbox_chat",
+        )
+        for i in range(count)
+    ]
+
+
+def _store(messages: list, metadata: dict = None) -> MagicMock:
+    """Store mock that serves keyset pages from an in-memory list."""
+
+    async def get_messages(conversation_id, limit=None, cursor=None, newest_first=False):
+        rows = list(reversed(messages)) if newest_first else list(messages)
+        if cursor:
+            at, msg_id = decode_keyset_cursor(cursor)
+            if newest_first:
+                rows = [m for m in rows if (m.timestamp, m.id) < (at, msg_id)]
+            else:
+                rows = [m for m in rows if (m.timestamp, m.id) > (at, msg_id)]
+        return rows[:limit] if limit is not None else rows
+
+    store = MagicMock()
+    store.get_messages = AsyncMock(side_effect=get_messages)
+    store.get_conversation_metadata = AsyncMock(return_value=metadata or {})
+    store.update_conversation_metadata = AsyncMock()
+    return store
+
+
+class TestHistoryWindowLoader:
+    @pytest.mark.asyncio
+    async def test_short_thread_fits_without_summary(self):
+        messages = _messages(5)
+        store = _store(messages)
+        loader = HistoryWindowLoader(store, token_budget=1000, summary_token_budget=100)
+
+        window = await loader.load("conv-1")
+
+        assert [m["content"] for m in window.messages] == [m.content_text for m in messages]
+        assert window.summary is None
+        store.get_conversation_metadata.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_tail_in_pages_until_budget(self):
+        messages = _messages(200)
+        store = _store(messages)
+        # Each message costs ~15 tokens, so ~6 fit
+        loader = HistoryWindowLoader(store, token_budget=100, summary_token_budget=200, page_size=4)
+
+        window = await loader.load("conv-1")
+
+        assert window.messages[-1]["content"] == messages[-1].content_text
+        assert len(window.messages) == 6
+        assert window.estimated_tokens <= 100
+        # Never loads the full thread
+        for call in store.get_messages.await_args_list:
+            assert call.kwargs["limit"] is not None
+
+    @pytest.mark.asyncio
+    async def test_newest_message_kept_even_when_over_budget(self):
+        store = _store(_messages(3, chars=4000))
+        loader = HistoryWindowLoader(store, token_budget=10, summary_token_budget=100)
+
+        window = await loader.load("conv-1")
+
+        assert len(window.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_fold_summarizes_evicted_messages(self):
+        messages = _messages(20)
+        store = _store(messages)
+        loader = HistoryWindowLoader(store, token_budget=50, summary_token_budget=1000)
+
+        window = await loader.load("conv-1")
+
+        newest_evicted = messages[len(messages) - len(window.messages) - 1]
+        assert window.summary.splitlines()[-1].startswith(
+            f"{newest_evicted.role}: {newest_evicted.content_text[:4]}"
+        )
+        update = store.update_conversation_metadata.await_args.args[1][SUMMARY_METADATA_KEY]
+        assert update["text"] == window.summary
+        assert update["through"] == message_cursor(newest_evicted)
+
+    @pytest.mark.asyncio
+    async def test_incremental_fold_reads_only_new_evictions(self):
+        messages = _messages(20)
+        metadata = {
+            SUMMARY_METADATA_KEY: {"text": "user: earlier", "through": message_cursor(messages[14])}
+        }
+        store = _store(messages, metadata)
+        loader = HistoryWindowLoader(store, token_budget=50, summary_token_budget=1000)
+
+        window = await loader.load("conv-1")
+
+        lines = window.summary.splitlines()
+        assert lines[0] == "user: earlier"
+        assert lines[1].startswith("assistant: m015")
+
+    @pytest.mark.asyncio
+    async def test_summary_up_to_date_is_not_rewritten(self):
+        messages = _messages(20)
+        metadata = {
+            SUMMARY_METADATA_KEY: {"text": "user: earlier", "through": message_cursor(messages[16])}
+        }
+        store = _store(messages, metadata)
+        loader = HistoryWindowLoader(store, token_budget=50, summary_token_budget=1000)
+
+        window = await loader.load("conv-1")
+
+        assert window.summary == "user: earlier"
+        store.update_conversation_metadata.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_summary_failure_does_not_break_history(self):
+        store = _store(_messages(20))
+        store.get_conversation_metadata = AsyncMock(side_effect=RuntimeError("db down"))
+        loader = HistoryWindowLoader(store, token_budget=50, summary_token_budget=1000)
+
+        window = await loader.load("conv-1")
+
+        assert window.messages
+        assert window.summary is None
+
+
+class TestHelpers:
+    def test_fold_summary_drops_oldest_lines_over_budget(self):
+        summary = fold_summary("user: " + "a" * 40, ["assistant: " + "b" * 40], token_budget=15)
+        assert summary == "assistant: " + "b" * 40
+
+    def test_task_step_outputs_are_truncated(self):
+        msg = SimpleNamespace(
+            role="assistant",
+            content_text="Step — done.",
+            content_data={"outputs": {"data": "y" * 5000}},
+            agent_id="task_orchestrator",
+        )
+
+        content = format_history_message(msg)["content"]
+
+        assert "Step output:" in content
+        assert "… (truncated)" in content
+
+    def test_empty_message_is_skipped(self):
+        msg = SimpleNamespace(role="user", content_text="  ", content_data=None, agent_id=None)
+        assert format_history_message(msg) is None
@@ -0,0 +1,194 @@
+"""Unit tests for the warm Playwright browser pool (fake browsers)."""
+
+import asyncio
+import base64
+
+import pytest
+
+from src.plugins.browser_pool import BrowserPool, BrowserPoolTimeoutError
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    async def set_content(self, html):
+        self.context.html = html
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def screenshot(self, **kwargs):
+        return b"png:" + self.context.html.encode()[:8]
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.html = ""
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+    browsers = []
+
+    def factory(**kwargs):
+        async def launcher():
+            browser = FakeBrowser()
+            browsers.append(browser)
+            return browser
+
+        kwargs.setdefault("size", 1)
+        kwargs.setdefault("max_pages_per_browser", 4)
+        kwargs.setdefault("max_contexts_per_browser", 100)
+        pool = BrowserPool(launcher=launcher, **kwargs)
+        pool.browsers = browsers
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+async def _page_browser(page):
+    return page.context.browser
+
+
+class TestBrowserPool:
+    @pytest.mark.asyncio
+    async def test_browser_is_reused_with_fresh_context_per_call(self, make_pool):
+        pool = make_pool()
+
+        browsers = [await pool.run(_page_browser, {"viewport": {"width": 10, "height": 10}}) for _ in range(5)]
+
+        assert pool.stats.launches == 1
+        assert pool.stats.contexts == 5
+        assert len(set(map(id, browsers))) == 1
+        contexts = pool.browsers[0].contexts
+        assert len(contexts) == 5 and all(c.closed for c in contexts)
+        assert contexts[0].options == {"viewport": {"width": 10, "height": 10}}
+
+    def test_browsers_stay_warm_across_event_loops(self, make_pool):
+        pool = make_pool()
+
+        asyncio.run(pool.run(_page_browser))
+        asyncio.run(pool.run(_page_browser))
+
+        assert pool.stats.launches == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_are_capped(self, make_pool):
+        pool = make_pool(size=2, max_pages_per_browser=2)
+        active = 0
+        peak = 0
+
+        async def work(page):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(pool.run(work) for _ in range(12)))
+
+        assert peak == 4
+        assert pool.stats.launches == 2
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_context_limit(self, make_pool):
+        pool = make_pool(max_contexts_per_browser=2)
+
+        for _ in range(3):
+            await pool.run(_page_browser)
+        await asyncio.sleep(0.05)
+
+        assert pool.stats.launches == 2
+        assert pool.stats.recycled == 1
+        assert pool.browsers[0].closed
+
+    @pytest.mark.asyncio
+    async def test_crashed_browser_is_replaced_and_call_retried(self, make_pool):
+        pool = make_pool()
+        calls = 0
+
+        async def flaky(page):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                page.context.browser.connected = False
+                raise RuntimeError("Target closed")
+            return "ok"
+
+        assert await pool.run(flaky) == "ok"
+        assert pool.stats.crashed == 1
+        assert pool.stats.retries == 1
+        assert pool.stats.launches == 2
+
+    @pytest.mark.asyncio
+    async def test_page_errors_are_not_retried(self, make_pool):
+        pool = make_pool()
+
+        async def broken(page):
+            raise ValueError("bad selector")
+
+        with pytest.raises(ValueError):
+            await pool.run(broken)
+        assert pool.stats.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_times_out_when_all_pages_busy(self, make_pool):
+        pool = make_pool(max_pages_per_browser=1, acquire_timeout=0.05)
+
+        async def hold(page):
+            await asyncio.sleep(0.3)
+
+        blocker = asyncio.ensure_future(pool.run(hold))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(BrowserPoolTimeoutError):
+            await pool.run(_page_browser)
+        await blocker
+
+
+@pytest.mark.asyncio
+async def test_tweet_image_handler_uses_pool(make_pool, monkeypatch):
+    from src.plugins import playwright_plugin
+
+    pool = make_pool()
+    monkeypatch.setattr(playwright_plugin, "browser_pool", pool)
+
+    result = await playwright_plugin.generate_tweet_image_handler(
+        {"tweet_text": "hello", "width": 600, "height": 300}
+    )
+
+    assert base64.b64decode(result["result"]).startswith(b"png:")
+    assert pool.browsers[0].contexts[0].options == {"viewport": {"width": 600, "height": 300}}
@@ -0,0 +1,160 @@
+"""Unit tests for plugin handler thread/process pools."""
+
+import asyncio
+import importlib
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.execution_runtime.plugin_executor import (
+    DEFAULT_PLUGIN_TIMEOUT,
+    PLUGIN_REGISTRY,
+    _plugin_policy,
+    execute_step,
+)
+from src.plugins import pdf_composer_plugin
+from src.plugins.handler_pools import PROCESS, THREAD, HandlerPools, HandlerTimeoutError
+from src.plugins.registry import PluginDefinition, PluginRegistry
+
+
+def _where_step_handler(inputs, context):
+    return {"thread": threading.get_ident()}
+
+
+STEP_PLUGIN_DEFINITIONS = [{"handler": _where_step_handler, "execution_mode": THREAD}]
+
+
+@pytest.fixture
+def pools():
+    pools = HandlerPools(thread_workers=2, process_workers=1)
+    yield pools
+    pools.shutdown()
+
+
+class TestThreadPool:
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self, pools):
+        loop_thread = threading.get_ident()
+
+        worker_thread = await pools.run(threading.get_ident, mode=THREAD)
+
+        assert worker_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_coroutine_handler_runs_on_private_loop(self, pools):
+        caller_loop = asyncio.get_running_loop()
+
+        async def handler(inputs):
+            return {"same_loop": asyncio.get_running_loop() is caller_loop, **inputs}
+
+        result = await pools.run(handler, {"n": 1}, mode=THREAD)
+
+        assert result == {"same_loop": False, "n": 1}
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_without_blocking_loop(self, pools):
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        with pytest.raises(HandlerTimeoutError):
+            await asyncio.gather(pools.run(time.sleep, 0.5, mode=THREAD, timeout=0.1), ticker())
+
+        assert len(ticks) == 3
+
+
+class TestProcessPool:
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker_and_pool_recovers(self, pools):
+        # Warm the pool so spawn time does not count against the timeout
+        assert await pools.run(pow, 2, 10, mode=PROCESS, timeout=60) == 1024
+
+        with pytest.raises(HandlerTimeoutError):
+            await pools.run(time.sleep, 30, mode=PROCESS, timeout=0.5)
+
+        assert await pools.run(pow, 3, 3, mode=PROCESS, timeout=60) == 27
+
+    @pytest.mark.asyncio
+    async def test_runaway_worker_process_is_killed(self, pools):
+        assert await pools.run(pow, 2, 10, mode=PROCESS, timeout=60) == 1024
+        workers = list(pools._pool(PROCESS)._processes.values())
+
+        with pytest.raises(HandlerTimeoutError):
+            await pools.run(time.sleep, 30, mode=PROCESS, timeout=0.5)
+
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_pdf_composer_bounds_its_process_render(self, monkeypatch):
+        calls = []
+
+        async def fake_offload(fn, *args, mode=THREAD, timeout=None):
+            calls.append((fn.__name__, mode, timeout))
+            raise HandlerTimeoutError(f"{fn.__name__} exceeded {timeout}s timeout")
+
+        monkeypatch.setattr(pdf_composer_plugin, "offload", fake_offload)
+
+        result = await pdf_composer_plugin.pdf_composer_handler({"content": "# Report"})
+
+        assert calls == [("_markdown_to_html", PROCESS, pdf_composer_plugin.MARKDOWN_RENDER_TIMEOUT)]
+        assert "exceeded" in result["error"]
+
+
+class TestRegistryExecutionPolicy:
+    @pytest.mark.asyncio
+    async def test_thread_mode_plugin_runs_in_pool(self):
+        registry = PluginRegistry()
+        registry.register(
+            PluginDefinition(
+                name="where",
+                description="Report the executing thread",
+                handler=lambda inputs: {"thread": threading.get_ident()},
+                execution_mode=THREAD,
+            )
+        )
+
+        result = await registry.execute("where", {})
+
+        assert result["thread"] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_async_plugin_timeout(self):
+        async def slow(inputs):
+            await asyncio.sleep(1)
+
+        registry = PluginRegistry()
+        registry.register(
+            PluginDefinition(name="slow", description="Sleeps", handler=slow, timeout_seconds=0.05)
+        )
+
+        with pytest.raises(HandlerTimeoutError):
+            await registry.execute("slow", {})
+
+
+class TestStepExecutorPolicy:
+    def test_timeout_comes_from_plugin_definition(self):
+        def timeout_of(agent_type):
+            module_path, handler_name = PLUGIN_REGISTRY[agent_type]
+            module = importlib.import_module(module_path)
+            return _plugin_policy(agent_type, module, getattr(module, handler_name))[1]
+
+        assert timeout_of("csv_composer") == 120
+        assert timeout_of("workspace_import_csv") == 300
+        assert timeout_of("transform") == DEFAULT_PLUGIN_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_step_runs_in_the_pool_its_definition_declares(self, monkeypatch):
+        monkeypatch.setitem(PLUGIN_REGISTRY, "where_step", (__name__, "_where_step_handler"))
+        step = SimpleNamespace(agent_type="where_step", id="step-1", inputs={})
+
+        result = await execute_step(step)
+
+        assert result.success
+        assert result.output["thread"] != threading.get_ident()
@@ -0,0 +1,141 @@
+"""Unit tests for the pooled outbound HTTP transport."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from src.plugins.http_transport import (
+    OutboundHttpTransport,
+    ResponseTooLargeError,
+    TokenBucketRateLimiter,
+    parse_host_limits,
+)
+
+
+def _transport(handler, **kwargs):
+    kwargs.setdefault("max_concurrency_per_host", 4)
+    return OutboundHttpTransport(transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestOutboundHttpTransport:
+    @pytest.mark.asyncio
+    async def test_reuses_one_client_per_host(self):
+        transport = _transport(lambda request: httpx.Response(200, text="ok"))
+
+        await transport.request("GET", "https://93.184.216.34/", host="a.example")
+        first = (await transport._pool("a.example", True)).client
+        await transport.request("GET", "https://93.184.216.34/", host="A.example")
+
+        assert (await transport._pool("a.example", True)).client is first
+        assert (await transport._pool("b.example", True)).client is not first
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_cap(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        transport = _transport(handler, host_limits={"slow.example": 2})
+
+        await asyncio.gather(
+            *(transport.request("GET", "https://93.184.216.34/", host="slow.example") for _ in range(10))
+        )
+
+        assert peak == 2
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_a_slot_counts_against_timeout(self):
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200)
+
+        transport = _transport(handler, max_concurrency_per_host=1)
+        blocker = asyncio.create_task(transport.request("GET", "https://93.184.216.34/", host="a.example"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(httpx.PoolTimeout):
+            await transport.request("GET", "https://93.184.216.34/", host="a.example", timeout=0.05)
+
+        release.set()
+        await blocker
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit_is_rejected(self):
+        async def chunks():
+            for _ in range(10):
+                yield b"x" * 100
+
+        transport = _transport(lambda request: httpx.Response(200, content=chunks()))
+
+        with pytest.raises(ResponseTooLargeError):
+            await transport.request(
+                "GET", "https://93.184.216.34/", host="a.example", max_response_bytes=250
+            )
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit_is_rejected_before_reading(self):
+        transport = _transport(lambda request: httpx.Response(200, content=b"x" * 1000))
+
+        with pytest.raises(ResponseTooLargeError, match="1000 bytes"):
+            await transport.request(
+                "GET", "https://93.184.216.34/", host="a.example", max_response_bytes=999
+            )
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_buffered_response_decodes_json_and_text(self):
+        transport = _transport(lambda request: httpx.Response(200, json={"name": "pikachu"}))
+
+        resp = await transport.request("GET", "https://93.184.216.34/", host="a.example")
+
+        assert resp.status_code == 200
+        assert resp.json() == {"name": "pikachu"}
+        assert "pikachu" in resp.text
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_idle_host_pools_are_evicted(self):
+        transport = _transport(lambda request: httpx.Response(200), max_host_pools=2)
+
+        for host in ("a.example", "b.example", "c.example"):
+            await transport.request("GET", "https://93.184.216.34/", host=host)
+
+        assert [key[0] for key in transport._pools.get()] == ["b.example", "c.example"]
+        await transport.aclose()
+
+
+def test_parse_host_limits():
+    assert parse_host_limits("API.example.com=5, b.example=0, junk, c.example=x") == {
+        "api.example.com": 5,
+        "b.example": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_at_max_calls_per_window():
+    limiter = TokenBucketRateLimiter("redis://localhost:6379/0")
+    script = AsyncMock(side_effect=[1, 0])
+    limiter._scripts.get = lambda: script
+
+    assert await limiter.acquire("bucket", max_calls=30, window_s=60) is True
+    assert await limiter.acquire("bucket", max_calls=30, window_s=60) is False
+
+    _, kwargs = script.await_args
+    capacity, rate, _now = kwargs["args"]
+    assert kwargs["keys"] == ["bucket"]
+    assert (capacity, rate) == (30, 0.5)
@@ -0,0 +1,110 @@
+"""Unit tests for manifest-based lazy plugin loading."""
+
+import sys
+
+import pytest
+
+from src.plugins.manifest import build_manifest, load_manifest
+from src.plugins.registry import PluginRegistry, parse_allowlist
+
+
+def _entry(name, module, function="handler", category="utility", **extra):
+    return {
+        "name": name,
+        "description": f"{name} plugin",
+        "category": category,
+        "inputs_schema": {"type": "object"},
+        "outputs_schema": {"type": "object"},
+        "entry_point": f"{module}:{function}",
+        **extra,
+    }
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """A throwaway plugin module on sys.path that has not been imported yet."""
+    name = "lazy_registry_test_plugin"
+    (tmp_path / f"{name}.py").write_text(
+        "def handler(inputs):\n    return {'doubled': inputs['n'] * 2}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+class TestLazyRegistry:
+    def test_registration_does_not_import_module(self, plugin_module):
+        registry = PluginRegistry()
+
+        assert registry.register_manifest([_entry("double", plugin_module)]) == 1
+
+        assert plugin_module not in sys.modules
+        definition = registry.definitions()[0]
+        assert definition.handler is None
+        assert definition.inputs_schema == {"type": "object"}
+
+    @pytest.mark.asyncio
+    async def test_first_use_imports_and_records_load_stats(self, plugin_module):
+        registry = PluginRegistry()
+        registry.register_manifest([_entry("double", plugin_module)])
+
+        assert await registry.execute("double", {"n": 21}) == {"doubled": 42}
+
+        assert plugin_module in sys.modules
+        report = registry.load_report()
+        assert [s.module for s in report] == [plugin_module]
+        assert report[0].plugins == ["double"]
+        assert report[0].seconds >= 0
+
+    def test_allowlist_matches_names_and_categories(self, plugin_module):
+        registry = PluginRegistry()
+        registry.register_manifest(
+            [
+                _entry("double", plugin_module),
+                _entry("gmail_list", plugin_module, category="google"),
+                _entry("den_upload", plugin_module, category="file_io"),
+            ],
+            allowlist=parse_allowlist("double, google"),
+        )
+
+        assert sorted(d.name for d in registry.definitions()) == ["double", "gmail_list"]
+
+    def test_missing_optional_dependency_is_skipped(self, plugin_module):
+        registry = PluginRegistry()
+
+        registered = registry.register_manifest(
+            [_entry("shot", plugin_module, requires=["surely_not_installed_pkg"])]
+        )
+
+        assert registered == 0
+        assert registry.get("shot") is None
+
+    def test_broken_entry_point_is_dropped(self):
+        registry = PluginRegistry()
+        registry.register_manifest([_entry("broken", "no_such_plugin_module")])
+
+        assert registry.get("broken") is None
+        assert registry.definitions() == []
+
+    def test_preload_resolves_all_plugins(self, plugin_module):
+        registry = PluginRegistry()
+        registry.register_manifest([_entry("a", plugin_module), _entry("b", plugin_module)])
+
+        report = registry.preload()
+
+        assert all(d.handler is not None for d in registry.definitions())
+        assert len(report) == 1
+        assert report[0].plugins == ["a", "b"]
+
+    def test_empty_allowlist_means_unrestricted(self):
+        assert parse_allowlist("") is None
+        assert parse_allowlist(" , ") is None
+
+
+def test_manifest_matches_plugin_definitions():
+    """manifest.json must be regenerated after changing a plugin definition.
+
+    Run ``python -m src.plugins.manifest`` to update it.
+    """
+    manifest = load_manifest()
+    assert build_manifest(manifest) == manifest
@@ -1,10 +1,12 @@
 """Unit tests for InboxService."""
 
 import uuid
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.database.conversation_store import decode_keyset_cursor
 from src.database.models import InboxPriority, ReadStatus
 from src.infrastructure.inbox.inbox_service import InboxService
 
@@ -45,7 +47,7 @@ class TestListInbox:
     @pytest.mark.asyncio
     async def test_returns_correct_structure(self, service, mock_store):
         result = await service.list_inbox("user-1")
-        assert result == {"items": [], "total": 0, "limit": 50, "offset": 0}
+        assert result == {"items": [], "total": 0, "limit": 50, "offset": 0, "next_cursor": None}
         mock_store.get_inbox_conversations.assert_awaited_once_with(
             user_id="user-1",
             read_status=None,
@@ -54,6 +56,7 @@ class TestListInbox:
             exclude_archived=False,
             limit=50,
             offset=0,
+            cursor=None,
         )
 
     @pytest.mark.asyncio
@@ -75,6 +78,33 @@ class TestListInbox:
         assert result["limit"] == 10
         assert result["offset"] == 20
 
+    @pytest.mark.asyncio
+    async def test_full_page_returns_next_cursor(self, service, mock_store):
+        conv_id = str(uuid.uuid4())
+        mock_store.get_inbox_conversations.return_value = [
+            {"conversation_id": conv_id, "last_activity_at": "2026-02-10T12:00:00"},
+        ]
+        mock_store.get_inbox_count = AsyncMock(return_value=3)
+        result = await service.list_inbox("u", limit=1)
+
+        cursor_at, cursor_id = decode_keyset_cursor(result["next_cursor"])
+        assert cursor_at == datetime(2026, 2, 10, 12, 0, 0)
+        assert str(cursor_id) == conv_id
+
+    @pytest.mark.asyncio
+    async def test_partial_page_has_no_next_cursor(self, service, mock_store):
+        mock_store.get_inbox_conversations.return_value = [
+            {"conversation_id": str(uuid.uuid4()), "last_activity_at": "2026-02-10T12:00:00"},
+        ]
+        result = await service.list_inbox("u", limit=10)
+        assert result["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_passes_cursor(self, service, mock_store):
+        await service.list_inbox("u", cursor="abc")
+        call_kwargs = mock_store.get_inbox_conversations.call_args.kwargs
+        assert call_kwargs["cursor"] == "abc"
+
     @pytest.mark.asyncio
     async def test_invalid_read_status_raises(self, service):
         with pytest.raises(ValueError):
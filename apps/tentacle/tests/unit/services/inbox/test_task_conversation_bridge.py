@@ -9,7 +9,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.database.models import MessageDirection, MessageType, TriggerType
+from src.database.models import (
+    InboxPriority,
+    MessageDirection,
+    MessageType,
+    ReadStatus,
+    TriggerType,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +108,7 @@ class TestCreateInboxConversation:
         ) as MockConvStore:
             instance = MockConvStore.return_value
             instance.start_conversation = AsyncMock(return_value=mock_conv)
+            instance.set_inbox_fields = AsyncMock()
             instance.add_message = AsyncMock(return_value=True)
 
             # Import is deferred inside the method, so we also patch it there
@@ -140,6 +147,7 @@ class TestCreateInboxConversation:
         ) as MockConvStore:
             instance = MockConvStore.return_value
             instance.start_conversation = AsyncMock(return_value=mock_conv)
+            instance.set_inbox_fields = AsyncMock()
             instance.add_message = AsyncMock(return_value=True)
 
             await adapter.ensure_conversation(
@@ -173,6 +181,7 @@ class TestCreateInboxConversation:
         ) as MockConvStore:
             instance = MockConvStore.return_value
             instance.start_conversation = AsyncMock(return_value=mock_conv)
+            instance.set_inbox_fields = AsyncMock()
             instance.add_message = AsyncMock(return_value=True)
 
             await adapter.ensure_conversation(
@@ -225,8 +234,9 @@ class TestCreateInboxConversation:
             )
 
     @pytest.mark.asyncio
-    async def test_sets_inbox_fields_via_session(self):
-        """Verify that user_id, read_status, and priority are set via SQL update."""
+    async def test_sets_inbox_fields_through_store(self):
+        """user_id, read_status and priority go through the store, which
+        also builds the inbox projection row."""
         pg_store = _mock_pg_store()
         adapter = _make_conversation_adapter(pg_store=pg_store)
         self._mock_early_checks(adapter, pg_store)
@@ -238,6 +248,7 @@ class TestCreateInboxConversation:
         ) as MockConvStore:
             instance = MockConvStore.return_value
             instance.start_conversation = AsyncMock(return_value=mock_conv)
+            instance.set_inbox_fields = AsyncMock()
             instance.add_message = AsyncMock(return_value=True)
 
             await adapter.ensure_conversation(
@@ -246,9 +257,9 @@ class TestCreateInboxConversation:
                 user_id=USER_ID,
             )
 
-        # Session execute was called: once for SELECT (conversation_id check)
-        # and once for UPDATE (inbox fields). Each uses a separate get_session call.
-        session_cm = pg_store.db.get_session.return_value
-        session_mock = session_cm.__aenter__.return_value
-        session_mock.execute.assert_awaited()
-        session_mock.commit.assert_awaited()
+        instance.set_inbox_fields.assert_awaited_once_with(
+            str(mock_conv.id),
+            user_id=USER_ID,
+            read_status=ReadStatus.UNREAD,
+            priority=InboxPriority.NORMAL,
+        )
@@ -0,0 +1,168 @@
+"""Tests for MCP filesystem provider I/O: ranged reads, atomic writes, paging."""
+
+import os
+
+import pytest
+
+from src.mcp.filesystem_provider import FileSystemProvider
+from src.mcp.registry import MCPRegistry
+
+
+@pytest.fixture
+async def provider(tmp_path):
+    provider = FileSystemProvider({"base_path": str(tmp_path), "chunk_size": 4, "max_read_bytes": 64})
+    await provider.initialize()
+    yield provider
+    await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_read_file_returns_whole_small_file(provider, tmp_path):
+    (tmp_path / "notes.txt").write_text("hello world", encoding="utf-8")
+
+    result = await provider.execute_tool("read_file", {"path": "notes.txt"})
+
+    assert result["success"] is True
+    assert result["content"] == "hello world"
+    assert result["size"] == 11
+    assert result["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_ranged_reads_continue_from_next_offset(provider, tmp_path):
+    (tmp_path / "data.txt").write_text("abcdefghij", encoding="utf-8")
+
+    first = await provider.execute_tool("read_file", {"path": "data.txt", "length": 4})
+    second = await provider.execute_tool(
+        "read_file", {"path": "data.txt", "offset": first["next_offset"], "length": 100}
+    )
+
+    assert first["content"] == "abcd" and first["truncated"] is True
+    assert second["content"] == "efghij" and second["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_read_is_capped_and_never_splits_utf8(provider, tmp_path):
+    (tmp_path / "wide.txt").write_text("a" + "é" * 40, encoding="utf-8")  # 81 bytes
+
+    first = await provider.execute_tool("read_file", {"path": "wide.txt"})
+    rest = await provider.execute_tool("read_file", {"path": "wide.txt", "offset": first["next_offset"]})
+
+    # 64-byte cap lands inside a two-byte character; it is left for the next read
+    assert first["bytes_read"] == 63
+    assert first["truncated"] is True
+    assert first["content"] + rest["content"] == "a" + "é" * 40
+
+
+@pytest.mark.asyncio
+async def test_read_missing_file(provider):
+    result = await provider.execute_tool("read_file", {"path": "missing.txt"})
+
+    assert result == {"success": False, "error": "File not found"}
+
+
+@pytest.mark.asyncio
+async def test_read_rejects_negative_offset(provider, tmp_path):
+    (tmp_path / "data.txt").write_text("abc", encoding="utf-8")
+
+    result = await provider.execute_tool("read_file", {"path": "data.txt", "offset": -1})
+
+    assert result["success"] is False
+
+
+@pytest.mark.asyncio
+async def test_stream_file_yields_chunks(provider, tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"0123456789")
+
+    chunks = [chunk async for chunk in provider.stream_file("data.bin", offset=2, length=7)]
+
+    assert chunks == [b"2345", b"678"]
+
+
+@pytest.mark.asyncio
+async def test_write_file_replaces_atomically_and_keeps_mode(provider, tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("old", encoding="utf-8")
+    os.chmod(target, 0o640)
+
+    result = await provider.execute_tool("write_file", {"path": "out.txt", "content": "new"})
+
+    assert result["success"] is True
+    assert target.read_text(encoding="utf-8") == "new"
+    assert os.stat(target).st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+@pytest.mark.asyncio
+async def test_write_stream_commits_on_completion(provider, tmp_path):
+    async def chunks():
+        yield "hello "
+        yield b"world"
+
+    result = await provider.write_stream("nested/out.txt", chunks())
+
+    assert result["bytes_written"] == 11
+    assert (tmp_path / "nested" / "out.txt").read_text(encoding="utf-8") == "hello world"
+
+
+@pytest.mark.asyncio
+async def test_write_stream_failure_leaves_target_untouched(provider, tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("original", encoding="utf-8")
+
+    async def chunks():
+        yield "partial"
+        raise RuntimeError("upstream closed")
+
+    with pytest.raises(RuntimeError):
+        await provider.write_stream("out.txt", chunks())
+
+    assert target.read_text(encoding="utf-8") == "original"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+@pytest.mark.asyncio
+async def test_list_directory_pages_in_name_order(provider, tmp_path):
+    for name in ["c.txt", "a.txt", "b.txt"]:
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+
+    first = await provider.execute_tool("list_directory", {"path": ".", "limit": 3})
+    second = await provider.execute_tool(
+        "list_directory", {"path": ".", "limit": 3, "cursor": first["next_cursor"]}
+    )
+
+    assert [item["name"] for item in first["items"]] == ["a.txt", "b.txt", "c.txt"]
+    assert first["total"] == 4
+    assert second["items"] == [{"name": "sub", "type": "directory", "size": None}]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_directory_cache_is_invalidated_by_writes(provider, tmp_path):
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    await provider.execute_tool("list_directory", {"path": "."})
+
+    # Changes made outside the provider are served from cache until the TTL expires
+    (tmp_path / "external.txt").write_text("x", encoding="utf-8")
+    cached = await provider.execute_tool("list_directory", {"path": "."})
+    await provider.execute_tool("write_file", {"path": "b.txt", "content": "b"})
+    fresh = await provider.execute_tool("list_directory", {"path": "."})
+
+    assert [item["name"] for item in cached["items"]] == ["a.txt"]
+    assert [item["name"] for item in fresh["items"]] == ["a.txt", "b.txt", "external.txt"]
+
+
+@pytest.mark.asyncio
+async def test_registry_reports_operation_latency(provider, monkeypatch):
+    monkeypatch.setattr(MCPRegistry, "_providers", {"filesystem": provider})
+
+    await provider.execute_tool("write_file", {"path": "a.txt", "content": "a"})
+    await provider.execute_tool("read_file", {"path": "a.txt"})
+    await provider.execute_tool("read_file", {"path": "missing.txt"})
+
+    stats = MCPRegistry.get_stats()["filesystem"]
+    assert stats["read_file"]["calls"] == 2
+    assert stats["read_file"]["errors"] == 1
+    assert stats["write_file"]["calls"] == 1
+    assert stats["write_file"]["max_ms"] >= stats["write_file"]["p50_ms"] > 0
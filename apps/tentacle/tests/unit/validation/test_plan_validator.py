@@ -15,6 +15,7 @@ from src.validation.plan_validator import (
     PlanValidationError,
     PlanValidationException,
 )
+from src.validation.agent_schemas import AgentSchemaCache, FieldMatcher
 
 
 class MockAgentConfig:
@@ -535,3 +536,89 @@ class TestPlanValidationIntegration:
 
         assert result.valid is False
         assert any("data" in e.field for e in result.errors)
+
+
+class TestCompiledSchemas:
+    """Tests for compiled, cached agent schemas."""
+
+    def _steps(self):
+        return [
+            TaskStep(
+                id="step_1",
+                name="search",
+                description="Search web",
+                agent_type="web_search",
+                inputs={"query": "test"},
+                dependencies=[],
+            ),
+            TaskStep(
+                id="step_2",
+                name="summarize",
+                description="Summarize results",
+                agent_type="summarize",
+                inputs={"content": ["{{step_1.outputs.results}}", {"x": "{{step_1.outputs.source}}"}]},
+                dependencies=["step_1"],
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_schemas_compiled_once_across_validators(self, mock_registry):
+        cache = AgentSchemaCache()
+        calls = []
+        original = mock_registry.get_agent_config
+        mock_registry.get_agent_config = lambda t: calls.append(t) or original(t)
+
+        for _ in range(3):
+            v = PlanValidator(schema_cache=cache)
+            v._registry = mock_registry
+            await v.validate_plan(self._steps())
+            await v.validate_step_inputs_at_runtime(self._steps()[0])
+
+        assert sorted(calls) == ["summarize", "web_search"]
+
+    @pytest.mark.asyncio
+    async def test_registry_version_bump_recompiles(self, mock_registry):
+        cache = AgentSchemaCache()
+        v = PlanValidator(schema_cache=cache)
+        v._registry = mock_registry
+        mock_registry.version = 1
+        step = self._steps()[0]
+
+        assert (await v.validate_step_inputs_at_runtime(step)).valid
+
+        mock_registry._agents["web_search"] = MockAgentConfig(
+            inputs_schema={"q": {"required": True}},
+        )
+        assert (await v.validate_step_inputs_at_runtime(step)).valid  # Still cached
+
+        mock_registry.version = 2
+        result = await v.validate_step_inputs_at_runtime(step)
+        assert not result.valid
+        invalid = next(e for e in result.errors if e.field == "query")
+        assert invalid.suggestion == "Use 'q' instead of 'query'"
+
+    @pytest.mark.asyncio
+    async def test_nested_template_references_checked(self, validator):
+        result = await validator.validate_plan(self._steps())
+
+        messages = [e.message for e in result.errors]
+        assert messages == ["'step_1' does not have output field 'source'"]
+        assert result.errors[0].suggestion == "Use 'sources' instead of 'source'"
+
+    @pytest.mark.asyncio
+    async def test_forward_reference_fields_not_checked(self, validator):
+        steps = list(reversed(self._steps()))
+        steps[0].inputs = {"content": "{{step_1.outputs.anything}}"}
+
+        result = await validator.validate_plan(steps)
+
+        assert result.valid is True
+
+    def test_field_matcher_heuristics(self):
+        matcher = FieldMatcher({"search_results", "sources", "Query"})
+
+        assert matcher.closest("query") == "Query"
+        assert matcher.closest("source") == "sources"
+        assert matcher.closest("results") == "search_results"
+        assert matcher.closest("zzz") is None
+        assert matcher.listing == "Query, search_results, sources"
@@ -18,6 +18,7 @@ from src.validation.schema_validator import (
     ValidationResult,
     ValidationError,
     SchemaType,
+    clear_compiled_schemas,
 )
 
 
@@ -936,3 +937,78 @@ def test_output_validation_empty_schema():
     result = validator.validate_outputs(data, schema)
 
     assert result.valid
+
+
+# ==============================================================================
+# 9. COMPILED SCHEMAS
+# ==============================================================================
+
+
+EQUIVALENCE_SCHEMA = {
+    "name": {"type": "string", "required": True, "min_length": 2, "max_length": 8},
+    "count": {"type": "int", "min": 0, "max": 10},
+    "ratio": {"type": "float", "min": 0.0, "max": 1.0},
+    "enabled": {"type": "bool", "nullable": True},
+    "tags": {"type": "list", "max_length": 2},
+    "meta": {"type": "dict"},
+    "mode": {"type": "string", "enum": ["fast", "slow"]},
+    "limit": {"type": "int", "required": True, "default": 5},
+    "rows": {"type": "list"},
+    "label": {"type": "string"},
+    "anything": {"type": "any"},
+    "legacy": {"type": "integer"},
+}
+
+EQUIVALENCE_PAYLOADS = [
+    {"name": "ok", "count": 3},
+    {"name": "x", "count": -1, "ratio": 2},
+    {"name": "toolongname", "count": "7", "ratio": "0.5", "enabled": "yes"},
+    {"name": None, "enabled": None, "tags": ["a", "b", "c"]},
+    {"name": "ok", "count": True, "meta": [], "mode": "medium"},
+    {"name": "ok", "rows": {"rows": [1, 2]}, "label": False, "count": 4.0},
+    {"name": "ok", "count": 4.5, "ratio": "abc", "enabled": "maybe"},
+    {"name": "ok", "anything": object(), "legacy": 3, "extra": 1},
+    {"name": ("t", "u"), "tags": "abc", "meta": {"a": 1}},
+    {},
+]
+
+
+@pytest.mark.parametrize("payload", EQUIVALENCE_PAYLOADS)
+@pytest.mark.parametrize("coercion", [True, False])
+def test_compiled_matches_interpreted(payload, coercion):
+    """Compiled and interpreted validation agree on every result."""
+    compiled = SchemaValidator(enable_coercion=coercion)
+    interpreted = SchemaValidator(enable_coercion=coercion, compiled=False)
+
+    for method in ("validate_inputs", "validate_outputs"):
+        expected = getattr(interpreted, method)(payload, EQUIVALENCE_SCHEMA)
+        actual = getattr(compiled, method)(payload, EQUIVALENCE_SCHEMA)
+        assert actual.to_dict() == expected.to_dict()
+        assert actual.coerced_data == expected.coerced_data
+
+
+def test_compiled_schema_is_cached_by_content():
+    """Equal schemas share a compilation; an edited schema recompiles."""
+    validator = SchemaValidator()
+    schema = {"count": {"type": "int", "max": 5}}
+
+    first = validator.compile(schema)
+    assert validator.compile({"count": {"max": 5, "type": "int"}}) is first
+    assert SchemaValidator().compile(schema) is first
+    assert SchemaValidator(enable_coercion=False).compile(schema) is not first
+
+    edited = {"count": {"type": "int", "max": 1}}
+    assert validator.compile(edited) is not first
+    assert not validator.validate_inputs({"count": 3}, edited).valid
+
+
+def test_in_place_edit_needs_cache_clear():
+    """A schema dict is recognised by identity until the cache is cleared."""
+    validator = SchemaValidator()
+    schema = {"count": {"type": "int", "max": 5}}
+    assert validator.validate_inputs({"count": 3}, schema).valid
+
+    schema["count"]["max"] = 1
+    clear_compiled_schemas()
+
+    assert not validator.validate_inputs({"count": 3}, schema).valid
@@ -2,7 +2,7 @@
 
 from .agent import Agent, AgentOptions
 from .agent_loop import agent_loop, agent_loop_continue
-from .event_stream import EventStream
+from .event_stream import EventStream, EventStreamStats, OverflowPolicy
 from .proxy import ProxyMessageEventStream, ProxyStreamOptions, stream_proxy
 from .types import (
     AgentContext,
@@ -30,6 +30,8 @@ __all__ = [
     "Agent",
     "AgentOptions",
     "EventStream",
+    "EventStreamStats",
+    "OverflowPolicy",
     "agent_loop",
     "agent_loop_continue",
     "stream_proxy",
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 from .agent_loop import agent_loop, agent_loop_continue, build_error_message
+from .event_stream import OverflowPolicy
 from .types import (
     AgentContext,
     AgentEndEvent,
@@ -66,6 +67,10 @@ class AgentOptions:
     thinking_budgets: ThinkingBudgets | None = None
     transport: Transport = "sse"
     max_retry_delay_ms: int | None = None
+    max_tool_concurrency: int = 8
+    tool_timeout_ms: int | None = None
+    event_buffer_size: int | None = None
+    event_overflow: OverflowPolicy = "block"
 
 
 class Agent:
@@ -94,6 +99,10 @@ class Agent:
         self._thinking_budgets = options.thinking_budgets
         self._transport: Transport = options.transport
         self._max_retry_delay_ms = options.max_retry_delay_ms
+        self._max_tool_concurrency = options.max_tool_concurrency
+        self._tool_timeout_ms = options.tool_timeout_ms
+        self._event_buffer_size = options.event_buffer_size
+        self._event_overflow = options.event_overflow
         self._running_prompt: asyncio.Task[None] | None = None
 
     @property
@@ -285,6 +294,10 @@ class Agent:
                 get_api_key=self.get_api_key,
                 get_steering_messages=_get_steering_messages,
                 get_follow_up_messages=self._dequeue_follow_up_messages,
+                max_tool_concurrency=self._max_tool_concurrency,
+                tool_timeout_ms=self._tool_timeout_ms,
+                event_buffer_size=self._event_buffer_size,
+                event_overflow=self._event_overflow,
             )
 
             partial: AgentMessage | None = None
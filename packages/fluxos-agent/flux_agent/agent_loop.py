@@ -42,7 +42,7 @@ def agent_loop(
     signal: Any | None = None,
     stream_fn: Any | None = None,
 ) -> EventStream[AgentEvent, list[AgentMessage]]:
-    stream = _create_agent_stream()
+    stream = _create_agent_stream(config)
 
     async def _run() -> None:
         new_messages: list[AgentMessage] = list(prompts)
@@ -81,7 +81,7 @@ def agent_loop_continue(
     if _message_role(last) == "assistant":
         raise ValueError("Cannot continue from message role: assistant")
 
-    stream = _create_agent_stream()
+    stream = _create_agent_stream(config)
 
     async def _run() -> None:
         new_messages: list[AgentMessage] = []
@@ -103,10 +103,12 @@ def agent_loop_continue(
     return stream
 
 
-def _create_agent_stream() -> EventStream[AgentEvent, list[AgentMessage]]:
+def _create_agent_stream(config: AgentLoopConfig) -> EventStream[AgentEvent, list[AgentMessage]]:
     return EventStream[AgentEvent, list[AgentMessage]](
         lambda event: getattr(event, "type", "") == "agent_end",
         lambda event: event.messages if isinstance(event, AgentEndEvent) else [],
+        max_buffer=config.event_buffer_size,
+        overflow=config.event_overflow,
     )
 
 
@@ -159,6 +161,8 @@ async def _run_loop(
                     signal,
                     stream,
                     config.get_steering_messages,
+                    config.max_tool_concurrency,
+                    config.tool_timeout_ms,
                 )
                 tool_results.extend(tool_execution["tool_results"])
                 steering_after_tools = tool_execution.get("steering_messages")
@@ -168,6 +172,7 @@ async def _run_loop(
                     new_messages.append(result)
 
             stream.push(TurnEndEvent(message=message, tool_results=tool_results))
+            await stream.drain()
 
             if steering_after_tools:
                 pending_messages = steering_after_tools
@@ -262,6 +267,7 @@ async def _stream_assistant_response(
                         message=partial_message,
                     )
                 )
+                await stream.drain()
             continue
 
         if event_type in {"done", "error"}:
@@ -283,16 +289,96 @@ async def _execute_tool_calls(
     signal: Any | None,
     stream: EventStream[AgentEvent, list[AgentMessage]],
     get_steering_messages: Any | None,
+    max_concurrency: int = 8,
+    default_timeout_ms: int | None = None,
 ) -> dict[str, Any]:
     tool_calls = [_to_tool_call(part) for part in assistant_message.content if _is_tool_call(part)]
+    tools_by_name: dict[str, AgentTool] = {}
+    for tool in tools or []:
+        tools_by_name.setdefault(tool.name, tool)
+
     results: list[ToolResultMessage] = []
     steering_messages: list[AgentMessage] | None = None
+    gate = asyncio.Semaphore(max(1, max_concurrency))
+
+    for batch_start, batch in _batch_tool_calls(tool_calls, tools_by_name):
+        runs = [
+            _run_tool_call(tools_by_name.get(tool_call.name), tool_call, signal, stream, gate, default_timeout_ms)
+            for tool_call in batch
+        ]
+        if len(runs) == 1:
+            outcomes = [await runs[0]]
+        else:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run) for run in runs]
+            outcomes = [task.result() for task in tasks]
+
+        # Tool result messages go into the transcript in call order,
+        # whatever order the calls finished in.
+        for tool_call, (result, is_error) in zip(batch, outcomes):
+            tool_result_message = ToolResultMessage(
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.name,
+                content=result.content,
+                details=result.details,
+                is_error=is_error,
+            )
+
+            results.append(tool_result_message)
+            stream.push(MessageStartEvent(message=tool_result_message))
+            stream.push(MessageEndEvent(message=tool_result_message))
+        await stream.drain()
+
+        if get_steering_messages:
+            steering = await _get_messages(get_steering_messages)
+            if steering:
+                steering_messages = steering
+                for skipped in tool_calls[batch_start + len(batch) :]:
+                    results.append(_skip_tool_call(skipped, stream))
+                break
+
+    return {
+        "tool_results": results,
+        "steering_messages": steering_messages,
+    }
+
+
+def _batch_tool_calls(
+    tool_calls: list[ToolCallContent],
+    tools_by_name: dict[str, AgentTool],
+) -> list[tuple[int, list[ToolCallContent]]]:
+    """Group consecutive concurrency-safe calls; every exclusive call is its own batch."""
+    batches: list[tuple[int, list[ToolCallContent]]] = []
+    shared: list[ToolCallContent] = []
+    shared_start = 0
 
     for index, tool_call in enumerate(tool_calls):
-        tool = None
-        if tools:
-            tool = next((candidate for candidate in tools if candidate.name == tool_call.name), None)
+        tool = tools_by_name.get(tool_call.name)
+        # Unknown tools fail without side effects, so they never need to run alone
+        if tool is None or tool.concurrency_safe:
+            if not shared:
+                shared_start = index
+            shared.append(tool_call)
+            continue
+        if shared:
+            batches.append((shared_start, shared))
+            shared = []
+        batches.append((index, [tool_call]))
+
+    if shared:
+        batches.append((shared_start, shared))
+    return batches
 
+
+async def _run_tool_call(
+    tool: AgentTool | None,
+    tool_call: ToolCallContent,
+    signal: Any | None,
+    stream: EventStream[AgentEvent, list[AgentMessage]],
+    gate: asyncio.Semaphore,
+    default_timeout_ms: int | None,
+) -> tuple[AgentToolResult, bool]:
+    async with gate:
         stream.push(
             ToolExecutionStartEvent(
                 tool_call_id=tool_call.id,
@@ -301,10 +387,17 @@ async def _execute_tool_calls(
             )
         )
 
+        timeout_ms = default_timeout_ms
+        if tool is not None and tool.timeout_ms is not None:
+            timeout_ms = tool.timeout_ms
+
         is_error = False
+        deadline = asyncio.timeout(timeout_ms / 1000 if timeout_ms is not None else None)
         try:
             if tool is None:
                 raise RuntimeError(f"Tool {tool_call.name} not found")
+            if signal is not None and getattr(signal, "aborted", False):
+                raise RuntimeError("Tool execution aborted")
 
             validated_args = validate_tool_arguments(tool, tool_call)
 
@@ -318,10 +411,14 @@ async def _execute_tool_calls(
                     )
                 )
 
-            result = await tool.execute(tool_call.id, validated_args, signal, _on_update)
+            async with deadline:
+                result = await tool.execute(tool_call.id, validated_args, signal, _on_update)
         except Exception as exc:
+            message = str(exc)
+            if deadline.expired():
+                message = f"Tool {tool_call.name} timed out after {timeout_ms}ms"
             result = AgentToolResult(
-                content=[TextContent(text=str(exc))],
+                content=[TextContent(text=message)],
                 details={},
             )
             is_error = True
@@ -334,31 +431,7 @@ async def _execute_tool_calls(
                 is_error=is_error,
             )
         )
-
-        tool_result_message = ToolResultMessage(
-            tool_call_id=tool_call.id,
-            tool_name=tool_call.name,
-            content=result.content,
-            details=result.details,
-            is_error=is_error,
-        )
-
-        results.append(tool_result_message)
-        stream.push(MessageStartEvent(message=tool_result_message))
-        stream.push(MessageEndEvent(message=tool_result_message))
-
-        if get_steering_messages:
-            steering = await _get_messages(get_steering_messages)
-            if steering:
-                steering_messages = steering
-                for skipped in tool_calls[index + 1 :]:
-                    results.append(_skip_tool_call(skipped, stream))
-                break
-
-    return {
-        "tool_results": results,
-        "steering_messages": steering_messages,
-    }
+        return result, is_error
 
 
 def _skip_tool_call(
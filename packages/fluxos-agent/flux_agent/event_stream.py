@@ -1,46 +1,185 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Callable
-from typing import Generic, TypeVar
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, replace
+from typing import Any, Generic, Literal, TypeAlias, TypeVar
 
 EventT = TypeVar("EventT")
 ResultT = TypeVar("ResultT")
 
+OverflowPolicy: TypeAlias = Literal["block", "drop_oldest", "coalesce"]
+
+_DELTA_TYPES = frozenset({"text_delta", "thinking_delta", "toolcall_delta"})
+# Only these are evicted under drop_oldest; lifecycle events carry state
+_DROPPABLE_TYPES = _DELTA_TYPES | {"message_update"}
+
+
+@dataclass
+class EventStreamStats:
+    pushed: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    filtered: int = 0
+    high_watermark: int = 0
+
+
+def coalesce_deltas(previous: Any, event: Any) -> Any | None:
+    """Merge two consecutive delta events for the same content block.
+
+    Handles both assistant stream events (``text_delta`` etc.) and agent
+    ``message_update`` events wrapping them. Returns None when the events
+    cannot be merged.
+    """
+    if getattr(previous, "type", None) == "message_update" and getattr(event, "type", None) == "message_update":
+        merged = coalesce_deltas(previous.assistant_message_event, event.assistant_message_event)
+        if merged is None:
+            return None
+        return replace(event, assistant_message_event=merged)
+
+    event_type = getattr(event, "type", None)
+    if (
+        event_type not in _DELTA_TYPES
+        or getattr(previous, "type", None) != event_type
+        or previous.content_index != event.content_index
+    ):
+        return None
+    return replace(event, delta=previous.delta + event.delta)
+
 
 class EventStream(Generic[EventT, ResultT], AsyncIterator[EventT]):
-    """A push-based async event stream with terminal result extraction."""
+    """A push-based async event stream with terminal result extraction.
+
+    By default the buffer is unbounded. With ``max_buffer`` set, ``overflow``
+    decides what happens when the reader falls behind:
+
+    - ``"block"``: ``push`` still buffers every event; producers ``await
+      drain()`` at safe points and wait there until the reader catches up.
+    - ``"drop_oldest"``: the oldest buffered delta or ``message_update`` is
+      discarded. When only lifecycle events are buffered the event is still
+      admitted and producers wait in ``drain()`` as under ``"block"``.
+    - ``"coalesce"``: a delta is merged into the buffered delta before it
+      (see ``coalesce_deltas``); anything else is handled as ``"block"``.
+
+    The terminal event is never dropped.
+    """
 
     def __init__(
         self,
         is_terminal_event: Callable[[EventT], bool],
         terminal_result: Callable[[EventT], ResultT],
+        max_buffer: int | None = None,
+        overflow: OverflowPolicy = "block",
+        coalesce: Callable[[EventT, EventT], EventT | None] = coalesce_deltas,
     ) -> None:
+        if overflow not in ("block", "drop_oldest", "coalesce"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
         self._is_terminal_event = is_terminal_event
         self._terminal_result = terminal_result
-        self._queue: asyncio.Queue[EventT | None] = asyncio.Queue()
+        self._max_buffer = max_buffer if max_buffer and max_buffer > 0 else None
+        self._overflow = overflow
+        self._coalesce = coalesce
+        self._buffer: deque[EventT] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._event_types: frozenset[str] | None = None
         self._result_future: asyncio.Future[ResultT] = asyncio.get_running_loop().create_future()
         self._closed = False
+        self.stats = EventStreamStats()
 
     def push(self, event: EventT) -> None:
         if self._closed:
             return
-        self._queue.put_nowait(event)
+        self.stats.pushed += 1
+        terminal = self._is_terminal_event(event)
+
+        if not terminal and not self._accepts(event):
+            self.stats.filtered += 1
+        else:
+            self._enqueue(event, terminal)
 
-        if self._is_terminal_event(event) and not self._result_future.done():
+        if terminal and not self._result_future.done():
             self._result_future.set_result(self._terminal_result(event))
-            self._closed = True
-            self._queue.put_nowait(None)
+            self._close()
+
+    def _enqueue(self, event: EventT, terminal: bool) -> None:
+        buffer = self._buffer
+        if buffer and self._overflow == "coalesce" and not terminal:
+            # Anything still buffered is unread, so merging loses nothing
+            merged = self._coalesce(buffer[-1], event)
+            if merged is not None:
+                buffer[-1] = merged
+                self.stats.coalesced += 1
+                return
+
+        if self._overflow == "drop_oldest" and self._max_buffer is not None:
+            while len(buffer) >= self._max_buffer and self._drop_oldest_droppable():
+                pass
+
+        buffer.append(event)
+        if len(buffer) > self.stats.high_watermark:
+            self.stats.high_watermark = len(buffer)
+        # drop_oldest holds producers back only when it had nothing to drop;
+        # an unmerged event under coalesce is handled as block
+        if self._max_buffer is not None:
+            limit = self._max_buffer + 1 if self._overflow == "drop_oldest" else self._max_buffer
+            if len(buffer) >= limit:
+                self._writable.clear()
+        self._readable.set()
+
+    def _drop_oldest_droppable(self) -> bool:
+        for index, buffered in enumerate(self._buffer):
+            if getattr(buffered, "type", None) in _DROPPABLE_TYPES:
+                del self._buffer[index]
+                self.stats.dropped += 1
+                return True
+        return False
 
     def end(self, result: ResultT | None = None) -> None:
         if self._closed:
             return
-        self._closed = True
         if result is not None and not self._result_future.done():
             self._result_future.set_result(result)
         elif result is None and not self._result_future.done():
             self._result_future.set_exception(RuntimeError("Event stream ended before terminal event"))
-        self._queue.put_nowait(None)
+        self._close()
+
+    def _close(self) -> None:
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
+
+    async def drain(self) -> None:
+        """Wait until the buffer is below ``max_buffer`` (no-op when unbounded)."""
+        while not self._closed and not self._writable.is_set():
+            await self._writable.wait()
+
+    def subscribe(self, event_types: Iterable[str] | None = None) -> EventStream[EventT, ResultT]:
+        """Only deliver events whose ``type`` is in ``event_types``.
+
+        Other events are not buffered at all; the terminal event is always
+        delivered. ``None`` removes the filter.
+        """
+        self._event_types = frozenset(event_types) if event_types is not None else None
+        if self._event_types is not None and self._buffer:
+            kept = [
+                event
+                for event in self._buffer
+                if self._accepts(event) or self._is_terminal_event(event)
+            ]
+            self.stats.filtered += len(self._buffer) - len(kept)
+            self._buffer = deque(kept)
+        return self
+
+    def _accepts(self, event: EventT) -> bool:
+        return self._event_types is None or getattr(event, "type", None) in self._event_types
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
 
     async def result(self) -> ResultT:
         return await self._result_future
@@ -49,8 +188,14 @@ class EventStream(Generic[EventT, ResultT], AsyncIterator[EventT]):
         return self
 
     async def __anext__(self) -> EventT:
-        item = await self._queue.get()
-        if item is None:
-            raise StopAsyncIteration
-        return item
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
 
+        event = self._buffer.popleft()
+        self.stats.delivered += 1
+        if self._max_buffer is None or len(self._buffer) < self._max_buffer:
+            self._writable.set()
+        return event
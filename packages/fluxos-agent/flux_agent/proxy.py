@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import json
+import weakref
 from dataclasses import asdict, dataclass, is_dataclass
 from typing import Any
 
 import httpx
 
-from .event_stream import EventStream
+from .event_stream import EventStream, OverflowPolicy
+from .streaming_json import StreamingJsonParser
 from .types import (
     AssistantDoneEvent,
     AssistantErrorEvent,
@@ -40,10 +42,12 @@ class ProxyError(RuntimeError):
 
 
 class ProxyMessageEventStream(EventStream[AssistantMessageEvent, AssistantMessage]):
-    def __init__(self) -> None:
+    def __init__(self, max_buffer: int | None = None, overflow: OverflowPolicy = "block") -> None:
         super().__init__(
             lambda event: getattr(event, "type", "") in {"done", "error"},
             lambda event: event.message if getattr(event, "type", "") == "done" else event.error,
+            max_buffer=max_buffer,
+            overflow=overflow,
         )
 
 
@@ -51,10 +55,56 @@ class ProxyMessageEventStream(EventStream[AssistantMessageEvent, AssistantMessag
 class ProxyStreamOptions(SimpleStreamOptions):
     auth_token: str = ""
     proxy_url: str = ""
+    # Defaults to a client shared by every stream on the running event loop
+    client: httpx.AsyncClient | None = None
+
+
+_PROXY_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """Return the pooled proxy client for the running event loop.
+
+    httpx clients are bound to the loop they first run on, so each loop
+    gets its own client; connections are kept alive across streams.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=None, limits=_PROXY_LIMITS)
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_proxy_client() -> None:
+    """Close the pooled proxy client for the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class _StreamBuffers:
+    """Per-stream tool-call parsers, keyed by content index.
+
+    Tool-call arguments are parsed incrementally. Text and thinking deltas
+    are appended to ``partial`` directly so it stays current mid-stream.
+    """
+
+    def __init__(self) -> None:
+        self.json: dict[int, StreamingJsonParser] = {}
+
+    def flush(self, partial: AssistantMessage) -> None:
+        """Drop the arguments of tool calls that were cut off."""
+        for index, parser in self.json.items():
+            _finish_arguments(_get_content(partial, index), parser)
+        self.json.clear()
 
 
 def stream_proxy(model: Model, context: Context, options: ProxyStreamOptions) -> ProxyMessageEventStream:
-    stream = ProxyMessageEventStream()
+    stream = ProxyMessageEventStream(options.event_buffer_size, options.event_overflow)
 
     async def _run() -> None:
         partial = AssistantMessage(
@@ -64,7 +114,7 @@ def stream_proxy(model: Model, context: Context, options: ProxyStreamOptions) ->
             model=model.id,
             usage=Usage(cost=UsageCost()),
         )
-        partial_json: dict[int, str] = {}
+        buffers = _StreamBuffers()
 
         try:
             if not options.proxy_url:
@@ -82,41 +132,43 @@ def stream_proxy(model: Model, context: Context, options: ProxyStreamOptions) ->
                 },
             }
 
-            async with httpx.AsyncClient(timeout=None) as client:
-                async with client.stream(
-                    "POST",
-                    f"{options.proxy_url.rstrip('/')}/api/stream",
-                    headers={
-                        "Authorization": f"Bearer {options.auth_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                ) as response:
-                    if response.status_code >= 400:
-                        message = f"Proxy error: {response.status_code}"
-                        try:
-                            data = await response.aread()
-                            parsed = json.loads(data.decode("utf-8"))
-                            if isinstance(parsed, dict) and parsed.get("error"):
-                                message = f"Proxy error: {parsed['error']}"
-                        except Exception:
-                            pass
-                        raise ProxyError(message)
-
-                    async for line in response.aiter_lines():
-                        if options.signal and options.signal.aborted:
-                            raise ProxyError("Request aborted by user")
-                        if not line.startswith("data: "):
-                            continue
-
-                        data = line[6:].strip()
-                        if not data:
-                            continue
-
-                        proxy_event = json.loads(data)
-                        event = _process_proxy_event(proxy_event, partial, partial_json)
-                        if event:
-                            stream.push(event)
+            client = options.client or get_proxy_client()
+            async with client.stream(
+                "POST",
+                f"{options.proxy_url.rstrip('/')}/api/stream",
+                headers={
+                    "Authorization": f"Bearer {options.auth_token}",
+                    "Content-Type": "application/json",
+                },
+                json=payload,
+            ) as response:
+                if response.status_code >= 400:
+                    message = f"Proxy error: {response.status_code}"
+                    try:
+                        data = await response.aread()
+                        parsed = json.loads(data.decode("utf-8"))
+                        if isinstance(parsed, dict) and parsed.get("error"):
+                            message = f"Proxy error: {parsed['error']}"
+                    except Exception:
+                        pass
+                    raise ProxyError(message)
+
+                async for line in response.aiter_lines():
+                    if options.signal and options.signal.aborted:
+                        raise ProxyError("Request aborted by user")
+                    if not line.startswith("data: "):
+                        continue
+
+                    data = line[6:].strip()
+                    if not data:
+                        continue
+
+                    proxy_event = json.loads(data)
+                    event = _process_proxy_event(proxy_event, partial, buffers)
+                    if event:
+                        stream.push(event)
+                        # Stop reading the response while the reader is behind
+                        await stream.drain()
 
             if options.signal and options.signal.aborted:
                 raise ProxyError("Request aborted by user")
@@ -128,6 +180,9 @@ def stream_proxy(model: Model, context: Context, options: ProxyStreamOptions) ->
             partial.error_message = str(exc)
             stream.push(AssistantErrorEvent(reason="aborted" if reason == "aborted" else "error", error=partial))
             stream.end()
+        finally:
+            # Also runs when the task is cancelled
+            buffers.flush(partial)
 
     asyncio.create_task(_run())
     return stream
@@ -136,7 +191,7 @@ def stream_proxy(model: Model, context: Context, options: ProxyStreamOptions) ->
 def _process_proxy_event(
     proxy_event: dict[str, Any],
     partial: AssistantMessage,
-    partial_json: dict[int, str],
+    buffers: _StreamBuffers,
 ) -> AssistantMessageEvent | None:
     event_type = proxy_event.get("type")
 
@@ -153,8 +208,9 @@ def _process_proxy_event(
         content = _get_content(partial, index)
         if not isinstance(content, TextContent):
             raise ProxyError("Received text_delta for non-text content")
-        content.text += str(proxy_event.get("delta", ""))
-        return AssistantTextDeltaEvent(content_index=index, delta=str(proxy_event.get("delta", "")), partial=partial)
+        delta = str(proxy_event.get("delta", ""))
+        content.text += delta
+        return AssistantTextDeltaEvent(content_index=index, delta=delta, partial=partial)
 
     if event_type == "text_end":
         index = int(proxy_event["contentIndex"])
@@ -173,8 +229,9 @@ def _process_proxy_event(
         content = _get_content(partial, index)
         if not isinstance(content, ThinkingContent):
             raise ProxyError("Received thinking_delta for non-thinking content")
-        content.thinking += str(proxy_event.get("delta", ""))
-        return AssistantThinkingDeltaEvent(content_index=index, delta=str(proxy_event.get("delta", "")), partial=partial)
+        delta = str(proxy_event.get("delta", ""))
+        content.thinking += delta
+        return AssistantThinkingDeltaEvent(content_index=index, delta=delta, partial=partial)
 
     if event_type == "thinking_end":
         index = int(proxy_event["contentIndex"])
@@ -194,7 +251,7 @@ def _process_proxy_event(
             arguments={},
         )
         _set_content(partial, index, tool_call)
-        partial_json[index] = ""
+        buffers.json[index] = StreamingJsonParser()
         return AssistantToolCallStartEvent(content_index=index, partial=partial)
 
     if event_type == "toolcall_delta":
@@ -203,10 +260,11 @@ def _process_proxy_event(
         if not isinstance(content, ToolCallContent):
             raise ProxyError("Received toolcall_delta for non-toolCall content")
         delta = str(proxy_event.get("delta", ""))
-        partial_json[index] = partial_json.get(index, "") + delta
-        parsed = _parse_streaming_json(partial_json[index])
-        if isinstance(parsed, dict):
-            content.arguments = parsed
+        parser = buffers.json.setdefault(index, StreamingJsonParser())
+        parser.feed(delta)
+        arguments = parser.object_value()
+        # Malformed arguments are never handed to a tool, even partially
+        content.arguments = arguments if arguments is not None else {}
         return AssistantToolCallDeltaEvent(content_index=index, delta=delta, partial=partial)
 
     if event_type == "toolcall_end":
@@ -214,15 +272,17 @@ def _process_proxy_event(
         content = _get_content(partial, index)
         if not isinstance(content, ToolCallContent):
             return None
-        partial_json.pop(index, None)
+        _finish_arguments(content, buffers.json.pop(index, None))
         return AssistantToolCallEndEvent(content_index=index, tool_call=content, partial=partial)
 
     if event_type == "done":
+        buffers.flush(partial)
         partial.stop_reason = str(proxy_event.get("reason", "stop"))  # type: ignore[assignment]
         partial.usage = _deserialize_usage(proxy_event.get("usage"))
         return AssistantDoneEvent(reason=partial.stop_reason if partial.stop_reason in {"stop", "length", "toolUse"} else "stop", message=partial)
 
     if event_type == "error":
+        buffers.flush(partial)
         reason = str(proxy_event.get("reason", "error"))
         partial.stop_reason = "aborted" if reason == "aborted" else "error"
         partial.error_message = proxy_event.get("errorMessage")
@@ -284,11 +344,9 @@ def _get_content(partial: AssistantMessage, index: int) -> Any:
     return partial.content[index]
 
 
-def _parse_streaming_json(value: str) -> dict[str, Any] | None:
-    try:
-        parsed = json.loads(value)
-    except json.JSONDecodeError:
-        return None
-    if isinstance(parsed, dict):
-        return parsed
-    return None
+def _finish_arguments(content: Any, parser: StreamingJsonParser | None) -> None:
+    # Deltas publish partial arguments for display; a tool only ever gets a
+    # complete JSON document
+    if isinstance(content, ToolCallContent) and parser is not None and not parser.complete:
+        content.arguments = {}
+
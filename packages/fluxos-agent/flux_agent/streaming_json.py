@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_STRING_STOP = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_CONTROL = re.compile(r"[\x00-\x1f]")
+_WHITESPACE = " \t\n\r"
+_SCALAR_START = "-0123456789tfnNI"
+
+_UNSET: Any = object()
+
+
+class StreamingJsonError(ValueError):
+    pass
+
+
+class StreamingJsonParser:
+    """Incremental JSON parser for streamed tool-call arguments.
+
+    ``feed`` consumes one delta and keeps tokenizer state between calls, so
+    the work per delta is proportional to the delta rather than to the whole
+    buffer. ``value`` is the document built so far: containers are created as
+    soon as they open and filled in place; strings, numbers and literals
+    appear once their token is complete.
+
+    A malformed document sets ``failed`` and further deltas are ignored.
+    """
+
+    def __init__(self) -> None:
+        self.value: Any = _UNSET
+        self.failed = False
+        # One frame per open container: [container, pending_key]
+        self._stack: list[list[Any]] = []
+        self._state = "value"
+        self._token: list[str] = []
+        self._string_is_key = False
+        self._escape = False
+
+    @property
+    def complete(self) -> bool:
+        return self._state == "end"
+
+    def object_value(self) -> dict[str, Any] | None:
+        """The parsed value if the document is a JSON object, else None."""
+        if not self.failed and isinstance(self.value, dict):
+            return self.value
+        return None
+
+    def feed(self, text: str) -> Any:
+        if self.failed:
+            return self.value
+        try:
+            self._consume(text)
+        except StreamingJsonError:
+            self.failed = True
+        return self.value
+
+    def _consume(self, text: str) -> None:
+        i = 0
+        n = len(text)
+        while i < n:
+            state = self._state
+
+            if state == "string":
+                if self._escape:
+                    self._token.append(text[i])
+                    self._escape = False
+                    i += 1
+                    continue
+                match = _STRING_STOP.search(text, i)
+                if match is None:
+                    self._token.append(text[i:])
+                    return
+                j = match.start()
+                self._token.append(text[i:j])
+                if text[j] == "\\":
+                    self._token.append("\\")
+                    self._escape = True
+                else:
+                    self._finish_string()
+                i = j + 1
+                continue
+
+            if state == "scalar":
+                match = _SCALAR_END.search(text, i)
+                if match is None:
+                    self._token.append(text[i:])
+                    return
+                self._token.append(text[i : match.start()])
+                self._finish_scalar()
+                i = match.start()
+                continue
+
+            char = text[i]
+            if char in _WHITESPACE:
+                i += 1
+                continue
+
+            if state in ("value", "value_or_end"):
+                if char == "{":
+                    self._open({}, "key_or_end")
+                elif char == "[":
+                    self._open([], "value_or_end")
+                elif char == '"':
+                    self._start_string(is_key=False)
+                elif char in _SCALAR_START:
+                    self._state = "scalar"
+                    self._token = []
+                    continue
+                elif char == "]" and state == "value_or_end":
+                    self._close(list)
+                else:
+                    raise StreamingJsonError(f"Unexpected {char!r}")
+            elif state in ("key", "key_or_end"):
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == "}" and state == "key_or_end":
+                    self._close(dict)
+                else:
+                    raise StreamingJsonError(f"Expected object key, got {char!r}")
+            elif state == "colon":
+                if char != ":":
+                    raise StreamingJsonError(f"Expected ':', got {char!r}")
+                self._state = "value"
+            elif state == "comma":
+                container = self._stack[-1][0]
+                if char == ",":
+                    self._state = "key" if isinstance(container, dict) else "value"
+                elif char == "}":
+                    self._close(dict)
+                elif char == "]":
+                    self._close(list)
+                else:
+                    raise StreamingJsonError(f"Expected ',' or closing bracket, got {char!r}")
+            else:
+                raise StreamingJsonError(f"Unexpected {char!r} after end of document")
+            i += 1
+
+    def _start_string(self, is_key: bool) -> None:
+        self._state = "string"
+        self._string_is_key = is_key
+        self._token = []
+
+    def _finish_string(self) -> None:
+        raw = "".join(self._token)
+        self._token = []
+        if "\\" in raw:
+            # Escape sequences (including surrogate pairs) decode exactly as json.loads would
+            try:
+                text = json.loads(f'"{raw}"')
+            except json.JSONDecodeError as exc:
+                raise StreamingJsonError(str(exc)) from None
+        elif _CONTROL.search(raw):
+            raise StreamingJsonError("Invalid control character in string")
+        else:
+            text = raw
+        if self._string_is_key:
+            self._stack[-1][1] = text
+            self._state = "colon"
+        else:
+            self._attach(text)
+
+    def _finish_scalar(self) -> None:
+        raw = "".join(self._token)
+        self._token = []
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise StreamingJsonError(str(exc)) from None
+        self._attach(value)
+
+    def _open(self, container: Any, state: str) -> None:
+        self._attach(container)
+        self._stack.append([container, None])
+        self._state = state
+
+    def _close(self, kind: type) -> None:
+        if not isinstance(self._stack[-1][0], kind):
+            raise StreamingJsonError("Mismatched closing bracket")
+        self._stack.pop()
+        self._state = "comma" if self._stack else "end"
+
+    def _attach(self, value: Any) -> None:
+        if not self._stack:
+            self.value = value
+            if not isinstance(value, (dict, list)):
+                self._state = "end"
+            return
+        frame = self._stack[-1]
+        container = frame[0]
+        if isinstance(container, dict):
+            container[frame[1]] = value
+        else:
+            container.append(value)
+        if not isinstance(value, (dict, list)):
+            self._state = "comma"
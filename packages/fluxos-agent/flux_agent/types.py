@@ -14,7 +14,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:
-    from .event_stream import EventStream
+    from .event_stream import EventStream, OverflowPolicy
 
 
 ThinkingLevel: TypeAlias = Literal["off", "minimal", "low", "medium", "high", "xhigh"]
@@ -146,6 +146,10 @@ class SimpleStreamOptions:
     thinking_budgets: ThinkingBudgets | None = None
     transport: Transport = "sse"
     max_retry_delay_ms: int | None = None
+    # Bound on undelivered events in the provider and agent streams; None
+    # keeps the buffers unbounded
+    event_buffer_size: int | None = None
+    event_overflow: OverflowPolicy = "block"
 
 
 @dataclass
@@ -169,6 +173,10 @@ class AgentTool:
     execute: AgentToolExecute
     parameters: Any = None
     validate: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+    # Safe tools may run alongside other safe calls from the same turn;
+    # exclusive tools (the default) run alone, in order.
+    concurrency_safe: bool = False
+    timeout_ms: int | None = None
 
 
 @dataclass
@@ -199,6 +207,8 @@ class AgentLoopConfig(SimpleStreamOptions):
     get_api_key: ApiKeyCallback | None = None
     get_steering_messages: QueuedMessagesCallback | None = None
     get_follow_up_messages: QueuedMessagesCallback | None = None
+    max_tool_concurrency: int = 8
+    tool_timeout_ms: int | None = None
 
 
 # Assistant stream events
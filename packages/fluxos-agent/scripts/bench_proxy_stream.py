@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark proxy stream decoding of large tool-call arguments.
+
+Replays an SSE trace (the body of a recorded ``/api/stream`` response)
+through ``_process_proxy_event`` and compares it with the previous
+decoding, which appended every delta to a string and re-ran ``json.loads``
+over the whole argument buffer on each one. The trace is then streamed
+end to end through ``stream_proxy`` over an in-memory transport.
+
+Without ``--trace`` a synthetic trace is generated: a short text block and
+one tool call whose arguments are ``--kb`` kilobytes of JSON, sent in
+``--delta`` byte deltas.
+
+Usage:
+    python scripts/bench_proxy_stream.py [--trace stream.sse] [--kb 100] [--delta 16] [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from flux_agent.proxy import ProxyStreamOptions, _process_proxy_event, _StreamBuffers, stream_proxy  # noqa: E402
+from flux_agent.types import AssistantMessage, Context, Model  # noqa: E402
+
+MODEL = Model(id="bench", name="bench", api="bench", provider="bench")
+
+
+def synthetic_trace(kb: int, delta: int) -> str:
+    rows = [{"line": n, "text": f"row {n} of the generated file, with some padding"} for n in range(kb * 1024 // 78)]
+    arguments = json.dumps({"path": "data/rows.json", "rows": rows, "overwrite": True})
+    events = [
+        {"type": "start"},
+        {"type": "text_start", "contentIndex": 0},
+        *({"type": "text_delta", "contentIndex": 0, "delta": "Writing the rows now. "} for _ in range(50)),
+        {"type": "text_end", "contentIndex": 0},
+        {"type": "toolcall_start", "contentIndex": 1, "id": "call-1", "toolName": "write_file"},
+        *(
+            {"type": "toolcall_delta", "contentIndex": 1, "delta": arguments[start : start + delta]}
+            for start in range(0, len(arguments), delta)
+        ),
+        {"type": "toolcall_end", "contentIndex": 1},
+        {"type": "done", "reason": "toolUse"},
+    ]
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+
+
+def parse_trace(body: str) -> list[dict]:
+    return [json.loads(line[6:]) for line in body.splitlines() if line.startswith("data: ") and line[6:].strip()]
+
+
+def decode_legacy(events: list[dict]) -> None:
+    text: dict[int, str] = {}
+    partial_json: dict[int, str] = {}
+    arguments: dict[int, dict] = {}
+    for event in events:
+        event_type = event.get("type")
+        index = event.get("contentIndex")
+        if event_type == "text_delta":
+            text[index] = text.get(index, "") + event["delta"]
+        elif event_type == "toolcall_delta":
+            partial_json[index] = partial_json.get(index, "") + event["delta"]
+            try:
+                parsed = json.loads(partial_json[index])
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                arguments[index] = parsed
+
+
+def decode_incremental(events: list[dict]) -> None:
+    partial = AssistantMessage(content=[], api="bench", provider="bench", model="bench")
+    buffers = _StreamBuffers()
+    for event in events:
+        _process_proxy_event(event, partial, buffers)
+
+
+def timed(label: str, fn, rounds: int) -> float:
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_round = (time.perf_counter() - started) / rounds
+    print(f"{label:<22} {per_round * 1000:9.1f} ms per stream")
+    return per_round
+
+
+async def replay_end_to_end(body: str, rounds: int) -> None:
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body.encode("utf-8")))
+    )
+    options = ProxyStreamOptions(auth_token="bench", proxy_url="https://proxy.invalid", client=client)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        stream = stream_proxy(MODEL, Context(system_prompt="", messages=[]), options)
+        message = await stream.result()
+        if message.stop_reason == "error":
+            sys.exit(f"Replay failed: {message.error_message}")
+    per_round = (time.perf_counter() - started) / rounds
+    await client.aclose()
+    print(f"{'stream_proxy replay':<22} {per_round * 1000:9.1f} ms per stream")
+
+
+def main(trace: str | None, kb: int, delta: int, rounds: int) -> None:
+    if trace:
+        with open(trace, encoding="utf-8") as f:
+            body = f.read()
+    else:
+        body = synthetic_trace(kb, delta)
+    events = parse_trace(body)
+    argument_bytes = sum(len(e["delta"]) for e in events if e.get("type") == "toolcall_delta")
+    print(f"{len(events)} events, {argument_bytes / 1024:.0f} KB of tool arguments")
+
+    legacy = timed("legacy re-parse", lambda: decode_legacy(events), rounds)
+    incremental = timed("incremental", lambda: decode_incremental(events), rounds)
+    print(f"{'speedup':<22} {legacy / incremental:9.1f}x")
+    asyncio.run(replay_end_to_end(body, rounds))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trace", help="Recorded SSE response body")
+    parser.add_argument("--kb", type=int, default=100)
+    parser.add_argument("--delta", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    main(args.trace, args.kb, args.delta, args.rounds)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential versus concurrent tool-call execution in the agent loop.
+
+One assistant turn requests ``--calls`` lookups of a fake tool that sleeps
+for a fixed, deterministic delay. The turn is timed with the tool marked
+exclusive (calls run one after another) and concurrency-safe (calls run
+together, bounded by ``--concurrency``).
+
+Usage:
+    python scripts/bench_tool_calls.py [--calls 5] [--delay-ms 100] [--concurrency 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flux_agent import EventStream, agent_loop  # noqa: E402
+from flux_agent.types import (  # noqa: E402
+    AgentContext,
+    AgentLoopConfig,
+    AgentTool,
+    AgentToolResult,
+    AssistantDoneEvent,
+    AssistantMessage,
+    Model,
+    TextContent,
+    ToolCallContent,
+    UserMessage,
+)
+
+MODEL = Model(id="bench", name="bench", api="bench", provider="bench")
+
+
+def make_stream_fn(calls: int):
+    turn = {"value": 0}
+
+    def stream_fn(_model, _context, _options):
+        stream = EventStream(
+            lambda event: event.type == "done",
+            lambda event: event.message,
+        )
+        if turn["value"] == 0:
+            content = [ToolCallContent(id=f"call-{n}", name="lookup", arguments={"n": n}) for n in range(calls)]
+            message = AssistantMessage(content=content, api="bench", provider="bench", model="bench", stop_reason="toolUse")
+        else:
+            message = AssistantMessage(content=[TextContent(text="done")], api="bench", provider="bench", model="bench")
+        turn["value"] += 1
+        stream.push(AssistantDoneEvent(reason=message.stop_reason, message=message))
+        return stream
+
+    return stream_fn
+
+
+def make_tool(delay_s: float, concurrency_safe: bool) -> AgentTool:
+    async def execute(_tool_call_id, params, _signal, _on_update):
+        await asyncio.sleep(delay_s)
+        return AgentToolResult(content=[TextContent(text=str(params["n"]))], details={})
+
+    return AgentTool(
+        name="lookup",
+        label="Lookup",
+        description="Fake lookup with a fixed delay",
+        execute=execute,
+        concurrency_safe=concurrency_safe,
+    )
+
+
+async def timed(label: str, calls: int, delay_s: float, concurrency_safe: bool, concurrency: int) -> float:
+    context = AgentContext(system_prompt="", messages=[], tools=[make_tool(delay_s, concurrency_safe)])
+    config = AgentLoopConfig(model=MODEL, convert_to_llm=list, max_tool_concurrency=concurrency)
+
+    started = time.perf_counter()
+    stream = agent_loop([UserMessage(content="go")], context, config, None, make_stream_fn(calls))
+    async for _ in stream:
+        pass
+    elapsed = time.perf_counter() - started
+
+    print(f"{label:<12} {elapsed * 1000:8.1f} ms per turn")
+    return elapsed
+
+
+async def main(calls: int, delay_ms: float, concurrency: int) -> None:
+    delay_s = delay_ms / 1000
+    print(f"{calls} tool calls x {delay_ms:.0f} ms, concurrency {concurrency}")
+    sequential = await timed("exclusive", calls, delay_s, False, concurrency)
+    concurrent = await timed("concurrent", calls, delay_s, True, concurrency)
+    print(f"speedup      {sequential / concurrent:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument("--delay-ms", type=float, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.delay_ms, args.concurrency))
@@ -9,8 +9,10 @@ from flux_agent.types import (
     AgentTool,
     AgentToolResult,
     AssistantStartEvent,
+    AssistantTextDeltaEvent,
     TextContent,
     UserMessage,
+    message_role,
 )
 
 from .helpers import (
@@ -275,5 +277,48 @@ async def test_agent_forwards_session_id_to_stream_options() -> None:
     assert received_session["value"] == "session-def"
 
 
+@pytest.mark.asyncio
+async def test_agent_forwards_event_buffer_options() -> None:
+    received = {}
+
+    def stream_fn(_model, _context, options):
+        received["options"] = (options.event_buffer_size, options.event_overflow)
+        stream = MockAssistantStream()
+        asyncio.get_running_loop().call_soon(lambda: push_done(stream, create_assistant_message(text="ok")))
+        return stream
+
+    agent = Agent(AgentOptions(stream_fn=stream_fn, event_buffer_size=32, event_overflow="coalesce"))
+
+    await agent.prompt("hello")
+    assert received["options"] == (32, "coalesce")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("buffer_size", [1, 2])
+@pytest.mark.parametrize("overflow", ["block", "drop_oldest", "coalesce"])
+async def test_agent_keeps_messages_with_small_event_buffer(buffer_size, overflow) -> None:
+    def stream_fn(_model, _context, _options):
+        stream = MockAssistantStream()
+
+        async def produce():
+            partial = create_assistant_message(content=[TextContent(text="")])
+            stream.push(AssistantStartEvent(partial=partial))
+            for _ in range(20):
+                partial.content[0].text += "t"
+                stream.push(AssistantTextDeltaEvent(content_index=0, delta="t", partial=partial))
+            push_done(stream, create_assistant_message(text="t" * 20))
+
+        asyncio.get_running_loop().create_task(produce())
+        return stream
+
+    agent = Agent(AgentOptions(stream_fn=stream_fn, event_buffer_size=buffer_size, event_overflow=overflow))
+
+    await agent.prompt("hello")
+
+    assert [message_role(message) for message in agent.state.messages] == ["user", "assistant"]
+    assert agent.state.messages[1].content[0].text == "t" * 20
+    assert agent.state.stream_message is None
+
+
 async def _noop_tool(_tool_call_id, _params, _signal, _on_update):
     return AgentToolResult(content=[TextContent(text="ok")], details={})
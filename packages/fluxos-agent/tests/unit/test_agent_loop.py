@@ -264,3 +264,121 @@ async def test_agent_loop_continue_processes_existing_context() -> None:
     assert len(message_end_events) == 1
     assert getattr(message_end_events[0].message, "role", None) == "assistant"
 
+
+
+def _tool_turn_stream_fn(tool_calls):
+    """Stream function that requests ``tool_calls`` once, then answers with text."""
+    call_index = {"value": 0}
+
+    def stream_fn(_model, _context, _options):
+        stream = MockAssistantStream()
+
+        def _push():
+            if call_index["value"] == 0:
+                push_done(stream, create_assistant_message(content=tool_calls, stop_reason="toolUse"))
+            else:
+                push_done(stream, create_assistant_message(text="done"))
+            call_index["value"] += 1
+
+        asyncio.get_running_loop().call_soon(_push)
+        return stream
+
+    return stream_fn
+
+
+def _sleep_tool(name, delays, active, concurrency_safe=True, timeout_ms=None):
+    async def execute(tool_call_id, params, _signal, _on_update):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            await asyncio.sleep(delays[tool_call_id])
+        finally:
+            active["now"] -= 1
+        return AgentToolResult(content=[TextContent(text=f"{name}:{tool_call_id}")], details={})
+
+    return AgentTool(
+        name=name,
+        label=name,
+        description=name,
+        execute=execute,
+        concurrency_safe=concurrency_safe,
+        timeout_ms=timeout_ms,
+    )
+
+
+async def _run_tools(tools, tool_calls, **config_kwargs):
+    context = AgentContext(system_prompt="", messages=[], tools=tools)
+    config = AgentLoopConfig(model=create_model(), convert_to_llm=identity_converter, **config_kwargs)
+    stream = agent_loop([UserMessage(content="go")], context, config, None, _tool_turn_stream_fn(tool_calls))
+    events = [event async for event in stream]
+    return events, await stream.result()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_safe_tools_run_together_in_call_order() -> None:
+    delays = {"a": 0.03, "b": 0.01, "c": 0.02}
+    active = {"now": 0, "peak": 0}
+    tool = _sleep_tool("lookup", delays, active)
+    calls = [ToolCallContent(id=call_id, name="lookup") for call_id in delays]
+
+    events, messages = await _run_tools([tool], calls)
+
+    assert active["peak"] == 3
+    finished = [event.tool_call_id for event in events if event.type == "tool_execution_end"]
+    assert finished == ["b", "c", "a"]
+    transcript = [m.tool_call_id for m in messages if getattr(m, "role", None) == "toolResult"]
+    assert transcript == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_exclusive_tool_runs_alone() -> None:
+    delays = {"a": 0.01, "b": 0.01, "x": 0.01, "c": 0.01}
+    active = {"now": 0, "peak": 0}
+    exclusive_active = {"now": 0, "peak": 0}
+    safe = _sleep_tool("lookup", delays, active)
+    exclusive = _sleep_tool("write", delays, exclusive_active, concurrency_safe=False)
+    calls = [
+        ToolCallContent(id="a", name="lookup"),
+        ToolCallContent(id="b", name="lookup"),
+        ToolCallContent(id="x", name="write"),
+        ToolCallContent(id="c", name="lookup"),
+    ]
+
+    events, _ = await _run_tools([safe, exclusive], calls)
+
+    order = [(event.type, event.tool_call_id) for event in events if event.type.startswith("tool_execution")]
+    x_start = order.index(("tool_execution_start", "x"))
+    x_end = order.index(("tool_execution_end", "x"))
+    assert order[x_start + 1] == ("tool_execution_end", "x")
+    assert {call_id for _, call_id in order[:x_start]} == {"a", "b"}
+    assert order[x_end + 1 :] == [("tool_execution_start", "c"), ("tool_execution_end", "c")]
+    assert active["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_max_tool_concurrency_bounds_parallel_calls() -> None:
+    delays = {str(n): 0.01 for n in range(6)}
+    active = {"now": 0, "peak": 0}
+    tool = _sleep_tool("lookup", delays, active)
+    calls = [ToolCallContent(id=call_id, name="lookup") for call_id in delays]
+
+    await _run_tools([tool], calls, max_tool_concurrency=2)
+
+    assert active["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_becomes_error_result() -> None:
+    delays = {"slow": 1.0, "fast": 0.0}
+    active = {"now": 0, "peak": 0}
+    slow = _sleep_tool("slow", delays, active, timeout_ms=20)
+    fast = _sleep_tool("fast", delays, active)
+    calls = [ToolCallContent(id="slow", name="slow"), ToolCallContent(id="fast", name="fast")]
+
+    _, messages = await _run_tools([slow, fast], calls)
+
+    results = {m.tool_call_id: m for m in messages if getattr(m, "role", None) == "toolResult"}
+    assert results["slow"].is_error is True
+    assert "timed out after 20ms" in results["slow"].content[0].text
+    assert results["fast"].is_error is False
+    assert active["now"] == 0
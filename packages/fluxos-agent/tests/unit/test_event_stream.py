@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flux_agent.agent_loop import agent_loop
+from flux_agent.event_stream import EventStream
+from flux_agent.types import (
+    AgentContext,
+    AgentLoopConfig,
+    AssistantMessage,
+    AssistantStartEvent,
+    AssistantTextDeltaEvent,
+    AssistantToolCallDeltaEvent,
+    MessageUpdateEvent,
+    TextContent,
+    UserMessage,
+)
+
+from .helpers import MockAssistantStream, create_assistant_message, create_model, push_done
+
+
+def _stream(**kwargs) -> EventStream:
+    return EventStream(
+        lambda event: getattr(event, "type", "") == "done",
+        lambda event: "finished",
+        **kwargs,
+    )
+
+
+def _partial() -> AssistantMessage:
+    return create_assistant_message(text="")
+
+
+def _text_delta(delta: str, index: int = 0) -> AssistantTextDeltaEvent:
+    return AssistantTextDeltaEvent(content_index=index, delta=delta, partial=_partial())
+
+
+class _Done:
+    type = "done"
+
+
+async def _drain_all(stream: EventStream) -> list:
+    return [event async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_unbounded_stream_delivers_everything_in_order() -> None:
+    stream = _stream()
+    for n in range(5):
+        stream.push(_text_delta(str(n)))
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert [getattr(e, "delta", None) for e in events] == ["0", "1", "2", "3", "4", None]
+    assert await stream.result() == "finished"
+    assert stream.stats.high_watermark == 6
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_newest_events_and_terminal() -> None:
+    stream = _stream(max_buffer=3, overflow="drop_oldest")
+    for n in range(10):
+        stream.push(_text_delta(str(n)))
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert [getattr(e, "delta", None) for e in events] == ["8", "9", None]
+    assert stream.stats.dropped == 8
+    assert stream.stats.high_watermark == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_never_blocks_drain() -> None:
+    stream = _stream(max_buffer=2, overflow="drop_oldest")
+    for n in range(5):
+        stream.push(_text_delta(str(n)))
+
+    # No reader at all: a dropping policy must not hold the producer back
+    await asyncio.wait_for(stream.drain(), timeout=1)
+    assert stream.stats.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_only_evicts_deltas() -> None:
+    stream = _stream(max_buffer=2, overflow="drop_oldest")
+    starts = [AssistantStartEvent(partial=_partial()) for _ in range(3)]
+    stream.push(starts[0])
+    stream.push(_text_delta("0"))
+    stream.push(MessageUpdateEvent(assistant_message_event=_text_delta("1"), message=_partial()))
+    stream.push(starts[1])
+    assert stream.stats.dropped == 2
+
+    # Nothing droppable is buffered: the event is admitted and drain() waits
+    stream.push(starts[2])
+    assert stream.buffered == 3
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(stream.drain(), timeout=0.05)
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert events[:3] == starts
+    assert events[3].type == "done"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_consecutive_deltas_per_block() -> None:
+    stream = _stream(max_buffer=2, overflow="coalesce")
+    for delta in ["Hel", "lo", " wor", "ld"]:
+        stream.push(_text_delta(delta))
+    stream.push(_text_delta("x", index=1))
+    stream.push(AssistantToolCallDeltaEvent(content_index=1, delta='{"a"', partial=_partial()))
+    stream.push(AssistantToolCallDeltaEvent(content_index=1, delta=": 1}", partial=_partial()))
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert [(e.type, e.delta) for e in events[:-1]] == [
+        ("text_delta", "Hello world"),
+        ("text_delta", "x"),
+        ("toolcall_delta", '{"a": 1}'),
+    ]
+    assert stream.stats.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_agent_message_updates() -> None:
+    stream = _stream(overflow="coalesce")
+    partial = _partial()
+    for delta in ["a", "b", "c"]:
+        stream.push(MessageUpdateEvent(message=partial, assistant_message_event=_text_delta(delta)))
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert len(events) == 2
+    assert events[0].assistant_message_event.delta == "abc"
+    assert events[0].message is partial
+
+
+@pytest.mark.asyncio
+async def test_block_policy_drain_waits_for_reader() -> None:
+    stream = _stream(max_buffer=2, overflow="block")
+    stream.push(_text_delta("0"))
+    stream.push(_text_delta("1"))
+
+    drained = asyncio.create_task(stream.drain())
+    await asyncio.sleep(0)
+    assert not drained.done()
+
+    await stream.__anext__()
+    await asyncio.wait_for(drained, timeout=1)
+    assert stream.buffered == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_filters_event_types() -> None:
+    stream = _stream()
+    stream.push(AssistantStartEvent(partial=_partial()))
+    stream.subscribe({"start"})
+    stream.push(_text_delta("ignored"))
+    stream.push(AssistantStartEvent(partial=_partial()))
+    stream.push(_Done())
+
+    events = await _drain_all(stream)
+
+    assert [e.type for e in events] == ["start", "start", "done"]
+    assert stream.stats.filtered == 1
+
+
+@pytest.mark.asyncio
+async def test_iteration_after_end_stops() -> None:
+    stream = _stream()
+    stream.push(_Done())
+    await _drain_all(stream)
+
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_slow_reader_keeps_agent_buffer_bounded() -> None:
+    deltas = 400
+
+    def stream_fn(_model, _context, _options):
+        assistant = MockAssistantStream()
+
+        async def produce():
+            partial = create_assistant_message(content=[TextContent(text="")])
+            assistant.push(AssistantStartEvent(partial=partial))
+            for _ in range(deltas):
+                assistant.push(AssistantTextDeltaEvent(content_index=0, delta="t", partial=partial))
+                await asyncio.sleep(0)
+            push_done(assistant, create_assistant_message(text="t" * deltas))
+
+        asyncio.get_running_loop().create_task(produce())
+        return assistant
+
+    for overflow in ("block", "coalesce"):
+        config = AgentLoopConfig(
+            model=create_model(),
+            convert_to_llm=list,
+            event_buffer_size=16,
+            event_overflow=overflow,
+        )
+        stream = agent_loop([UserMessage(content="go")], AgentContext("", [], []), config, None, stream_fn)
+
+        text = []
+        async for event in stream:
+            if event.type == "message_update":
+                text.append(event.assistant_message_event.delta)
+            await asyncio.sleep(0.0001 if overflow == "block" else 0.001)
+
+        assert "".join(text) == "t" * deltas
+        assert stream.stats.high_watermark <= 16 + 4
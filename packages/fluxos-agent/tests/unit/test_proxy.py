@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from flux_agent.proxy import (
+    ProxyStreamOptions,
+    _process_proxy_event,
+    _StreamBuffers,
+    close_proxy_client,
+    get_proxy_client,
+    stream_proxy,
+)
+from flux_agent.types import AssistantMessage, Context
+
+from .helpers import create_model
+
+
+def _sse(events: list[dict]) -> bytes:
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode("utf-8")
+
+
+def _client(events: list[dict], requests: list[httpx.Request] | None = None) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, content=_sse(events), headers={"content-type": "text/event-stream"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _options(client: httpx.AsyncClient) -> ProxyStreamOptions:
+    return ProxyStreamOptions(auth_token="token", proxy_url="https://proxy.invalid", client=client)
+
+
+def _tool_call_events(arguments: str, chunk: int) -> list[dict]:
+    events = [
+        {"type": "start"},
+        {"type": "text_start", "contentIndex": 0},
+        *({"type": "text_delta", "contentIndex": 0, "delta": word} for word in ["Writing ", "the ", "file."]),
+        {"type": "text_end", "contentIndex": 0},
+        {"type": "toolcall_start", "contentIndex": 1, "id": "call-1", "toolName": "write_file"},
+    ]
+    events.extend(
+        {"type": "toolcall_delta", "contentIndex": 1, "delta": arguments[start : start + chunk]}
+        for start in range(0, len(arguments), chunk)
+    )
+    events.append({"type": "toolcall_end", "contentIndex": 1})
+    events.append({"type": "done", "reason": "toolUse", "usage": {"input": 3, "output": 4}})
+    return events
+
+
+@pytest.mark.asyncio
+async def test_stream_proxy_assembles_text_and_tool_arguments() -> None:
+    arguments = {"path": "big.txt", "content": "x" * 5000, "append": False}
+    client = _client(_tool_call_events(json.dumps(arguments), chunk=13))
+
+    stream = stream_proxy(create_model(), Context(system_prompt="", messages=[]), _options(client))
+    events = [event async for event in stream]
+    message = await stream.result()
+    await client.aclose()
+
+    text_end = next(event for event in events if event.type == "text_end")
+    assert text_end.content == "Writing the file."
+    assert message.content[0].text == "Writing the file."
+    assert message.content[1].arguments == arguments
+    assert message.stop_reason == "toolUse"
+    assert message.usage.output == 4
+
+
+def test_partial_tool_arguments_grow_with_each_delta() -> None:
+    partial = AssistantMessage(content=[], api="mock", provider="mock", model="mock")
+    buffers = _StreamBuffers()
+    _process_proxy_event({"type": "toolcall_start", "contentIndex": 0, "id": "c", "toolName": "t"}, partial, buffers)
+
+    snapshots = []
+    for delta in ['{"path": "a.txt", ', '"content": "hel', 'lo"}']:
+        _process_proxy_event({"type": "toolcall_delta", "contentIndex": 0, "delta": delta}, partial, buffers)
+        snapshots.append(dict(partial.content[0].arguments))
+
+    assert snapshots == [
+        {"path": "a.txt"},
+        {"path": "a.txt"},
+        {"path": "a.txt", "content": "hello"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_proxy_drops_malformed_arguments() -> None:
+    client = _client(_tool_call_events('{"path": "a.txt",, "content": 1}', chunk=5))
+
+    stream = stream_proxy(create_model(), Context(system_prompt="", messages=[]), _options(client))
+    message = await stream.result()
+    await client.aclose()
+
+    assert message.content[1].arguments == {}
+
+
+@pytest.mark.parametrize("end_events", [
+    [{"type": "toolcall_end", "contentIndex": 0}, {"type": "done", "reason": "length"}],
+    [{"type": "done", "reason": "length"}],
+])
+def test_cut_off_tool_arguments_are_dropped(end_events: list[dict]) -> None:
+    partial = AssistantMessage(content=[], api="mock", provider="mock", model="mock")
+    buffers = _StreamBuffers()
+    _process_proxy_event({"type": "toolcall_start", "contentIndex": 0, "id": "c", "toolName": "t"}, partial, buffers)
+    _process_proxy_event(
+        {"type": "toolcall_delta", "contentIndex": 0, "delta": '{"path": "a.txt", "overwrite": true, "con'},
+        partial,
+        buffers,
+    )
+    assert partial.content[0].arguments == {"path": "a.txt", "overwrite": True}
+
+    for event in end_events:
+        _process_proxy_event(event, partial, buffers)
+
+    assert partial.content[0].arguments == {}
+
+
+def test_partial_text_is_current_on_every_delta() -> None:
+    partial = AssistantMessage(content=[], api="mock", provider="mock", model="mock")
+    buffers = _StreamBuffers()
+    _process_proxy_event({"type": "text_start", "contentIndex": 0}, partial, buffers)
+    _process_proxy_event({"type": "thinking_start", "contentIndex": 1}, partial, buffers)
+
+    snapshots = []
+    for delta in ["Hel", "lo"]:
+        _process_proxy_event({"type": "text_delta", "contentIndex": 0, "delta": delta}, partial, buffers)
+        _process_proxy_event({"type": "thinking_delta", "contentIndex": 1, "delta": delta}, partial, buffers)
+        snapshots.append((partial.content[0].text, partial.content[1].thinking))
+
+    assert snapshots == [("Hel", "Hel"), ("Hello", "Hello")]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_drops_cut_off_tool_arguments() -> None:
+    sent = asyncio.Event()
+    hang = asyncio.Event()
+
+    class _Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield _sse([
+                {"type": "start"},
+                {"type": "toolcall_start", "contentIndex": 0, "id": "c", "toolName": "t"},
+                {"type": "toolcall_delta", "contentIndex": 0, "delta": '{"path": "a.txt", "con'},
+            ])
+            sent.set()
+            await hang.wait()
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=_Body())))
+    tasks_before = asyncio.all_tasks()
+    stream = stream_proxy(create_model(), Context(system_prompt="", messages=[]), _options(client))
+    (task,) = asyncio.all_tasks() - tasks_before
+
+    start = await stream.__anext__()
+    await sent.wait()
+    await asyncio.sleep(0)
+    assert start.partial.content[0].arguments == {"path": "a.txt"}
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await client.aclose()
+
+    assert start.partial.content[0].arguments == {}
+
+
+@pytest.mark.asyncio
+async def test_stream_proxy_keeps_unterminated_text_on_error() -> None:
+    events = [
+        {"type": "start"},
+        {"type": "text_start", "contentIndex": 0},
+        {"type": "text_delta", "contentIndex": 0, "delta": "partial "},
+        {"type": "text_delta", "contentIndex": 0, "delta": "answer"},
+        {"type": "error", "reason": "error", "errorMessage": "upstream failed"},
+    ]
+    client = _client(events)
+
+    stream = stream_proxy(create_model(), Context(system_prompt="", messages=[]), _options(client))
+    message = await stream.result()
+    await client.aclose()
+
+    assert message.stop_reason == "error"
+    assert message.content[0].text == "partial answer"
+
+
+@pytest.mark.asyncio
+async def test_slow_reader_keeps_proxy_buffer_bounded() -> None:
+    deltas = ["t"] * 400
+    client = _client([
+        {"type": "start"},
+        {"type": "text_start", "contentIndex": 0},
+        *({"type": "text_delta", "contentIndex": 0, "delta": delta} for delta in deltas),
+        {"type": "text_end", "contentIndex": 0},
+        {"type": "done", "reason": "stop"},
+    ])
+    options = _options(client)
+    options.event_buffer_size = 16
+
+    stream = stream_proxy(create_model(), Context(system_prompt="", messages=[]), options)
+    text = []
+    async for event in stream:
+        if event.type == "text_delta":
+            text.append(event.delta)
+        await asyncio.sleep(0)
+    await client.aclose()
+
+    assert text == deltas
+    assert stream.stats.high_watermark <= 16
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_is_shared_per_loop() -> None:
+    first = get_proxy_client()
+
+    assert get_proxy_client() is first
+
+    await close_proxy_client()
+    assert first.is_closed
+    assert get_proxy_client() is not first
+    await close_proxy_client()
+
+
+def test_pooled_client_is_not_shared_across_loops() -> None:
+    async def grab() -> httpx.AsyncClient:
+        client = get_proxy_client()
+        await close_proxy_client()
+        return client
+
+    assert asyncio.run(grab()) is not asyncio.run(grab())
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from flux_agent.streaming_json import StreamingJsonParser
+
+DOCUMENT = {
+    "path": "notes/today.md",
+    "content": 'line "one"\\nline two \\u00e9 😀\n\ttabbed',
+    "options": {"overwrite": True, "mode": None, "retries": 3, "ratio": -1.5e-3},
+    "tags": ["a", [], {}, [1, [2, [3]]]],
+}
+
+
+def _feed_in_chunks(text: str, size: int) -> StreamingJsonParser:
+    parser = StreamingJsonParser()
+    for start in range(0, len(text), size):
+        parser.feed(text[start : start + size])
+    return parser
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_chunked_feed_matches_json_loads(size: int, indent: int | None) -> None:
+    text = json.dumps(DOCUMENT, indent=indent, ensure_ascii=size % 2 == 0)
+
+    parser = _feed_in_chunks(text, size)
+
+    assert parser.complete
+    assert parser.value == json.loads(text)
+
+
+def test_partial_object_exposes_completed_values_only() -> None:
+    parser = StreamingJsonParser()
+
+    parser.feed('{"path": "a.txt", "count": 1')
+    assert parser.value == {"path": "a.txt"}
+
+    parser.feed('2, "body": "hel')
+    assert parser.value == {"path": "a.txt", "count": 12}
+
+    parser.feed('lo", "items": [1, ')
+    assert parser.value == {"path": "a.txt", "count": 12, "body": "hello", "items": [1]}
+    assert not parser.complete
+
+    parser.feed("2]}")
+    assert parser.complete
+
+
+def test_value_is_updated_in_place() -> None:
+    parser = StreamingJsonParser()
+    root = parser.feed('{"a": {')
+    parser.feed('"b": true}}')
+
+    assert root is parser.value
+    assert root == {"a": {"b": True}}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a":1,}', '{"a" 1}', '{"a": tru }', "[1 2]", '{"a": "\x01"}', '{"a": 1}}', '{"a": [1}', '{"a": "\\q"}'],
+)
+def test_malformed_documents_fail(text: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+
+    parser = StreamingJsonParser()
+    parser.feed(text)
+    parser.feed(" ")
+
+    assert parser.failed
+    assert parser.object_value() is None
+
+
+def test_non_object_document_has_no_object_value() -> None:
+    parser = StreamingJsonParser()
+    parser.feed("[1, 2]")
+
+    assert parser.complete
+    assert parser.object_value() is None